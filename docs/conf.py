@@ -4,6 +4,8 @@
 # license: ./licenses/numpy.rst
 
 import configparser
+import functools
+import importlib
 import os
 import sys
 import subprocess
@@ -43,6 +45,7 @@ extensions = [
     'sphinx.ext.autodoc',
     'sphinx.ext.coverage',
     'sphinx.ext.doctest',
+    'dwaveoceansdk.docs.doctesting',
     'sphinx.ext.intersphinx',
     'sphinx.ext.mathjax',
     'sphinx.ext.napoleon',
@@ -164,6 +167,9 @@ numpy.set_printoptions(legacy='1.25')
 # reduce output noise
 doctest_show_successes = False
 
+# test documents in parallel, e.g. DOCTEST_NUM_WORKERS=$(nproc) make doctest
+doctest_num_workers = int(os.environ.get('DOCTEST_NUM_WORKERS', 1))
+
 # -- Breathe configuration ------------------------------------------------
 
 # Path to the cpp xml files
@@ -176,11 +182,14 @@ breathe_projects = {
 breathe_default_members = ('members', )
 breathe_default_project = "minorminer"
 
-# We want to build the c++ docs in RTD with all warnings:
+# We want to build the c++ docs in RTD with all warnings.
+# Doxygen is only rerun when a project's C++ headers change.
+from dwaveoceansdk.docs import build_cpp_docs
+
 if os.environ.get('READTHEDOCS', False):
-    subprocess.call('cd ../minorminer/docs/; make cpp', shell=True)
-    subprocess.call('cd ../dimod/docs/; make cpp', shell=True)
-    subprocess.call('cd ../dwave-preprocessing/docs/; make cpp', shell=True)
+    build_cpp_docs(os.path.join(sdk_directory, 'minorminer'))
+    build_cpp_docs(os.path.join(sdk_directory, 'dimod'))
+    build_cpp_docs(os.path.join(sdk_directory, 'dwave-preprocessing'))
     subprocess.call('cd ../dwave-gate/; python dwave/gate/simulator/operation_generation.py', shell=True)
 
 # We want to build the c++ docs in CircleCI without warnings
@@ -189,9 +198,9 @@ if os.environ.get('CI', False):
     os.environ["DOXYGEN_QUIET"] = "YES"
     os.environ["DOXYGEN_WARNINGS"] = "NO"
     os.environ["DOXYGEN_WARN_LOGFILE"] = "/dev/null"
-    #subprocess.call('cd ../minorminer/docs/; make cpp > /dev/null 2>&1', shell=True)
-    subprocess.call('cd ../dimod/docs/; make cpp > /dev/null 2>&1', shell=True)
-    subprocess.call('cd ../dwave-preprocessing/docs/; make cpp > /dev/null 2>&1', shell=True)
+    #build_cpp_docs(os.path.join(sdk_directory, 'minorminer'), quiet=True)
+    build_cpp_docs(os.path.join(sdk_directory, 'dimod'), quiet=True)
+    build_cpp_docs(os.path.join(sdk_directory, 'dwave-preprocessing'), quiet=True)
     subprocess.call('cd ../dwave-gate/; python dwave/gate/simulator/operation_generation.py', shell=True)
 
 autodoc_type_aliases = {
@@ -262,6 +271,28 @@ html_sidebars = {
 }
 html_static_path = ['_static']
 
+# placeholder in packages.rst -> module whose __version__ replaces it
+version_substitutions = {
+    'dimod_version': 'dimod',
+    'cloud_version': 'dwave.cloud.client',
+    'gate_version': 'dwave.gate',
+    'graphs_version': 'dwave.graphs',
+    'hybrid_version': 'hybrid',
+    'inspector_version': 'dwave.inspector',
+    'dnx_version': 'dwave_networkx',
+    'optimization_version': 'dwave.optimization',
+    'preprocessing_version': 'dwave.preprocessing',
+    'samplers_version': 'dwave.samplers',
+    'system_version': 'dwave.system',
+    'minorminer_version': 'minorminer',
+}
+
+@functools.cache
+def package_versions():
+    """Versions of the Ocean packages, by placeholder in packages.rst."""
+    return {name: importlib.import_module(module).__version__
+            for name, module in version_substitutions.items()}
+
 def substitute_versions(app, docname, source):
     # Unfortunately we cannot use rst_prolog or rst_epilog within a
     # toctree, so we need a more blunt instrument
@@ -271,41 +302,18 @@ def substitute_versions(app, docname, source):
     if "packages" not in docname:
         return
 
-    from dimod import __version__ as dimod_version
-    source[0] = source[0].replace("|dimod_version|", dimod_version)
-
-    from dwave.cloud.client import __version__ as cloud_version
-    source[0] = source[0].replace("|cloud_version|", cloud_version)
-
-    from dwave.gate import __version__ as gate_version
-    source[0] = source[0].replace("|gate_version|", gate_version)
-
-    from dwave.graphs import __version__ as graphs_version
-    source[0] = source[0].replace("|graphs_version|", graphs_version)
-
-    from hybrid import __version__ as hybrid_version
-    source[0] = source[0].replace("|hybrid_version|", hybrid_version)
-
-    from dwave.inspector import __version__ as inspector_version
-    source[0] = source[0].replace("|inspector_version|", inspector_version)
-
-    from dwave_networkx import __version__ as dnx_version
-    source[0] = source[0].replace("|dnx_version|", dnx_version)
-
-    from dwave.optimization import __version__ as optimization_version
-    source[0] = source[0].replace("|optimization_version|", optimization_version)
-
-    from dwave.preprocessing import __version__ as preprocessing_version
-    source[0] = source[0].replace("|preprocessing_version|", preprocessing_version)
-
-    from dwave.samplers import __version__ as samplers_version
-    source[0] = source[0].replace("|samplers_version|", samplers_version)
+    for name, version in package_versions().items():
+        source[0] = source[0].replace(f"|{name}|", version)
 
-    from dwave.system import __version__ as system_version
-    source[0] = source[0].replace("|system_version|", system_version)
+# Passing doctest groups are cached (see dwaveoceansdk.docs.doctesting),
+# and rerun when any of these versions change. The SDK's own modules are
+# not versioned on every change, so the hash of their sources stands in
+from dwaveoceansdk.docs import headers_fingerprint
 
-    from minorminer import __version__ as minorminer_version
-    source[0] = source[0].replace("|minorminer_version|", minorminer_version)
+doctest_cache_versions = dict(
+    package_versions(),
+    dwaveoceansdk=headers_fingerprint(os.path.join(sdk_directory, 'dwaveoceansdk'),
+                                      extensions=['.py']))
 
 
 def setup(app):
@@ -12,4 +12,119 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+"""Lazy facade over the main entry points of the Ocean packages.
+
+Names listed in :data:`__all__` resolve on first attribute access
+(:pep:`562`), so ``import dwaveoceansdk`` does not import any of the
+component packages, numpy, networkx or the cloud client. Each component
+package is imported only when one of its names is first used.
+
+Examples:
+    >>> import dwaveoceansdk as ocean
+    >>> bqm = ocean.BinaryQuadraticModel.from_ising({'a': -1}, {})    # imports dimod
+    >>> sampleset = ocean.ExactSolver().sample(bqm)
+"""
+
+import importlib
+
 __version__ = '9.4.0'
+
+# public name -> module that defines it; keep sorted by module
+_LAZY_ATTRS = {
+    # dimod
+    'BINARY': 'dimod',
+    'BQM': 'dimod',
+    'Binary': 'dimod',
+    'BinaryArray': 'dimod',
+    'BinaryQuadraticModel': 'dimod',
+    'Binaries': 'dimod',
+    'CQM': 'dimod',
+    'ConstrainedQuadraticModel': 'dimod',
+    'DiscreteQuadraticModel': 'dimod',
+    'ExactCQMSolver': 'dimod',
+    'ExactSolver': 'dimod',
+    'INTEGER': 'dimod',
+    'Integer': 'dimod',
+    'IntegerArray': 'dimod',
+    'Integers': 'dimod',
+    'QM': 'dimod',
+    'QuadraticModel': 'dimod',
+    'REAL': 'dimod',
+    'Real': 'dimod',
+    'Reals': 'dimod',
+    'SPIN': 'dimod',
+    'SampleSet': 'dimod',
+    'Spin': 'dimod',
+    'SpinArray': 'dimod',
+    'Spins': 'dimod',
+    'Vartype': 'dimod',
+    'quicksum': 'dimod',
+
+    # dwave-system
+    'AutoEmbeddingComposite': 'dwave.system',
+    'DWaveCliqueSampler': 'dwave.system',
+    'DWaveSampler': 'dwave.system',
+    'EmbeddingComposite': 'dwave.system',
+    'FixedEmbeddingComposite': 'dwave.system',
+    'LazyFixedEmbeddingComposite': 'dwave.system',
+    'LeapHybridCQMSampler': 'dwave.system',
+    'LeapHybridNLSampler': 'dwave.system',
+    'LeapHybridSampler': 'dwave.system',
+    'ParallelEmbeddingComposite': 'dwave.system',
+    'TilingComposite': 'dwave.system',
+
+    # dwave-samplers
+    'PlanarGraphSolver': 'dwave.samplers',
+    'RandomSampler': 'dwave.samplers',
+    'SimulatedAnnealingSampler': 'dwave.samplers',
+    'SteepestDescentSolver': 'dwave.samplers',
+    'TabuSampler': 'dwave.samplers',
+    'TreeDecompositionSolver': 'dwave.samplers',
+
+    # dwave-preprocessing
+    'ClipComposite': 'dwave.preprocessing',
+    'ConnectedComponentsComposite': 'dwave.preprocessing',
+    'FixVariablesComposite': 'dwave.preprocessing',
+    'Presolver': 'dwave.preprocessing',
+    'ScaleComposite': 'dwave.preprocessing',
+    'SpinReversalTransformComposite': 'dwave.preprocessing',
+    'roof_duality': 'dwave.preprocessing',
+
+    # dwave-optimization
+    'Model': 'dwave.optimization',
+
+    # minorminer
+    'find_embedding': 'minorminer',
+
+    # dwave-hybrid
+    'ArgMin': 'hybrid',
+    'EnergyImpactDecomposer': 'hybrid',
+    'InterruptableTabuSampler': 'hybrid',
+    'Loop': 'hybrid',
+    'Map': 'hybrid',
+    'Parallel': 'hybrid',
+    'Race': 'hybrid',
+    'SimulatedAnnealingSubproblemSampler': 'hybrid',
+    'SplatComposer': 'hybrid',
+    'State': 'hybrid',
+    'States': 'hybrid',
+}
+
+__all__ = ['__version__', *_LAZY_ATTRS]
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name), name)
+
+    # cache on the module so __getattr__ is not called again for this name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
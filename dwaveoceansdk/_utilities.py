@@ -0,0 +1,44 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Private helpers shared by the SDK's modules."""
+
+import concurrent.futures
+import sys
+
+__all__ = ['InlineExecutor', 'max_rss']
+
+
+class InlineExecutor(concurrent.futures.Executor):
+    """Run submitted functions immediately in the calling thread."""
+    def submit(self, fn, /, *args, **kwargs):
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+
+def max_rss():
+    """Peak resident set size of the current process in bytes, or None if
+    it cannot be determined on this platform."""
+    try:
+        import resource
+    except ImportError:     # windows
+        return None
+
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    return maxrss if sys.platform == 'darwin' else maxrss * 1024
@@ -0,0 +1,467 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sample many small, independent problems with one call to a classical
+sampler.
+
+Calling ``SimulatedAnnealingSampler().sample(bqm)`` once per problem costs
+close to a millisecond even for a two-variable model, almost all of it in
+argument parsing, schedule selection and sample-set construction.
+:func:`sample_many` packs all problems into one set of contiguous arrays,
+runs the annealing kernel of ``dwave-samplers`` once over all of them and
+splits the result into one sample set per problem.
+
+.. autosummary::
+
+    sample_many
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import typing
+import warnings
+
+import numpy as np
+
+from dwaveoceansdk._utilities import InlineExecutor
+from dwaveoceansdk.tracing import span
+
+if typing.TYPE_CHECKING:
+    import dimod
+
+__all__ = ['sample_many']
+
+
+class _Packed:
+    """Binary quadratic models laid end to end.
+
+    Variable ``i`` of problem ``p`` is packed variable
+    ``variable_ptr[p] + i`` and the problem's interactions are
+    ``interaction_ptr[p]:interaction_ptr[p+1]``, so the packed arrays are a
+    block-diagonal problem with one block per model. Biases are kept in each
+    model's own vartype, ``h`` and ``J`` are the same problem in SPIN.
+    """
+    def __init__(self, bqms):
+        import dimod
+
+        self.variables = []
+        self.vartypes = []
+
+        linear = []
+        rows = []
+        columns = []
+        quadratic = []
+        offsets = []
+        for bqm in bqms:
+            ldata, (irow, icol, qdata), offset = bqm.to_numpy_vectors()
+            self.variables.append(bqm.variables)
+            self.vartypes.append(bqm.vartype)
+            linear.append(ldata)
+            rows.append(irow)
+            columns.append(icol)
+            quadratic.append(qdata)
+            offsets.append(offset)
+
+        num_problems = len(self.variables)
+        num_variables = np.fromiter(map(len, linear), dtype=np.int64, count=num_problems)
+        num_interactions = np.fromiter(map(len, quadratic), dtype=np.int64, count=num_problems)
+
+        self.variable_ptr = np.zeros(num_problems + 1, dtype=np.int64)
+        np.cumsum(num_variables, out=self.variable_ptr[1:])
+        self.interaction_ptr = np.zeros(num_problems + 1, dtype=np.int64)
+        np.cumsum(num_interactions, out=self.interaction_ptr[1:])
+
+        # problem of each packed variable and interaction
+        self.variable_problem = np.repeat(np.arange(num_problems), num_variables)
+        self.interaction_problem = np.repeat(np.arange(num_problems), num_interactions)
+
+        def concatenate(arrays, dtype):
+            return np.concatenate(arrays, dtype=dtype) if arrays else np.empty(0, dtype=dtype)
+
+        self.linear = concatenate(linear, np.float64)
+        self.quadratic = concatenate(quadratic, np.float64)
+        self.offset = np.asarray(offsets, dtype=np.float64)
+
+        shift = self.variable_ptr[self.interaction_problem]
+        self.irow = concatenate(rows, np.int64) + shift
+        self.icol = concatenate(columns, np.int64) + shift
+
+        # x = (s + 1) / 2 for the BINARY problems
+        binary = np.fromiter((vartype is dimod.BINARY for vartype in self.vartypes),
+                             dtype=bool, count=num_problems)
+        self.binary = binary[self.variable_problem]
+        quarter = np.where(binary[self.interaction_problem], self.quadratic / 4, 0)
+
+        self.h = np.where(self.binary, self.linear / 2, self.linear)
+        self.h += np.bincount(self.irow, weights=quarter, minlength=len(self.h))
+        self.h += np.bincount(self.icol, weights=quarter, minlength=len(self.h))
+        self.J = np.where(binary[self.interaction_problem], quarter, self.quadratic)
+
+    def __len__(self):
+        return len(self.variables)
+
+    @property
+    def num_variables(self):
+        return len(self.linear)
+
+    def chunks(self, problems, num_chunks):
+        """Split ``problems``, sorted problem indices, into at most
+        ``num_chunks`` groups with about the same number of variables, as
+        ``(variables, irow, icol, interactions)`` with ``irow`` and ``icol``
+        indexing into ``variables``."""
+        sizes = np.diff(self.variable_ptr)[problems]
+        targets = np.linspace(0, sizes.sum(), num_chunks + 1)[1:-1]
+        bounds = np.unique(np.searchsorted(np.cumsum(sizes), targets, side='right'))
+
+        selected = np.zeros(len(self), dtype=bool)
+        for part in np.split(problems, bounds):
+            if not len(part):
+                continue
+            selected[:] = False
+            selected[part] = True
+
+            variables = np.flatnonzero(selected[self.variable_problem])
+            interactions = np.flatnonzero(selected[self.interaction_problem])
+            yield (variables,
+                   np.searchsorted(variables, self.irow[interactions]),
+                   np.searchsorted(variables, self.icol[interactions]),
+                   interactions)
+
+    def beta_ranges(self):
+        """Default ``[hot, cold]`` beta range of each problem, as chosen by
+        :class:`~dwave.samplers.SimulatedAnnealingSampler` when it samples
+        that problem alone."""
+        num_problems = len(self)
+        abs_h = np.abs(self.h)
+        abs_J = np.abs(self.J)
+
+        sum_abs_bias = abs_h.copy()
+        np.add.at(sum_abs_bias, self.irow, abs_J)
+        np.add.at(sum_abs_bias, self.icol, abs_J)
+
+        # smallest nonzero bias on each variable
+        min_abs_bias = np.where(abs_h != 0, abs_h, np.inf)
+        nonzero = abs_J != 0
+        np.minimum.at(min_abs_bias, self.irow[nonzero], abs_J[nonzero])
+        np.minimum.at(min_abs_bias, self.icol[nonzero], abs_J[nonzero])
+
+        max_effective_field = np.zeros(num_problems)
+        np.maximum.at(max_effective_field, self.variable_problem, sum_abs_bias)
+        min_effective_field = np.full(num_problems, np.inf)
+        np.minimum.at(min_effective_field, self.variable_problem, min_abs_bias)
+        number_min_gaps = np.bincount(
+            self.variable_problem,
+            weights=min_abs_bias == min_effective_field[self.variable_problem],
+            minlength=num_problems)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            hot = np.where(max_effective_field == 0, 1, np.log(2) / (2 * max_effective_field))
+            cold = np.log(number_min_gaps / .01) / (2 * min_effective_field)
+
+        # all biases zero
+        null = np.isinf(min_effective_field)
+        if null.any():
+            warnings.warn("All biases of some problems are zero (all energies are zero), "
+                          "this is likely a value error. Their temperature range is set "
+                          "arbitrarily to [0.1, 1].")
+            hot[null] = .1
+            cold[null] = 1
+
+        return hot, cold
+
+    def energies(self, samples):
+        """Energies, of shape ``(num_reads, len(self))``, of ``samples``
+        given in each problem's vartype."""
+        num_reads = len(samples)
+        num_problems = len(self)
+
+        rows = np.arange(num_reads)[:, np.newaxis] * num_problems
+        energies = np.bincount((rows + self.variable_problem).ravel(),
+                               weights=(samples * self.linear).ravel(),
+                               minlength=num_reads * num_problems)
+        energies += np.bincount(
+            (rows + self.interaction_problem).ravel(),
+            weights=(samples[:, self.irow] * samples[:, self.icol] * self.quadratic).ravel(),
+            minlength=num_reads * num_problems)
+
+        return energies.reshape(num_reads, num_problems) + self.offset
+
+    def samplesets(self, samples, infos):
+        """Split spin-valued ``samples`` of all packed variables into one
+        sample set per problem, with the given ``info`` dicts."""
+        import dimod
+
+        samples = np.where(self.binary, (samples + 1) // 2, samples).astype(np.int8)
+        energies = self.energies(samples)
+
+        num_reads = len(samples)
+        num_occurrences = np.ones(num_reads, dtype=np.int64)
+        dtypes = {}
+
+        samplesets = []
+        for p, (variables, vartype, info) in enumerate(zip(self.variables, self.vartypes, infos)):
+            start, stop = self.variable_ptr[p], self.variable_ptr[p + 1]
+
+            try:
+                dtype = dtypes[stop - start]
+            except KeyError:
+                dtype = dtypes[stop - start] = np.dtype([('sample', np.int8, (stop - start,)),
+                                                         ('energy', np.float64),
+                                                         ('num_occurrences', np.int64)])
+
+            # fill as a plain array, recarray field access is slow
+            record = np.empty(num_reads, dtype=dtype)
+            record['sample'] = samples[:, start:stop]
+            record['energy'] = energies[:, p]
+            record['num_occurrences'] = num_occurrences
+
+            samplesets.append(dimod.SampleSet(record.view(np.recarray), variables, info,
+                                              vartype))
+
+        return samplesets
+
+
+def _schedule(beta_range, num_betas, beta_schedule_type):
+    if len(beta_range) != 2 or min(beta_range) < 0:
+        raise ValueError("'beta_range' should be a 2-tuple, or 2 element list of positive numbers")
+    if num_betas == 1:
+        return np.array([beta_range[-1]], dtype=float)
+    if beta_schedule_type == 'linear':
+        return np.linspace(*beta_range, num=num_betas)
+    if beta_schedule_type == 'geometric':
+        if min(beta_range) <= 0:
+            raise ValueError("'beta_range' must contain non-zero values for "
+                             "beta_schedule_type = 'geometric'")
+        return np.geomspace(*beta_range, num=num_betas)
+    raise ValueError(f"Beta schedule type {beta_schedule_type} not implemented")
+
+
+def _beta_schedules(packed, *, num_sweeps, num_sweeps_per_beta, beta_range, beta_schedule_type,
+                    beta_schedule):
+    """Group the problems by beta schedule.
+
+    Returns the factor each problem's biases are scaled by, the ``[hot,
+    cold]`` beta range each problem effectively sees and a list of
+    ``(problems, schedule)`` pairs, validated as by
+    :class:`~dwave.samplers.SimulatedAnnealingSampler`.
+    """
+    if not isinstance(num_sweeps_per_beta, int) or num_sweeps_per_beta < 1:
+        raise ValueError("'num_sweeps_per_beta' should be a positive integer: "
+                         f"value = {num_sweeps_per_beta}")
+
+    problems = np.arange(len(packed))
+    scale = np.ones(len(packed))
+
+    if beta_schedule_type == 'custom':
+        if beta_schedule is None:
+            raise ValueError("'beta_schedule' must be provided for beta_schedule_type = 'custom'")
+        beta_schedule = np.asarray(beta_schedule, dtype=float)
+        if beta_schedule.min(initial=0) < 0:
+            raise ValueError("'beta_schedule' cannot include negative values")
+        if num_sweeps is not None and num_sweeps != len(beta_schedule) * num_sweeps_per_beta:
+            raise ValueError("'num_sweeps' should be None, or consistent with 'beta_schedule' "
+                             "and 'num_sweeps_per_beta'")
+        beta_ranges = np.tile([beta_schedule[0], beta_schedule[-1]], (len(packed), 1))
+        return scale, beta_ranges, [(problems, beta_schedule)]
+
+    if beta_schedule is not None:
+        raise ValueError("'beta_schedule' must be None for beta_schedule_type other than 'custom'")
+
+    num_betas, rem = divmod(1000 if num_sweeps is None else num_sweeps, num_sweeps_per_beta)
+    if rem or num_betas < 0:
+        raise ValueError("'num_sweeps' must be a non-negative value divisible by "
+                         "'num_sweeps_per_beta'")
+
+    if beta_range is not None:
+        beta_ranges = np.tile(beta_range, (len(packed), 1))
+        return scale, beta_ranges, [(problems, _schedule(beta_range, num_betas,
+                                                         beta_schedule_type))]
+
+    # Annealing c*E with betas b/c is annealing E with betas b, so scaling
+    # each problem by its own default hot beta lets one schedule start every
+    # problem there. Problems whose default cold-to-hot ratios are within a
+    # factor of two share a schedule ending at their largest ratio.
+    hot, cold = packed.beta_ranges()
+    ratio = np.maximum(cold / hot, 1)
+    groups = np.ceil(np.log2(ratio)).astype(np.int64)
+
+    schedules = []
+    end = np.empty(len(packed))
+    for group in np.unique(groups):
+        members = np.flatnonzero(groups == group)
+        end[members] = ratio[members].max()
+        schedules.append((members, _schedule([1., end[members[0]]], num_betas,
+                                             beta_schedule_type)))
+
+    return hot, np.column_stack((hot, hot * end)), schedules
+
+
+def _anneal(packed, rng, num_threads, executor, *, num_reads=None, num_sweeps=None,
+            num_sweeps_per_beta=1, beta_range=None, beta_schedule_type='geometric',
+            beta_schedule=None, randomize_order=False, proposal_acceptance_criteria='Metropolis'):
+    from dwave.samplers.sa.simulated_annealing import simulated_annealing
+
+    num_reads = 1 if num_reads is None else num_reads
+    if not isinstance(num_reads, int) or num_reads < 1:
+        raise ValueError("'num_reads' should be a positive integer")
+
+    scale, beta_ranges, schedules = _beta_schedules(
+        packed, num_sweeps=num_sweeps, num_sweeps_per_beta=num_sweeps_per_beta,
+        beta_range=beta_range, beta_schedule_type=beta_schedule_type,
+        beta_schedule=beta_schedule)
+
+    h = packed.h * scale[packed.variable_problem]
+    J = packed.J * scale[packed.interaction_problem]
+
+    # random initial states, annealed in place
+    samples = rng.integers(2, size=(num_reads, packed.num_variables), dtype=np.int8)
+    samples *= 2
+    samples -= 1
+
+    def anneal(seed, schedule, variables, irow, icol, interactions):
+        states = np.ascontiguousarray(samples[:, variables])
+        simulated_annealing(num_reads, h[variables], irow, icol, J[interactions],
+                            num_sweeps_per_beta, schedule, seed, states,
+                            randomize_order, proposal_acceptance_criteria)
+        samples[:, variables] = states
+
+    futures = [executor.submit(anneal, int(rng.integers(2**31)), schedule, *chunk)
+               for problems, schedule in schedules
+               for chunk in packed.chunks(problems, num_threads)]
+    for future in futures:
+        future.result()
+
+    infos = (dict(beta_range=beta_range, beta_schedule_type=beta_schedule_type)
+             for beta_range in beta_ranges.tolist())
+    return samples, infos
+
+
+def _sample_union(sampler, packed, rng, num_threads, executor, **parameters):
+    import dimod
+
+    def sample(seed, variables, irow, icol, interactions):
+        bqm = dimod.BinaryQuadraticModel.from_numpy_vectors(
+            packed.h[variables], (irow, icol, packed.J[interactions]), 0, dimod.SPIN)
+        seeded = parameters if seed is None else dict(parameters, seed=seed)
+        sampleset = sampler.sample(bqm, **seeded).change_vartype(dimod.SPIN)
+
+        # back to the order of variables
+        order = np.argsort(np.fromiter(sampleset.variables, dtype=np.int64,
+                                       count=len(sampleset.variables)))
+        return variables, sampleset.record.sample[:, order]
+
+    chunks = list(packed.chunks(np.arange(len(packed)), num_threads))
+    seeds = [None] * len(chunks)
+    if 'seed' in sampler.parameters:
+        seeds = rng.integers(2**31, size=len(chunks)).tolist()
+
+    futures = [executor.submit(sample, seed, *chunk) for seed, chunk in zip(seeds, chunks)]
+    parts = [future.result() for future in futures]
+
+    num_reads = min((len(states) for _, states in parts), default=0)
+    samples = np.empty((num_reads, packed.num_variables), dtype=np.int8)
+    for variables, states in parts:
+        samples[:, variables] = states[:num_reads]
+    return samples, ({} for _ in range(len(packed)))
+
+
+def sample_many(sampler: dimod.Sampler,
+                bqms: typing.Iterable[dimod.BinaryQuadraticModel],
+                *,
+                num_threads: int = 1,
+                seed: typing.Optional[int] = None,
+                **parameters,
+                ) -> list[dimod.SampleSet]:
+    """Sample many independent binary quadratic models at once.
+
+    The models are packed end to end into one set of contiguous arrays, a
+    block-diagonal problem with one block per model, sampled together and
+    returned as one sample set per model.
+
+    For :class:`~dwave.samplers.SimulatedAnnealingSampler` the packed
+    problem goes directly to the sampler's native annealing loop. By
+    default each model is annealed from the hot beta the sampler would
+    choose for it alone to at least, and at most twice, the cold beta it
+    would choose: models are scaled to a common hot beta and those with
+    similar ranges share one call. A batch of similar models is annealed in
+    a single call. Each sample set's ``info`` holds the ``beta_range`` its
+    model saw and the ``beta_schedule_type``.
+
+    Other samplers are called once on the disjoint union of the models.
+    This suits samplers that treat disconnected parts of a problem
+    independently, such as
+    :class:`~dwave.samplers.SteepestDescentSolver` and
+    :class:`~dwave.samplers.RandomSampler`, but not exact solvers.
+
+    Args:
+        sampler: Sampler to use.
+
+        bqms: Binary quadratic models, of either vartype.
+
+        num_threads: Number of threads. Models are split into this many
+            groups of about the same number of variables, each sampled by a
+            separate call in its own thread. The annealing loop releases the
+            GIL, so groups anneal concurrently.
+
+        seed: Seed of the random initial states and of the sampler. Results
+            are reproducible for the same seed and number of threads.
+
+        **parameters: Keyword arguments of the sampler's ``sample`` method
+            that apply to all models. For
+            :class:`~dwave.samplers.SimulatedAnnealingSampler` these are
+            ``num_reads``, ``num_sweeps``, ``num_sweeps_per_beta``,
+            ``beta_range``, ``beta_schedule_type``, ``beta_schedule``,
+            ``randomize_order`` and ``proposal_acceptance_criteria``.
+
+    Returns:
+        One sample set per model, in the order of ``bqms``, with samples
+        in the model's vartype and ``num_reads`` unaggregated samples.
+
+    Examples:
+        >>> import dimod
+        >>> from dwave.samplers import SimulatedAnnealingSampler
+        >>> from dwaveoceansdk.batching import sample_many
+        ...
+        >>> bqms = [dimod.BQM.from_ising({'a': -1, 'b': +1}, {('a', 'b'): -1})] * 1000
+        >>> samplesets = sample_many(SimulatedAnnealingSampler(), bqms, num_reads=2, seed=5)
+        >>> len(samplesets)
+        1000
+        >>> print(samplesets[0].first.energy)
+        -1.0
+    """
+    from dwave.samplers import SimulatedAnnealingSampler
+
+    if not isinstance(num_threads, int) or num_threads < 1:
+        raise ValueError("num_threads must be a positive integer")
+
+    with span('sample_many.pack') as s:
+        packed = _Packed(bqms)
+        s.set(num_problems=len(packed), num_variables=packed.num_variables)
+    rng = np.random.default_rng(seed)
+
+    if num_threads == 1:
+        executor = InlineExecutor()
+    else:
+        executor = concurrent.futures.ThreadPoolExecutor(num_threads,
+                                                         thread_name_prefix='sample_many')
+    with executor, span('sample_many.sample', num_threads=num_threads):
+        if isinstance(sampler, SimulatedAnnealingSampler):
+            samples, infos = _anneal(packed, rng, num_threads, executor, **parameters)
+        else:
+            samples, infos = _sample_union(sampler, packed, rng, num_threads, executor,
+                                           **parameters)
+
+    with span('sample_many.split'):
+        return packed.samplesets(samples, infos)
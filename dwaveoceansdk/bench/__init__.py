@@ -0,0 +1,20 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for the Ocean SDK.
+
+Run as ``python -m dwaveoceansdk.bench``; see ``--help`` for the available
+benchmarks. Each benchmark writes a JSON report so that results can be
+compared across SDK versions.
+"""
@@ -0,0 +1,72 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import importlib
+import json
+import sys
+
+# Each benchmark module defines DESCRIPTION, add_arguments(parser) and
+# main(args), which returns a JSON-serializable report. A report with a
+# true 'failed' entry makes the command exit with a nonzero status.
+# command -> module
+BENCHMARKS = {
+    'components': 'dwaveoceansdk.bench.components',
+    'construction': 'dwaveoceansdk.bench.construction',
+    'gate': 'dwaveoceansdk.bench.gate',
+    'graphs': 'dwaveoceansdk.bench.graphs',
+    'labels': 'dwaveoceansdk.bench.labels',
+    'nonlinear': 'dwaveoceansdk.bench.nonlinear',
+    'pipeline': 'dwaveoceansdk.bench.pipeline',
+    'processes': 'dwaveoceansdk.bench.processes',
+    'regression': 'dwaveoceansdk.bench.regression',
+}
+
+DEFAULT_BENCHMARK = 'components'
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if not argv or (argv[0].startswith('-') and argv[0] not in ('-h', '--help')):
+        argv = [DEFAULT_BENCHMARK, *argv]
+
+    parser = argparse.ArgumentParser(prog='python -m dwaveoceansdk.bench',
+                                     description="Ocean SDK benchmarks.")
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    modules = {}
+    for name, module_name in BENCHMARKS.items():
+        # benchmark modules import their heavy dependencies lazily
+        modules[name] = module = importlib.import_module(module_name)
+
+        subparser = subparsers.add_parser(name, help=module.DESCRIPTION)
+        subparser.add_argument('-o', '--output', metavar='FILE',
+                               help="write the JSON report to FILE")
+        module.add_arguments(subparser)
+
+    args = parser.parse_args(argv)
+
+    report = modules[args.benchmark].main(args)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    return 1 if report.get('failed') else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,254 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cold-import and first-call benchmarks for the pinned Ocean components.
+
+Every measurement runs in a fresh interpreter so that nothing imported
+by a previous measurement (or by the benchmark runner itself) is cached.
+
+.. autosummary::
+
+    measure_component
+    run
+
+Run from the command line as ``python -m dwaveoceansdk.bench components``.
+"""
+
+import json
+import statistics
+import time
+import warnings
+
+from importlib.metadata import requires, version
+
+from dwaveoceansdk.bench.utilities import max_rss, parse_pin, run_probe, system_info
+
+__all__ = ['COMPONENTS', 'FIRST_CALLS', 'measure_component', 'pinned_components', 'run']
+
+DESCRIPTION = "cold import time, memory and first-call latency per component"
+
+# distribution name -> top-level module
+COMPONENTS = {
+    'dimod': 'dimod',
+    'dwave-cloud-client': 'dwave.cloud',
+    'dwave-gate': 'dwave.gate',
+    'dwave-graphs': 'dwave.graphs',
+    'dwave-hybrid': 'hybrid',
+    'dwave-inspector': 'dwave.inspector',
+    'dwave-networkx': 'dwave_networkx',
+    'dwave-optimization': 'dwave.optimization',
+    'dwave-preprocessing': 'dwave.preprocessing',
+    'dwave-samplers': 'dwave.samplers',
+    'dwave-system': 'dwave.system',
+    'minorminer': 'minorminer',
+    'penaltymodel': 'penaltymodel',
+}
+
+
+# The first calls are the snippets in tests/test_individually.py. Each one
+# imports what it needs inside the function so that the import cost is
+# attributed to the import measurement, not to the call.
+
+def _maximum_cut():
+    import dimod
+    import dwave.graphs
+
+    G = dwave.graphs.chimera_graph(1)
+    dwave.graphs.maximum_cut(G, dimod.ExactSolver())
+
+
+def _hybrid_loop():
+    import dimod
+    import hybrid
+
+    bqm = dimod.BinaryQuadraticModel({}, {'ab': 1, 'bc': -1, 'ca': 1}, 0, dimod.SPIN)
+
+    workflow = hybrid.Loop(hybrid.Race(
+        hybrid.InterruptableTabuSampler(),
+        hybrid.EnergyImpactDecomposer(size=2)
+        | hybrid.SimulatedAnnealingSubproblemSampler()
+        | hybrid.SplatComposer()
+    ) | hybrid.ArgMin(), convergence=3)
+
+    workflow.run(hybrid.State.from_problem(bqm)).result()
+
+
+def _simulated_annealing():
+    from dwave.samplers import SimulatedAnnealingSampler
+
+    SimulatedAnnealingSampler().sample_ising({'a': -1, 'b': +1}, {('a', 'b'): -1})
+
+
+def _roof_duality():
+    import dimod
+    from dwave.preprocessing.lower_bounds import roof_duality
+
+    roof_duality(dimod.BinaryQuadraticModel.from_ising({'a': 10}, {'ab': -1, 'bc': 1}))
+
+
+def _scale_composite():
+    import dimod
+    from dwave.preprocessing.composites import ScaleComposite
+
+    bqm = dimod.BinaryQuadraticModel.from_ising({'a': 10}, {'ab': -1, 'bc': 1})
+    ScaleComposite(dimod.ExactSolver()).sample(bqm, scalar=0.5)
+
+
+# distribution name -> {call name: callable}
+FIRST_CALLS = {
+    'dwave-graphs': {'maximum_cut': _maximum_cut},
+    'dwave-hybrid': {'Loop(Race(...))': _hybrid_loop},
+    'dwave-samplers': {'SimulatedAnnealingSampler.sample_ising': _simulated_annealing},
+    'dwave-preprocessing': {'roof_duality': _roof_duality,
+                            'ScaleComposite.sample': _scale_composite},
+}
+
+
+def pinned_components():
+    """Return the names of the component distributions pinned by the SDK.
+
+    The names are read from the installed ``dwave-ocean-sdk`` metadata, so
+    they always match the ``install_requires`` of ``setup.cfg``. Other
+    dependencies, required by version range, are not components.
+    """
+    names = []
+    for requirement in requires('dwave-ocean-sdk'):
+        name, pinned = parse_pin(requirement)
+        if pinned is not None:
+            names.append(name)
+    return names
+
+
+def _probe(name):
+    """Measure ``name`` in the current (fresh) interpreter and print the
+    result as JSON. Run by :func:`measure_component` in a subprocess."""
+    import importlib
+
+    rss_before = max_rss()
+
+    with warnings.catch_warnings():
+        # dwave-networkx and penaltymodel warn about their deprecation
+        warnings.simplefilter('ignore', DeprecationWarning)
+
+        t = time.perf_counter()
+        importlib.import_module(COMPONENTS[name])
+        import_time = time.perf_counter() - t
+
+    rss_after = max_rss()
+
+    first_calls = {}
+    for call_name, func in FIRST_CALLS.get(name, {}).items():
+        t = time.perf_counter()
+        func()
+        first_calls[call_name] = time.perf_counter() - t
+
+    print(json.dumps(dict(
+        import_time=import_time,
+        rss_before=rss_before,
+        rss_after=rss_after,
+        first_calls=first_calls,
+        )))
+
+
+def measure_component(name, repeat=1):
+    """Measure the cold-import cost and first-call latency of a component.
+
+    Args:
+        name (str):
+            Distribution name of the component, e.g. ``'dimod'``.
+
+        repeat (int, optional, default=1):
+            Number of fresh interpreters to measure in. Timings are reported
+            as the minimum and median over all repeats.
+
+    Returns:
+        dict: Measurements for the component. Times are in seconds and
+        memory in bytes. Memory is ``None`` on platforms where it cannot be
+        measured.
+    """
+    if name not in COMPONENTS:
+        raise ValueError(f"unknown component {name!r}, expected one of {sorted(COMPONENTS)}")
+    if repeat < 1:
+        raise ValueError("repeat must be a positive integer")
+
+    runs = [run_probe(f'from dwaveoceansdk.bench.components import _probe; _probe({name!r})',
+                      repr(name))
+            for _ in range(repeat)]
+
+    def summarize(values):
+        return dict(min=min(values), median=statistics.median(values))
+
+    rss_after = runs[0]['rss_after']
+    rss_before = runs[0]['rss_before']
+
+    return dict(
+        version=version(name),
+        module=COMPONENTS[name],
+        repeat=repeat,
+        import_time=summarize([r['import_time'] for r in runs]),
+        rss_after_import=rss_after,
+        rss_import_delta=None if rss_after is None else rss_after - rss_before,
+        first_calls={call_name: summarize([r['first_calls'][call_name] for r in runs])
+                     for call_name in runs[0]['first_calls']},
+        )
+
+
+def run(components=None, repeat=1):
+    """Measure all pinned components.
+
+    Args:
+        components (iterable[str], optional):
+            Distribution names of the components to measure. Defaults to
+            all components pinned by the SDK.
+
+        repeat (int, optional, default=1):
+            See :func:`measure_component`.
+
+    Returns:
+        dict: A JSON-serializable report with the SDK version, the Python
+        version and platform, and the measurements for each component.
+    """
+    if components is None:
+        components = pinned_components()
+
+    return dict(
+        benchmark='components',
+        **system_info(),
+        components={name: measure_component(name, repeat=repeat) for name in components},
+        )
+
+
+def add_arguments(parser):
+    """Add the command-line arguments of this benchmark to ``parser``."""
+    parser.add_argument('--components', nargs='+', metavar='NAME',
+                        help="component distributions to measure (default: all pinned components)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="number of fresh interpreters per component (default: %(default)s)")
+
+
+def main(args):
+    """Run the benchmark from parsed command-line arguments, print a
+    summary and return the report."""
+    report = run(args.components, repeat=args.repeat)
+
+    for name, result in report['components'].items():
+        line = (f"{name:<22} {result['version']:<10} "
+                f"import {result['import_time']['median'] * 1e3:9.1f} ms")
+        if result['rss_import_delta'] is not None:
+            line += f"  rss +{result['rss_import_delta'] / 2**20:7.1f} MiB"
+        print(line)
+        for call_name, timing in result['first_calls'].items():
+            print(f"    {call_name:<40} {timing['median'] * 1e3:9.1f} ms")
+
+    return report
@@ -0,0 +1,225 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Build time and peak memory of constrained quadratic model construction.
+
+The bin packing problem of the *Scaling for Production* section of the
+documentation is built with the fastest method shown there and with
+:func:`dwaveoceansdk.construction.bin_packing`. Every build runs in a fresh
+interpreter so that peak memory is attributable to it alone.
+
+.. autosummary::
+
+    bin_packing_reference
+    measure_build
+    run
+
+Run from the command line as ``python -m dwaveoceansdk.bench construction``.
+"""
+
+import json
+import time
+
+from dwaveoceansdk.bench.utilities import max_rss, run_probe, system_info
+
+__all__ = ['BUILDERS', 'bin_packing_reference', 'measure_build', 'run']
+
+DESCRIPTION = "build time and peak memory of the scaling-guide bin packing CQM"
+
+SIZES = (100, 1000, 5000)
+
+
+def bin_packing_reference(weights):
+    """Generate a bin packing problem as a constrained quadratic model.
+
+    The *Add Constraints Without Copying* version of the *Scaling for
+    Production* section of the documentation, with string variable labels.
+    """
+    import dimod
+
+    n = len(weights)
+
+    # y_j indicates that bin j is used
+    y_labels = [f'y_{j}' for j in range(n)]
+
+    # x_i,j indicates that item i is put in bin j
+    x_labels = [[f'x_{i},{j}' for j in range(n)] for i in range(n)]
+
+    cqm = dimod.ConstrainedQuadraticModel()
+
+    # we wish to minimize the number of bins used
+    objective = dimod.QuadraticModel()
+    objective.add_linear_from(((v, 1) for v in y_labels), default_vartype='BINARY')
+    cqm.set_objective(objective)
+
+    # each item can only go in one bin
+    for i in range(n):
+        lhs = dimod.QuadraticModel()
+        lhs.add_linear_from(((v, 1) for v in x_labels[i]), default_vartype='BINARY')
+        cqm.add_constraint_from_model(lhs, rhs=1, sense='==', label=f'item_placing_{i}',
+                                      copy=False)
+
+    # each bin has a capacity that must be respected
+    for j in range(n):
+        lhs = dimod.QuadraticModel()
+        lhs.add_linear_from(((x_labels[i][j], weights[i]) for i in range(n)),
+                            default_vartype='BINARY')
+        lhs.add_linear(y_labels[j], -1, default_vartype='BINARY')
+        cqm.add_constraint_from_model(lhs, rhs=0, sense='<=', label=f'capacity_bin_{j}',
+                                      copy=False)
+
+    return cqm
+
+
+def _bin_packing_arrays(weights):
+    from dwaveoceansdk.construction import bin_packing
+
+    return bin_packing(weights)
+
+
+# builder name -> function of the item weights
+BUILDERS = {
+    'reference': bin_packing_reference,
+    'arrays': _bin_packing_arrays,
+}
+
+
+def _probe(builder, num_items, seed):
+    """Build one model in the current (fresh) interpreter and print the
+    measurements as JSON. Run by :func:`measure_build` in a subprocess."""
+    import dimod   # noqa: F401 (imported before measuring the baseline)
+    import numpy as np
+
+    weights = np.random.default_rng(seed).random(num_items)
+
+    rss_before = max_rss()
+
+    t = time.perf_counter()
+    cqm = BUILDERS[builder](weights)
+    build_time = time.perf_counter() - t
+
+    rss_after = max_rss()
+
+    print(json.dumps(dict(
+        build_time=build_time,
+        rss_before=rss_before,
+        rss_after=rss_after,
+        num_variables=cqm.num_variables(),
+        num_constraints=len(cqm.constraints),
+        )))
+
+
+def measure_build(builder, num_items, seed=None):
+    """Measure building the bin packing model for ``num_items`` items.
+
+    Args:
+        builder (str):
+            One of :data:`BUILDERS`.
+
+        num_items (int):
+            Number of items, and so of bins.
+
+        seed (int, optional):
+            Random seed of the item weights.
+
+    Returns:
+        dict: Build time in seconds, peak resident memory and its growth
+        during the build in bytes, and the size of the model. Memory is
+        ``None`` on platforms where it cannot be measured.
+    """
+    if builder not in BUILDERS:
+        raise ValueError(f"unknown builder {builder!r}, expected one of {sorted(BUILDERS)}")
+    if num_items < 1:
+        raise ValueError("num_items must be a positive integer")
+
+    result = run_probe(
+        'from dwaveoceansdk.bench.construction import _probe; '
+        f'_probe({builder!r}, {num_items!r}, {seed!r})',
+        f'{builder!r} with {num_items} items')
+
+    rss_before = result.pop('rss_before')
+    result.update(peak_rss=result['rss_after'],
+                  rss_build_delta=None if rss_before is None else result['rss_after'] - rss_before)
+    del result['rss_after']
+    return result
+
+
+def run(sizes=SIZES, builders=tuple(BUILDERS), reference_max_size=1000, seed=None):
+    """Measure each builder at each size.
+
+    Args:
+        sizes (iterable[int], optional, default=(100, 1000, 5000)):
+            Numbers of items. The model has ``n*(n+1)`` variables for
+            ``n`` items.
+
+        builders (iterable[str], optional):
+            Builders to measure. Defaults to all of :data:`BUILDERS`.
+
+        reference_max_size (int, optional, default=1000):
+            Largest size at which the reference builder is measured. With
+            string labels its memory use grows quickly enough to exhaust
+            smaller machines at the largest default size. ``None`` for no
+            limit.
+
+        seed (int, optional):
+            Random seed of the item weights.
+
+    Returns:
+        dict: A JSON-serializable report.
+    """
+    results = {}
+    for builder in builders:
+        results[builder] = {}
+        for n in sizes:
+            if (builder == 'reference' and reference_max_size is not None
+                    and n > reference_max_size):
+                continue
+            results[builder][str(n)] = measure_build(builder, n, seed=seed)
+
+    return dict(
+        benchmark='construction',
+        **system_info(),
+        parameters=dict(sizes=list(sizes), reference_max_size=reference_max_size, seed=seed),
+        builders=results,
+        )
+
+
+def add_arguments(parser):
+    """Add the command-line arguments of this benchmark to ``parser``."""
+    parser.add_argument('--sizes', type=int, nargs='+', metavar='N', default=list(SIZES),
+                        help="numbers of items (default: %(default)s)")
+    parser.add_argument('--builders', nargs='+', choices=list(BUILDERS), default=list(BUILDERS),
+                        help="builders to measure (default: all)")
+    parser.add_argument('--reference-max-size', type=int, default=1000, metavar='N',
+                        help="largest size the reference builder is measured at, "
+                             "0 for no limit (default: %(default)s)")
+    parser.add_argument('--seed', type=int, help="random seed for the item weights")
+
+
+def main(args):
+    """Run the benchmark from parsed command-line arguments, print a
+    summary and return the report."""
+    report = run(args.sizes, builders=args.builders,
+                 reference_max_size=args.reference_max_size or None, seed=args.seed)
+
+    for builder, results in report['builders'].items():
+        print(f"{builder}:")
+        for n, result in results.items():
+            line = f"    n={n:<8} {result['build_time']:9.3f} s"
+            if result['peak_rss'] is not None:
+                line += (f"  peak rss {result['peak_rss'] / 2**20:8.1f} MiB"
+                         f"  (+{result['rss_build_delta'] / 2**20:.1f} MiB)")
+            print(line)
+
+    return report
@@ -0,0 +1,280 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wall time and memory of batched and sparse circuit simulation.
+
+Two circuits are simulated with :func:`dwave.gate.simulator.simulate`, the
+reference, and with :mod:`dwaveoceansdk.gate`:
+
+*   ``batch``: a parametric circuit of layers of RY rotations and a chain of
+    CX gates, for a batch of random parameter values. The reference
+    evaluates the circuit with
+    :meth:`~dwave.gate.ParametricCircuit.eval` and simulates it once per
+    row; :func:`~dwaveoceansdk.gate.simulate_batch` simulates the batch in
+    one call.
+*   ``sparse``: a GHZ state followed by layers of Pauli, RZ, CZ and swap
+    gates, whose state has two nonzero amplitudes, simulated with
+    :func:`~dwaveoceansdk.gate.simulate_sparse`.
+
+Memory is the peak of the allocations traced by :mod:`tracemalloc` during
+a separate run, which for the reference simulates a single circuit.
+
+.. autosummary::
+
+    ghz_circuit
+    layered_circuit
+    measure_batch
+    measure_sparse
+    run
+
+Run from the command line as ``python -m dwaveoceansdk.bench gate``.
+"""
+
+import time
+import tracemalloc
+
+from dwaveoceansdk.bench.utilities import system_info
+
+__all__ = ['MODES', 'ghz_circuit', 'layered_circuit', 'measure_batch', 'measure_sparse',
+           'run']
+
+DESCRIPTION = "wall time and memory of batched and sparse circuit simulation"
+
+MODES = ('batch', 'sparse')
+
+
+def layered_circuit(num_qubits, num_layers=2):
+    """:class:`~dwave.gate.ParametricCircuit` of ``num_layers`` layers, each
+    of an RY rotation on every qubit and a chain of CX gates, with one
+    parameter per rotation."""
+    import dwave.gate.operations as ops
+    from dwave.gate import ParametricCircuit
+
+    circuit = ParametricCircuit(num_qubits)
+    with circuit.context as (p, q, c):
+        for layer in range(num_layers):
+            for i in range(num_qubits):
+                ops.RY(p[layer * num_qubits + i], q[i])
+            for i in range(num_qubits - 1):
+                ops.CX(q[i], q[i + 1])
+    return circuit
+
+
+def ghz_circuit(num_qubits, num_layers=2):
+    """:class:`~dwave.gate.Circuit` preparing a GHZ state, followed by
+    ``num_layers`` layers of RZ, X, CZ and swap gates."""
+    import dwave.gate.operations as ops
+    from dwave.gate import Circuit
+
+    circuit = Circuit(num_qubits)
+    with circuit.context as (q, c):
+        ops.Hadamard(q[0])
+        for i in range(num_qubits - 1):
+            ops.CX(q[i], q[i + 1])
+        for layer in range(num_layers):
+            for i in range(num_qubits):
+                ops.RZ([.1 * (i + 1)], q[i])
+                ops.X(q[i])
+            for i in range(layer % 2, num_qubits - 1, 2):
+                ops.CZ(q[i], q[i + 1])
+            ops.SWAP((q[0], q[num_qubits - 1]))
+    return circuit
+
+
+def _reference_batch(circuit, parameters):
+    """Simulate ``circuit`` for each row of ``parameters`` as with
+    :mod:`dwave.gate` alone, and return the last state."""
+    import dwave.gate.operations as ops
+    from dwave.gate.simulator import simulate
+
+    # the layered circuit takes its parameters in order, one per rotation
+    state = None
+    for row in parameters.tolist():
+        values = iter(row)
+        evaluated = circuit.eval([[next(values)] if isinstance(op, ops.ParametricOperation)
+                                  else None for op in circuit.circuit])
+        simulate(evaluated)
+        state = evaluated.state
+    return state
+
+
+def _timed(func, *args):
+    t = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - t
+
+
+def _peak_memory(func, *args):
+    """Peak bytes traced while running ``func``."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def measure_batch(num_qubits, num_circuits=16, num_layers=2, seed=None):
+    """Time and memory of simulating a layered circuit for a batch of
+    parameters.
+
+    Args:
+        num_qubits (int): Number of qubits.
+        num_circuits (int, optional, default=16): Size of the batch.
+        num_layers (int, optional, default=2): Layers of the circuit.
+        seed (int, optional): Random seed of the parameters.
+
+    Returns:
+        dict: Seconds per circuit (``'time'``) and peak bytes
+        (``'memory'``) of the reference and of ``simulate_batch``, and the
+        largest difference between their final states (``'max_error'``).
+    """
+    import numpy as np
+    from dwaveoceansdk.gate import simulate_batch
+
+    circuit = layered_circuit(num_qubits, num_layers)
+    parameters = np.random.default_rng(seed).uniform(
+        -np.pi, np.pi, size=(num_circuits, circuit.num_parameters))
+
+    reference, reference_time = _timed(_reference_batch, circuit, parameters)
+    states, batch_time = _timed(simulate_batch, circuit, parameters)
+
+    return dict(
+        num_qubits=num_qubits, num_circuits=num_circuits,
+        time=dict(reference=reference_time / num_circuits, batch=batch_time / num_circuits),
+        memory=dict(reference=_peak_memory(_reference_batch, circuit, parameters[:1]),
+                    batch=_peak_memory(simulate_batch, circuit, parameters)),
+        max_error=float(np.abs(states[-1] - reference).max()),
+        )
+
+
+def measure_sparse(num_qubits, num_layers=2):
+    """Time and memory of simulating a GHZ circuit densely and sparsely.
+
+    Args:
+        num_qubits (int): Number of qubits.
+        num_layers (int, optional, default=2): Layers after the GHZ state.
+
+    Returns:
+        dict: Seconds (``'time'``) and peak bytes (``'memory'``) of the
+        reference and of ``simulate_sparse``, the number of nonzero
+        amplitudes and the largest difference between the states
+        (``'max_error'``).
+    """
+    import numpy as np
+    from dwave.gate.simulator import simulate
+    from dwaveoceansdk.gate import simulate_sparse
+
+    circuit = ghz_circuit(num_qubits, num_layers)
+
+    _, reference_time = _timed(simulate, circuit)
+    state = circuit.state
+    reference_memory = _peak_memory(simulate, circuit)
+
+    (indices, amplitudes), sparse_time = _timed(simulate_sparse, circuit)
+
+    dense = np.zeros_like(state)
+    dense[indices] = amplitudes
+
+    return dict(
+        num_qubits=num_qubits, num_amplitudes=len(indices),
+        time=dict(reference=reference_time, sparse=sparse_time),
+        memory=dict(reference=reference_memory,
+                    sparse=_peak_memory(simulate_sparse, circuit)),
+        max_error=float(np.abs(dense - state).max()),
+        )
+
+
+def run(modes=MODES, num_qubits=range(10, 25, 2), num_circuits=16, num_layers=2,
+        max_batch_bytes=2**30, seed=None):
+    """Measure each mode for each number of qubits.
+
+    Args:
+        modes (iterable[str], optional):
+            Modes to measure, by default all of :data:`MODES`.
+
+        num_qubits (iterable[int], optional, default=range(10, 25, 2)):
+            Numbers of qubits.
+
+        num_circuits (int, optional, default=16):
+            Size of the batch of parameters in ``batch`` mode.
+
+        num_layers (int, optional, default=2):
+            Layers of the circuits.
+
+        max_batch_bytes (int, optional, default=2**30):
+            The batch is reduced, to one state at least, to keep its states
+            within this many bytes.
+
+        seed (int, optional):
+            Random seed of the parameters.
+
+    Returns:
+        dict: A JSON-serializable report.
+    """
+    for mode in modes:
+        if mode not in MODES:
+            raise ValueError(f"unknown mode {mode!r}, expected one of {MODES}")
+
+    num_qubits = list(num_qubits)
+    results = {}
+    if 'batch' in modes:
+        results['batch'] = [
+            measure_batch(n, max(1, min(num_circuits, max_batch_bytes // (16 << n))),
+                          num_layers, seed=seed)
+            for n in num_qubits]
+    if 'sparse' in modes:
+        results['sparse'] = [measure_sparse(n, num_layers) for n in num_qubits]
+
+    return dict(
+        benchmark='gate',
+        **system_info(),
+        parameters=dict(num_qubits=num_qubits, num_circuits=num_circuits,
+                        num_layers=num_layers, max_batch_bytes=max_batch_bytes, seed=seed),
+        modes=results,
+        )
+
+
+def add_arguments(parser):
+    """Add the command-line arguments of this benchmark to ``parser``."""
+    parser.add_argument('--modes', nargs='+', default=list(MODES), choices=MODES,
+                        metavar='NAME', help="modes to measure (default: all)")
+    parser.add_argument('--num-qubits', nargs='+', type=int, default=list(range(10, 25, 2)),
+                        metavar='N', help="numbers of qubits (default: 10 12 ... 24)")
+    parser.add_argument('--num-circuits', type=int, default=16,
+                        help="batch size in batch mode (default: %(default)s)")
+    parser.add_argument('--num-layers', type=int, default=2,
+                        help="layers of the circuits (default: %(default)s)")
+    parser.add_argument('--max-batch-bytes', type=int, default=2**30,
+                        help="memory limit of a batch of states (default: %(default)s)")
+    parser.add_argument('--seed', type=int, help="random seed")
+
+
+def main(args):
+    """Run the benchmark from parsed command-line arguments, print a
+    summary and return the report."""
+    report = run(args.modes, num_qubits=args.num_qubits, num_circuits=args.num_circuits,
+                 num_layers=args.num_layers, max_batch_bytes=args.max_batch_bytes,
+                 seed=args.seed)
+
+    for mode, results in report['modes'].items():
+        for result in results:
+            times, memory = result['time'], result['memory']
+            print(f"{mode:>6} {result['num_qubits']:2} qubits:"
+                  f"  {times['reference']:8.4f}s -> {times[mode]:8.4f}s"
+                  f" ({times['reference'] / times[mode]:6.1f}x)"
+                  f"  {memory['reference'] / 2**20:8.1f} MiB -> {memory[mode] / 2**20:8.1f} MiB")
+
+    return report
@@ -0,0 +1,236 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Build, reweighting and decoding times of graph-algorithm problems.
+
+Each problem of :mod:`dwaveoceansdk.graphs` is timed against the model
+construction of the corresponding :mod:`dwave.graphs` function, on a random
+graph: building the binary quadratic model, updating it for new weights
+(rebuilt from scratch by :mod:`dwave.graphs`) and decoding the lowest-energy
+sample of a sample set of random samples. Building is timed both from the
+:class:`networkx.Graph` and from its CSR adjacency matrix.
+
+.. autosummary::
+
+    measure_problem
+    random_graph
+    run
+
+Run from the command line as ``python -m dwaveoceansdk.bench graphs``.
+"""
+
+import time
+
+from dwaveoceansdk.bench.utilities import system_info
+
+__all__ = ['PROBLEMS', 'measure_problem', 'random_graph', 'run']
+
+DESCRIPTION = "build, reweighting and decoding times of graph-algorithm problems"
+
+PROBLEMS = ('max_cut', 'independent_set', 'vertex_cover', 'vertex_coloring')
+
+NUM_COLORS = 4
+
+
+def random_graph(num_nodes, num_edges, seed=None):
+    """Random :class:`networkx.Graph` with ``num_nodes`` nodes and about
+    ``num_edges`` edges, with random ``'weight'`` edge and node
+    attributes."""
+    import networkx as nx
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    u = rng.integers(num_nodes, size=num_edges)
+    v = rng.integers(num_nodes, size=num_edges)
+    weights = rng.uniform(.5, 1.5, size=num_edges)
+
+    G = nx.Graph()
+    G.add_nodes_from((i, dict(weight=w))
+                     for i, w in enumerate(rng.uniform(.5, 1.5, size=num_nodes).tolist()))
+    G.add_weighted_edges_from((a, b, w) for a, b, w in zip(u.tolist(), v.tolist(),
+                                                           weights.tolist()) if a != b)
+    return G
+
+
+def _reference_bqm(problem, G, weight):
+    """Model as built by the :mod:`dwave.graphs` function of ``problem``."""
+    import dimod
+
+    if problem == 'max_cut':
+        h = {v: 0. for v in G}
+        J = {(u, v): G[u][v][weight] for u, v in G.edges}
+        return dimod.BinaryQuadraticModel.from_ising(h, J)
+    if problem in ('independent_set', 'vertex_cover'):
+        return dimod.generators.maximum_weight_independent_set(
+            G.edges, G.nodes(data=weight, default=1), strength_multiplier=2.0)
+    return dimod.generators.vertex_coloring(G, range(NUM_COLORS))
+
+
+def _reference_decode(problem, G, sampleset):
+    """Decode the lowest-energy sample as the :mod:`dwave.graphs` function
+    of ``problem``."""
+    sample = next(iter(sampleset))
+    if problem == 'max_cut':
+        return set(v for v in G if sample[v] >= 0)
+    if problem == 'independent_set':
+        return [v for v in sample if sample[v] > 0]
+    if problem == 'vertex_cover':
+        independent = set(v for v in sample if sample[v] > 0)
+        return [v for v in G if v not in independent]
+    return {v: c for (v, c), val in sample.items() if val}
+
+
+def _random_sampleset(bqm, num_reads, rng):
+    import dimod
+
+    samples = rng.integers(2, size=(num_reads, bqm.num_variables), dtype='int8')
+    if bqm.vartype is dimod.SPIN:
+        samples = 2 * samples - 1
+    return dimod.SampleSet.from_samples_bqm((samples, list(bqm.variables)), bqm)
+
+
+def _timed(func, *args):
+    t = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - t
+
+
+def measure_problem(problem, G, num_reads=10, seed=None):
+    """Time a problem on graph ``G`` against :mod:`dwave.graphs`.
+
+    Args:
+        problem (str): One of :data:`PROBLEMS`.
+        G (:class:`networkx.Graph`): Graph with ``'weight'`` attributes,
+            e.g. from :func:`random_graph`.
+        num_reads (int, optional, default=10): Samples decoded.
+        seed (int, optional): Random seed of the samples and new weights.
+
+    Returns:
+        dict: Seconds taken by ``dwave.graphs`` (``'reference'``) and by the
+        array-based problem (``'arrays'``) to build, reweight (but for
+        coloring, which has no weights) and decode. Building is also timed
+        from the graph's CSR adjacency matrix (``'csr'``).
+    """
+    import networkx as nx
+    import numpy as np
+    from dwaveoceansdk import graphs
+
+    if problem not in PROBLEMS:
+        raise ValueError(f"unknown problem {problem!r}, expected one of {PROBLEMS}")
+
+    rng = np.random.default_rng(seed)
+    weight = 'weight'
+
+    if problem == 'max_cut':
+        build = lambda graph: graphs.MaxCut(graph, weight=weight)
+    elif problem == 'independent_set':
+        build = lambda graph: graphs.IndependentSet(graph, weight=weight)
+    elif problem == 'vertex_cover':
+        build = lambda graph: graphs.VertexCover(graph, weight=weight)
+    else:
+        build = lambda graph: graphs.VertexColoring(graph, NUM_COLORS)
+
+    adjacency = nx.to_scipy_sparse_array(G, weight=weight, format='csr')
+
+    reference, reference_build = _timed(_reference_bqm, problem, G, weight)
+    instance, array_build = _timed(build, G)
+    _, csr_build = _timed(build, adjacency)
+
+    result = dict(num_nodes=G.number_of_nodes(), num_edges=G.number_of_edges(),
+                  num_variables=instance.bqm.num_variables,
+                  build=dict(reference=reference_build, arrays=array_build, csr=csr_build))
+
+    if problem != 'vertex_coloring':
+        # reweighting: dwave.graphs rebuilds the model from the graph
+        weights = rng.uniform(.5, 1.5, size=len(instance.weights))
+        _, reference_reweight = _timed(_reference_bqm, problem, G, weight)
+        _, array_reweight = _timed(instance.set_weights, weights)
+        result.update(reweight=dict(reference=reference_reweight, arrays=array_reweight))
+
+    reference_samples = _random_sampleset(reference, num_reads, rng)
+    samples = _random_sampleset(instance.bqm, num_reads, rng)
+    _, reference_decode = _timed(_reference_decode, problem, G, reference_samples)
+    _, array_decode = _timed(
+        lambda: instance._result(instance.decode(samples.truncate(1))[0]))
+    result.update(decode=dict(reference=reference_decode, arrays=array_decode))
+
+    return result
+
+
+def run(problems=PROBLEMS, num_nodes=20000, num_edges=100000, num_reads=10, seed=None):
+    """Measure each problem on one random graph.
+
+    Args:
+        problems (iterable[str], optional):
+            Problems to measure, by default all of :data:`PROBLEMS`.
+
+        num_nodes (int, optional, default=20000):
+            Number of nodes of the graph.
+
+        num_edges (int, optional, default=100000):
+            Number of random edges drawn; the few self-loops and repeats
+            are dropped.
+
+        num_reads (int, optional, default=10):
+            Number of samples decoded.
+
+        seed (int, optional):
+            Random seed of the graph, samples and weights.
+
+    Returns:
+        dict: A JSON-serializable report.
+    """
+    G = random_graph(num_nodes, num_edges, seed=seed)
+
+    return dict(
+        benchmark='graphs',
+        **system_info(),
+        parameters=dict(num_nodes=num_nodes, num_edges=num_edges, num_reads=num_reads,
+                        seed=seed),
+        problems={problem: measure_problem(problem, G, num_reads=num_reads, seed=seed)
+                  for problem in problems},
+        )
+
+
+def add_arguments(parser):
+    """Add the command-line arguments of this benchmark to ``parser``."""
+    parser.add_argument('--problems', nargs='+', default=list(PROBLEMS), choices=PROBLEMS,
+                        metavar='NAME', help="problems to measure (default: all)")
+    parser.add_argument('--num-nodes', type=int, default=20000,
+                        help="nodes of the random graph (default: %(default)s)")
+    parser.add_argument('--num-edges', type=int, default=100000,
+                        help="edges of the random graph (default: %(default)s)")
+    parser.add_argument('--num-reads', type=int, default=10,
+                        help="samples decoded (default: %(default)s)")
+    parser.add_argument('--seed', type=int, help="random seed")
+
+
+def main(args):
+    """Run the benchmark from parsed command-line arguments, print a
+    summary and return the report."""
+    report = run(args.problems, num_nodes=args.num_nodes, num_edges=args.num_edges,
+                 num_reads=args.num_reads, seed=args.seed)
+
+    for problem, result in report['problems'].items():
+        line = f"{problem:>16}:"
+        for stage in ('build', 'reweight', 'decode'):
+            if stage in result:
+                times = result[stage]
+                line += (f"  {stage} {times['reference']:7.3f}s -> {times['arrays']:7.4f}s"
+                         f" ({times['reference'] / times['arrays']:5.1f}x)")
+                if 'csr' in times:
+                    line += f" csr {times['csr']:7.4f}s"
+        print(line)
+
+    return report
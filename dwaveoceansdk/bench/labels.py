@@ -0,0 +1,192 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Memory per variable and lookup throughput of structured variable labels.
+
+The ``x_{i},{j}`` and ``y_{j}`` labels of the bin packing problem of the
+*Scaling for Production* section of the documentation are held as
+:class:`dimod.variables.Variables` of strings and as
+:class:`~dwaveoceansdk.labels.StructuredVariables`, with dense blocks or with
+sparse blocks. Memory is measured with :mod:`tracemalloc` and lookups are of
+randomly chosen labels.
+
+.. autosummary::
+
+    measure_labels
+    run
+
+Run from the command line as ``python -m dwaveoceansdk.bench labels``.
+"""
+
+import itertools
+import time
+import tracemalloc
+
+from dwaveoceansdk.bench.utilities import system_info
+
+__all__ = ['REPRESENTATIONS', 'measure_labels', 'run']
+
+DESCRIPTION = "memory per variable and lookup throughput of structured labels"
+
+SIZES = (100, 1000)
+
+REPRESENTATIONS = ('strings', 'dense', 'sparse')
+
+
+def _build(representation, n):
+    import numpy as np
+    from dimod.variables import Variables
+    from dwaveoceansdk.labels import StructuredVariables
+
+    if representation == 'strings':
+        return Variables(itertools.chain(
+            (f'x_{i},{j}' for i in range(n) for j in range(n)),
+            (f'y_{j}' for j in range(n))))
+
+    variables = StructuredVariables()
+    if representation == 'dense':
+        variables.add('x_{i},{j}', (n, n))
+        variables.add('y_{j}', (n,))
+    elif representation == 'sparse':
+        i, j = np.divmod(np.arange(n * n), n)
+        variables.add_from('x_{i},{j}', np.stack([i, j], axis=1))
+        variables.add_from('y_{j}', np.arange(n)[:, None])
+    else:
+        raise ValueError(f"unknown representation {representation!r}, "
+                         f"expected one of {REPRESENTATIONS}")
+    return variables
+
+
+def measure_labels(representation, n, num_lookups=100000, seed=None):
+    """Measure the labels of a bin packing problem of ``n`` items.
+
+    Args:
+        representation (str): ``'strings'``, ``'dense'`` or ``'sparse'``.
+        n (int): Number of items, for ``n*n + n`` variables.
+        num_lookups (int, optional, default=100000): Labels looked up.
+        seed (int, optional): Random seed of the looked-up labels.
+
+    Returns:
+        dict: Bytes per variable, build time and lookups per second, one
+        label at a time and, for structured labels, in bulk from labels and
+        from integer fields.
+    """
+    import numpy as np
+
+    if representation not in REPRESENTATIONS:
+        raise ValueError(f"unknown representation {representation!r}, "
+                         f"expected one of {REPRESENTATIONS}")
+
+    _build(representation, 0)  # imports and templates outside of the measurement
+
+    tracemalloc.start()
+    try:
+        t = time.perf_counter()
+        variables = _build(representation, n)
+        build_time = time.perf_counter() - t
+        memory, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    num_variables = n * n + n
+    rng = np.random.default_rng(seed)
+    i = rng.integers(n, size=num_lookups)
+    j = rng.integers(n, size=num_lookups)
+    labels = [f'x_{a},{b}' for a, b in zip(i.tolist(), j.tolist())]
+
+    t = time.perf_counter()
+    for label in labels:
+        variables.index(label)
+    lookup_time = time.perf_counter() - t
+
+    result = dict(num_variables=num_variables,
+                  bytes_per_variable=memory / num_variables,
+                  build_time=build_time,
+                  lookups_per_second=num_lookups / lookup_time)
+
+    if representation != 'strings':
+        t = time.perf_counter()
+        variables.indices(labels)
+        result.update(bulk_lookups_per_second=num_lookups / (time.perf_counter() - t))
+
+        x = variables.blocks[0]
+        t = time.perf_counter()
+        x.index(i, j)
+        result.update(field_lookups_per_second=num_lookups / (time.perf_counter() - t))
+
+    return result
+
+
+def run(sizes=SIZES, representations=REPRESENTATIONS, num_lookups=100000, seed=None):
+    """Measure each representation of the labels at each size.
+
+    Args:
+        sizes (iterable[int], optional, default=(100, 1000)):
+            Numbers of items of the bin packing problems.
+
+        representations (iterable[str], optional):
+            Representations to measure, by default all of
+            :data:`REPRESENTATIONS`.
+
+        num_lookups (int, optional, default=100000):
+            Number of labels looked up per measurement.
+
+        seed (int, optional):
+            Random seed of the looked-up labels.
+
+    Returns:
+        dict: A JSON-serializable report.
+    """
+    results = {}
+    for representation in representations:
+        results[representation] = {
+            str(n): measure_labels(representation, n, num_lookups=num_lookups, seed=seed)
+            for n in sizes}
+
+    return dict(
+        benchmark='labels',
+        **system_info(),
+        parameters=dict(sizes=list(sizes), num_lookups=num_lookups, seed=seed),
+        representations=results,
+        )
+
+
+def add_arguments(parser):
+    """Add the command-line arguments of this benchmark to ``parser``."""
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES), metavar='N',
+                        help="numbers of items (default: %(default)s)")
+    parser.add_argument('--representations', nargs='+', default=list(REPRESENTATIONS),
+                        choices=REPRESENTATIONS, metavar='NAME',
+                        help="representations to measure (default: all)")
+    parser.add_argument('--num-lookups', type=int, default=100000,
+                        help="labels looked up per measurement (default: %(default)s)")
+    parser.add_argument('--seed', type=int, help="random seed of the looked-up labels")
+
+
+def main(args):
+    """Run the benchmark from parsed command-line arguments, print a
+    summary and return the report."""
+    report = run(args.sizes, args.representations, num_lookups=args.num_lookups,
+                 seed=args.seed)
+
+    for representation, results in report['representations'].items():
+        for n, result in results.items():
+            line = (f"{representation:>8} n={n:>6}: {result['bytes_per_variable']:8.2f} B/variable"
+                    f"  {result['lookups_per_second']:12,.0f} lookups/s")
+            if 'bulk_lookups_per_second' in result:
+                line += (f"  bulk {result['bulk_lookups_per_second']:12,.0f}/s"
+                         f"  fields {result['field_lookups_per_second']:14,.0f}/s")
+            print(line)
+
+    return report
@@ -0,0 +1,277 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wall time of evaluating batches of states of nonlinear models.
+
+Random states of the traveling-salesperson (``tsp``) and capacitated
+vehicle-routing (``cvrp``) models of :mod:`dwave.optimization.generators`
+are evaluated
+
+*   as the reference, by loading each state into ``model.states`` and
+    reading its objective and constraints;
+*   by :class:`~dwaveoceansdk.nonlinear.StateBatch`, for the whole batch.
+
+A fraction of the states is then changed by reversing a segment of one
+route, as a 2-opt move does, and re-evaluated by the reference and by
+:meth:`~dwaveoceansdk.nonlinear.StateBatch.update`.
+
+.. autosummary::
+
+    cvrp_model
+    measure_model
+    move_states
+    random_states
+    run
+    tsp_model
+
+Run from the command line as ``python -m dwaveoceansdk.bench nonlinear``.
+"""
+
+import time
+
+from dwaveoceansdk.bench.utilities import system_info
+
+__all__ = ['MODELS', 'cvrp_model', 'measure_model', 'move_states', 'random_states', 'run',
+           'tsp_model']
+
+DESCRIPTION = "wall time of batched and incremental evaluation of nonlinear models"
+
+MODELS = ('tsp', 'cvrp')
+
+
+def _distances(num_locations, rng):
+    points = rng.uniform(size=(num_locations, 2))
+    return ((points[:, None] - points[None, :]) ** 2).sum(axis=-1) ** .5
+
+
+def tsp_model(num_cities, seed=None):
+    """Traveling-salesperson model of ``num_cities`` random points in the
+    unit square."""
+    import numpy as np
+    from dwave.optimization.generators import traveling_salesperson
+
+    return traveling_salesperson(_distances(num_cities, np.random.default_rng(seed)))
+
+
+def cvrp_model(num_customers, num_vehicles=None, seed=None):
+    """Capacitated vehicle-routing model of ``num_customers`` random
+    customers and a depot in the unit square, with one vehicle per ten
+    customers by default and a capacity of a quarter more than the
+    average demand per vehicle."""
+    import numpy as np
+    from dwave.optimization.generators import capacitated_vehicle_routing
+
+    rng = np.random.default_rng(seed)
+    if num_vehicles is None:
+        num_vehicles = max(2, num_customers // 10)
+    demand = np.concatenate(([0], rng.integers(1, 10, num_customers)))
+    return capacitated_vehicle_routing(
+        demand, num_vehicles, vehicle_capacity=int(1.25 * demand.sum() / num_vehicles) + 1,
+        distances=_distances(num_customers + 1, rng))
+
+
+def random_states(model, num_states, seed=None):
+    """Random states of the single list or disjoint-lists decision of
+    ``model``."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    (decision,) = model.iter_decisions()
+    if type(decision).__name__ == 'ListVariable':
+        (size,) = decision.shape()
+        return [rng.permutation(size) for _ in range(num_states)]
+
+    size, num_lists = decision.primary_set_size(), decision.num_disjoint_lists()
+    return [np.split(rng.permutation(size), np.sort(rng.integers(0, size + 1, num_lists - 1)))
+            for _ in range(num_states)]
+
+
+def move_states(states, fraction=.1, seed=None):
+    """Rows and new states of a ``fraction`` of ``states``, each with a
+    segment of one of its routes reversed."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    rows = np.sort(rng.choice(len(states), max(1, int(fraction * len(states))), replace=False))
+
+    def move(route):
+        route = np.array(route)
+        i, j = np.sort(rng.integers(0, len(route) + 1, 2))
+        route[i:j] = route[i:j][::-1].copy()
+        return route
+
+    moved = []
+    for row in rows.tolist():
+        state = states[row]
+        if isinstance(state, list):
+            # the longest route of a disjoint-lists state
+            k = max(range(len(state)), key=lambda k: len(state[k]))
+            moved.append(state[:k] + [move(state[k])] + state[k + 1:])
+        else:
+            moved.append(move(state))
+    return rows, moved
+
+
+def _reference(model, states):
+    """Objective and feasibility of each state, loaded one at a time."""
+    import numpy as np
+
+    (decision,) = model.iter_decisions()
+    with model.lock():
+        model.states.resize(len(states))
+        for i, state in enumerate(states):
+            decision.set_state(i, state)
+        objective = [model.objective.state(i) for i in range(len(states))]
+        feasible = [model.feasible(i) for i in range(len(states))]
+    return np.asarray(objective), np.asarray(feasible)
+
+
+def _timed(func, *args, repeat=1):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        result = func(*args)
+        times.append(time.perf_counter() - t)
+    return result, min(times)
+
+
+def measure_model(name, size, num_states=1000, fraction=.1, repeat=3, seed=None):
+    """Time to evaluate a batch of states and to re-evaluate some after a
+    move.
+
+    Args:
+        name (str): ``'tsp'`` or ``'cvrp'``.
+        size (int): Number of cities or customers.
+        num_states (int, optional, default=1000): Size of the batch.
+        fraction (float, optional, default=0.1): Fraction of states moved.
+        repeat (int, optional, default=3): Best of this many runs is kept.
+        seed (int, optional): Random seed of the model and states.
+
+    Returns:
+        dict: Seconds to evaluate the batch (``'evaluate'``) and to
+        re-evaluate the moved states (``'update'``) by the reference and
+        by :class:`~dwaveoceansdk.nonlinear.StateBatch`, the symbols the
+        update re-evaluated, and the largest difference between the
+        objectives (``'max_error'``).
+    """
+    import numpy as np
+    from dwaveoceansdk.nonlinear import StateBatch
+
+    if name not in MODELS:
+        raise ValueError(f"unknown model {name!r}, expected one of {MODELS}")
+
+    model = (tsp_model if name == 'tsp' else cvrp_model)(size, seed=seed)
+    (decision,) = model.iter_decisions()
+    index = decision.topological_index()
+
+    states = random_states(model, num_states, seed)
+    rows, moved = move_states(states, fraction, seed)
+    original = [states[row] for row in rows.tolist()]
+
+    _, reference_time = _timed(_reference, model, states, repeat=repeat)
+    batch, batch_time = _timed(StateBatch, model, [states], repeat=repeat)
+
+    _, reference_update = _timed(_reference, model, moved, repeat=repeat)
+    update_times = []
+    for _ in range(repeat):
+        batch.update({index: original}, rows)
+        evaluated, update_time = _timed(batch.update, {index: moved}, rows)
+        update_times.append(update_time)
+
+    for row, state in zip(rows.tolist(), moved):
+        states[row] = state
+    objective, feasible = _reference(model, states)
+
+    return dict(
+        model=name, size=size, num_states=num_states, num_moved=len(rows),
+        num_symbols=model.num_symbols(), num_evaluated=len(evaluated),
+        time=dict(evaluate=dict(reference=reference_time, batch=batch_time),
+                  update=dict(reference=reference_update, batch=min(update_times))),
+        max_error=float(np.abs(batch.objective - objective).max()),
+        feasible_match=bool((batch.feasible == feasible).all()),
+        )
+
+
+def run(models=MODELS, sizes=(50, 100, 200), num_states=1000, fraction=.1, repeat=3,
+        seed=None):
+    """Measure each model for each size.
+
+    Args:
+        models (iterable[str], optional):
+            Models to measure, by default all of :data:`MODELS`.
+
+        sizes (iterable[int], optional, default=(50, 100, 200)):
+            Numbers of cities or customers.
+
+        num_states (int, optional, default=1000):
+            Size of the batch of states.
+
+        fraction (float, optional, default=0.1):
+            Fraction of the states moved and re-evaluated.
+
+        repeat (int, optional, default=3):
+            Number of runs of each measurement, the best of which is kept.
+
+        seed (int, optional):
+            Random seed of the models and states.
+
+    Returns:
+        dict: A JSON-serializable report.
+    """
+    for name in models:
+        if name not in MODELS:
+            raise ValueError(f"unknown model {name!r}, expected one of {MODELS}")
+
+    sizes = list(sizes)
+    return dict(
+        benchmark='nonlinear',
+        **system_info(),
+        parameters=dict(sizes=sizes, num_states=num_states, fraction=fraction, repeat=repeat,
+                        seed=seed),
+        models={name: [measure_model(name, size, num_states, fraction, repeat, seed)
+                       for size in sizes]
+                for name in models},
+        )
+
+
+def add_arguments(parser):
+    """Add the command-line arguments of this benchmark to ``parser``."""
+    parser.add_argument('--models', nargs='+', default=list(MODELS), choices=MODELS,
+                        metavar='NAME', help="models to measure (default: all)")
+    parser.add_argument('--sizes', nargs='+', type=int, default=[50, 100, 200],
+                        metavar='N', help="cities or customers (default: 50 100 200)")
+    parser.add_argument('--num-states', type=int, default=1000,
+                        help="size of the batch of states (default: %(default)s)")
+    parser.add_argument('--fraction', type=float, default=.1,
+                        help="fraction of states moved (default: %(default)s)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="runs per measurement (default: %(default)s)")
+    parser.add_argument('--seed', type=int, help="random seed")
+
+
+def main(args):
+    """Run the benchmark from parsed command-line arguments, print a
+    summary and return the report."""
+    report = run(args.models, sizes=args.sizes, num_states=args.num_states,
+                 fraction=args.fraction, repeat=args.repeat, seed=args.seed)
+
+    for name, results in report['models'].items():
+        for result in results:
+            line = f"{name:>4} {result['size']:4}:"
+            for stage, times in result['time'].items():
+                line += (f"  {stage} {times['reference']:8.4f}s -> {times['batch']:8.4f}s"
+                         f" ({times['reference'] / times['batch']:5.1f}x)")
+            print(line + f"  {result['num_evaluated']}/{result['num_symbols']} symbols")
+
+    return report
@@ -0,0 +1,338 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""End-to-end throughput of the QPU pipelines on a mocked QPU.
+
+Problems are pushed through ``EmbeddingComposite(DWaveSampler())`` and
+through a ``dwave-hybrid`` workflow with a QPU subproblem sampler while
+:func:`~dwaveoceansdk.testing.mock_qpu` is active, so no network access or
+credentials are needed.
+
+.. autosummary::
+
+    StageTimer
+    generate_problems
+    run_embedding_pipeline
+    run_hybrid_pipeline
+    run
+
+Run from the command line as ``python -m dwaveoceansdk.bench pipeline``.
+"""
+
+import collections
+import contextlib
+import statistics
+import time
+
+from dwaveoceansdk.bench.utilities import system_info
+from dwaveoceansdk.testing import mock_qpu
+
+__all__ = ['StageTimer', 'generate_problems', 'run_embedding_pipeline', 'run_hybrid_pipeline',
+           'run']
+
+DESCRIPTION = "offline end-to-end pipeline throughput on a mocked QPU"
+
+PIPELINES = ('embedding', 'hybrid')
+
+
+class StageTimer:
+    """Collect the durations of named pipeline stages.
+
+    Examples:
+        >>> timer = StageTimer()
+        >>> with timer('sampling'):
+        ...     pass
+        >>> timer.summary()['sampling']['count']
+        1
+    """
+    def __init__(self):
+        self.durations = collections.defaultdict(list)
+
+    @contextlib.contextmanager
+    def __call__(self, stage):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[stage].append(time.perf_counter() - t)
+
+    def add(self, stage, duration):
+        """Record a ``duration`` in seconds measured elsewhere for ``stage``."""
+        self.durations[stage].append(duration)
+
+    def summary(self):
+        """Return the count, total, mean, median and maximum duration of
+        each stage, in seconds."""
+        return {stage: dict(count=len(durations),
+                            total=sum(durations),
+                            mean=statistics.mean(durations),
+                            median=statistics.median(durations),
+                            max=max(durations))
+                for stage, durations in self.durations.items()}
+
+
+def generate_problems(num_problems, num_variables, density=0.5, seed=None):
+    """Generate random Ising problems as binary quadratic models.
+
+    Args:
+        num_problems (int): Number of problems.
+        num_variables (int): Number of variables in each problem.
+        density (float, optional, default=0.5):
+            Probability of each interaction being present.
+        seed (int, optional): Random seed.
+
+    Returns:
+        list[:class:`~dimod.BinaryQuadraticModel`]
+    """
+    import dimod
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    return [dimod.generators.gnp_random_bqm(num_variables, density, 'SPIN',
+                                            random_state=int(rng.integers(2**32)))
+            for _ in range(num_problems)]
+
+
+def _pipeline_report(num_problems, elapsed, timer):
+    return dict(num_problems=num_problems,
+                elapsed=elapsed,
+                problems_per_second=num_problems / elapsed if elapsed else float('inf'),
+                stages=timer.summary())
+
+
+def run_embedding_pipeline(problems, qpu=None, num_reads=100):
+    """Sample each problem with ``EmbeddingComposite(DWaveSampler())``.
+
+    The following stages are timed for every problem:
+
+    * ``embedding``: finding the minor embedding and embedding the problem.
+    * ``sampling``: sampling the embedded problem on the QPU sampler.
+    * ``unembedding``: resolving chains back to the source variables.
+    * ``postprocessing``: aggregating the unembedded samples and selecting
+      the lowest-energy sample.
+
+    Args:
+        problems (iterable[:class:`~dimod.BinaryQuadraticModel`]):
+            Problems to sample.
+
+        qpu (:class:`dimod.Sampler`, optional):
+            Structured sampler to embed on. Defaults to ``DWaveSampler()``,
+            which is a mock inside a :func:`~dwaveoceansdk.testing.mock_qpu`
+            context.
+
+        num_reads (int, optional, default=100):
+            Number of reads per problem.
+
+    Returns:
+        dict: Number of problems, elapsed time, problems per second and
+        a per-stage latency summary. Times are in seconds.
+    """
+    import minorminer
+    from dwave.system import DWaveSampler, EmbeddingComposite
+
+    problems = list(problems)
+    timer = StageTimer()
+
+    if qpu is None:
+        qpu = DWaveSampler()
+
+    sample = qpu.sample
+
+    def timed_sample(bqm, **parameters):
+        with timer('sampling'):
+            sampleset = sample(bqm, **parameters)
+            sampleset.resolve()
+        return sampleset
+
+    find_embedding_durations = []
+
+    def find_embedding(S, T, **parameters):
+        t = time.perf_counter()
+        embedding = minorminer.find_embedding(S, T, **parameters)
+        find_embedding_durations.append(time.perf_counter() - t)
+        return embedding
+
+    # shadow the method on this instance only, until the problems are done
+    qpu.sample = timed_sample
+    try:
+        sampler = EmbeddingComposite(qpu, find_embedding=find_embedding)
+
+        t = time.perf_counter()
+        for bqm in problems:
+            sampleset = sampler.sample(bqm, num_reads=num_reads, return_embedding=True)
+            sampleset.resolve()
+
+            with timer('postprocessing'):
+                sampleset.aggregate().first
+
+            # EmbeddingComposite times embedding the problem and unembedding
+            # the samples itself
+            composite_timing = sampleset.info['embedding_context']['timing']
+            timer.add('embedding',
+                      find_embedding_durations.pop() + composite_timing['embedding'])
+            timer.add('unembedding', composite_timing['unembedding'])
+        elapsed = time.perf_counter() - t
+    finally:
+        del qpu.sample
+
+    return _pipeline_report(len(problems), elapsed, timer)
+
+
+def run_hybrid_pipeline(problems, num_reads=100, subproblem_size=10, max_iter=5):
+    """Solve each problem with a ``dwave-hybrid`` workflow that races tabu
+    search against QPU-sampled subproblems.
+
+    The workflow is the one used in the smoke tests with the simulated
+    annealing subproblem sampler replaced by
+    :class:`~hybrid.samplers.QPUSubproblemAutoEmbeddingSampler`. Stages are
+    the runnables of the workflow, timed with their own ``dispatch.next``
+    timers; composite runnables such as ``Loop`` include the time of their
+    children.
+
+    Args:
+        problems (iterable[:class:`~dimod.BinaryQuadraticModel`]):
+            Problems to solve.
+
+        num_reads (int, optional, default=100):
+            Number of reads per QPU subproblem.
+
+        subproblem_size (int, optional, default=10):
+            Number of variables in each QPU subproblem.
+
+        max_iter (int, optional, default=5):
+            Maximum number of workflow iterations per problem.
+
+    Returns:
+        dict: Number of problems, elapsed time, problems per second and
+        a per-stage latency summary. Times are in seconds.
+    """
+    import hybrid
+    from hybrid.profiling import iter_inorder
+
+    problems = list(problems)
+
+    subproblem = (hybrid.EnergyImpactDecomposer(size=subproblem_size)
+                  | hybrid.QPUSubproblemAutoEmbeddingSampler(num_reads=num_reads)
+                  | hybrid.SplatComposer())
+    workflow = hybrid.Loop(hybrid.Race(hybrid.InterruptableTabuSampler(), subproblem)
+                           | hybrid.ArgMin(), max_iter=max_iter, convergence=3)
+
+    t = time.perf_counter()
+    for bqm in problems:
+        workflow.run(hybrid.State.from_problem(bqm)).result()
+    elapsed = time.perf_counter() - t
+
+    timer = StageTimer()
+    for runnable in iter_inorder(workflow):
+        for duration in runnable.timers.get('dispatch.next', []):
+            timer.add(runnable.name, duration)
+
+    return _pipeline_report(len(problems), elapsed, timer)
+
+
+def run(pipelines=PIPELINES, num_problems=10, num_variables=20, density=0.5, num_reads=100,
+        topology_type='pegasus', topology_shape=None, seed=None):
+    """Run the pipelines on a mocked QPU.
+
+    Args:
+        pipelines (iterable[str], optional, default=('embedding', 'hybrid')):
+            Pipelines to run.
+
+        num_problems (int, optional, default=10):
+            Number of problems pushed through each pipeline.
+
+        num_variables (int, optional, default=20):
+            Number of variables per problem.
+
+        density (float, optional, default=0.5):
+            Interaction density of the problems.
+
+        num_reads (int, optional, default=100):
+            Number of reads per QPU call.
+
+        topology_type (str, optional, default='pegasus'):
+            Topology of the mocked QPU.
+
+        topology_shape (list[int], optional):
+            Shape of the mocked QPU's topology. Defaults to the
+            :class:`~dwave.system.testing.MockDWaveSampler` default.
+
+        seed (int, optional):
+            Random seed used to generate the problems.
+
+    Returns:
+        dict: A JSON-serializable report.
+    """
+    problems = generate_problems(num_problems, num_variables, density=density, seed=seed)
+
+    mock_parameters = dict(topology_type=topology_type)
+    if topology_shape is not None:
+        mock_parameters.update(topology_shape=list(topology_shape))
+
+    results = {}
+    with mock_qpu(**mock_parameters):
+        for pipeline in pipelines:
+            if pipeline == 'embedding':
+                results[pipeline] = run_embedding_pipeline(problems, num_reads=num_reads)
+            elif pipeline == 'hybrid':
+                results[pipeline] = run_hybrid_pipeline(problems, num_reads=num_reads)
+            else:
+                raise ValueError(f"unknown pipeline {pipeline!r}, expected one of {PIPELINES}")
+
+    return dict(
+        benchmark='pipeline',
+        **system_info(),
+        parameters=dict(num_problems=num_problems, num_variables=num_variables,
+                        density=density, num_reads=num_reads, seed=seed,
+                        topology_type=topology_type, topology_shape=topology_shape),
+        pipelines=results,
+        )
+
+
+def add_arguments(parser):
+    """Add the command-line arguments of this benchmark to ``parser``."""
+    parser.add_argument('--pipelines', nargs='+', choices=PIPELINES, default=list(PIPELINES),
+                        help="pipelines to run (default: all)")
+    parser.add_argument('--num-problems', type=int, default=10,
+                        help="number of problems per pipeline (default: %(default)s)")
+    parser.add_argument('--num-variables', type=int, default=20,
+                        help="number of variables per problem (default: %(default)s)")
+    parser.add_argument('--density', type=float, default=0.5,
+                        help="interaction density of the problems (default: %(default)s)")
+    parser.add_argument('--num-reads', type=int, default=100,
+                        help="number of reads per QPU call (default: %(default)s)")
+    parser.add_argument('--topology-type', default='pegasus',
+                        choices=['chimera', 'pegasus', 'zephyr'],
+                        help="topology of the mocked QPU (default: %(default)s)")
+    parser.add_argument('--topology-shape', type=int, nargs='+', metavar='N',
+                        help="shape of the mocked QPU's topology")
+    parser.add_argument('--seed', type=int, help="random seed for the generated problems")
+
+
+def main(args):
+    """Run the benchmark from parsed command-line arguments, print a
+    summary and return the report."""
+    report = run(args.pipelines, num_problems=args.num_problems,
+                 num_variables=args.num_variables, density=args.density,
+                 num_reads=args.num_reads, topology_type=args.topology_type,
+                 topology_shape=args.topology_shape, seed=args.seed)
+
+    for pipeline, result in report['pipelines'].items():
+        print(f"{pipeline}: {result['problems_per_second']:.2f} problems/s "
+              f"({result['num_problems']} problems in {result['elapsed']:.3f} s)")
+        for stage, summary in result['stages'].items():
+            print(f"    {stage:<40} mean {summary['mean'] * 1e3:9.2f} ms  "
+                  f"max {summary['max'] * 1e3:9.2f} ms")
+
+    return report
@@ -0,0 +1,180 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Speedup of ``dwave-hybrid`` branches in worker processes over threads.
+
+For each worker count, as many CPU-bound branches, each a loop of energy
+impact decomposition, simulated annealing of the subproblem and
+composition, run once under :class:`hybrid.Parallel` with threads and once
+under :class:`~dwaveoceansdk.processes.ProcessParallel` with a pool of that
+many worker processes. Speedups above one need as many CPUs as workers.
+
+.. autosummary::
+
+    make_branch
+    measure
+    run
+
+Run from the command line as ``python -m dwaveoceansdk.bench processes``.
+"""
+
+import os
+import time
+
+from dwaveoceansdk.bench.utilities import system_info
+
+__all__ = ['make_branch', 'measure', 'run']
+
+DESCRIPTION = "hybrid branches in worker processes versus threads"
+
+EXECUTORS = ('threads', 'processes')
+
+
+def make_branch(subproblem_size=50, num_iterations=10, num_sweeps=100):
+    """Return a CPU-bound branch that runs ``num_iterations`` iterations of
+    energy impact decomposition, simulated annealing of the subproblem and
+    composition."""
+    import hybrid
+
+    return hybrid.Loop(hybrid.EnergyImpactDecomposer(size=subproblem_size)
+                       | hybrid.SimulatedAnnealingSubproblemSampler(num_sweeps=num_sweeps)
+                       | hybrid.SplatComposer()
+                       # the next subproblem's annealing starts from random states
+                       | hybrid.Const(subsamples=None),
+                       max_iter=num_iterations)
+
+
+def measure(executor, state, num_branches, pool=None, **branch_parameters):
+    """Return the seconds taken to run ``num_branches`` branches made by
+    :func:`make_branch` in parallel on ``state``.
+
+    Args:
+        executor (str): ``'threads'`` or ``'processes'``.
+        state (:class:`~hybrid.core.State`): Input state.
+        num_branches (int): Number of branches.
+        pool (:class:`~dwaveoceansdk.processes.ProcessPool`, optional):
+            Worker processes for the ``'processes'`` executor.
+        **branch_parameters: Passed to :func:`make_branch`.
+    """
+    import hybrid
+    from dwaveoceansdk.processes import ProcessParallel
+
+    branches = [make_branch(**branch_parameters) for _ in range(num_branches)]
+
+    if executor == 'threads':
+        workflow = hybrid.Parallel(*branches)
+    elif executor == 'processes':
+        workflow = ProcessParallel(*branches, pool=pool)
+    else:
+        raise ValueError(f"unknown executor {executor!r}, expected one of {EXECUTORS}")
+
+    t = time.perf_counter()
+    workflow.run(state).result()
+    return time.perf_counter() - t
+
+
+def run(worker_counts=(4, 8, 16), num_variables=1000, degree=3, subproblem_size=50,
+        num_iterations=10, num_sweeps=100, seed=None):
+    """Compare thread and process execution for each worker count.
+
+    Args:
+        worker_counts (iterable[int], optional, default=(4, 8, 16)):
+            Numbers of branches, and of worker processes, to run.
+
+        num_variables (int, optional, default=1000):
+            Number of variables of the problem, a RAN1 problem on a random
+            regular graph.
+
+        degree (int, optional, default=3):
+            Degree of the problem's variables.
+
+        subproblem_size (int, optional, default=50):
+            Number of variables in each subproblem.
+
+        num_iterations (int, optional, default=10):
+            Number of iterations of each branch.
+
+        num_sweeps (int, optional, default=100):
+            Number of simulated annealing sweeps per subproblem.
+
+        seed (int, optional):
+            Random seed of the problem.
+
+    Returns:
+        dict: A JSON-serializable report.
+    """
+    import dimod
+    import hybrid
+    import networkx as nx
+    from dwaveoceansdk.processes import ProcessPool
+
+    bqm = dimod.generators.ran_r(1, nx.random_regular_graph(degree, num_variables, seed=seed),
+                                 seed=seed)
+    state = hybrid.State.from_problem(bqm)
+    branch_parameters = dict(subproblem_size=subproblem_size, num_iterations=num_iterations,
+                             num_sweeps=num_sweeps)
+
+    results = {}
+    for num_workers in worker_counts:
+        threads = measure('threads', state, num_workers, **branch_parameters)
+
+        with ProcessPool(num_workers) as pool:
+            # start the workers and import the branches' packages in them
+            measure('processes', state, num_workers, pool=pool,
+                    **dict(branch_parameters, num_iterations=1))
+            processes = measure('processes', state, num_workers, pool=pool,
+                                **branch_parameters)
+
+        results[str(num_workers)] = dict(threads=threads, processes=processes,
+                                         speedup=threads / processes)
+
+    return dict(
+        benchmark='processes',
+        **system_info(),
+        cpu_count=os.cpu_count(),
+        parameters=dict(num_variables=num_variables, degree=degree,
+                        subproblem_size=subproblem_size, num_iterations=num_iterations,
+                        num_sweeps=num_sweeps, seed=seed),
+        workers=results,
+        )
+
+
+def add_arguments(parser):
+    """Add the command-line arguments of this benchmark to ``parser``."""
+    parser.add_argument('--workers', type=int, nargs='+', default=[4, 8, 16], metavar='N',
+                        help="numbers of branches and worker processes (default: 4 8 16)")
+    parser.add_argument('--num-variables', type=int, default=1000,
+                        help="number of variables of the problem (default: %(default)s)")
+    parser.add_argument('--subproblem-size', type=int, default=50,
+                        help="number of variables per subproblem (default: %(default)s)")
+    parser.add_argument('--num-iterations', type=int, default=10,
+                        help="number of iterations of each branch (default: %(default)s)")
+    parser.add_argument('--num-sweeps', type=int, default=100,
+                        help="annealing sweeps per subproblem (default: %(default)s)")
+    parser.add_argument('--seed', type=int, help="random seed of the problem")
+
+
+def main(args):
+    """Run the benchmark from parsed command-line arguments, print a
+    summary and return the report."""
+    report = run(args.workers, num_variables=args.num_variables,
+                 subproblem_size=args.subproblem_size, num_iterations=args.num_iterations,
+                 num_sweeps=args.num_sweeps, seed=args.seed)
+
+    print(f"{report['cpu_count']} CPUs")
+    for num_workers, result in report['workers'].items():
+        print(f"{num_workers:>3} workers: threads {result['threads']:8.3f} s  "
+              f"processes {result['processes']:8.3f} s  speedup {result['speedup']:5.2f}x")
+
+    return report
@@ -0,0 +1,549 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Performance regression gate between two sets of pinned components.
+
+The component pins of a baseline and a candidate ``setup.cfg`` (a file, or
+the file at a git revision) are installed into isolated virtual
+environments, and a fixed suite of workloads is timed in each:
+
+*   ``cqm_build``: the bin packing CQM of the *Scaling for Production*
+    section of the documentation;
+*   ``bqm_energies``: energies of a batch of samples of a random BQM;
+*   ``simulated_annealing``: simulated annealing of a random BQM;
+*   ``roof_duality``: roof duality of a random BQM;
+*   ``hybrid_loop``: a ``dwave-hybrid`` loop of decomposition, simulated
+    annealing of the subproblem and composition;
+*   ``embedding``: minor embedding of a random graph on a mock Pegasus
+    QPU graph.
+
+Measurements alternate between the environments, each in a fresh
+interpreter, so that drift of the machine affects both alike. A workload
+regresses when the median time of the candidate exceeds that of the
+baseline by more than a threshold, and a Mann-Whitney U test finds the
+difference significant. The command exits with a nonzero status if any
+workload regresses. Nothing is measured if the pins are the same.
+
+.. autosummary::
+
+    compare
+    create_environment
+    load_pins
+    mann_whitney_u
+    measure_environment
+    run
+
+Run from the command line as ``python -m dwaveoceansdk.bench regression``,
+for example ``--baseline 9.3.0 --candidate setup.cfg`` to compare the
+pins of the working tree against those of a release tag.
+"""
+
+import configparser
+import contextlib
+import hashlib
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import venv
+import warnings
+
+from importlib.metadata import PackageNotFoundError, version
+
+from dwaveoceansdk.bench.components import COMPONENTS
+from dwaveoceansdk.bench.utilities import parse_pin, run_probe, system_info
+
+__all__ = ['WORKLOADS', 'compare', 'create_environment', 'load_pins', 'mann_whitney_u',
+           'measure_environment', 'run']
+
+DESCRIPTION = "performance regression gate between two sets of pinned components"
+
+
+# Each workload takes a scale of its problem size, builds its problem and
+# returns the call to time. Only the pinned components are used, through
+# APIs that are stable across releases, so that any pin set can run them.
+
+def _cqm_build(scale):
+    import numpy as np
+    from dwaveoceansdk.bench.construction import bin_packing_reference
+
+    weights = np.random.default_rng(0).integers(1, 10, max(2, int(100 * scale)))
+    return lambda: bin_packing_reference(weights.tolist())
+
+
+def _random_bqm(num_variables, p):
+    import dimod
+
+    return dimod.generators.gnp_random_bqm(max(2, num_variables), p, 'SPIN', random_state=0)
+
+
+def _bqm_energies(scale):
+    import numpy as np
+
+    bqm = _random_bqm(int(1000 * scale), .05)
+    samples = np.random.default_rng(0).choice(np.array([-1, 1], dtype=np.int8),
+                                              (1000, bqm.num_variables))
+    return lambda: bqm.energies((samples, bqm.variables))
+
+
+def _simulated_annealing(scale):
+    from dwave.samplers import SimulatedAnnealingSampler
+
+    bqm = _random_bqm(int(500 * scale), .05)
+    sampler = SimulatedAnnealingSampler()
+    return lambda: sampler.sample(bqm, num_reads=20, num_sweeps=200, seed=0)
+
+
+def _roof_duality(scale):
+    from dwave.preprocessing.lower_bounds import roof_duality
+
+    bqm = _random_bqm(int(10000 * scale), .001)
+    return lambda: roof_duality(bqm)
+
+
+def _hybrid_loop(scale):
+    import hybrid
+
+    bqm = _random_bqm(int(200 * scale), .05)
+    workflow = hybrid.Loop(
+        hybrid.EnergyImpactDecomposer(size=min(20, bqm.num_variables))
+        # not the samples of the previous subproblem as initial states
+        | hybrid.Const(subsamples=None)
+        | hybrid.SimulatedAnnealingSubproblemSampler(num_reads=10, num_sweeps=100)
+        | hybrid.SplatComposer(),
+        max_iter=10)
+    state = hybrid.State.from_problem(bqm)
+    return lambda: workflow.run(state).result()
+
+
+def _embedding(scale):
+    import minorminer
+    import networkx as nx
+    from dwave.system.testing import MockDWaveSampler
+
+    target = MockDWaveSampler(topology_type='pegasus', topology_shape=[6]).edgelist
+    source = nx.random_regular_graph(3, 2 * max(2, int(30 * scale)), seed=0).edges
+    return lambda: minorminer.find_embedding(source, target, random_seed=0)
+
+
+# name -> workload
+WORKLOADS = {
+    'cqm_build': _cqm_build,
+    'bqm_energies': _bqm_energies,
+    'simulated_annealing': _simulated_annealing,
+    'roof_duality': _roof_duality,
+    'hybrid_loop': _hybrid_loop,
+    'embedding': _embedding,
+}
+
+
+def _parse_pins(text, source):
+    """Component name -> pinned version, from the text of a setup.cfg."""
+    config = configparser.ConfigParser()
+    config.read_string(text)
+    try:
+        requirements = config['options']['install_requires']
+    except KeyError:
+        raise ValueError(f"{source} has no install_requires") from None
+
+    pins = {}
+    for requirement in filter(None, map(str.strip, requirements.splitlines())):
+        try:
+            name, pinned = parse_pin(requirement)
+        except ValueError:
+            raise ValueError(f"{source}: invalid requirement {requirement!r}") from None
+        if pinned is None:
+            if name not in COMPONENTS:
+                # other dependencies are required by version range
+                continue
+            raise ValueError(f"{source}: {requirement!r} is not pinned to a version")
+        pins[name] = pinned
+    return pins
+
+
+def load_pins(source, repository=None):
+    """Return the component pins of a ``setup.cfg``.
+
+    Args:
+        source (str):
+            Path of a ``setup.cfg`` or, if there is no such file, a git
+            revision whose ``setup.cfg`` is read, e.g. ``'HEAD'`` or a
+            release tag.
+
+        repository (str, optional):
+            Working tree of the git repository. Defaults to the current
+            directory.
+
+    Returns:
+        dict[str, str]: Pinned version of each component distribution.
+    """
+    if os.path.isfile(source):
+        with open(source) as f:
+            return _parse_pins(f.read(), source)
+
+    proc = subprocess.run(['git', 'show', f'{source}:setup.cfg'], cwd=repository,
+                          capture_output=True, text=True)
+    if proc.returncode:
+        raise ValueError(f"{source!r} is neither a file nor a git revision with a setup.cfg:\n"
+                         f"{proc.stderr}")
+    return _parse_pins(proc.stdout, f"{source}:setup.cfg")
+
+
+def _python(env_dir):
+    if sys.platform == 'win32':
+        return os.path.join(env_dir, 'Scripts', 'python.exe')
+    return os.path.join(env_dir, 'bin', 'python')
+
+
+def create_environment(pins, directory, pip_args=()):
+    """Create a virtual environment with the pinned components installed.
+
+    The environment is created in a subdirectory of ``directory`` named
+    after the pins, and reused by later calls with the same pins.
+
+    Args:
+        pins (dict[str, str]): Pinned version of each component.
+        directory (str): Directory of the environments.
+        pip_args (iterable[str], optional): Additional ``pip install`` arguments.
+
+    Returns:
+        str: Path of the environment's Python interpreter.
+    """
+    requirements = [f'{name}=={pinned}' for name, pinned in sorted(pins.items())]
+    digest = hashlib.sha256('\n'.join(requirements).encode()).hexdigest()[:16]
+    env_dir = os.path.join(directory, f'pins-{digest}')
+    marker = os.path.join(env_dir, 'pins.json')
+
+    if not os.path.isfile(marker):
+        venv.EnvBuilder(clear=True, with_pip=True).create(env_dir)
+        proc = subprocess.run(
+            [_python(env_dir), '-m', 'pip', 'install', '--disable-pip-version-check',
+             *pip_args, *requirements],
+            capture_output=True, text=True)
+        if proc.returncode:
+            raise RuntimeError(f"installing {', '.join(requirements)} failed:\n{proc.stderr}")
+        # written last, so that a failed installation is not reused
+        with open(marker, 'w') as f:
+            json.dump(pins, f)
+
+    return _python(env_dir)
+
+
+def _probe(workloads, repeat, scale, distributions):
+    """Time ``workloads`` in the current (fresh) interpreter and print the
+    result as JSON. Run by :func:`measure_environment` in a subprocess."""
+    times = {}
+    with warnings.catch_warnings():
+        # dwave-networkx and penaltymodel warn about their deprecation
+        warnings.simplefilter('ignore', DeprecationWarning)
+
+        for name in workloads:
+            func = WORKLOADS[name](scale)
+            func()      # warm up
+            times[name] = []
+            for _ in range(repeat):
+                t = time.perf_counter()
+                func()
+                times[name].append(time.perf_counter() - t)
+
+    versions = {}
+    for distribution in distributions:
+        try:
+            versions[distribution] = version(distribution)
+        except PackageNotFoundError:
+            versions[distribution] = None
+
+    print(json.dumps(dict(times=times, versions=versions)))
+
+
+def measure_environment(python=None, workloads=tuple(WORKLOADS), repeat=3, scale=1.,
+                        distributions=()):
+    """Time workloads in a fresh interpreter.
+
+    Args:
+        python (str, optional):
+            Interpreter to measure in, by default the current one. The SDK
+            is imported from this source tree, so it need not be installed.
+
+        workloads (iterable[str], optional):
+            Names of workloads to time, by default all of :data:`WORKLOADS`.
+
+        repeat (int, optional, default=3):
+            Timed calls of each workload, after one untimed call.
+
+        scale (float, optional, default=1):
+            Factor of the problem size of each workload.
+
+        distributions (iterable[str], optional):
+            Distributions whose installed versions are reported.
+
+    Returns:
+        dict: Times in seconds of each call by workload (``'times'``), and
+        installed version of each distribution, or None if it is not
+        installed (``'versions'``).
+    """
+    workloads = list(workloads)
+    for name in workloads:
+        if name not in WORKLOADS:
+            raise ValueError(f"unknown workload {name!r}, expected one of {list(WORKLOADS)}")
+    if repeat < 1:
+        raise ValueError("repeat must be a positive integer")
+
+    # the source tree of this package, ahead of any installed copy
+    source = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [source, env.get('PYTHONPATH')]))
+
+    statement = ('from dwaveoceansdk.bench.regression import _probe; '
+                 f'_probe({workloads!r}, {repeat!r}, {scale!r}, {list(distributions)!r})')
+    return run_probe(statement, f"workloads in {python or sys.executable}", python, env)
+
+
+def mann_whitney_u(x, y):
+    """Two-sided Mann-Whitney U test of two samples.
+
+    Uses the normal approximation with tie and continuity corrections,
+    which is adequate for the sample sizes of this benchmark.
+
+    Returns:
+        tuple: The U statistic of ``x`` and the p-value.
+
+    Examples:
+        >>> from dwaveoceansdk.bench.regression import mann_whitney_u
+        >>> u, p = mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+        >>> u, round(p, 4)
+        (0.0, 0.0122)
+    """
+    n1, n2 = len(x), len(y)
+    if not n1 or not n2:
+        raise ValueError("both samples must be nonempty")
+    n = n1 + n2
+
+    # average ranks, ties sharing the mean of their ranks
+    values = sorted([(value, 0) for value in x] + [(value, 1) for value in y])
+    rank_sum, ties, i = 0., 0., 0
+    while i < n:
+        j = i
+        while j < n and values[j][0] == values[i][0]:
+            j += 1
+        rank = (i + j + 1) / 2
+        rank_sum += rank * sum(1 for _, group in values[i:j] if group == 0)
+        ties += (j - i) ** 3 - (j - i)
+        i = j
+
+    u = rank_sum - n1 * (n1 + 1) / 2
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1))))
+    if not sigma:
+        return u, 1.
+    z = max(abs(u - n1 * n2 / 2) - .5, 0) / sigma
+    return u, min(1., 2 * (1 - statistics.NormalDist().cdf(z)))
+
+
+def compare(baseline, candidate, threshold=.1, alpha=.01):
+    """Compare the times of the workloads in two environments.
+
+    Args:
+        baseline (dict[str, list[float]]): Times of each workload.
+        candidate (dict[str, list[float]]): Times of each workload.
+
+        threshold (float, optional, default=0.1):
+            Largest relative slowdown of the median time that is not a
+            regression.
+
+        alpha (float, optional, default=0.01):
+            Significance level of the Mann-Whitney U test.
+
+    Returns:
+        dict: For each workload of both, the median times, the relative
+        change of the median (``'delta'``), the p-value and whether it
+        regressed.
+
+    Examples:
+        >>> from dwaveoceansdk.bench.regression import compare
+        >>> result = compare({'w': [1., 1.1, .9, 1., 1.05, .95]},
+        ...                  {'w': [2., 2.1, 1.9, 2., 2.05, 1.95]})
+        >>> result['w']['delta'], result['w']['regression']
+        (1.0, True)
+    """
+    if threshold < 0:
+        raise ValueError("threshold must be nonnegative")
+
+    results = {}
+    for name in baseline:
+        if name not in candidate:
+            continue
+        before = statistics.median(baseline[name])
+        after = statistics.median(candidate[name])
+        delta = after / before - 1
+        _, p_value = mann_whitney_u(baseline[name], candidate[name])
+        results[name] = dict(
+            baseline=before, candidate=after, delta=delta, p_value=p_value,
+            regression=delta > threshold and p_value < alpha,
+            improvement=delta < -threshold and p_value < alpha,
+            )
+    return results
+
+
+def run(baseline='HEAD', candidate='setup.cfg', workloads=tuple(WORKLOADS), rounds=5,
+        repeat=3, scale=1., threshold=.1, alpha=.01, env_dir=None, pip_args=(),
+        repository=None):
+    """Time the workloads with the baseline and candidate pins.
+
+    Args:
+        baseline (str, optional, default='HEAD'):
+            ``setup.cfg`` of the baseline pins; see :func:`load_pins`.
+
+        candidate (str, optional, default='setup.cfg'):
+            ``setup.cfg`` of the candidate pins; see :func:`load_pins`.
+
+        workloads (iterable[str], optional):
+            Names of workloads to time, by default all of :data:`WORKLOADS`.
+
+        rounds (int, optional, default=5):
+            Fresh interpreters per environment, alternating between them.
+
+        repeat (int, optional, default=3):
+            Timed calls of each workload per interpreter.
+
+        scale (float, optional, default=1):
+            Factor of the problem size of each workload.
+
+        threshold (float, optional, default=0.1):
+            See :func:`compare`.
+
+        alpha (float, optional, default=0.01):
+            See :func:`compare`.
+
+        env_dir (str, optional):
+            Directory of the virtual environments, kept for reuse by later
+            runs. By default a temporary directory.
+
+        pip_args (iterable[str], optional):
+            Additional ``pip install`` arguments, e.g. ``--only-binary``.
+
+        repository (str, optional):
+            Git working tree of git revisions. Defaults to the current
+            directory.
+
+    Returns:
+        dict: A JSON-serializable report. ``'failed'`` is true if any
+        workload regressed. If the pins are the same, nothing is measured
+        and ``'skipped'`` is true.
+    """
+    workloads = list(workloads)
+    for name in workloads:
+        if name not in WORKLOADS:
+            raise ValueError(f"unknown workload {name!r}, expected one of {list(WORKLOADS)}")
+    if rounds < 1:
+        raise ValueError("rounds must be a positive integer")
+
+    sources = dict(baseline=baseline, candidate=candidate)
+    pins = {side: load_pins(source, repository) for side, source in sources.items()}
+    changed = {name: [pins['baseline'].get(name), pins['candidate'].get(name)]
+               for name in sorted(pins['baseline'].keys() | pins['candidate'].keys())
+               if pins['baseline'].get(name) != pins['candidate'].get(name)}
+
+    # with the same pins, both sides would run in one environment and the
+    # gate could only fail on noise
+    times, versions, comparison = {}, {}, {}
+    if changed:
+        times = {side: {name: [] for name in workloads} for side in sources}
+        with contextlib.ExitStack() as stack:
+            if env_dir is None:
+                env_dir = stack.enter_context(tempfile.TemporaryDirectory())
+            pythons = {side: create_environment(pins[side], env_dir, pip_args)
+                       for side in sources}
+
+            for i in range(rounds):
+                for side in (sources if i % 2 == 0 else reversed(list(sources))):
+                    result = measure_environment(pythons[side], workloads, repeat, scale,
+                                                 pins[side])
+                    for name, values in result['times'].items():
+                        times[side][name].extend(values)
+                    versions[side] = result['versions']
+
+        comparison = compare(times['baseline'], times['candidate'], threshold, alpha)
+    regressions = [name for name, result in comparison.items() if result['regression']]
+
+    return dict(
+        benchmark='regression',
+        **system_info(),
+        parameters=dict(baseline=baseline, candidate=candidate, rounds=rounds, repeat=repeat,
+                        scale=scale, threshold=threshold, alpha=alpha),
+        pins=dict(pins, changed=changed),
+        versions=versions,
+        times=times,
+        workloads=comparison,
+        regressions=regressions,
+        skipped=not changed,
+        failed=bool(regressions),
+        )
+
+
+def add_arguments(parser):
+    """Add the command-line arguments of this benchmark to ``parser``."""
+    parser.add_argument('--baseline', default='HEAD',
+                        help="setup.cfg or git revision of the baseline pins "
+                             "(default: %(default)s)")
+    parser.add_argument('--candidate', default='setup.cfg',
+                        help="setup.cfg or git revision of the candidate pins "
+                             "(default: %(default)s)")
+    parser.add_argument('--workloads', nargs='+', default=list(WORKLOADS), choices=WORKLOADS,
+                        metavar='NAME', help="workloads to time (default: all)")
+    parser.add_argument('--rounds', type=int, default=5,
+                        help="fresh interpreters per environment (default: %(default)s)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="timed calls per workload and interpreter (default: %(default)s)")
+    parser.add_argument('--scale', type=float, default=1.,
+                        help="factor of the workload problem sizes (default: %(default)s)")
+    parser.add_argument('--threshold', type=float, default=.1,
+                        help="largest relative slowdown allowed (default: %(default)s)")
+    parser.add_argument('--alpha', type=float, default=.01,
+                        help="significance level of the test (default: %(default)s)")
+    parser.add_argument('--env-dir', metavar='DIR',
+                        help="keep the virtual environments in DIR for reuse "
+                             "(default: a temporary directory)")
+    parser.add_argument('--pip-arg', dest='pip_args', action='append', default=[],
+                        metavar='ARG', help="additional pip install argument (repeatable)")
+
+
+def main(args):
+    """Run the benchmark from parsed command-line arguments, print a
+    summary and return the report."""
+    report = run(args.baseline, args.candidate, workloads=args.workloads, rounds=args.rounds,
+                 repeat=args.repeat, scale=args.scale, threshold=args.threshold,
+                 alpha=args.alpha, env_dir=args.env_dir, pip_args=args.pip_args)
+
+    if report['skipped']:
+        print("pins unchanged, nothing to compare")
+
+    for name, (before, after) in report['pins']['changed'].items():
+        print(f"{name:<22} {before or '-':>10} -> {after or '-'}")
+
+    for name, result in report['workloads'].items():
+        status = ('REGRESSION' if result['regression'] else
+                  'improvement' if result['improvement'] else '')
+        print(f"{name:<20} {result['baseline'] * 1e3:9.2f} ms -> "
+              f"{result['candidate'] * 1e3:9.2f} ms  {result['delta']:+7.1%}  "
+              f"p={result['p_value']:.3g}  {status}")
+
+    if report['failed']:
+        print(f"failed: {', '.join(report['regressions'])} slower by more than "
+              f"{args.threshold:.0%}")
+
+    return report
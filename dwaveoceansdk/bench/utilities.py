@@ -0,0 +1,64 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import platform
+import subprocess
+import sys
+
+from packaging.requirements import Requirement
+
+from dwaveoceansdk._utilities import max_rss
+
+__all__ = ['max_rss', 'parse_pin', 'run_probe', 'system_info']
+
+
+def parse_pin(requirement):
+    """Return the distribution name of a requirement string and the
+    version it pins, e.g. ``('dimod', '0.12.22')`` for
+    ``'dimod==0.12.22'``. The version is None if the requirement allows
+    more than one.
+
+    Raises:
+        ValueError: If ``requirement`` is not a valid requirement.
+    """
+    requirement = Requirement(requirement)
+    specifiers = list(requirement.specifier)
+    if (len(specifiers) == 1 and specifiers[0].operator in ('==', '===')
+            and not specifiers[0].version.endswith('*')):
+        return requirement.name, specifiers[0].version
+    return requirement.name, None
+
+
+def run_probe(statement, description, executable=None, env=None):
+    """Run ``statement`` in a fresh interpreter and return the JSON object
+    it prints last on stdout.
+
+    The interpreter is ``executable``, by default the current one, run with
+    the environment variables ``env``, by default those of this process.
+    """
+    proc = subprocess.run([executable or sys.executable, '-c', statement],
+                          capture_output=True, text=True, env=env)
+    if proc.returncode:
+        raise RuntimeError(f"measuring {description} failed:\n{proc.stderr}")
+    return json.loads(proc.stdout.splitlines()[-1])
+
+
+def system_info():
+    """Return the SDK version, Python version and platform of the report."""
+    from dwaveoceansdk import __version__
+
+    return dict(sdk_version=__version__,
+                python_version=platform.python_version(),
+                platform=platform.platform())
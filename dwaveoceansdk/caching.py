@@ -0,0 +1,433 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content-addressed caching of deterministic sampler and function results.
+
+Results are keyed by a hash of the contents of the model, the parameters
+and the sampler or function that produced them, so repeating a
+deterministic computation on an identical model returns the stored result.
+
+.. autosummary::
+
+    CachingComposite
+    ResultCache
+    model_hash
+"""
+
+import collections
+import functools
+import hashlib
+import pickle
+import sys
+import threading
+import time
+
+import dimod
+
+__all__ = ['CachingComposite', 'ResultCache', 'model_hash']
+
+
+def _update_hash(h, value):
+    """Feed a parameter value into hash ``h``.
+
+    Arrays are hashed by content, since their ``repr`` is truncated, and
+    containers recursively.
+    """
+    import numpy as np
+
+    if isinstance(value, np.ndarray):
+        h.update(b'ndarray:%s:%r;' % (value.dtype.str.encode(), value.shape))
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dimod.BinaryQuadraticModel):
+        h.update(b'bqm:' + model_hash(value).encode())
+    elif isinstance(value, dimod.SampleSet):
+        h.update(b'sampleset:')
+        _update_hash(h, list(value.variables))
+        _update_hash(h, value.record.sample)
+    elif isinstance(value, dict):
+        h.update(b'dict:%d;' % len(value))
+        for key, item in sorted(value.items(), key=lambda item: repr(item[0])):
+            _update_hash(h, key)
+            _update_hash(h, item)
+    elif isinstance(value, (list, tuple)):
+        h.update(b'%s:%d;' % (type(value).__name__.encode(), len(value)))
+        for item in value:
+            _update_hash(h, item)
+    else:
+        h.update(repr(value).encode() + b';')
+
+
+def model_hash(bqm: dimod.BinaryQuadraticModel) -> str:
+    """Return a hash of the contents of a binary quadratic model.
+
+    The hash covers the vartype, the variable labels in order, the biases
+    and the offset. Models that are equal with their variables in the same
+    order have the same hash, regardless of how they were constructed.
+    Variable order is part of the hash because seeded samplers may return
+    different samples for a reordered model.
+
+    Examples:
+        >>> import dimod
+        >>> from dwaveoceansdk.caching import model_hash
+        >>> a = dimod.BinaryQuadraticModel({'x': 1}, {('x', 'y'): -1}, 0, 'SPIN')
+        >>> b = dimod.BinaryQuadraticModel('SPIN')
+        >>> b.add_linear_from({'x': 1, 'y': 0})
+        >>> b.add_quadratic('y', 'x', -1)
+        >>> model_hash(a) == model_hash(b)
+        True
+    """
+    import numpy as np
+
+    linear, (irow, icol, quadratic), offset = bqm.to_numpy_vectors(bqm.variables)
+
+    # interactions in a canonical order, each with row < col
+    irow, icol = np.minimum(irow, icol), np.maximum(irow, icol)
+    order = np.lexsort((icol, irow))
+    irow, icol, quadratic = irow[order], icol[order], quadratic[order]
+
+    h = hashlib.sha256(b'bqm:%s;' % bqm.vartype.name.encode())
+    _update_hash(h, list(bqm.variables))
+    h.update(np.asarray(linear, dtype='<f8').tobytes())
+    h.update(np.asarray(irow, dtype='<i8').tobytes())
+    h.update(np.asarray(icol, dtype='<i8').tobytes())
+    h.update(np.asarray(quadratic, dtype='<f8').tobytes())
+    h.update(repr(float(offset)).encode())
+    return h.hexdigest()
+
+
+class _MemoryStore:
+    """In-memory store with the subset of the :class:`diskcache.Cache`
+    interface used by :class:`ResultCache`, evicting the least recently used
+    entries beyond ``size_limit`` bytes."""
+    def __init__(self, size_limit):
+        self.size_limit = size_limit
+        self._entries = collections.OrderedDict()   # key -> (value, expire_time)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                value, expire_time = self._entries[key]
+            except KeyError:
+                return None
+
+            if expire_time is not None and expire_time <= time.time():
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, expire=None):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, None if expire is None else time.time() + expire)
+            self._size += len(value)
+
+            while self._size > self.size_limit and len(self._entries) > 1:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        value, _ = self._entries.pop(key)
+        self._size -= len(value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def volume(self):
+        return self._size
+
+    def close(self):
+        pass
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class ResultCache:
+    """Store of results keyed by content hash, in memory or on disk.
+
+    Args:
+        directory (str, optional):
+            Directory of a persistent ``diskcache`` store, shared by all
+            processes using the same directory, e.g. under
+            :func:`~dwave.cloud.config.get_cache_dir`. Results are kept in
+            memory if not given.
+
+        ttl (float, optional):
+            Seconds after which a stored result expires. Results do not
+            expire by default.
+
+        size_limit (int, optional, default=2**28):
+            Maximum size of the stored results in bytes. The least recently
+            used results are evicted first.
+
+    Examples:
+        Cache the roof duality bound of repeated models.
+
+        >>> import dimod
+        >>> from dwave.preprocessing import roof_duality
+        >>> from dwaveoceansdk.caching import ResultCache
+        ...
+        >>> cache = ResultCache()
+        >>> cached_roof_duality = cache.wrap(roof_duality)
+        >>> bqm = dimod.BinaryQuadraticModel({'a': -1}, {'ab': 2}, 0, 'BINARY')
+        >>> cached_roof_duality(bqm) == cached_roof_duality(bqm.copy())
+        True
+        >>> cache.stats()['hits']
+        1
+    """
+    def __init__(self, directory=None, *, ttl=None, size_limit=2**28):
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        if directory is None:
+            self.store = _MemoryStore(size_limit)
+        else:
+            import diskcache
+            self.store = diskcache.Cache(directory,
+                                         eviction_policy='least-recently-used',
+                                         size_limit=size_limit)
+
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, namespace, model, parameters):
+        """Return the key of the result of ``namespace``, e.g. a sampler or
+        function name, applied to ``model`` with ``parameters``."""
+        h = hashlib.sha256(namespace.encode() + b';')
+        h.update(model_hash(model).encode())
+        _update_hash(h, parameters)
+        return h.hexdigest()
+
+    def get(self, key):
+        """Return the result stored under ``key``, or ``None``, and count
+        the hit or miss."""
+        data = self.store.get(key)
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(data)
+
+    def set(self, key, result):
+        """Store ``result`` under ``key``.
+
+        Results are stored pickled, so a result returned from the cache is
+        never the object stored, nor shared with other callers.
+        """
+        self.store.set(key, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL),
+                       expire=self.ttl)
+
+    def wrap(self, func):
+        """Wrap a deterministic function of a binary quadratic model, such
+        as :func:`~dwave.preprocessing.lower_bounds.roof_duality`, to cache
+        its results.
+
+        The returned function takes the model as its first argument,
+        followed by the arguments of ``func``.
+        """
+        namespace = f'{func.__module__}.{func.__qualname__}'
+
+        @functools.wraps(func)
+        def wrapper(bqm, *args, **kwargs):
+            key = self.key(namespace, bqm, [list(args), kwargs])
+            result = self.get(key)
+            if result is None:
+                result = func(bqm, *args, **kwargs)
+                self.set(key, result)
+            return result
+
+        return wrapper
+
+    def stats(self):
+        """Return the cache statistics.
+
+        Returns:
+            dict: The ``hits`` and ``misses`` of this cache object, the
+            ``hit_rate``, and the number of ``entries`` and ``size`` in bytes
+            of the underlying store.
+        """
+        lookups = self.hits + self.misses
+        return dict(hits=self.hits,
+                    misses=self.misses,
+                    hit_rate=self.hits / lookups if lookups else 0.0,
+                    entries=len(self.store),
+                    size=self.store.volume())
+
+    def clear(self):
+        """Remove all results and reset the statistics."""
+        self.store.clear()
+        self.hits = self.misses = 0
+
+    def close(self):
+        """Close the underlying store."""
+        self.store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# (module, name) of samplers and composites whose output depends only on
+# their input and parameters
+DETERMINISTIC = frozenset([
+    ('dimod', 'ExactSolver'),
+    ('dimod', 'NullSampler'),
+    ('dwave.preprocessing', 'ClipComposite'),
+    ('dwave.preprocessing', 'FixVariablesComposite'),
+    ('dwave.preprocessing', 'ScaleComposite'),
+])
+
+
+class CachingComposite(dimod.ComposedSampler):
+    """Composite that returns stored sample sets for repeated problems.
+
+    Only deterministic calls are cached: the child sampler and every
+    composite between it and this one must be known to be deterministic
+    (:class:`~dimod.ExactSolver`, or
+    :class:`~dwave.preprocessing.composites.ScaleComposite` over one, for
+    example), or the call must set a ``seed`` that the child accepts, as
+    for :class:`~dwave.samplers.SimulatedAnnealingSampler`. Other calls
+    raise :exc:`ValueError` rather than returning a stale random sample.
+
+    The ``info`` field of returned sample sets has a ``'cache'`` entry with
+    whether the call was a ``hit`` and the ``hits``, ``misses`` and
+    ``hit_rate`` of the cache.
+
+    Args:
+        child (:class:`dimod.Sampler`):
+            Sampler to cache the results of.
+
+        cache (:class:`ResultCache`, optional):
+            Store of results. Can be shared by several composites. Defaults
+            to a new in-memory cache.
+
+        deterministic (bool, optional, default=False):
+            Declare the child deterministic, so that unseeded calls are
+            cached too.
+
+    Examples:
+        >>> import dimod
+        >>> from dwave.samplers import SimulatedAnnealingSampler
+        >>> from dwaveoceansdk.caching import CachingComposite
+        ...
+        >>> sampler = CachingComposite(SimulatedAnnealingSampler())
+        >>> bqm = dimod.generators.ran_r(1, 10, seed=3)
+        >>> sampleset = sampler.sample(bqm, seed=5, num_reads=10)
+        >>> sampleset = sampler.sample(bqm, seed=5, num_reads=10)
+        >>> sampleset.info['cache']['hit']
+        True
+    """
+    def __init__(self, child, cache=None, *, deterministic=False):
+        self._children = [child]
+        self.cache = cache if cache is not None else ResultCache()
+        self.deterministic = deterministic
+
+    @property
+    def children(self):
+        return self._children
+
+    @property
+    def child(self):
+        return self._children[0]
+
+    @property
+    def parameters(self):
+        return self.child.parameters.copy()
+
+    @property
+    def properties(self):
+        return dict(child_properties=self.child.properties.copy())
+
+    def _chain(self):
+        sampler = self.child
+        while True:
+            yield sampler
+            children = getattr(sampler, 'children', None)
+            if not children:
+                return
+            if len(children) > 1:
+                # e.g. a composite that dispatches to several samplers
+                yield None
+                return
+            sampler = children[0]
+
+    def _is_deterministic(self, parameters):
+        if self.deterministic:
+            return True
+
+        if parameters.get('seed') is not None and 'seed' in self.child.parameters:
+            return True
+
+        for sampler in self._chain():
+            if sampler is None:
+                return False
+            if not any(_isinstance(sampler, module, name) for module, name in DETERMINISTIC):
+                return False
+        return True
+
+    def sample(self, bqm, **parameters):
+        """Sample from the child sampler, or return the stored sample set.
+
+        Args:
+            bqm (:class:`~dimod.BinaryQuadraticModel`):
+                Binary quadratic model to sample.
+
+            **parameters:
+                Parameters for the child sampler.
+
+        Returns:
+            :class:`~dimod.SampleSet`
+
+        Raises:
+            ValueError: If the call is not deterministic.
+        """
+        if not self._is_deterministic(parameters):
+            raise ValueError(
+                f"{type(self.child).__name__} is not known to be deterministic and no seed "
+                "was given; results are only cached for deterministic calls")
+
+        namespace = ':'.join(f'{type(sampler).__module__}.{type(sampler).__qualname__}'
+                             for sampler in self._chain() if sampler is not None)
+        key = self.cache.key(namespace, bqm, parameters)
+
+        sampleset = self.cache.get(key)
+        hit = sampleset is not None
+        if not hit:
+            sampleset = self.child.sample(bqm, **parameters)
+            sampleset.resolve()
+            self.cache.set(key, sampleset)
+
+        stats = self.cache.stats()
+        sampleset.info['cache'] = dict(hit=hit,
+                                       hits=stats['hits'],
+                                       misses=stats['misses'],
+                                       hit_rate=stats['hit_rate'])
+        return sampleset
+
+
+def _isinstance(obj, module, name):
+    """Check ``isinstance(obj, module.name)`` without importing ``module``,
+    an object cannot be an instance of a class that was never imported."""
+    cls = getattr(sys.modules.get(module), name, None)
+    return cls is not None and isinstance(obj, cls)
@@ -0,0 +1,312 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bulk construction of constrained quadratic models from NumPy arrays.
+
+The functions in this module build objectives and constraints of a
+:class:`~dimod.ConstrainedQuadraticModel` directly from index and
+coefficient arrays. Variables are labeled by integers ``0, 1, ...``, so
+neither symbolic expressions (:func:`dimod.Binary` and friends) nor
+per-term label strings are created. See the *Scaling for Production*
+section of the documentation for the construction methods these replace.
+
+.. autosummary::
+
+    add_constraints_from_arrays
+    set_objective_from_arrays
+    bin_packing
+"""
+
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    import dimod
+    import numpy.typing
+
+__all__ = ['add_constraints_from_arrays', 'set_objective_from_arrays', 'bin_packing']
+
+
+def _add_variables(cqm, indices, vartype, lower_bound, upper_bound):
+    """Add variables ``range(max(indices) + 1)`` to ``cqm``."""
+    if len(indices):
+        cqm.add_variables(vartype, int(indices.max()) + 1,
+                          lower_bound=lower_bound, upper_bound=upper_bound)
+
+
+def _linear_model(indices, coefficients, vartype, lower_bound, upper_bound):
+    """Construct a model with linear biases ``coefficients`` on variables
+    labeled ``indices``."""
+    import dimod
+
+    vartype = dimod.as_vartype(vartype, extended=True)
+
+    if vartype is dimod.BINARY or vartype is dimod.SPIN:
+        model = dimod.BinaryQuadraticModel(vartype)
+        model.add_linear_from(zip(indices.tolist(), coefficients.tolist()))
+    else:
+        model = dimod.QuadraticModel()
+        model.add_linear_from(zip(indices.tolist(), coefficients.tolist()),
+                              default_vartype=vartype,
+                              default_lower_bound=lower_bound,
+                              default_upper_bound=upper_bound)
+    return model
+
+
+def set_objective_from_arrays(cqm: dimod.ConstrainedQuadraticModel,
+                              indices: numpy.typing.ArrayLike,
+                              coefficients: numpy.typing.ArrayLike,
+                              offset: float = 0,
+                              *,
+                              quadratic: typing.Optional[tuple] = None,
+                              vartype: dimod.typing.VartypeLike = 'BINARY',
+                              lower_bound: typing.Optional[float] = None,
+                              upper_bound: typing.Optional[float] = None,
+                              ) -> None:
+    """Set the objective of a constrained quadratic model from arrays.
+
+    Args:
+        cqm: Constrained quadratic model.
+
+        indices: Variables with a linear bias in the objective, as integer
+            labels. Biases of repeated variables are summed.
+
+        coefficients: Linear biases, one per entry of ``indices``.
+
+        offset: Constant offset.
+
+        quadratic: Quadratic biases as a 3-tuple ``(row, col, biases)`` of
+            arrays, such that ``biases[k]`` is the bias of the interaction
+            between variables ``row[k]`` and ``col[k]``. Supported only for
+            binary and spin variables.
+
+        vartype: Variable type of any variables added to the model.
+
+        lower_bound: Lower bound of any integer or real variables added to
+            the model.
+
+        upper_bound: Upper bound of any integer or real variables added to
+            the model.
+
+    Examples:
+        Minimize the number of variables among ``0, 1, 2`` that are set.
+
+        >>> import dimod
+        >>> import numpy as np
+        >>> from dwaveoceansdk.construction import set_objective_from_arrays
+        >>> cqm = dimod.ConstrainedQuadraticModel()
+        >>> set_objective_from_arrays(cqm, np.arange(3), np.ones(3))
+        >>> cqm.objective.linear[2]
+        1.0
+    """
+    import dimod
+    import numpy as np
+
+    indices = np.asarray(indices, dtype=np.int64)
+    coefficients = np.asarray(coefficients, dtype=np.float64)
+
+    if indices.shape != coefficients.shape or indices.ndim != 1:
+        raise ValueError("indices and coefficients must be 1-dimensional arrays of equal length")
+
+    if quadratic is None:
+        _add_variables(cqm, indices, vartype, lower_bound, upper_bound)
+
+        objective = _linear_model(indices, coefficients, vartype, lower_bound, upper_bound)
+        objective.offset = offset
+        cqm.set_objective(objective)
+        return
+
+    vartype = dimod.as_vartype(vartype, extended=True)
+    if vartype is not dimod.BINARY and vartype is not dimod.SPIN:
+        raise ValueError("quadratic biases are supported only for binary and spin variables")
+
+    row, col, biases = quadratic
+    row = np.asarray(row, dtype=np.int64)
+    col = np.asarray(col, dtype=np.int64)
+    biases = np.asarray(biases, dtype=np.float64)
+
+    variables = np.concatenate((indices, row, col))
+    _add_variables(cqm, variables, vartype, lower_bound, upper_bound)
+
+    # With a dense linear vector the objective's variables are range(n),
+    # which dimod stores without materializing any labels
+    linear = np.zeros(int(variables.max()) + 1 if len(variables) else 0)
+    np.add.at(linear, indices, coefficients)
+
+    cqm.set_objective(dimod.BinaryQuadraticModel.from_numpy_vectors(
+        linear, (row, col, biases), offset, vartype))
+
+
+def add_constraints_from_arrays(cqm: dimod.ConstrainedQuadraticModel,
+                                indptr: numpy.typing.ArrayLike,
+                                indices: numpy.typing.ArrayLike,
+                                coefficients: numpy.typing.ArrayLike,
+                                sense: typing.Union[str, typing.Sequence[str]],
+                                rhs: numpy.typing.ArrayLike,
+                                *,
+                                labels: typing.Optional[typing.Sequence[typing.Hashable]] = None,
+                                vartype: dimod.typing.VartypeLike = 'BINARY',
+                                lower_bound: typing.Optional[float] = None,
+                                upper_bound: typing.Optional[float] = None,
+                                ) -> list:
+    """Add linear constraints ``A x (sense) rhs`` given in compressed sparse
+    row (CSR) format.
+
+    Row ``c`` of the constraint matrix ``A`` has coefficients
+    ``coefficients[indptr[c]:indptr[c+1]]`` on the variables
+    ``indices[indptr[c]:indptr[c+1]]``, which is the layout of
+    :class:`scipy.sparse.csr_array`.
+
+    Args:
+        cqm: Constrained quadratic model.
+
+        indptr: Row pointer array, of length ``num_constraints + 1``.
+
+        indices: Variables of each constraint, as integer labels.
+            Coefficients of a variable repeated within a row are summed.
+
+        coefficients: Coefficient of each entry of ``indices``.
+
+        sense: One of ``'<='``, ``'>='`` or ``'=='``, or one per constraint.
+
+        rhs: Right-hand side, a scalar or one value per constraint.
+
+        labels: Constraint labels, one per constraint. Generated by
+            :mod:`dimod` if not provided.
+
+        vartype: Variable type of any variables added to the model.
+
+        lower_bound: Lower bound of any integer or real variables added to
+            the model.
+
+        upper_bound: Upper bound of any integer or real variables added to
+            the model.
+
+    Returns:
+        list: Labels of the added constraints.
+
+    Examples:
+        Add the one-hot constraints ``x0 + x1 == 1`` and ``x2 + x3 == 1``.
+
+        >>> import dimod
+        >>> from dwaveoceansdk.construction import add_constraints_from_arrays
+        >>> cqm = dimod.ConstrainedQuadraticModel()
+        >>> add_constraints_from_arrays(cqm, [0, 2, 4], [0, 1, 2, 3], [1, 1, 1, 1], '==', 1,
+        ...                             labels=['one-hot-0', 'one-hot-1'])
+        ['one-hot-0', 'one-hot-1']
+    """
+    import numpy as np
+
+    indptr = np.asarray(indptr, dtype=np.int64)
+    indices = np.asarray(indices, dtype=np.int64)
+    coefficients = np.asarray(coefficients, dtype=np.float64)
+
+    if indptr.ndim != 1 or not len(indptr):
+        raise ValueError("indptr must be a non-empty 1-dimensional array")
+    if indices.shape != coefficients.shape or indices.ndim != 1:
+        raise ValueError("indices and coefficients must be 1-dimensional arrays of equal length")
+    if indptr[-1] != len(indices):
+        raise ValueError("indptr[-1] must equal the number of indices")
+
+    num_constraints = len(indptr) - 1
+
+    if isinstance(sense, str):
+        sense = [sense] * num_constraints
+    elif len(sense) != num_constraints:
+        raise ValueError("sense must be a string or have one entry per constraint")
+
+    rhs = np.broadcast_to(np.asarray(rhs, dtype=np.float64), (num_constraints,))
+
+    if labels is None:
+        labels = [None] * num_constraints
+    elif len(labels) != num_constraints:
+        raise ValueError("labels must have one entry per constraint")
+
+    _add_variables(cqm, indices, vartype, lower_bound, upper_bound)
+
+    # the constraint models are constructed here and not used elsewhere, so
+    # the CQM can take ownership without copying
+    return [cqm.add_constraint_from_model(
+                _linear_model(indices[start:stop], coefficients[start:stop],
+                              vartype, lower_bound, upper_bound),
+                sense[c], rhs[c], label=labels[c], copy=False)
+            for c, (start, stop) in enumerate(zip(indptr[:-1].tolist(), indptr[1:].tolist()))]
+
+
+def bin_packing(weights: numpy.typing.ArrayLike) -> dimod.ConstrainedQuadraticModel:
+    """Generate a bin packing problem as a constrained quadratic model.
+
+    The model is the same as the one constructed in the *Scaling for
+    Production* section of the documentation, built from arrays. Each bin
+    has capacity 1.
+
+    Variable ``i*n + j`` indicates that item ``i`` is put in bin ``j`` and
+    variable ``n*n + j`` indicates that bin ``j`` is used, where ``n`` is
+    the number of items.
+
+    Args:
+        weights: Weight of each item.
+
+    Returns:
+        A constrained quadratic model with ``n*(n+1)`` binary variables and
+        ``2*n`` constraints.
+
+    Examples:
+        >>> import numpy as np
+        >>> from dwaveoceansdk.construction import bin_packing
+        >>> cqm = bin_packing(np.random.default_rng(42).random(100))
+        >>> cqm.num_variables
+        10100
+    """
+    import dimod
+    import numpy as np
+
+    weights = np.asarray(weights, dtype=np.float64)
+    n = len(weights)
+
+    cqm = dimod.ConstrainedQuadraticModel()
+
+    # variables are added in the order x, y
+    cqm.add_variables('BINARY', n * (n + 1))
+
+    # minimize the number of bins used
+    set_objective_from_arrays(cqm, n * n + np.arange(n), np.ones(n))
+
+    # each item can go in only one bin: row i is x[i, :]
+    add_constraints_from_arrays(
+        cqm,
+        indptr=np.arange(0, n * n + 1, n),
+        indices=np.arange(n * n),
+        coefficients=np.ones(n * n),
+        sense='==',
+        rhs=1,
+        labels=[f'item_placing_{i}' for i in range(n)],
+        )
+
+    # each bin has a capacity that must be respected: row j is x[:, j]
+    # followed by -y[j]
+    items = np.arange(n)
+    bins = np.arange(n)[:, np.newaxis]
+    add_constraints_from_arrays(
+        cqm,
+        indptr=np.arange(0, (n + 1) * (n + 1), n + 1),
+        indices=np.hstack((items * n + bins, n * n + bins)).ravel(),
+        coefficients=np.hstack((np.broadcast_to(weights, (n, n)), -np.ones((n, 1)))).ravel(),
+        sense='<=',
+        rhs=0,
+        labels=[f'capacity_bin_{j}' for j in range(n)],
+        )
+
+    return cqm
@@ -0,0 +1,100 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Doxygen builds of the C++ API docs, skipped when the headers are unchanged."""
+
+import hashlib
+import os
+import subprocess
+
+__all__ = ['build_cpp_docs', 'headers_fingerprint']
+
+HEADER_EXTENSIONS = ('.h', '.hpp', '.hh', '.hxx')
+
+# written to the output directory after a successful build
+FINGERPRINT_FILE = '.headers.sha256'
+
+
+def headers_fingerprint(project, extensions=HEADER_EXTENSIONS, extra=()):
+    """Hash of the paths and contents of the C++ headers under ``project``.
+
+    Hidden directories, such as ``.git``, are skipped.
+
+    Args:
+        project (str): Root directory of the project.
+        extensions (iterable[str], optional): Extensions of header files.
+        extra (iterable[str], optional):
+            Other files hashed if they exist, e.g. the Doxygen configuration.
+
+    Returns:
+        str: Hex digest.
+    """
+    extensions = tuple(extensions)
+
+    paths = []
+    for root, dirs, files in os.walk(project):
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
+        paths.extend(os.path.join(root, f) for f in files if f.endswith(extensions))
+    paths.extend(path for path in extra if os.path.isfile(path))
+
+    h = hashlib.sha256()
+    for path in sorted(paths):
+        h.update(os.path.relpath(path, project).encode() + b'\0')
+        with open(path, 'rb') as f:
+            h.update(hashlib.sha256(f.read()).digest())
+    return h.hexdigest()
+
+
+def build_cpp_docs(project, *, command='make cpp', output='build-cpp', quiet=False):
+    """Run Doxygen for a project's C++ API docs unless its headers are
+    unchanged since the last successful build.
+
+    Args:
+        project (str):
+            Root directory of the project, e.g. the ``dimod`` submodule.
+            ``command`` is run in its ``docs`` directory.
+
+        command (str, optional, default='make cpp'):
+            Shell command that builds the docs.
+
+        output (str, optional, default='build-cpp'):
+            Output directory, relative to the ``docs`` directory. The
+            fingerprint of the headers is kept in it.
+
+        quiet (bool, optional, default=False):
+            Discard the output of ``command``.
+
+    Returns:
+        bool: True if the docs were built, False if the build was skipped.
+    """
+    docs = os.path.join(project, 'docs')
+    output = os.path.join(docs, output)
+    fingerprint_file = os.path.join(output, FINGERPRINT_FILE)
+
+    fingerprint = headers_fingerprint(project, extra=[os.path.join(docs, 'Doxyfile')])
+    try:
+        with open(fingerprint_file) as f:
+            if f.read().strip() == fingerprint:
+                return False
+    except OSError:
+        pass
+
+    stdout = subprocess.DEVNULL if quiet else None
+    returncode = subprocess.call(command, shell=True, cwd=docs, stdout=stdout, stderr=stdout)
+
+    # failed builds are retried next time, as by the Makefile
+    if returncode == 0 and os.path.isdir(output):
+        with open(fingerprint_file, 'w') as f:
+            f.write(fingerprint)
+    return True
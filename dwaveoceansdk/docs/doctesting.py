@@ -0,0 +1,216 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sphinx doctest builder that runs documents in parallel and caches passes.
+
+Add ``'dwaveoceansdk.docs.doctesting'`` to the ``extensions`` of
+``conf.py``, after ``'sphinx.ext.doctest'``, to replace its ``doctest``
+builder. Configuration values:
+
+``doctest_num_workers`` (int, default 1)
+    Worker processes that documents are distributed over, largest first.
+    Workers are forked from the Sphinx process, so need the ``fork`` start
+    method; elsewhere documents are tested serially.
+
+``doctest_cache`` (bool, default True)
+    Skip test groups that passed before with identical code, keyed by the
+    group's setup, tests and cleanup, the global setup and cleanup, the
+    doctest flags, the Python version and ``doctest_cache_versions``. Keys
+    are kept in ``doctest-cache.json`` in the output directory.
+
+``doctest_cache_versions`` (dict, default {})
+    Versions of the packages exercised by the tests, or hashes of their
+    sources, e.g. by :func:`~dwaveoceansdk.docs.headers_fingerprint`; any
+    change reruns all groups.
+"""
+
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import sys
+
+from sphinx.ext.doctest import DocTestBuilder
+from sphinx.util import logging
+
+from dwaveoceansdk import __version__
+
+__all__ = ['ParallelDocTestBuilder', 'setup']
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = 'doctest-cache.json'
+
+_COUNTERS = ('total_failures', 'total_tries', 'setup_failures', 'setup_tries',
+             'cleanup_failures', 'cleanup_tries', 'cached_groups')
+
+# the builder of the Sphinx process, inherited by forked workers
+_builder = None
+
+
+def _test_documents(docnames):
+    """Test ``docnames`` in a worker process and return its output, counts
+    and passed groups."""
+    builder = _builder
+    builder.outfile = io.StringIO()
+    for name in _COUNTERS:
+        setattr(builder, name, 0)
+    builder.passed = set()
+    builder.hits = set()
+
+    builder._test_documents(docnames)
+
+    return dict(docnames=docnames,
+                output=builder.outfile.getvalue(),
+                counts={name: getattr(builder, name) for name in _COUNTERS},
+                passed=sorted(builder.passed),
+                hits=sorted(builder.hits))
+
+
+class ParallelDocTestBuilder(DocTestBuilder):
+    """:class:`sphinx.ext.doctest.DocTestBuilder` that distributes documents
+    over worker processes and skips groups that passed before."""
+    def init(self):
+        super().init()
+
+        self.cached_groups = 0
+        self.passed = set()     # keys of groups that passed in this run
+        self.hits = set()       # keys of groups skipped in this run
+        self.cache = set()      # keys of groups that passed before
+        self._complete = False
+
+        self.cache_file = os.path.join(self.outdir, CACHE_FILE)
+        if self.config.doctest_cache:
+            try:
+                with open(self.cache_file) as f:
+                    self.cache = set(json.load(f)['passed'])
+            except (OSError, ValueError, KeyError):
+                pass
+
+        h = hashlib.sha256()
+        for value in (sys.version, self.opt,
+                      sorted(self.config.doctest_cache_versions.items()),
+                      self.config.doctest_global_setup, self.config.doctest_global_cleanup):
+            h.update(repr(value).encode() + b'\0')
+        self._environment_key = h.digest()
+
+    def group_key(self, group):
+        """Cache key of a :class:`sphinx.ext.doctest.TestGroup`."""
+        h = hashlib.sha256(self._environment_key)
+        h.update(group.name.encode() + b'\0')
+        for code in group.setup + [c for test in group.tests for c in test] + group.cleanup:
+            if code is None:
+                h.update(b'\1')
+            else:
+                h.update(repr((code.type, code.code, sorted(code.options.items()))).encode())
+                h.update(b'\0')
+        return h.hexdigest()
+
+    def _failures(self):
+        return sum(runner.failures for runner in
+                   (self.setup_runner, self.test_runner, self.cleanup_runner))
+
+    def test_group(self, group):
+        if not self.config.doctest_cache:
+            return super().test_group(group)
+
+        key = self.group_key(group)
+        if key in self.cache:
+            self.cached_groups += 1
+            self.hits.add(key)
+            return
+
+        failures = self._failures()
+        super().test_group(group)
+        if self._failures() == failures:
+            self.passed.add(key)
+
+    def _test_documents(self, docnames):
+        for docname in docnames:
+            # no need to resolve the doctree
+            doctree = self.env.get_doctree(docname)
+            self.test_doc(docname, doctree)
+
+    def write_documents(self, docnames):
+        global _builder
+
+        from sphinx.util.console import bold
+
+        num_workers = min(self.config.doctest_num_workers, len(docnames))
+        if num_workers > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+            logger.info("doctest_num_workers needs the 'fork' start method, "
+                        "testing serially")
+            num_workers = 1
+
+        self._complete = set(docnames) >= set(self.env.found_docs)
+
+        if num_workers <= 1:
+            logger.info(bold('running tests...'))
+            self._test_documents(sorted(docnames))
+            return
+
+        logger.info(bold(f'running tests in {num_workers} processes...'))
+
+        # largest documents first, for a better balance at the end
+        def size(docname):
+            try:
+                return os.path.getsize(os.path.join(self.doctreedir, f'{docname}.doctree'))
+            except OSError:
+                return 0
+
+        # or workers would write the buffered output again when replacing it
+        self.outfile.flush()
+
+        _builder = self
+        try:
+            context = multiprocessing.get_context('fork')
+            with context.Pool(num_workers) as pool:
+                results = list(pool.imap_unordered(
+                    _test_documents, [[d] for d in sorted(docnames, key=size, reverse=True)]))
+        finally:
+            _builder = None
+
+        # output in document order, as when testing serially
+        for result in sorted(results, key=lambda result: result['docnames']):
+            self.outfile.write(result['output'])
+            for name, count in result['counts'].items():
+                setattr(self, name, getattr(self, name) + count)
+            self.passed.update(result['passed'])
+            self.hits.update(result['hits'])
+
+    def finish(self):
+        if self.cached_groups:
+            self._out(f"\n{self.cached_groups:5} group{'s' if self.cached_groups != 1 else ''}"
+                      " skipped, passed before\n")
+
+        if self.config.doctest_cache:
+            # after testing all documents, forget groups that no longer exist
+            keys = self.passed | (self.hits if self._complete else self.cache)
+            with open(self.cache_file, 'w') as f:
+                json.dump(dict(passed=sorted(keys)), f)
+
+        super().finish()
+
+
+def setup(app):
+    app.setup_extension('sphinx.ext.doctest')
+    app.add_builder(ParallelDocTestBuilder, override=True)
+    app.add_config_value('doctest_num_workers', 1, '', types=frozenset({int}))
+    app.add_config_value('doctest_cache', True, '', types=frozenset({bool}))
+    app.add_config_value('doctest_cache_versions', {}, '', types=frozenset({dict}))
+    return {
+        'version': __version__,
+        'parallel_read_safe': True,
+    }
@@ -0,0 +1,46 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+
+from dwaveoceansdk.embedding.cache import *
+from dwaveoceansdk.embedding.parallel import *
+
+# names defined in modules that import dimod or dwave-system, resolved on
+# first access (PEP 562) so that importing this package stays fast
+_LAZY_ATTRS = {
+    'ChainIndex': 'dwaveoceansdk.embedding.unembedding',
+    'unembed_sampleset': 'dwaveoceansdk.embedding.unembedding',
+    'uniform_torque_compensation': 'dwaveoceansdk.embedding.unembedding',
+    'VectorizedEmbeddingComposite': 'dwaveoceansdk.embedding.composites',
+    'VectorizedFixedEmbeddingComposite': 'dwaveoceansdk.embedding.composites',
+    'VectorizedLazyFixedEmbeddingComposite': 'dwaveoceansdk.embedding.composites',
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name), name)
+
+    # cache on the module so __getattr__ is not called again for this name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
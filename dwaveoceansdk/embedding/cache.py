@@ -0,0 +1,243 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Persistent cache of minor embeddings."""
+
+import hashlib
+import os
+
+__all__ = ['EmbeddingCache', 'canonical_order']
+
+
+def canonical_order(edgelist):
+    """Order the nodes of a graph by their structural role.
+
+    Nodes are ordered by the colors of Weisfeiler-Lehman color refinement
+    started from the node degrees. Nodes that refinement cannot tell apart
+    keep their order of first appearance in ``edgelist``.
+
+    For graphs where refinement distinguishes every node, isomorphic graphs
+    get the same ordering regardless of their node labels. Graphs with
+    symmetries that refinement cannot resolve may be ordered differently
+    under relabeling, in which case :class:`EmbeddingCache` misses rather
+    than returning an invalid embedding.
+
+    Args:
+        edgelist (iterable[tuple]):
+            Edges of the graph. Self-loops ``(v, v)`` add isolated nodes.
+
+    Returns:
+        list: Nodes of the graph in canonical order.
+    """
+    adj = {}
+    for u, v in edgelist:
+        adj.setdefault(u, set())
+        adj.setdefault(v, set())
+        if u != v:
+            adj[u].add(v)
+            adj[v].add(u)
+
+    nodes = list(adj)
+    colors = {v: len(adj[v]) for v in nodes}
+    num_colors = len(set(colors.values()))
+
+    while True:
+        signatures = {v: (colors[v], tuple(sorted(colors[u] for u in adj[v]))) for v in nodes}
+        palette = {signature: color
+                   for color, signature in enumerate(sorted(set(signatures.values())))}
+        colors = {v: palette[signatures[v]] for v in nodes}
+
+        if len(palette) == num_colors:
+            break
+        num_colors = len(palette)
+
+    # sort is stable, so ties keep their order of appearance
+    return sorted(nodes, key=colors.__getitem__)
+
+
+def _graph_key(edgelist, order):
+    """Hash the structure of a graph with nodes relabeled by their index in
+    ``order``."""
+    index = {v: i for i, v in enumerate(order)}
+    edges = sorted({(min(index[u], index[v]), max(index[u], index[v]))
+                    for u, v in edgelist if u != v})
+
+    h = hashlib.sha256(str(len(order)).encode())
+    for edge in edges:
+        h.update(b'%d,%d;' % edge)
+    return h.hexdigest()
+
+
+class EmbeddingCache:
+    """Persistent cache of minor embeddings.
+
+    A drop-in replacement for :func:`minorminer.find_embedding`, and so
+    for the ``find_embedding`` argument of
+    :class:`~dwave.system.composites.EmbeddingComposite`, that only runs
+    the embedding heuristic for source graphs it has not seen before on the
+    given target graph.
+
+    Embeddings are keyed by the structure of the source graph rather than
+    its labels (see :func:`canonical_order`), a hash of the target
+    (working) graph, which identifies the QPU topology and its yield, and
+    the embedding parameters. A problem that differs from a cached one only
+    in its biases or variable labels therefore reuses the cached
+    embedding.
+
+    Entries are stored in a ``diskcache`` database, which can be shared by
+    multiple processes, is memory-mapped, and evicts the least recently
+    used embeddings once it exceeds its size limit.
+
+    Args:
+        directory (str, optional):
+            Cache directory. Defaults to an ``embeddings`` directory under the
+            Ocean cache directory, see
+            :func:`~dwave.cloud.config.get_cache_dir`.
+
+        size_limit (int, optional, default=2**30):
+            Maximum size of the cache in bytes.
+
+        mmap_size (int, optional, default=2**26):
+            Number of bytes of the cache database to memory-map.
+
+        find_embedding (callable, optional):
+            Function ``find_embedding(S, T, **parameters)`` used on cache
+            misses. Defaults to :func:`minorminer.find_embedding`.
+
+    Examples:
+        >>> from dwave.system import DWaveSampler, EmbeddingComposite
+        >>> from dwaveoceansdk.embedding import EmbeddingCache
+        ...
+        >>> cache = EmbeddingCache()
+        >>> sampler = EmbeddingComposite(DWaveSampler(), find_embedding=cache)   # doctest: +SKIP
+        >>> sampleset = sampler.sample_ising({'a': -1}, {('a', 'b'): 1})   # doctest: +SKIP
+        >>> sampleset = sampler.sample_ising({'x': 3}, {('x', 'y'): -1})   # doctest: +SKIP
+        >>> cache.stats()['hits']    # doctest: +SKIP
+        1
+    """
+    # embedding parameters that do not change the embedding found
+    IGNORED_PARAMETERS = frozenset(['verbose', 'interactive'])
+
+    def __init__(self, directory=None, *, size_limit=2**30, mmap_size=2**26,
+                 find_embedding=None):
+        import diskcache
+
+        if directory is None:
+            from dwave.cloud.config import get_cache_dir
+            directory = os.path.join(get_cache_dir(), 'embeddings')
+
+        if find_embedding is None:
+            from minorminer import find_embedding
+
+        self.find_embedding = find_embedding
+
+        self.store = diskcache.Cache(directory,
+                                     eviction_policy='least-recently-used',
+                                     size_limit=size_limit,
+                                     sqlite_mmap_size=mmap_size)
+
+        self.hits = 0
+        self.misses = 0
+
+        # id(T) -> (T, key); EmbeddingComposite passes the same target
+        # edgelist object on every call, so its hash is only computed once.
+        # We hold a reference to T so that its id is not reused.
+        self._target_keys = {}
+
+    def __call__(self, S, T, **parameters):
+        """Find an embedding of ``S`` in ``T``, using the cache if possible.
+
+        Args:
+            S (iterable[tuple]): Source graph edges.
+            T (iterable[tuple]): Target graph edges.
+            **parameters: Passed to ``find_embedding`` on a cache miss.
+
+        Returns:
+            dict: The embedding, mapping source nodes to chains of target
+            nodes. Empty if no embedding was found.
+        """
+        S = list(S)
+        order = canonical_order(S)
+        key = self._key(S, order, T, parameters)
+
+        chains = self.store.get(key)
+        if chains is not None:
+            self.hits += 1
+            return dict(zip(order, (list(chain) for chain in chains)))
+
+        self.misses += 1
+
+        embedding = self.find_embedding(S, T, **parameters)
+
+        # failed embeddings are not cached, a later attempt may succeed
+        if embedding:
+            self.store.set(key, [tuple(embedding[v]) for v in order])
+
+        return embedding
+
+    def _target_key(self, T):
+        try:
+            target, key = self._target_keys[id(T)]
+        except KeyError:
+            pass
+        else:
+            if target is T:
+                return key
+
+        edges = list(T)
+        key = _graph_key(edges, sorted(set(v for edge in edges for v in edge), key=repr))
+
+        # only a handful of targets are expected, so don't let the memo grow
+        if len(self._target_keys) > 16:
+            self._target_keys.clear()
+        self._target_keys[id(T)] = (T, key)
+        return key
+
+    def _key(self, S, order, T, parameters):
+        parameters = sorted((name, repr(value)) for name, value in parameters.items()
+                            if name not in self.IGNORED_PARAMETERS)
+        return '{}:{}:{}'.format(
+            self._target_key(T),
+            _graph_key(S, order),
+            hashlib.sha256(repr(parameters).encode()).hexdigest())
+
+    def stats(self):
+        """Return the cache statistics.
+
+        Returns:
+            dict: The ``hits`` and ``misses`` of this cache object, the
+            ``hit_rate``, and the number of ``entries`` and ``size`` in bytes
+            of the underlying store.
+        """
+        lookups = self.hits + self.misses
+        return dict(hits=self.hits,
+                    misses=self.misses,
+                    hit_rate=self.hits / lookups if lookups else 0.0,
+                    entries=len(self.store),
+                    size=self.store.volume())
+
+    def clear(self):
+        """Remove all embeddings from the cache and reset the statistics."""
+        self.store.clear()
+        self.hits = self.misses = 0
+
+    def close(self):
+        """Close the underlying store."""
+        self.store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
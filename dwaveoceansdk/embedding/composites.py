@@ -0,0 +1,87 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Embedding composites that unembed with :mod:`~dwaveoceansdk.embedding.unembedding`."""
+
+import dimod
+
+from dwave.system.composites.embedding import (
+    EmbeddingComposite, FixedEmbeddingComposite, LazyFixedEmbeddingComposite)
+
+from dwaveoceansdk.embedding.unembedding import _resolver, uniform_torque_compensation
+
+__all__ = ['VectorizedEmbeddingComposite', 'VectorizedFixedEmbeddingComposite',
+           'VectorizedLazyFixedEmbeddingComposite']
+
+
+class _VectorizedUnembedding:
+    """Mixin for the embedding composites of :mod:`dwave.system` that
+    resolves chains with
+    :class:`~dwaveoceansdk.embedding.unembedding.ChainIndex` and computes the default
+    chain strength from arrays."""
+    def sample(self, bqm, *, chain_strength=None, chain_break_method=None,
+               chain_break_fraction=True, **parameters):
+        if chain_strength is None:
+            chain_strength = uniform_torque_compensation
+
+        resolver = _resolver(chain_break_method)
+        if resolver is None:
+            return super().sample(bqm, chain_strength=chain_strength,
+                                  chain_break_method=chain_break_method,
+                                  chain_break_fraction=chain_break_fraction, **parameters)
+
+        sampleset = super().sample(bqm, chain_strength=chain_strength,
+                                   chain_break_method=resolver, chain_break_fraction=False,
+                                   **parameters)
+
+        def finish(sampleset):
+            sampleset.resolve()
+            return resolver.finish(sampleset, chain_break_fraction)
+
+        return dimod.SampleSet.from_future(sampleset, finish)
+
+
+class VectorizedEmbeddingComposite(_VectorizedUnembedding, EmbeddingComposite):
+    """:class:`~dwave.system.composites.EmbeddingComposite` that unembeds
+    as
+    :func:`~dwaveoceansdk.embedding.unembedding.unembed_sampleset`, with the timings in the sample set's info
+    as ``'unembedding_timing'``, and computes the default chain strength
+    with
+    :func:`~dwaveoceansdk.embedding.unembedding.uniform_torque_compensation`.
+
+    Examples:
+        >>> from dwave.system import DWaveSampler
+        >>> from dwaveoceansdk.embedding import VectorizedEmbeddingComposite
+        >>> from dwaveoceansdk.testing import StandInSAPI
+        ...
+        >>> with StandInSAPI() as sapi:
+        ...     sampler = VectorizedEmbeddingComposite(DWaveSampler(**sapi.config))
+        ...     sampleset = sampler.sample_ising({}, {'ab': -1, 'bc': -1, 'ca': -1})
+        ...     timing = sampleset.info['unembedding_timing']
+        >>> sorted(timing)
+        ['chain_breaks', 'index', 'index_reused']
+    """
+
+
+class VectorizedLazyFixedEmbeddingComposite(_VectorizedUnembedding,
+                                            LazyFixedEmbeddingComposite):
+    """:class:`~dwave.system.composites.LazyFixedEmbeddingComposite` that
+    unembeds as :class:`VectorizedEmbeddingComposite`. Its fixed embedding
+    reuses one chain index for all calls."""
+
+
+class VectorizedFixedEmbeddingComposite(_VectorizedUnembedding, FixedEmbeddingComposite):
+    """:class:`~dwave.system.composites.FixedEmbeddingComposite` that
+    unembeds as :class:`VectorizedEmbeddingComposite`. Its fixed embedding
+    reuses one chain index for all calls."""
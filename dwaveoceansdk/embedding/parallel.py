@@ -0,0 +1,214 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Minor-embedding search parallelized over processes."""
+
+import multiprocessing
+import os
+import queue
+import random
+
+__all__ = ['ParallelFindEmbedding']
+
+
+def _search(find_embedding, S, T, parameters, index, results):
+    """Run one embedding search in a worker process and put
+    ``(index, embedding, error)`` on the ``results`` queue."""
+    from dwave.embedding import is_valid_embedding
+
+    if find_embedding is None:
+        from minorminer import find_embedding
+
+    try:
+        embedding = find_embedding(S, T, **parameters)
+    except Exception as err:
+        results.put((index, None, f'{type(err).__name__}: {err}'))
+        return
+
+    if not embedding or not is_valid_embedding(embedding, S, T):
+        embedding = None
+
+    results.put((index, embedding, None))
+
+
+def _max_chain_length(embedding):
+    return (max(map(len, embedding.values())), sum(map(len, embedding.values())))
+
+
+def _total_qubits(embedding):
+    return (sum(map(len, embedding.values())), max(map(len, embedding.values())))
+
+
+class ParallelFindEmbedding:
+    """Run several minor-embedding searches in parallel processes.
+
+    A drop-in replacement for :func:`minorminer.find_embedding`, and so
+    for the ``find_embedding`` argument of the ``dwave-system`` embedding
+    composites. Each search runs with a different ``random_seed``.
+
+    Args:
+        num_tries (int, optional):
+            Number of searches, each with its own random seed. Defaults to
+            the number of CPUs.
+
+        mode (str, optional, default='first'):
+            ``'first'`` returns the first valid embedding found and
+            terminates the remaining searches. ``'best'`` waits for all
+            searches and returns the best valid embedding according to
+            ``objective``.
+
+        objective (str, optional, default='max_chain_length'):
+            In ``'best'`` mode, ``'max_chain_length'`` minimizes the longest
+            chain, breaking ties on the number of qubits used, and
+            ``'total_qubits'`` minimizes the number of qubits used, breaking
+            ties on the longest chain.
+
+        max_workers (int, optional):
+            Maximum number of searches running at once. Defaults to
+            ``num_tries``.
+
+        seed (int, optional):
+            Seed for the random seeds of the searches. A ``random_seed``
+            embedding parameter, if given, takes precedence.
+
+        find_embedding (callable, optional):
+            Function ``find_embedding(S, T, random_seed=..., **parameters)``
+            run by each search. Must be picklable. Defaults to
+            :func:`minorminer.find_embedding`.
+
+        mp_context (:class:`multiprocessing.context.BaseContext`, optional):
+            Context used to start the worker processes. Defaults to the
+            :mod:`multiprocessing` default.
+
+    Examples:
+        >>> from dwave.system import DWaveSampler, EmbeddingComposite
+        >>> from dwaveoceansdk.embedding import ParallelFindEmbedding
+        ...
+        >>> find_embedding = ParallelFindEmbedding(num_tries=8, mode='best')
+        >>> sampler = EmbeddingComposite(DWaveSampler(), find_embedding=find_embedding)   # doctest: +SKIP
+    """
+    MODES = ('first', 'best')
+
+    OBJECTIVES = {
+        'max_chain_length': _max_chain_length,
+        'total_qubits': _total_qubits,
+    }
+
+    def __init__(self, num_tries=None, *, mode='first', objective='max_chain_length',
+                 max_workers=None, seed=None, find_embedding=None, mp_context=None):
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}, received {mode!r}")
+        if objective not in self.OBJECTIVES:
+            raise ValueError(f"objective must be one of {tuple(self.OBJECTIVES)}, "
+                             f"received {objective!r}")
+
+        if num_tries is None:
+            num_tries = os.cpu_count() or 1
+        if num_tries < 1:
+            raise ValueError("num_tries must be a positive integer")
+
+        if max_workers is None:
+            max_workers = num_tries
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+
+        self.num_tries = num_tries
+        self.mode = mode
+        self.objective = objective
+        self.max_workers = max_workers
+        self.find_embedding = find_embedding
+        self.mp_context = mp_context if mp_context is not None else multiprocessing.get_context()
+
+        self._random = random.Random(seed)
+
+    def __call__(self, S, T, **parameters):
+        """Find an embedding of ``S`` in ``T``.
+
+        Args:
+            S (iterable[tuple]): Source graph edges.
+            T (iterable[tuple]): Target graph edges.
+            **parameters: Passed to each search.
+
+        Returns:
+            dict: The embedding, mapping source nodes to chains of target
+            nodes. Empty if no search found a valid embedding.
+
+        Raises:
+            RuntimeError: If every search raised an exception or exited
+                abnormally.
+        """
+        S = list(S)
+        T = list(T)
+
+        if 'random_seed' in parameters:
+            base = parameters.pop('random_seed')
+            seeds = [base + i for i in range(self.num_tries)]
+        else:
+            seeds = [self._random.randrange(2**31) for _ in range(self.num_tries)]
+
+        results = self.mp_context.Queue()
+
+        pending = list(enumerate(seeds))
+        pending.reverse()  # pop from the end in seed order
+        running = {}
+        embeddings = []
+        errors = []
+
+        try:
+            while pending or running:
+                while pending and len(running) < self.max_workers:
+                    index, seed = pending.pop()
+                    process = self.mp_context.Process(
+                        target=_search,
+                        args=(self.find_embedding, S, T, dict(parameters, random_seed=seed),
+                              index, results),
+                        daemon=True)
+                    process.start()
+                    running[index] = process
+
+                try:
+                    index, embedding, error = results.get(timeout=.1)
+                except queue.Empty:
+                    # workers that die without reporting, e.g. killed by
+                    # the OS, would otherwise be waited on forever
+                    for index, process in list(running.items()):
+                        if not process.is_alive() and process.exitcode != 0:
+                            del running[index]
+                            errors.append(f"search exited with code {process.exitcode}")
+                    continue
+
+                running.pop(index).join()
+
+                if error is not None:
+                    errors.append(error)
+                elif embedding is not None:
+                    embeddings.append((index, embedding))
+                    if self.mode == 'first':
+                        break
+        finally:
+            for process in running.values():
+                process.terminate()
+            for process in running.values():
+                process.join()
+            results.close()
+
+        if embeddings:
+            # break ties by seed order so that results are reproducible
+            objective = self.OBJECTIVES[self.objective]
+            return min(embeddings, key=lambda item: (objective(item[1]), item[0]))[1]
+
+        if len(errors) == self.num_tries:
+            raise RuntimeError("all embedding searches failed:\n" + "\n".join(errors))
+
+        return {}
@@ -0,0 +1,328 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Vectorized unembedding with chain indices reused across calls."""
+
+import collections
+import math
+import threading
+import time
+
+import dimod
+import numpy as np
+import numpy.lib.recfunctions
+
+from dwave.embedding import chain_breaks
+
+__all__ = ['ChainIndex', 'unembed_sampleset', 'uniform_torque_compensation']
+
+
+class ChainIndex:
+    """Chains of an embedding as a sparse matrix, for resolving the chains
+    of all samples at once.
+
+    The chain-index matrix has a row per chain and a column per target
+    variable, with ones at the chain's qubits, so that the sums of the
+    values of every chain of every sample are one sparse matrix product.
+    It is built for the target variables of the first samples and rebuilt
+    only when they change.
+
+    Args:
+        chains (sequence[iterable]):
+            Target variables of each chain, in the order of the source
+            variables.
+
+    Examples:
+        >>> import numpy as np
+        >>> from dwaveoceansdk.embedding import ChainIndex
+        ...
+        >>> index = ChainIndex([(0, 1), (2,)])
+        >>> samples = np.array([[1, 1, -1], [1, -1, 1]], dtype=np.int8)
+        >>> unembedded, rows, broken = index.majority_vote(samples, [0, 1, 2])
+        >>> unembedded
+        array([[ 1, -1],
+               [ 1,  1]], dtype=int8)
+        >>> broken
+        array([[False, False],
+               [ True, False]])
+    """
+    def __init__(self, chains):
+        self.chains = chains = tuple(tuple(chain) for chain in chains)
+        if not all(chains):
+            raise ValueError("chains must not be empty")
+
+        self.lengths = np.fromiter(map(len, chains), dtype=np.int64, count=len(chains))
+        self.indptr = np.zeros(len(chains) + 1, dtype=np.int64)
+        np.cumsum(self.lengths, out=self.indptr[1:])
+        self.qubits = [q for chain in chains for q in chain]
+
+        self._lock = threading.Lock()
+        self._target_variables = None
+        self._matrix = None
+        self._columns = None
+
+    def __len__(self):
+        return len(self.chains)
+
+    def _columns_of(self, target_variables):
+        try:
+            labels = np.asarray(target_variables)
+            qubits = np.asarray(self.qubits)
+            if labels.dtype.kind not in 'iu' or qubits.dtype.kind not in 'iu':
+                raise TypeError
+            if len(qubits) and qubits.min() < 0:
+                raise KeyError
+            # integer labels, e.g. qubits: look them up in an array
+            lookup = np.full(max(labels.max(initial=0), qubits.max(initial=0)) + 1, -1)
+            lookup[labels] = np.arange(len(labels))
+            columns = lookup[qubits]
+            if (columns < 0).any():
+                raise KeyError
+            return columns
+        except (TypeError, KeyError):
+            pass
+
+        position = {v: i for i, v in enumerate(target_variables)}
+        try:
+            return np.fromiter((position[q] for q in self.qubits), dtype=np.int64,
+                               count=len(self.qubits))
+        except KeyError as err:
+            raise ValueError(f"target variable {err.args[0]!r} of a chain "
+                             "is not in the samples") from None
+
+    def matrix(self, target_variables):
+        """Chain-index matrix, a :class:`scipy.sparse.csr_array` of shape
+        ``(num_chains, len(target_variables))``, and the column of each
+        chain's qubits, chain after chain."""
+        from scipy.sparse import csr_array
+
+        with self._lock:
+            if self._target_variables is None or target_variables != self._target_variables:
+                target_variables = list(target_variables)
+                columns = self._columns_of(target_variables)
+                self._matrix = csr_array(
+                    (np.ones(len(columns), dtype=np.int32), columns, self.indptr),
+                    shape=(len(self), len(target_variables)))
+                self._columns = columns
+                self._target_variables = target_variables
+            return self._matrix, self._columns
+
+    def _sums(self, samples, target_variables, vartype):
+        """Sums of the values of each chain's qubits, as an array of shape
+        ``(num_samples, num_chains)``, and whether the samples are
+        spin-valued."""
+        samples = np.asarray(samples)
+        matrix, _ = self.matrix(target_variables)
+        if vartype is None:
+            # spin-valued samples have no zeros, as in dwave.embedding.chain_breaks
+            spin = bool(samples.all())
+        else:
+            spin = dimod.as_vartype(vartype) is dimod.SPIN
+        return np.asarray(samples @ matrix.T), spin
+
+    def _broken(self, sums, spin):
+        if spin:
+            return (sums != self.lengths) & (sums != -self.lengths)
+        return (sums != self.lengths) & (sums != 0)
+
+    def broken(self, samples, target_variables, vartype=None) -> np.ndarray:
+        """Boolean array, of shape ``(num_samples, num_chains)``, of the
+        broken chains of each sample.
+
+        The vartype of the samples, if not given, is inferred from their
+        values, as by :mod:`dwave.embedding.chain_breaks`: spin-valued if
+        none is zero.
+        """
+        return self._broken(*self._sums(samples, target_variables, vartype))
+
+    def majority_vote(self, samples, target_variables, vartype=None):
+        """Resolve each chain to the value of most of its qubits, with ties
+        going to 1, as :func:`dwave.embedding.chain_breaks.majority_vote`.
+
+        Returns:
+            tuple: The unembedded samples, the rows of the samples kept, all
+            of them, and the broken chains as by :meth:`broken`.
+        """
+        sums, spin = self._sums(samples, target_variables, vartype)
+
+        if spin:
+            unembedded = np.where(sums >= 0, 1, -1).astype(np.int8)
+        else:
+            unembedded = (2 * sums >= self.lengths).astype(np.int8)
+
+        return unembedded, np.arange(len(sums)), self._broken(sums, spin)
+
+    def discard(self, samples, target_variables, vartype=None):
+        """Discard samples with broken chains, as
+        :func:`dwave.embedding.chain_breaks.discard`.
+
+        Returns:
+            tuple: The unembedded samples, the rows of the samples kept and
+            the broken chains of the samples kept.
+        """
+        sums, spin = self._sums(samples, target_variables, vartype)
+        rows = np.flatnonzero(~self._broken(sums, spin).any(axis=1))
+
+        # unbroken chains have the value of any of their qubits
+        _, columns = self.matrix(target_variables)
+        first = columns[self.indptr[:-1]]
+        return (np.asarray(samples)[np.ix_(rows, first)].astype(np.int8), rows,
+                np.zeros((len(rows), len(self)), dtype=bool))
+
+
+_CHAIN_BREAK_METHODS = {
+    chain_breaks.majority_vote: ChainIndex.majority_vote,
+    chain_breaks.discard: ChainIndex.discard,
+}
+
+# chains -> ChainIndex, most recently used last
+_indices = collections.OrderedDict()
+_indices_lock = threading.Lock()
+
+MAX_CACHED_INDICES = 16
+"""int: Number of chain indices kept for reuse by :func:`unembed_sampleset`
+and the composites."""
+
+
+def _get_index(chains):
+    """Chain index of ``chains``, built or reused, and the seconds taken."""
+    t = time.perf_counter()
+    key = tuple(tuple(chain) for chain in chains)
+    with _indices_lock:
+        index = _indices.get(key)
+        if index is not None:
+            _indices.move_to_end(key)
+            return index, time.perf_counter() - t, True
+
+    index = ChainIndex(key)
+    with _indices_lock:
+        _indices[key] = index
+        while len(_indices) > MAX_CACHED_INDICES:
+            _indices.popitem(last=False)
+    return index, time.perf_counter() - t, False
+
+
+def uniform_torque_compensation(bqm, embedding=None, prefactor=1.414):
+    """Chain strength of
+    :func:`dwave.embedding.chain_strength.uniform_torque_compensation`,
+    computed from the arrays of ``bqm`` rather than by iterating over its
+    interactions.
+
+    Examples:
+        >>> import dimod
+        >>> from dwaveoceansdk.embedding import uniform_torque_compensation
+        >>> bqm = dimod.BinaryQuadraticModel.from_ising({}, {'ab': 1, 'bc': 1})
+        >>> round(uniform_torque_compensation(bqm), 3)
+        1.633
+    """
+    if not bqm.num_interactions:
+        # won't matter (chain strength isn't needed to embed this problem)
+        return 1
+
+    _, (irow, icol, quadratic), _ = bqm.to_numpy_vectors()
+    rms = math.sqrt(np.dot(quadratic, quadratic) / len(quadratic))
+    # each interaction adds to the degree of two variables
+    avg_degree = 2 * len(quadratic) / bqm.num_variables
+    return prefactor * rms * math.sqrt(avg_degree)
+
+
+class _Resolver:
+    """Chain-break method for one unembedding that resolves the chains with
+    a :class:`ChainIndex` and keeps the broken chains and timings."""
+    def __init__(self, method, name):
+        self.method = method
+        # recorded in the embedding context when the embedding is returned
+        self.__name__ = name
+        self.broken = None
+        self.rows = None
+        self.timing = {}
+
+    def __call__(self, target_sampleset, chains):
+        index, self.timing['index'], self.timing['index_reused'] = _get_index(chains)
+
+        t = time.perf_counter()
+        record = target_sampleset.record
+        unembedded, self.rows, self.broken = self.method(
+            index, record.sample, target_sampleset.variables, target_sampleset.vartype)
+        self.timing['chain_breaks'] = time.perf_counter() - t
+        return unembedded, self.rows
+
+    def finish(self, sampleset, chain_break_fraction):
+        """Add the chain break fraction and timings to an unembedded sample
+        set."""
+        if chain_break_fraction and 'chain_break_fraction' not in sampleset.record.dtype.names:
+            if self.broken is None:
+                # chains of length one, resolved without a chain-break method
+                fraction = np.zeros(len(sampleset))
+            elif self.broken.shape[1]:
+                fraction = self.broken.mean(axis=1)
+            else:
+                fraction = np.ones(len(sampleset))
+            record = np.lib.recfunctions.append_fields(
+                sampleset.record, 'chain_break_fraction', fraction, asrecarray=True,
+                usemask=False)
+            sampleset = dimod.SampleSet(record, sampleset.variables, sampleset.info,
+                                        sampleset.vartype)
+        sampleset.info['unembedding_timing'] = self.timing
+        return sampleset
+
+
+def _resolver(chain_break_method):
+    """Resolver for the chain-break method, or None if it is not
+    vectorized."""
+    if chain_break_method is None:
+        chain_break_method = chain_breaks.majority_vote
+    method = _CHAIN_BREAK_METHODS.get(chain_break_method)
+    return None if method is None else _Resolver(method, chain_break_method.__name__)
+
+
+def unembed_sampleset(target_sampleset, embedding, source_bqm,
+                      chain_break_method=None, chain_break_fraction=False,
+                      return_embedding=False):
+    """Unembed a sample set, as :func:`dwave.embedding.unembed_sampleset`.
+
+    Majority vote and discard, the chain-break methods of
+    :mod:`dwave.embedding.chain_breaks` that are not random, resolve all
+    samples at once with a :class:`ChainIndex`, which is reused for later
+    calls with the same chains. Other methods are passed on to
+    :func:`dwave.embedding.unembed_sampleset`.
+
+    The time taken to get the chain index, whether it was reused and the
+    time taken to resolve the chains are added to the sample set's info as
+    ``'unembedding_timing'``.
+
+    Examples:
+        >>> import dimod
+        >>> from dwaveoceansdk.embedding import unembed_sampleset
+        ...
+        >>> embedding = {'a': (0, 1), 'b': (2,)}
+        >>> bqm = dimod.BinaryQuadraticModel.from_ising({}, {'ab': -1})
+        >>> target = dimod.SampleSet.from_samples(
+        ...     ([[1, 1, 1], [1, -1, -1]], [0, 1, 2]), 'SPIN', 0)
+        >>> sampleset = unembed_sampleset(target, embedding, bqm, chain_break_fraction=True)
+        >>> sampleset.record.chain_break_fraction
+        array([0. , 0.5])
+    """
+    import dwave.embedding
+
+    resolver = _resolver(chain_break_method)
+    if resolver is None:
+        return dwave.embedding.unembed_sampleset(
+            target_sampleset, embedding, source_bqm, chain_break_method=chain_break_method,
+            chain_break_fraction=chain_break_fraction, return_embedding=return_embedding)
+
+    sampleset = dwave.embedding.unembed_sampleset(
+        target_sampleset, embedding, source_bqm, chain_break_method=resolver,
+        chain_break_fraction=False, return_embedding=return_embedding)
+    return resolver.finish(sampleset, chain_break_fraction)
@@ -0,0 +1,480 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batched and sparse state-vector simulation of :mod:`dwave.gate` circuits.
+
+:func:`dwave.gate.simulator.simulate` runs one circuit on a dense state
+vector, so evaluating a parametric circuit for many parameter values means
+copying the circuit with :meth:`~dwave.gate.ParametricCircuit.eval` and
+simulating each copy in turn. This module compiles a circuit once into a
+list of gates and then
+
+*   :func:`simulate_batch` applies each gate to the states of all the
+    parameter values at once, as a ``(batch, 2**num_qubits)`` array, with
+    the matrices of the parametric gates computed for the whole batch;
+*   :func:`simulate_sparse` keeps only the nonzero amplitudes, for circuits
+    whose states stay sparse, such as those made mostly of Pauli,
+    controlled and diagonal gates.
+
+Both return states with the qubit ordering of
+:func:`~dwave.gate.simulator.simulate`. Measurements are not supported.
+
+.. autosummary::
+
+    simulate_batch
+    simulate_sparse
+"""
+
+from __future__ import annotations
+
+import typing
+
+import numpy as np
+
+__all__ = ['simulate_batch', 'simulate_sparse']
+
+
+def _rx(theta):
+    c = np.cos(theta / 2)
+    s = -1j * np.sin(theta / 2)
+    return np.stack([c, s, s, c], axis=-1).reshape(-1, 2, 2)
+
+
+def _ry(theta):
+    c = np.cos(theta / 2)
+    s = np.sin(theta / 2)
+    return np.stack([c, -s, s, c], axis=-1).reshape(-1, 2, 2).astype(np.complex128)
+
+
+def _rz(theta):
+    phase = np.exp(-.5j * theta)
+    return np.stack([phase, np.zeros_like(phase), np.zeros_like(phase), phase.conj()],
+                    axis=-1).reshape(-1, 2, 2)
+
+
+def _rotation(beta, gamma, delta):
+    c = np.cos(gamma / 2)
+    s = np.sin(gamma / 2)
+    return np.stack([np.exp(-.5j * (beta + delta)) * c, -np.exp(.5j * (beta - delta)) * s,
+                     np.exp(-.5j * (beta - delta)) * s, np.exp(.5j * (beta + delta)) * c],
+                    axis=-1).reshape(-1, 2, 2)
+
+
+# operation name -> matrices for a batch of parameters, and whether diagonal
+_BATCH_MATRICES = {
+    'RX': (_rx, False),
+    'RY': (_ry, False),
+    'RZ': (_rz, True),
+    'Rotation': (_rotation, False),
+}
+
+_X = np.array([[0, 1], [1, 0]], dtype=np.complex128)
+
+# states of at least this many amplitudes are simulated with the compiled
+# kernels of dwave-gate
+_KERNEL_MIN_SIZE = 1 << 15
+
+
+class _Gate:
+    """Operation ``op`` of a circuit on qubits ``targets``: a single-qubit
+    gate on ``target``, applied where all of ``controls`` are 1, or a swap
+    of the two qubits of ``target`` if it has no matrix."""
+    def __init__(self, op, targets, target, controls=(), matrix=None, operation=None,
+                 parameters=()):
+        self.op = op
+        self.targets = targets
+        self.target = target
+        self.controls = tuple(controls)
+        self.matrix = matrix            # constant (2, 2) matrix
+        self.operation = operation      # class of a gate with variable parameters
+        self.parameters = parameters    # (column or None, constant) per parameter
+
+        if matrix is not None:
+            self.diagonal = matrix[0, 1] == 0 and matrix[1, 0] == 0
+            self.antidiagonal = matrix[0, 0] == 0 and matrix[1, 1] == 0
+        else:
+            self.diagonal = _BATCH_MATRICES.get(getattr(operation, '__name__', None),
+                                                (None, False))[1]
+            self.antidiagonal = False
+
+    @property
+    def is_swap(self):
+        return self.matrix is None and self.operation is None
+
+    def _values(self, parameters):
+        return [parameters[:, column] if column is not None
+                else np.full(len(parameters), constant)
+                for column, constant in self.parameters]
+
+    def matrices(self, parameters):
+        """Matrix of the gate for each row of ``parameters``, as an array
+        of shape ``(len(parameters), 2, 2)``, or its constant matrix."""
+        if self.operation is None:
+            return self.matrix
+
+        values = self._values(parameters)
+        batched = _BATCH_MATRICES.get(self.operation.__name__)
+        if batched is not None:
+            return batched[0](*values)
+        return np.stack([self.operation(list(row)).matrix for row in zip(*values)])
+
+    def operations(self, parameters):
+        """The operation with the parameters of each row of ``parameters``."""
+        if self.operation is None:
+            return [self.op] * len(parameters)
+        return [type(self.op)(list(row)) for row in zip(*self._values(parameters))]
+
+
+def _compile(circuit) -> list[_Gate]:
+    """Gates of a :class:`dwave.gate.Circuit`, with qubits as indices."""
+    import dwave.gate.operations as ops
+    from dwave.gate.primitives import Variable
+
+    # variables of a parametric circuit, in the order of its parameters
+    columns = {variable.name: i for i, variable in
+               enumerate(getattr(circuit, '_parameter_register', ()))}
+
+    def parameters(op):
+        resolved = []
+        for parameter in op.parameters:
+            if isinstance(parameter, Variable):
+                if parameter.name not in columns:
+                    raise ValueError(f"unknown parameter variable {parameter!r} in {op.label}")
+                resolved.append((columns[parameter.name], None))
+            else:
+                resolved.append((None, parameter))
+        return resolved
+
+    def gate(op, targets, controls, operation):
+        # operation is the class of the single-qubit gate applied
+        if not isinstance(op, ops.ParametricOperation):
+            matrix = np.asarray(operation.matrix, dtype=np.complex128)
+            return _Gate(op, targets, targets[-1], controls, matrix=matrix)
+
+        resolved = parameters(op)
+        if all(column is None for column, _ in resolved):
+            matrix = operation([constant for _, constant in resolved]).matrix
+            return _Gate(op, targets, targets[-1], controls,
+                         matrix=np.asarray(matrix, dtype=np.complex128))
+        return _Gate(op, targets, targets[-1], controls, operation=operation,
+                     parameters=resolved)
+
+    gates = []
+    for op in circuit.circuit:
+        if isinstance(op, ops.Barrier) or op.is_blocked:
+            continue
+        if isinstance(op, ops.Measurement):
+            raise ValueError("measurements are not supported, simulate the circuit with "
+                             "dwave.gate.simulator.simulate instead")
+
+        targets = [circuit.qubits.index(qubit) for qubit in op.qubits]
+
+        if isinstance(op, ops.SWAP):
+            gates.append(_Gate(op, targets, tuple(targets)))
+        elif isinstance(op, ops.CSWAP):
+            gates.append(_Gate(op, targets, tuple(targets[1:]), targets[:1]))
+        elif isinstance(op, ops.CCX):
+            gates.append(_Gate(op, targets, targets[2], targets[:2], matrix=_X))
+        elif isinstance(op, ops.ControlledOperation):
+            num_control = op.num_control
+            if len(targets) != num_control + 1:
+                raise ValueError(f"unsupported controlled operation {op.label}")
+            gates.append(gate(op, targets, targets[:num_control], op.target_operation))
+        elif op.num_qubits == 1:
+            gates.append(gate(op, targets, (), type(op)))
+        else:
+            raise ValueError(f"unsupported multi-qubit operation {op.label}")
+
+    return gates
+
+
+def _parameters(circuit, parameters, batched):
+    num_parameters = getattr(circuit, 'num_parameters', 0)
+
+    if parameters is None:
+        if num_parameters:
+            raise ValueError(f"circuit has {num_parameters} parameters, none given")
+        parameters = np.empty((1, 0))
+    else:
+        parameters = np.asarray(parameters, dtype=np.float64)
+        if not batched:
+            parameters = parameters.reshape(1, -1)
+        if parameters.ndim != 2 or parameters.shape[1] != num_parameters:
+            raise ValueError(f"expected parameters of shape (batch, {num_parameters}), "
+                             f"received {parameters.shape}")
+    return parameters
+
+
+def simulate_batch(circuit, parameters=None, *,
+                   little_endian: bool = False,
+                   dtype: typing.Union[np.dtype, str] = np.complex128,
+                   ) -> np.ndarray:
+    """Final state vectors of a circuit for a batch of parameter values.
+
+    Args:
+        circuit (:class:`dwave.gate.Circuit`):
+            Circuit without measurements. For a
+            :class:`~dwave.gate.ParametricCircuit`, column ``i`` of
+            ``parameters`` is the value of its parameter ``i``.
+
+        parameters (array-like, optional):
+            Parameter values, of shape ``(batch, circuit.num_parameters)``.
+            Defaults to a batch of one for circuits without parameters.
+
+        little_endian:
+            Index the states with little-endian qubit ordering rather than
+            the default big-endian, as :func:`~dwave.gate.simulator.simulate`.
+
+        dtype:
+            Complex type of the states; ``complex64`` halves their memory.
+
+    Returns:
+        Array of shape ``(batch, 2**circuit.num_qubits)``: the state of each
+        row of ``parameters``.
+
+    Examples:
+        >>> import numpy as np
+        >>> import dwave.gate.operations as ops
+        >>> from dwave.gate import ParametricCircuit
+        >>> from dwaveoceansdk.gate import simulate_batch
+        ...
+        >>> circuit = ParametricCircuit(2)
+        >>> with circuit.context as (p, q, c):
+        ...     ops.RY(p[0], q[0])
+        ...     ops.CX(q[0], q[1])
+        >>> states = simulate_batch(circuit, [[0], [np.pi]])
+        >>> np.round(states.real, 6)
+        array([[1., 0., 0., 0.],
+               [0., 0., 0., 1.]])
+    """
+    parameters = _parameters(circuit, parameters, batched=True)
+    gates = _compile(circuit)
+
+    num_qubits = circuit.num_qubits
+    batch = len(parameters)
+
+    states = np.zeros((batch, 1 << num_qubits), dtype=dtype)
+    states[:, 0] = 1
+
+    # large states are updated one at a time by the compiled kernels of
+    # dwave-gate, which make a single pass over each state
+    if states.dtype == np.complex128 and (1 << num_qubits) >= _KERNEL_MIN_SIZE:
+        from dwave.gate.simulator.simulator import apply_instruction
+
+        for gate in gates:
+            for state, op in zip(states, gate.operations(parameters)):
+                apply_instruction(num_qubits, state, op, gate.targets, little_endian, None)
+        return states
+
+    def position(qubit):
+        # of the qubit's bit in the basis-state indices, most significant first
+        return num_qubits - 1 - qubit if little_endian else qubit
+
+    for gate in gates:
+        batched = gate.operation is not None
+        targets = gate.target if gate.is_swap else (gate.target,)
+        positions = sorted(map(position, gate.controls + tuple(targets)))
+
+        # the states as an array with one axis of length 2 for each of the
+        # gate's qubits, the other qubits merged, and a batch axis first if
+        # the gate's matrix varies over the batch
+        shape = []
+        previous = -1
+        for p in positions:
+            shape.extend((1 << (p - previous - 1), 2))
+            previous = p
+        shape.append(1 << (num_qubits - 1 - previous))
+        if batched:
+            shape.insert(0, batch)
+        else:
+            shape[0] *= batch
+        tensor = states.reshape(shape)
+
+        def axis(qubit):
+            return batched + 2 * positions.index(position(qubit)) + 1
+
+        index = [slice(None)] * len(shape)
+        for control in gate.controls:
+            index[axis(control)] = 1
+
+        if gate.is_swap:
+            first, second = map(axis, gate.target)
+            index[first], index[second] = 0, 1
+            a = tensor[tuple(index)]
+            index[first], index[second] = 1, 0
+            b = tensor[tuple(index)]
+            swapped = a.copy()
+            a[...] = b
+            b[...] = swapped
+            continue
+
+        index[axis(gate.target)] = 0
+        a = tensor[tuple(index)]
+        index[axis(gate.target)] = 1
+        b = tensor[tuple(index)]
+
+        matrix = gate.matrices(parameters)
+        if matrix.ndim == 3:
+            # one matrix per state, broadcast along the qubit axes
+            matrix = matrix.astype(dtype, copy=False).reshape((batch, 2, 2) + (1,) * (a.ndim - 1))
+            (u00, u01), (u10, u11) = np.moveaxis(matrix, (1, 2), (0, 1))
+        else:
+            (u00, u01), (u10, u11) = matrix.tolist()
+
+        if gate.diagonal:
+            _scale(a, u00)
+            _scale(b, u11)
+        elif gate.antidiagonal:
+            flipped = a * u10 if not _is_one(u10) else a.copy()
+            if _is_one(u01):
+                a[...] = b
+            else:
+                np.multiply(b, u01, out=a)
+            b[...] = flipped
+        else:
+            new = a * u00
+            new += b * u01
+            _scale(b, u11)
+            b += a * u10
+            a[...] = new
+
+    return states
+
+
+def _is_one(u):
+    return not isinstance(u, np.ndarray) and u == 1
+
+
+def _scale(array, u):
+    if not _is_one(u):
+        array *= u
+
+
+def simulate_sparse(circuit, parameters=None, *,
+                    little_endian: bool = False,
+                    atol: float = 1e-12,
+                    ) -> tuple[np.ndarray, np.ndarray]:
+    """Final state vector of a circuit, as its nonzero amplitudes.
+
+    The state is kept as sorted arrays of basis-state indices and
+    amplitudes throughout, so memory and time scale with the number of
+    nonzero amplitudes rather than with ``2**num_qubits``. Pauli, swap and
+    diagonal gates, controlled or not, never increase that number; other
+    gates can at most double it.
+
+    Args:
+        circuit (:class:`dwave.gate.Circuit`):
+            Circuit without measurements, on at most 62 qubits.
+
+        parameters (array-like, optional):
+            Values of the parameters of a
+            :class:`~dwave.gate.ParametricCircuit`, of length
+            ``circuit.num_parameters``.
+
+        little_endian:
+            Index the state with little-endian qubit ordering rather than
+            the default big-endian.
+
+        atol:
+            Amplitudes with smaller absolute values are dropped.
+
+    Returns:
+        Sorted indices of the basis states with nonzero amplitudes and
+        their amplitudes.
+
+    Examples:
+        >>> import dwave.gate.operations as ops
+        >>> from dwave.gate import Circuit
+        >>> from dwaveoceansdk.gate import simulate_sparse
+        ...
+        >>> circuit = Circuit(40)
+        >>> with circuit.context as (q, c):
+        ...     ops.Hadamard(q[0])
+        ...     for i in range(39):
+        ...         ops.CX(q[i], q[i + 1])
+        >>> indices, amplitudes = simulate_sparse(circuit)
+        >>> indices.tolist()
+        [0, 1099511627775]
+    """
+    parameters = _parameters(circuit, parameters, batched=False)
+    gates = _compile(circuit)
+
+    num_qubits = circuit.num_qubits
+    if num_qubits > 62:
+        raise ValueError("simulate_sparse supports circuits of up to 62 qubits")
+
+    def mask(qubit):
+        return np.int64(1 << (qubit if little_endian else num_qubits - 1 - qubit))
+
+    indices = np.zeros(1, dtype=np.int64)
+    amplitudes = np.ones(1, dtype=np.complex128)
+
+    for gate in gates:
+        control_mask = np.int64(sum(int(mask(control)) for control in gate.controls))
+        if gate.controls:
+            selected = (indices & control_mask) == control_mask
+        else:
+            selected = None
+
+        if gate.is_swap:
+            first, second = map(mask, gate.target)
+            differ = ((indices & first) != 0) != ((indices & second) != 0)
+            if selected is not None:
+                differ &= selected
+            indices = np.where(differ, indices ^ (first | second), indices)
+            order = np.argsort(indices, kind='stable')
+            indices, amplitudes = indices[order], amplitudes[order]
+            continue
+
+        target = mask(gate.target)
+        (u00, u01), (u10, u11) = np.asarray(gate.matrices(parameters)).reshape(-1, 2, 2)[0]
+        is_set = (indices & target) != 0
+
+        if gate.diagonal:
+            factors = np.where(is_set, u11, u00)
+            if selected is not None:
+                factors = np.where(selected, factors, 1)
+            amplitudes = amplitudes * factors
+        elif gate.antidiagonal:
+            if selected is None:
+                selected = np.ones(len(indices), dtype=bool)
+            amplitudes = np.where(selected, amplitudes * np.where(is_set, u01, u10), amplitudes)
+            indices = np.where(selected, indices ^ target, indices)
+            order = np.argsort(indices, kind='stable')
+            indices, amplitudes = indices[order], amplitudes[order]
+        else:
+            if selected is not None:
+                kept_indices, kept_amplitudes = indices[~selected], amplitudes[~selected]
+                indices, amplitudes, is_set = indices[selected], amplitudes[selected], is_set[selected]
+
+            # amplitudes of each pair of basis states that differ in the target
+            pairs, position = np.unique(indices & ~target, return_inverse=True)
+            a = np.zeros(len(pairs), dtype=np.complex128)
+            b = np.zeros(len(pairs), dtype=np.complex128)
+            a[position[~is_set]] = amplitudes[~is_set]
+            b[position[is_set]] = amplitudes[is_set]
+
+            indices = np.concatenate([pairs, pairs | target])
+            amplitudes = np.concatenate([u00 * a + u01 * b, u10 * a + u11 * b])
+
+            if selected is not None:
+                indices = np.concatenate([indices, kept_indices])
+                amplitudes = np.concatenate([amplitudes, kept_amplitudes])
+
+            nonzero = np.abs(amplitudes) > atol
+            indices, amplitudes = indices[nonzero], amplitudes[nonzero]
+            order = np.argsort(indices)
+            indices, amplitudes = indices[order], amplitudes[order]
+
+    return indices, amplitudes
@@ -0,0 +1,332 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Array-based problems of the :mod:`dwave.graphs` algorithms.
+
+Functions such as :func:`dwave.graphs.maximum_cut` build a binary quadratic
+model from the edges of a :class:`networkx.Graph` one at a time on every
+call, and map the sampler's sample back to the nodes through dicts. The
+problems of this module build the same model from the graph's adjacency in
+compressed sparse row (CSR) form with array operations, label its variables
+by node position, and decode sample sets into arrays. A problem keeps its
+model, so that when only the weights change, :meth:`~MaxCut.set_weights`
+updates the biases in place rather than rebuilding it.
+
+.. autosummary::
+
+    IndependentSet
+    MaxCut
+    VertexColoring
+    VertexCover
+"""
+
+import itertools
+
+import numpy as np
+
+__all__ = ['IndependentSet', 'MaxCut', 'VertexColoring', 'VertexCover']
+
+
+def _adjacency(graph, weight):
+    """Nodes, upper-triangle edges as rows and columns of node positions,
+    and edge weights of ``graph``."""
+    from dwaveoceansdk.topology import Topology
+
+    if isinstance(graph, Topology):
+        edges = graph.index(graph.edges())
+        return graph.nodes, edges[:, 0], edges[:, 1], np.ones(len(edges))
+
+    if hasattr(graph, 'tocoo'):
+        # scipy sparse matrix or array, its entries are the edge weights
+        matrix = graph.tocoo()
+        if matrix.shape[0] != matrix.shape[1]:
+            raise ValueError("adjacency matrix must be square")
+        rows, cols = matrix.row.astype(np.int64), matrix.col.astype(np.int64)
+        data = np.asarray(matrix.data, dtype=np.float64)
+        nodes = np.arange(matrix.shape[0])
+    else:
+        # networkx graph: one pass over its edges
+        nodes = list(graph)
+        index = {v: i for i, v in enumerate(nodes)}
+        if weight is None:
+            pairs = ((index[u], index[v]) for u, v in graph.edges)
+            edges = np.fromiter(itertools.chain.from_iterable(pairs), dtype=np.int64)
+            rows, cols = edges[0::2], edges[1::2]
+            data = np.ones(len(rows))
+        else:
+            triples = ((index[u], index[v], w)
+                       for u, v, w in graph.edges(data=weight, default=1))
+            edges = np.fromiter(itertools.chain.from_iterable(triples), dtype=np.float64)
+            rows, cols = edges[0::3].astype(np.int64), edges[1::3].astype(np.int64)
+            data = edges[2::3]
+        nodes = np.array(nodes + [None], dtype=object)[:-1]
+
+    # each edge once, as stored in the upper triangle or symmetrically
+    lower, upper = np.minimum(rows, cols), np.maximum(rows, cols)
+    _, first = np.unique(lower * len(nodes) + upper, return_index=True)
+    keep = first[lower[first] != upper[first]]
+    return nodes, lower[keep], upper[keep], data[keep]
+
+
+def _node_weights(graph, weight, num_nodes):
+    """Node weights of a :class:`networkx.Graph`'s ``weight`` attribute,
+    default 1."""
+    if weight is None or not hasattr(graph, 'nodes') or not callable(graph.nodes):
+        return np.ones(num_nodes)
+    return np.fromiter((w for _, w in graph.nodes(data=weight, default=1)),
+                       dtype=np.float64, count=num_nodes)
+
+
+class _GraphProblem:
+    """Binary quadratic model of a graph problem and its decoding."""
+    def __init__(self, graph, weight=None):
+        self.nodes, self.irow, self.icol, self._edge_weights = _adjacency(graph, weight)
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes of the graph."""
+        return len(self.nodes)
+
+    @property
+    def edges(self) -> np.ndarray:
+        """Edges, as an array of shape ``(num_edges, 2)`` of node
+        positions."""
+        return np.stack([self.irow, self.icol], axis=1)
+
+    def samples(self, sampleset) -> np.ndarray:
+        """Samples of ``sampleset`` as an array with one column per variable
+        of :attr:`bqm`, in order."""
+        labels = np.fromiter(sampleset.variables, dtype=np.int64,
+                             count=len(sampleset.variables))
+        samples = sampleset.record.sample
+        if (labels == np.arange(len(labels))).all():
+            return samples
+        order = np.empty(len(labels), dtype=np.int64)
+        order[labels] = np.arange(len(labels))
+        return samples[:, order]
+
+    def solve(self, sampler, **sampler_args):
+        """Sample :attr:`bqm` with ``sampler`` and decode the lowest-energy
+        sample, as the corresponding :mod:`dwave.graphs` function."""
+        sampleset = sampler.sample(self.bqm, **sampler_args)
+        return self._result(self.decode(sampleset.truncate(1))[0])
+
+
+class MaxCut(_GraphProblem):
+    """Maximum cut, as :func:`dwave.graphs.maximum_cut` and
+    :func:`dwave.graphs.weighted_maximum_cut`.
+
+    Args:
+        graph (:class:`networkx.Graph`/:class:`scipy.sparse.sparray`/:class:`~dwaveoceansdk.topology.Topology`):
+            The graph. A sparse matrix is an adjacency matrix, symmetric or
+            upper triangular, with the edge weights as entries; its nodes
+            are ``0, 1, ...``.
+
+        weight (str, optional):
+            Edge attribute of a :class:`networkx.Graph` that holds the edge
+            weights. Edges are unweighted by default.
+
+    Examples:
+        >>> import dimod
+        >>> import networkx as nx
+        >>> from dwaveoceansdk.graphs import MaxCut
+        ...
+        >>> problem = MaxCut(nx.cycle_graph(4))
+        >>> sorted(problem.solve(dimod.ExactSolver()))
+        [0, 2]
+        >>> problem.edges.tolist()
+        [[0, 1], [0, 3], [1, 2], [2, 3]]
+        >>> problem.set_weights([1, 1, 1, -5])   # reuses the model
+        >>> sorted(problem.solve(dimod.ExactSolver()))
+        [0]
+    """
+    def __init__(self, graph, *, weight=None):
+        import dimod
+
+        super().__init__(graph, weight)
+        self.weights = self._edge_weights
+        self.bqm = dimod.BinaryQuadraticModel.from_numpy_vectors(
+            np.zeros(self.num_nodes), (self.irow, self.icol, self.weights), 0.0, dimod.SPIN)
+
+    def set_weights(self, weights):
+        """Set the edge weights, in the order of :attr:`edges`, updating
+        :attr:`bqm` in place."""
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.shape != self.weights.shape:
+            raise ValueError(f"expected {len(self.weights)} edge weights")
+        self.bqm.data.add_quadratic_from_arrays(self.irow, self.icol, weights - self.weights)
+        self.weights = weights
+
+    def decode(self, sampleset) -> np.ndarray:
+        """Boolean array, of shape ``(num_samples, num_nodes)``, of the nodes
+        on the spin-up side of the cut of each sample."""
+        return self.samples(sampleset) >= 0
+
+    def _result(self, selected):
+        return set(self.nodes[selected].tolist())
+
+
+class IndependentSet(_GraphProblem):
+    """Maximum (weighted) independent set, as
+    :func:`dwave.graphs.maximum_weighted_independent_set` and
+    :func:`dwave.graphs.maximum_independent_set`.
+
+    Args:
+        graph (:class:`networkx.Graph`/:class:`scipy.sparse.sparray`/:class:`~dwaveoceansdk.topology.Topology`):
+            The graph, as for :class:`MaxCut`. Only its structure is used.
+
+        weight (str, optional):
+            Node attribute of a :class:`networkx.Graph` that holds the node
+            weights. Nodes have weight 1 by default; see also
+            :meth:`set_weights`.
+
+        lagrange (float, optional, default=2.0):
+            Strength of the edge penalties, relative to the largest node
+            weight.
+
+    Examples:
+        >>> import dimod
+        >>> import networkx as nx
+        >>> from dwaveoceansdk.graphs import IndependentSet
+        ...
+        >>> problem = IndependentSet(nx.path_graph(3))
+        >>> problem.solve(dimod.ExactSolver())
+        [0, 2]
+        >>> problem.set_weights([1, 3, 1])
+        >>> problem.solve(dimod.ExactSolver())
+        [1]
+    """
+    def __init__(self, graph, *, weight=None, lagrange=2.0):
+        import dimod
+
+        super().__init__(graph, None)
+        self.lagrange = lagrange
+        self.weights = _node_weights(graph, weight, self.num_nodes)
+        self.bqm = dimod.BinaryQuadraticModel.from_numpy_vectors(
+            -self.weights,
+            (self.irow, self.icol, np.full(len(self.irow), self._strength(self.weights))),
+            0.0, dimod.BINARY)
+
+    def _strength(self, weights):
+        # as dimod.generators.maximum_weight_independent_set
+        return self.lagrange * (weights.max() if len(weights) else 1)
+
+    def set_weights(self, weights):
+        """Set the node weights, updating :attr:`bqm` in place."""
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.shape != self.weights.shape:
+            raise ValueError(f"expected {len(self.weights)} node weights")
+
+        self.bqm.data.add_linear_from_array(self.weights - weights)
+
+        delta = self._strength(weights) - self._strength(self.weights)
+        if delta:
+            self.bqm.data.add_quadratic_from_arrays(
+                self.irow, self.icol, np.full(len(self.irow), delta))
+
+        self.weights = weights
+
+    def decode(self, sampleset) -> np.ndarray:
+        """Boolean array, of shape ``(num_samples, num_nodes)``, of the nodes
+        in the set of each sample."""
+        return self.samples(sampleset) > 0
+
+    def _result(self, selected):
+        return self.nodes[selected].tolist()
+
+
+class VertexCover(IndependentSet):
+    """Minimum (weighted) vertex cover, as
+    :func:`dwave.graphs.min_weighted_vertex_cover` and
+    :func:`dwave.graphs.min_vertex_cover`: the complement of a maximum
+    (weighted) independent set.
+
+    Takes the arguments of :class:`IndependentSet`.
+
+    Examples:
+        >>> import dimod
+        >>> import networkx as nx
+        >>> from dwaveoceansdk.graphs import VertexCover
+        ...
+        >>> VertexCover(nx.star_graph(3)).solve(dimod.ExactSolver())
+        [0]
+    """
+    def decode(self, sampleset) -> np.ndarray:
+        """Boolean array, of shape ``(num_samples, num_nodes)``, of the nodes
+        in the cover of each sample."""
+        return ~super().decode(sampleset)
+
+
+class VertexColoring(_GraphProblem):
+    """Vertex coloring, as :func:`dwave.graphs.vertex_coloring`.
+
+    Variable ``i*num_colors + c`` of :attr:`bqm` is node ``nodes[i]``
+    having color ``c``.
+
+    Args:
+        graph (:class:`networkx.Graph`/:class:`scipy.sparse.sparray`/:class:`~dwaveoceansdk.topology.Topology`):
+            The graph, as for :class:`MaxCut`. Only its structure is used.
+
+        colors (int/sequence):
+            Number of colors, or the colors.
+
+    Examples:
+        >>> import dimod
+        >>> import networkx as nx
+        >>> from dwaveoceansdk.graphs import VertexColoring
+        ...
+        >>> problem = VertexColoring(nx.path_graph(3), ['red', 'blue'])
+        >>> coloring = problem.solve(dimod.ExactSolver())
+        >>> coloring[0] == coloring[2] != coloring[1]
+        True
+    """
+    def __init__(self, graph, colors):
+        import dimod
+
+        super().__init__(graph, None)
+        self.colors = range(colors) if isinstance(colors, int) else list(colors)
+
+        n, k = self.num_nodes, len(self.colors)
+        variables = np.arange(n * k).reshape(n, k)
+
+        # at most one color per node: -1 for each color, 2 for each pair
+        c0, c1 = np.triu_indices(k, 1)
+        one_hot_rows = variables[:, c0].ravel()
+        one_hot_cols = variables[:, c1].ravel()
+
+        # adjacent nodes have different colors
+        edge_rows = variables[self.irow].ravel()
+        edge_cols = variables[self.icol].ravel()
+
+        self.bqm = dimod.BinaryQuadraticModel.from_numpy_vectors(
+            np.full(n * k, -1.0),
+            (np.concatenate([one_hot_rows, edge_rows]),
+             np.concatenate([one_hot_cols, edge_cols]),
+             np.concatenate([np.full(len(one_hot_rows), 2.0), np.ones(len(edge_rows))])),
+            0.0, dimod.BINARY)
+
+    def decode(self, sampleset) -> np.ndarray:
+        """Integer array, of shape ``(num_samples, num_nodes)``, of the
+        index in :attr:`colors` of the color of each node in each sample,
+        or -1 for nodes without a color. Of several colors, the last is
+        taken, as by :func:`dwave.graphs.vertex_coloring`."""
+        k = len(self.colors)
+        samples = self.samples(sampleset).reshape(len(sampleset), self.num_nodes, k)
+        last = k - 1 - np.argmax(samples[:, :, ::-1], axis=2)
+        return np.where(samples.any(axis=2), last, -1)
+
+    def _result(self, colors):
+        colored = np.flatnonzero(colors >= 0)
+        return {v: self.colors[c] for v, c in zip(self.nodes[colored].tolist(),
+                                                 colors[colored].tolist())}
@@ -0,0 +1,615 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Incremental energy evaluation for ``dwave-hybrid`` decomposition loops.
+
+In a workflow such as
+
+.. code-block:: python
+
+    hybrid.Loop(hybrid.EnergyImpactDecomposer(size=50)
+                | hybrid.SimulatedAnnealingSubproblemSampler()
+                | hybrid.SplatComposer(), convergence=3)
+
+every iteration recomputes the energy impact of all variables and the
+energy of the whole composed sample, although only the subproblem's
+variables changed. :class:`IncrementalEnergyImpactDecomposer` and
+:class:`IncrementalSplatComposer` are drop-in replacements that share an
+:class:`IncrementalEnergy` through the state. It keeps the local field of
+every variable for the current sample, so that applying the subproblem's
+samples, updating the energy and re-ranking the energy impacts take time
+proportional to the degree of the changed variables rather than to the
+size of the problem.
+
+.. autosummary::
+
+    IncrementalEnergy
+    IncrementalEnergyImpactDecomposer
+    IncrementalSplatComposer
+"""
+
+import collections
+import heapq
+import threading
+import weakref
+
+import dimod
+import hybrid
+import numpy as np
+from hybrid.exceptions import EndOfStream
+
+__all__ = ['IncrementalEnergy', 'IncrementalEnergyImpactDecomposer',
+           'IncrementalSplatComposer']
+
+# state field holding the shared IncrementalEnergy
+STATE_KEY = 'incremental_energy'
+
+
+class IncrementalEnergy:
+    """Energy and local fields of a sample of a binary quadratic model,
+    updated incrementally as variables change.
+
+    The local field of variable :math:`i` is
+    :math:`h_i + \\sum_j J_{ij} s_j`. Changing a set of variables updates
+    the energy and the local fields of their neighbours in time
+    proportional to the sum of their degrees. Changes are logged so that
+    consumers of the flip gains, such as the ranking of an
+    :class:`IncrementalEnergyImpactDecomposer`, update only the affected
+    variables.
+
+    The model must not be modified while in use. Methods that read or
+    change the sample should be called with :attr:`lock` held when the
+    object is shared between threads, e.g. by branches of a
+    :class:`hybrid.Race` sharing a state.
+
+    Args:
+        bqm (:class:`dimod.BinaryQuadraticModel`):
+            Binary quadratic model.
+
+        sample (array-like, optional):
+            Initial sample, ordered as ``bqm.variables``.
+
+        history (int, optional, default=64):
+            Number of updates kept in the change log. Consumers further
+            behind recompute everything.
+
+    Examples:
+        >>> import dimod
+        >>> from dwaveoceansdk.incremental import IncrementalEnergy
+        ...
+        >>> bqm = dimod.BinaryQuadraticModel({'a': 1}, {'ab': -1, 'bc': 2}, 0, 'SPIN')
+        >>> energy = IncrementalEnergy(bqm, [1, 1, 1])
+        >>> energy.energy
+        2.0
+        >>> energy.update([2], [-1]).tolist()       # indices of affected variables
+        [1, 2]
+        >>> energy.energy == float(bqm.energy({'a': 1, 'b': 1, 'c': -1}))
+        True
+    """
+    def __init__(self, bqm, sample=None, *, history=64):
+        linear, (irow, icol, quadratic), offset = bqm.to_numpy_vectors()
+        num_variables = len(linear)
+
+        self.bqm = bqm
+        self.variables = dimod.variables.Variables(bqm.variables)
+        self.vartype = bqm.vartype
+        self.linear = np.asarray(linear, dtype=np.float64)
+        self.offset = float(offset)
+
+        # symmetric adjacency in CSR form, each interaction in both rows
+        rows = np.concatenate((irow, icol)).astype(np.int64)
+        order = np.argsort(rows, kind='stable')
+        self.indptr = np.zeros(num_variables + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=num_variables), out=self.indptr[1:])
+        self.indices = np.concatenate((icol, irow)).astype(np.int64)[order]
+        self.data = np.concatenate((quadratic, quadratic)).astype(np.float64)[order]
+        self._rows = rows[order]
+
+        # the interactions in canonical order, to recognize copies of the model
+        self._keys, self._quadratic = self._canonical(irow, icol, quadratic)
+        self._verified = None       # weak reference to the last copy recognized
+
+        self.lock = threading.RLock()
+
+        self.sample = None
+        self.field = None
+        self.energy = None
+
+        # the sample set the current sample was last synchronized with
+        self.samples = None
+
+        self.sequence = 0
+        self._reset_sequence = 0
+        self._log = collections.deque(maxlen=history)     # (sequence, affected indices)
+
+        # scratch space for update and induced_bqm, kept zeroed and -1ed
+        self._delta = np.zeros(num_variables, dtype=np.float64)
+        self._local = np.full(num_variables, -1, dtype=np.int64)
+
+        if sample is not None:
+            self.set_sample(sample)
+
+    # hybrid states are deep-copied on every update, the incremental energy
+    # is shared by all copies instead
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['lock']
+        state['_verified'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state, lock=threading.RLock())
+
+    def __len__(self):
+        return len(self.linear)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} num_variables={len(self)} energy={self.energy}>'
+
+    def _entries(self, indices):
+        """Positions in the CSR arrays of the rows of ``indices``, and the
+        number of entries of each row."""
+        starts = self.indptr[indices]
+        counts = self.indptr[indices + 1] - starts
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        return offsets + np.arange(counts.sum()), counts
+
+    def set_sample(self, sample):
+        """Set the whole sample and recompute the energy and local fields,
+        in time proportional to the size of the model."""
+        sample = np.array(sample, dtype=np.int8)
+        if sample.shape != self.linear.shape:
+            raise ValueError(f"expected a sample of {len(self)} values, "
+                             f"received shape {sample.shape}")
+
+        values = sample.astype(np.float64)
+        self.sample = sample
+        self.field = self.linear + np.bincount(self._rows, weights=self.data * values[self.indices],
+                                               minlength=len(self))
+        self.energy = float(self.offset + (self.linear + self.field) @ values / 2)
+
+        self.sequence += 1
+        self._reset_sequence = self.sequence
+        self._log.clear()
+
+    def update(self, indices, values):
+        """Change the variables at ``indices`` to ``values``.
+
+        Returns:
+            :class:`numpy.ndarray`: Sorted indices of the variables whose
+            flip gains changed: the changed variables and their neighbours.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        values = np.asarray(values, dtype=np.int8)
+
+        changed = values != self.sample[indices]
+        indices, values = indices[changed], values[changed]
+        if not len(indices):
+            return indices
+
+        delta = values.astype(np.float64) - self.sample[indices]
+
+        positions, counts = self._entries(indices)
+        neighbors = self.indices[positions]
+        weights = self.data[positions] * np.repeat(delta, counts)
+
+        # dE = delta . field + delta . J delta / 2, with the second term over
+        # interactions between changed variables
+        self._delta[indices] = delta
+        self.energy += float(delta @ self.field[indices]
+                             + weights @ self._delta[neighbors] / 2)
+        self._delta[indices] = 0
+
+        np.add.at(self.field, neighbors, weights)
+        self.sample[indices] = values
+
+        affected = np.union1d(indices, neighbors)
+        self.sequence += 1
+        self._log.append((self.sequence, affected))
+        return affected
+
+    def changes_since(self, sequence):
+        """Return the sorted indices of the variables whose flip gains
+        changed after update number ``sequence``, or ``None`` if the change
+        log does not go back that far."""
+        if sequence == self.sequence:
+            return np.empty(0, dtype=np.int64)
+        if (sequence < self._reset_sequence
+                or not self._log or self._log[0][0] > sequence + 1):
+            return None
+        return np.unique(np.concatenate([affected for s, affected in self._log if s > sequence]))
+
+    def _canonical(self, irow, icol, quadratic):
+        """Interactions of a model over :attr:`variables` as sorted keys and
+        the matching biases, independent of the order they are stored in."""
+        irow = np.asarray(irow, dtype=np.int64)
+        icol = np.asarray(icol, dtype=np.int64)
+        keys = np.minimum(irow, icol) * len(self) + np.maximum(irow, icol)
+        order = np.argsort(keys)
+        return keys[order], np.asarray(quadratic, dtype=np.float64)[order]
+
+    def matches(self, bqm):
+        """Return whether ``bqm`` is the model, or an identical copy of it.
+
+        Copies, such as the ones made by :meth:`hybrid.State.updated`, are
+        compared in full: vartype, variable order, offset, and linear and
+        quadratic biases, in time proportional to the size of the model.
+        The last copy recognized is remembered, so repeated calls with the
+        same copy take constant time.
+        """
+        if bqm is self.bqm or (self._verified is not None and self._verified() is bqm):
+            return True
+        if (bqm.vartype is not self.vartype or len(bqm) != len(self)
+                or bqm.num_interactions * 2 != len(self.indices)
+                or bqm.offset != self.offset or bqm.variables != self.variables):
+            return False
+
+        linear, (irow, icol, quadratic), _ = bqm.to_numpy_vectors()
+        if not np.array_equal(linear, self.linear):
+            return False
+        keys, quadratic = self._canonical(irow, icol, quadratic)
+        if not (np.array_equal(keys, self._keys) and np.array_equal(quadratic, self._quadratic)):
+            return False
+
+        self._verified = weakref.ref(bqm)
+        return True
+
+    def gains(self, indices=None):
+        """Energy change of flipping each variable at ``indices``, or of
+        every variable, as in :func:`hybrid.utils.flip_energy_gains`."""
+        sample = self.sample if indices is None else self.sample[indices]
+        field = self.field if indices is None else self.field[indices]
+
+        if self.vartype is dimod.SPIN:
+            return -2.0 * sample * field
+        return (1.0 - 2.0 * sample) * field
+
+    def index(self, variables):
+        """Return the indices of ``variables`` as an array."""
+        return np.fromiter(map(self.variables.index, variables), dtype=np.int64,
+                           count=len(variables))
+
+    def sync(self, samples):
+        """Make the current sample the lowest-energy sample of ``samples``.
+
+        Only the variables that differ are updated, unless more than a
+        quarter of them do. A sample set already synchronized with is
+        recognized without comparing its samples.
+
+        Args:
+            samples (:class:`dimod.SampleSet`):
+                Samples over the variables of the model, of either vartype.
+        """
+        if samples is self.samples:
+            return
+
+        row = samples.record.sample[np.argmin(samples.record.energy)]
+
+        same_range = (samples.variables.is_range and self.variables.is_range
+                      and len(samples.variables) == len(self))
+        if not same_range and samples.variables != self.variables:
+            if len(samples.variables) != len(self):
+                raise ValueError("samples do not match the variables of the model")
+            row = row[[samples.variables.index(v) for v in self.variables]]
+
+        if samples.vartype is not self.vartype:
+            row = 2 * row - 1 if self.vartype is dimod.SPIN else (row + 1) // 2
+
+        if self.sample is None:
+            self.set_sample(row)
+        else:
+            changed = np.flatnonzero(row != self.sample)
+            if len(changed) > len(self) // 4:
+                self.set_sample(row)
+            else:
+                self.update(changed, row[changed])
+
+        self.samples = samples
+
+    def induced_bqm(self, indices):
+        """Return the model over the variables at ``indices`` with all other
+        variables fixed to their current values and no offset, as
+        :func:`hybrid.utils.bqm_induced_by`."""
+        indices = np.asarray(indices, dtype=np.int64)
+
+        positions, counts = self._entries(indices)
+        neighbors = self.indices[positions]
+        weights = self.data[positions]
+        rows = np.repeat(np.arange(len(indices)), counts)
+
+        self._local[indices] = np.arange(len(indices))
+        columns = self._local[neighbors]
+        self._local[indices] = -1
+
+        inside = columns >= 0
+
+        # the local field less the contributions from inside the subproblem
+        linear = self.field[indices] - np.bincount(
+            rows[inside], weights=weights[inside] * self.sample[neighbors[inside]],
+            minlength=len(indices))
+
+        upper = inside & (rows < columns)
+
+        return dimod.BinaryQuadraticModel.from_numpy_vectors(
+            linear, (rows[upper], columns[upper], weights[upper]), 0.0, self.vartype,
+            variable_order=[self.variables[i] for i in indices.tolist()])
+
+    def to_sampleset(self):
+        """Return the current sample and its energy as a sample set."""
+        record = np.rec.fromarrays(
+            [self.sample[np.newaxis, :].copy(), [self.energy], [1]],
+            dtype=[('sample', np.int8, (len(self),)), ('energy', np.float64),
+                   ('num_occurrences', np.int64)])
+        return dimod.SampleSet(record, self.variables, {}, self.vartype)
+
+
+class _GainRanking:
+    """Variables by descending flip gain, ties broken by descending index as
+    in :func:`hybrid.utils.flip_energy_gains`, skipping ``excluded`` ones.
+
+    A lazy max-heap: updated variables get a new entry with a new version,
+    and outdated entries are dropped when they reach the top.
+    """
+    def __init__(self, energy, excluded):
+        self.energy = energy
+        self.excluded = excluded
+        self.rebuild()
+
+    def rebuild(self):
+        candidates = np.flatnonzero(~self.excluded)
+        gains = self.energy.gains(candidates)
+        order = np.lexsort((-candidates, -gains))
+
+        # a sorted list is a heap
+        self.heap = [(-gain, -v, 0, v) for gain, v in zip(gains[order].tolist(),
+                                                          candidates[order].tolist())]
+        self.version = [0] * len(self.energy)
+        self.sequence = self.energy.sequence
+        self._popped = []
+
+    def refresh(self):
+        affected = self.energy.changes_since(self.sequence)
+        if affected is None or len(self.heap) > 2 * len(self.energy) + 1024:
+            self.rebuild()
+            return
+
+        affected = affected[~self.excluded[affected]]
+        version = self.version
+        for v, gain in zip(affected.tolist(), self.energy.gains(affected).tolist()):
+            version[v] += 1
+            heapq.heappush(self.heap, (-gain, -v, version[v], v))
+        self.sequence = self.energy.sequence
+
+    def ranked(self, min_gain=None):
+        """Yield variable indices by descending gain, down to ``min_gain``.
+        Yielded variables are removed until :meth:`restore`."""
+        heap, version, excluded = self.heap, self.version, self.excluded
+        while heap:
+            entry = heap[0]
+            if min_gain is not None and -entry[0] < min_gain:
+                return
+            heapq.heappop(heap)
+            v = entry[3]
+            if entry[2] != version[v] or excluded[v]:
+                continue
+            self._popped.append(entry)
+            yield v
+
+    def restore(self):
+        """Return the variables yielded by :meth:`ranked` that have not
+        been excluded since."""
+        for entry in self._popped:
+            if not self.excluded[entry[3]]:
+                heapq.heappush(self.heap, entry)
+        self._popped = []
+
+
+class IncrementalEnergyImpactDecomposer(hybrid.EnergyImpactDecomposer):
+    """:class:`hybrid.EnergyImpactDecomposer` that ranks energy impacts
+    incrementally.
+
+    Variables are selected as by :class:`hybrid.EnergyImpactDecomposer`,
+    with the same arguments, but the energy impacts are kept in a ranking
+    updated only for variables whose local fields changed since the
+    previous iteration, and the subproblem is induced from the local
+    fields. The :class:`IncrementalEnergy` is passed on in the
+    ``incremental_energy`` field of the output state for
+    :class:`IncrementalSplatComposer` to update.
+
+    As with :class:`hybrid.EnergyImpactDecomposer`, a different problem
+    starts a new roll. Problems and their copies are recognized with
+    :meth:`IncrementalEnergy.matches`, which does not detect changes to the
+    very model an :class:`IncrementalEnergy` was built from, so problems
+    must not be modified in place during a roll.
+
+    Examples:
+        >>> import dimod
+        >>> import hybrid
+        >>> from dwaveoceansdk.incremental import (
+        ...     IncrementalEnergyImpactDecomposer, IncrementalSplatComposer)
+        ...
+        >>> bqm = dimod.generators.ran_r(1, 100, seed=1)
+        >>> workflow = hybrid.Loop(
+        ...     IncrementalEnergyImpactDecomposer(size=10)
+        ...     | hybrid.SimulatedAnnealingSubproblemSampler()
+        ...     | IncrementalSplatComposer()
+        ...     | hybrid.Const(subsamples=None), max_iter=5)
+        >>> state = workflow.run(hybrid.State.from_problem(bqm)).result()
+    """
+    def __init__(self, size, min_gain=None, rolling=True, rolling_history=1.0,
+                 silent_rewind=True, traversal='energy', **runopts):
+        super().__init__(size, min_gain=min_gain, rolling=rolling,
+                         rolling_history=rolling_history, silent_rewind=silent_rewind,
+                         traversal=traversal, **runopts)
+
+        self.traversal = traversal
+
+        self._energy = None
+        self._ranking = None
+        self._unrolled = None
+        self._num_unrolled = 0
+
+    def _rewind(self):
+        self._unrolled[:] = False
+        self._num_unrolled = 0
+        self._ranking.rebuild()
+
+    def next(self, state, **runopts):
+        silent_rewind = runopts.get('silent_rewind', self.silent_rewind)
+
+        bqm = state.problem
+        energy = state.get(STATE_KEY)
+        if energy is None or not energy.matches(bqm):
+            if self._energy is not None and self._energy.matches(bqm):
+                energy = self._energy
+            else:
+                energy = IncrementalEnergy(bqm)
+
+        size = min(self.size, len(bqm))
+
+        with energy.lock:
+            energy.sync(state.samples)
+
+            if self._energy is None or not self._energy.matches(energy.bqm):
+                # a new problem, start a new roll
+                self._unrolled = np.zeros(len(energy), dtype=bool)
+                self._num_unrolled = 0
+                self._ranking = _GainRanking(energy, self._unrolled)
+            elif energy is not self._energy:
+                # the same problem from another branch's or process's state
+                self._ranking = _GainRanking(energy, self._unrolled)
+            else:
+                self._ranking.refresh()
+            self._energy = energy
+
+            if self.rolling and self._num_unrolled >= self.rolling_history * len(energy):
+                self._rewind()
+                if not silent_rewind:
+                    raise EndOfStream
+
+            try:
+                if self.traversal == 'energy':
+                    selected = []
+                    for v in self._ranking.ranked(self.min_gain):
+                        selected.append(v)
+                        if len(selected) >= size:
+                            break
+                else:
+                    selected = self._graph_search(size)
+            finally:
+                if self.rolling:
+                    self._unrolled[selected] = True
+                    self._num_unrolled += len(selected)
+                self._ranking.restore()
+
+            subbqm = energy.induced_bqm(selected)
+
+        return state.updated(subproblem=subbqm, **{STATE_KEY: energy})
+
+    def _graph_search(self, size):
+        """Multi-start breadth- or priority-first search, each search
+        seeded from the highest-ranked unselected variable, as
+        :meth:`hybrid.EnergyImpactDecomposer._iterative_graph_search`."""
+        selected = []
+        chosen = set()
+        traverse = self._bfs if self.traversal == 'bfs' else self._pfs
+
+        for source in self._ranking.ranked(self.min_gain):
+            if len(selected) >= size:
+                break
+            if source in chosen:
+                continue
+            nodes = traverse(source, size - len(selected), chosen)
+            selected.extend(nodes)
+            chosen.update(nodes)
+
+        return selected
+
+    def _neighbors(self, u, chosen):
+        indptr, unrolled = self._energy.indptr, self._unrolled
+        return [v for v in self._energy.indices[indptr[u]:indptr[u + 1]].tolist()
+                if v not in chosen and not unrolled[v]]
+
+    def _bfs(self, source, size, chosen):
+        nodes = [source]
+        seen = {source}
+        queue = collections.deque(nodes)
+
+        while queue and len(nodes) < size:
+            for v in self._neighbors(queue.popleft(), chosen):
+                if v not in seen:
+                    seen.add(v)
+                    nodes.append(v)
+                    queue.append(v)
+                    if len(nodes) >= size:
+                        break
+
+        return nodes
+
+    def _pfs(self, source, size, chosen):
+        gains = self._energy.gains
+        counter = 0
+
+        queue = [(-float(gains(source)), counter, source)]
+        visited = []
+        seen = {source}
+
+        while queue and len(visited) < size:
+            _, _, u = heapq.heappop(queue)
+            visited.append(u)
+
+            for v in self._neighbors(u, chosen):
+                if v not in seen:
+                    seen.add(v)
+                    counter += 1
+                    heapq.heappush(queue, (-float(gains(v)), counter, v))
+
+        return visited
+
+
+class IncrementalSplatComposer(hybrid.SplatComposer):
+    """:class:`hybrid.SplatComposer` that updates the energy incrementally.
+
+    When the state has the :class:`IncrementalEnergy` of its problem, set by
+    :class:`IncrementalEnergyImpactDecomposer`, and a single sample and
+    subsample, the subsample's values are applied to the lowest-energy
+    sample and the energy is updated in time proportional to the degree of
+    the subproblem's variables. Otherwise the samples are composed as by
+    :class:`hybrid.SplatComposer`.
+    """
+    def next(self, state, **runopts):
+        energy = state.get(STATE_KEY)
+        subsamples = state.subsamples
+
+        if (energy is None or not energy.matches(state.problem)
+                or len(state.samples) != 1 or len(subsamples) != 1):
+            return super().next(state, **runopts)
+
+        values = subsamples.record.sample[0]
+        if subsamples.vartype is not energy.vartype:
+            values = 2 * values - 1 if energy.vartype is dimod.SPIN else (values + 1) // 2
+
+        with energy.lock:
+            energy.sync(state.samples)
+            energy.update(energy.index(subsamples.variables), values)
+            samples = energy.to_sampleset()
+            energy.samples = samples
+
+        return state.updated(samples=samples)
@@ -0,0 +1,533 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact, paged problem payloads for ``dwave-inspector``.
+
+The inspector's local server sends the whole problem, embedding and every
+sample to the viewer as one JSON document, which for large problems with
+many reads runs to hundreds of megabytes. :func:`enable` makes the server
+send instead
+
+*   the same document with duplicate samples aggregated (their
+    ``num_occurrences`` summed), sorted by energy and optionally truncated
+    to the lowest-energy samples, gzip-compressed, the logical samples
+    paired with the embedded ones as before;
+*   a summary of the problem without samples or embedding, at
+    ``/api/problems/<id>/summary``, with the number of pages of each;
+*   pages of samples, at ``/api/problems/<id>/samples/<page>`` (and
+    ``?answer=unembedded`` for the logical samples), and of the embedding,
+    at ``/api/problems/<id>/embedding/<page>``, as gzip-compressed binary
+    typed arrays in the format of :func:`encode_arrays`.
+
+A viewer that reads the summary can then fetch only the pages it shows.
+The payload of a problem is built on first request and cached.
+
+.. autosummary::
+
+    InspectorPayload
+    aggregate_answer
+    decode_arrays
+    disable
+    enable
+    encode_arrays
+
+Examples:
+    >>> import dwave.inspector
+    >>> from dwaveoceansdk import inspector
+    >>> inspector.enable(page_size=500)
+    >>> dwave.inspector.show(sampleset)     # doctest: +SKIP
+"""
+
+import gzip
+import json
+import struct
+import threading
+
+import numpy as np
+
+__all__ = ['InspectorPayload', 'aggregate_answer', 'decode_arrays', 'disable', 'enable',
+           'encode_arrays']
+
+# alignment of the arrays of a binary page, enough for any typed array
+_ALIGNMENT = 8
+
+# settings while enabled, None while disabled
+_settings = None
+
+# problem id -> InspectorPayload of the stored problem data
+_payloads = {}
+
+# the inspector's view of a whole problem, replaced while enabled
+_original_view = None
+_routes_installed = False
+
+_lock = threading.Lock()
+
+
+def encode_arrays(arrays, **metadata):
+    """Binary page of numpy arrays, readable as JavaScript typed arrays.
+
+    The page is a little-endian ``uint32`` header length, a UTF-8 JSON
+    header and the arrays' data, each starting at a multiple of 8 bytes.
+    The header holds ``metadata`` and, under ``'arrays'``, the ``name``,
+    ``dtype`` (numpy type string, e.g. ``'<f8'`` for a ``Float64Array``),
+    ``shape`` and byte ``offset`` of each array.
+
+    Args:
+        arrays (dict[str, array-like]): Arrays by name.
+        **metadata: JSON-serializable values added to the header.
+
+    Returns:
+        bytes: The page.
+
+    Examples:
+        >>> import numpy as np
+        >>> from dwaveoceansdk.inspector import encode_arrays, decode_arrays
+        >>> page = encode_arrays({'energies': np.array([-1.5, 2.])}, offset=10)
+        >>> arrays, metadata = decode_arrays(page)
+        >>> arrays['energies'].tolist(), metadata['offset']
+        ([-1.5, 2.0], 10)
+    """
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    for name, array in arrays.items():
+        if array.dtype.byteorder == '>' or array.dtype.kind not in 'biuf':
+            raise ValueError(f"array {name!r} of type {array.dtype} has no typed-array type")
+
+    # offsets are relative to the end of the header, which is itself padded
+    specs, offset = [], 0
+    for name, array in arrays.items():
+        specs.append(dict(name=name, dtype=array.dtype.str, shape=array.shape, offset=offset))
+        offset += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+    header = json.dumps(dict(metadata, arrays=specs), separators=(',', ':')).encode()
+    header += b' ' * (-(4 + len(header)) % _ALIGNMENT)
+
+    parts = [struct.pack('<I', len(header)), header]
+    for array in arrays.values():
+        parts.append(array.tobytes())
+        parts.append(b'\0' * (-array.nbytes % _ALIGNMENT))
+    return b''.join(parts)
+
+
+def decode_arrays(page):
+    """Arrays and metadata of a page encoded by :func:`encode_arrays`.
+
+    Returns:
+        tuple: Dict of arrays by name, and dict of metadata.
+    """
+    (length,) = struct.unpack_from('<I', page)
+    metadata = json.loads(page[4:4 + length])
+    start = 4 + length
+
+    arrays = {}
+    for spec in metadata.pop('arrays'):
+        dtype = np.dtype(spec['dtype'])
+        count = int(np.prod(spec['shape'], dtype=np.int64))
+        arrays[spec['name']] = np.frombuffer(
+            page, dtype, count, start + spec['offset']).reshape(spec['shape'])
+    return arrays, metadata
+
+
+def aggregate_answer(answer):
+    """Inspector answer with duplicate samples aggregated.
+
+    Args:
+        answer (dict):
+            ``answer`` or ``unembedded_answer`` of inspector problem data,
+            with ``solutions``, ``energies`` and ``num_occurrences``.
+
+    Returns:
+        dict: A copy of ``answer`` with one sample per distinct solution,
+        sorted by energy, ties in order of first occurrence. Solutions,
+        energies and occurrences are numpy arrays.
+
+    Examples:
+        >>> from dwaveoceansdk.inspector import aggregate_answer
+        >>> answer = aggregate_answer(dict(solutions=[[1, -1], [-1, -1], [1, -1]],
+        ...                                energies=[0., -2., 0.],
+        ...                                num_occurrences=[1, 1, 2]))
+        >>> answer['solutions'].tolist(), answer['num_occurrences'].tolist()
+        ([[-1, -1], [1, -1]], [1, 3])
+    """
+    solutions, energies, num_occurrences = _arrays(answer)
+    rows, counts = _distinct(solutions, energies, num_occurrences)
+    return dict(answer, solutions=solutions[rows], energies=energies[rows],
+                num_occurrences=counts)
+
+
+def _arrays(answer):
+    """Solutions, energies and occurrences of an inspector answer."""
+    solutions = np.asarray(answer['solutions'], dtype=np.int8)
+    energies = np.asarray(answer['energies'], dtype=np.float64)
+    num_occurrences = np.asarray(answer['num_occurrences'], dtype=np.int64)
+
+    if solutions.ndim != 2:
+        solutions = solutions.reshape(len(energies), -1)
+    return solutions, energies, num_occurrences
+
+
+def _distinct(solutions, energies, num_occurrences):
+    """Rows of the first occurrence of every distinct solution, sorted by
+    energy, ties in order of first occurrence, and their total occurrences."""
+    # distinct rows, compared as opaque byte strings
+    rows = np.ascontiguousarray(solutions).view(np.dtype((np.void, solutions.shape[1])))
+    _, first, inverse = np.unique(rows.ravel(), return_index=True, return_inverse=True)
+    counts = np.bincount(inverse.ravel(), weights=num_occurrences, minlength=len(first))
+
+    order = np.lexsort((first, energies[first]))
+    return first[order], counts[order].astype(np.int64)
+
+
+def _pack(solutions):
+    """Solutions as bits, with their two values, or as int8 if they have more."""
+    values = np.unique(solutions)
+    if len(values) > 2:
+        return dict(solutions=solutions), dict(values=values.tolist(), packed=False)
+    low, high = (values.tolist() + [1])[:2] if len(values) else (-1, 1)
+    if len(values) == 1 and low > 0:
+        low, high = 0, low
+    return (dict(solutions=np.packbits(solutions == high, axis=1)),
+            dict(values=[low, high], packed=True, num_variables=solutions.shape[1]))
+
+
+class InspectorPayload:
+    """Compact views of the problem data the inspector serves.
+
+    Args:
+        data (dict):
+            Inspector problem data, as stored by
+            :func:`dwave.inspector.storage.push_inspector_data`.
+
+        page_size (int, optional, default=1000):
+            Samples, or source variables of the embedding, per page.
+
+        max_samples (int, optional):
+            Largest number of samples, lowest energy first, in
+            :meth:`document`. All of them by default. Pages hold all
+            samples.
+
+    Examples:
+        >>> from dwaveoceansdk.inspector import InspectorPayload
+        >>> data = dict(details=dict(id='p'), data=dict(data=dict(embedding={'a': [0, 4]})),
+        ...             answer=dict(solutions=[[1, 1], [1, 1]], energies=[-1., -1.],
+        ...                         num_occurrences=[1, 1]))
+        >>> payload = InspectorPayload(data, page_size=10)
+        >>> payload.summary()['pages']['answer']
+        {'num_samples': 1, 'num_reads': 2, 'num_pages': 1, 'page_size': 10}
+    """
+    def __init__(self, data, *, page_size=1000, max_samples=None):
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+
+        self.data = data
+        self.page_size = page_size
+        self.max_samples = max_samples
+
+        self._answers = None
+        self._embedding = None
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def answer(self, name='answer'):
+        """Aggregated ``answer`` or ``unembedded_answer``, or None.
+
+        Samples of the ``unembedded_answer`` are kept paired with those of
+        the ``answer``: both have the rows of the distinct embedded
+        solutions, in the same order.
+        """
+        if name not in ('answer', 'unembedded_answer'):
+            raise ValueError(f"unknown answer {name!r}")
+        with self._lock:
+            if self._answers is None:
+                self._answers = self._aggregate()
+            return self._answers.get(name)
+
+    def _aggregate(self):
+        answers = {}
+        answer = self.data.get('answer')
+        unembedded = self.data.get('unembedded_answer')
+
+        if answer is not None:
+            solutions, energies, num_occurrences = _arrays(answer)
+            rows, counts = _distinct(solutions, energies, num_occurrences)
+            answers['answer'] = dict(answer, solutions=solutions[rows], energies=energies[rows],
+                                     num_occurrences=counts)
+
+            # row i of the unembedded answer is unembedded from row i of the answer,
+            # unless samples with broken chains were discarded
+            if unembedded is not None and len(unembedded['energies']) == len(energies):
+                solutions, energies, _ = _arrays(unembedded)
+                answers['unembedded_answer'] = dict(
+                    unembedded, solutions=solutions[rows], energies=energies[rows],
+                    num_occurrences=counts)
+
+        if unembedded is not None and 'unembedded_answer' not in answers:
+            answers['unembedded_answer'] = aggregate_answer(unembedded)
+        return answers
+
+    def _chains(self):
+        """Source variables of the embedding, and its chains in CSR form."""
+        with self._lock:
+            if self._embedding is None:
+                embedding = self.data.get('data', {}).get('data', {}).get('embedding') or {}
+                variables = list(embedding)
+                sizes = np.fromiter((len(embedding[v]) for v in variables), dtype=np.int64,
+                                    count=len(variables))
+                indptr = np.zeros(len(variables) + 1, dtype=np.int64)
+                np.cumsum(sizes, out=indptr[1:])
+                qubits = np.fromiter((q for v in variables for q in embedding[v]),
+                                     dtype=np.int32, count=indptr[-1])
+                self._embedding = variables, indptr, qubits
+            return self._embedding
+
+    def _pages(self):
+        pages = {}
+        for name in ('answer', 'unembedded_answer'):
+            answer = self.answer(name)
+            if answer is not None:
+                num_samples = len(answer['energies'])
+                pages[name] = dict(num_samples=num_samples,
+                                   num_reads=int(answer['num_occurrences'].sum()),
+                                   num_pages=-(-num_samples // self.page_size),
+                                   page_size=self.page_size)
+        variables, _, qubits = self._chains()
+        pages['embedding'] = dict(num_variables=len(variables), num_qubits=len(qubits),
+                                  num_pages=-(-len(variables) // self.page_size),
+                                  page_size=self.page_size)
+        return pages
+
+    def document(self):
+        """The problem data with aggregated answers, as the viewer expects,
+        and the pages available under ``'pages'``."""
+        document = {key: value for key, value in self.data.items() if key != 'rel'}
+        for name in ('answer', 'unembedded_answer'):
+            answer = self.answer(name)
+            if answer is not None:
+                if self.max_samples is not None:
+                    answer = dict(answer, **{key: answer[key][:self.max_samples] for key in
+                                             ('solutions', 'energies', 'num_occurrences')})
+                document[name] = answer
+        document['pages'] = self._pages()
+        return document
+
+    def summary(self):
+        """The problem data without samples or embedding, with the pages
+        available under ``'pages'``."""
+        summary = {key: value for key, value in self.data.items()
+                   if key not in ('rel', 'answer', 'unembedded_answer')}
+        if 'data' in summary:
+            problem = dict(summary['data'])
+            problem['data'] = {key: value for key, value in problem.get('data', {}).items()
+                               if key != 'embedding'}
+            summary['data'] = problem
+        for name in ('answer', 'unembedded_answer'):
+            if name in self.data:
+                summary[name] = {key: value for key, value in self.data[name].items()
+                                 if key not in ('solutions', 'energies', 'num_occurrences')}
+        summary['pages'] = self._pages()
+        return summary
+
+    def samples(self, page, name='answer'):
+        """Binary page of aggregated samples, in the format of
+        :func:`encode_arrays`.
+
+        The page holds ``energies`` (``<f8``), ``num_occurrences``
+        (``<i4``) and ``solutions``: with ``packed`` true in the header,
+        bits (``|u1``, :func:`numpy.packbits` order, ``num_variables`` per
+        row) that select between the two ``values``; otherwise ``|i1``.
+        """
+        answer = self.answer(name)
+        if answer is None:
+            raise ValueError(f"problem has no {name}")
+        num_samples = len(answer['energies'])
+        start = self._start(page, num_samples)
+        rows = slice(start, start + self.page_size)
+
+        arrays, metadata = _pack(answer['solutions'][rows])
+        arrays.update(energies=answer['energies'][rows],
+                      num_occurrences=answer['num_occurrences'][rows].astype(np.int32))
+        return encode_arrays(arrays, page=page, offset=start, num_samples=num_samples,
+                             **metadata)
+
+    def embedding(self, page):
+        """Binary page of the embedding, in the format of
+        :func:`encode_arrays`: the chain of source variable
+        ``variables[i]`` is ``qubits[indptr[i]:indptr[i + 1]]``
+        (``<i4``)."""
+        variables, indptr, qubits = self._chains()
+        start = self._start(page, len(variables))
+        stop = min(start + self.page_size, len(variables))
+
+        return encode_arrays(
+            dict(indptr=(indptr[start:stop + 1] - indptr[start]).astype(np.int32),
+                 qubits=qubits[indptr[start]:indptr[stop]]),
+            page=page, offset=start, num_variables=len(variables),
+            variables=variables[start:stop])
+
+    def _start(self, page, size):
+        if not 0 <= page * self.page_size < max(size, 1):
+            raise ValueError(f"page {page} out of range")
+        return page * self.page_size
+
+    def cached(self, key, build, compresslevel=6):
+        """``build()``, gzip-compressed, computed once per ``key``."""
+        with self._lock:
+            body = self._cache.get(key)
+        if body is None:
+            body = gzip.compress(build(), compresslevel)
+            with self._lock:
+                self._cache[key] = body
+        return body
+
+
+def _payload(problem_id):
+    from dwave.inspector.storage import problem_store
+    from werkzeug.exceptions import NotFound
+
+    settings = _settings
+    if settings is None:
+        raise NotFound
+    try:
+        data = problem_store[problem_id]
+    except KeyError:
+        raise NotFound
+
+    with _lock:
+        payload = _payloads.get(problem_id)
+        if payload is None or payload.data is not data:
+            payload = _payloads[problem_id] = InspectorPayload(
+                data, page_size=settings['page_size'], max_samples=settings['max_samples'])
+    return payload, settings
+
+
+def _respond(payload, settings, key, build, mimetype):
+    """Response with the gzip-compressed body if the client accepts it."""
+    from flask import make_response, request
+
+    body = payload.cached(key, build, settings['compresslevel'])
+    if 'gzip' in request.accept_encodings:
+        response = make_response(body)
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = make_response(gzip.decompress(body))
+    response.headers['Content-Type'] = mimetype
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def _dumps(obj):
+    from dwave.inspector.server import app
+    return app.json.dumps(obj)
+
+
+def _send_problem(problem_id):
+    payload, settings = _payload(problem_id)
+    return _respond(payload, settings, 'document', lambda: _dumps(payload.document()),
+                    'application/json')
+
+
+def _send_summary(problem_id):
+    payload, settings = _payload(problem_id)
+    return _respond(payload, settings, 'summary', lambda: _dumps(payload.summary()),
+                    'application/json')
+
+
+def _send_samples(problem_id, page):
+    from flask import request
+    from werkzeug.exceptions import NotFound
+
+    payload, settings = _payload(problem_id)
+    name = 'unembedded_answer' if request.args.get('answer') == 'unembedded' else 'answer'
+    try:
+        return _respond(payload, settings, (name, page), lambda: payload.samples(page, name),
+                        'application/octet-stream')
+    except ValueError:
+        raise NotFound
+
+
+def _send_embedding(problem_id, page):
+    from werkzeug.exceptions import NotFound
+
+    payload, settings = _payload(problem_id)
+    try:
+        return _respond(payload, settings, ('embedding', page), lambda: payload.embedding(page),
+                        'application/octet-stream')
+    except ValueError:
+        raise NotFound
+
+
+def _install_routes(app):
+    """Add the paged endpoints to the inspector's app, once."""
+    global _routes_installed
+
+    if _routes_installed:
+        return
+    try:
+        app.add_url_rule('/api/problems/<problem_id>/summary', 'send_summary',
+                         _send_summary)
+        app.add_url_rule('/api/problems/<problem_id>/samples/<int:page>', 'send_samples',
+                         _send_samples)
+        app.add_url_rule('/api/problems/<problem_id>/embedding/<int:page>',
+                         'send_embedding', _send_embedding)
+    except AssertionError as exc:
+        raise RuntimeError("compact payloads must be enabled before the inspector "
+                           "server handles its first request") from exc
+    _routes_installed = True
+
+
+def enable(*, page_size=1000, max_samples=None, compresslevel=6):
+    """Serve compact, paged payloads from the inspector's local server.
+
+    Call before the first problem is shown; the paged endpoints cannot be
+    added once the server has handled a request.
+
+    Args:
+        page_size (int, optional, default=1000):
+            Samples, or source variables of the embedding, per page.
+
+        max_samples (int, optional):
+            Largest number of samples, lowest energy first, in the
+            document the viewer loads. All of them by default.
+
+        compresslevel (int, optional, default=6):
+            gzip compression level.
+    """
+    global _settings, _original_view
+
+    from dwave.inspector.server import app
+
+    if page_size < 1:
+        raise ValueError("page_size must be positive")
+
+    with _lock:
+        _install_routes(app)
+        if _original_view is None:
+            _original_view = app.view_functions['send_problem']
+            app.view_functions['send_problem'] = _send_problem
+        _settings = dict(page_size=page_size, max_samples=max_samples,
+                         compresslevel=compresslevel)
+        _payloads.clear()
+
+
+def disable():
+    """Serve the inspector's own payloads again."""
+    global _settings, _original_view
+
+    with _lock:
+        if _original_view is not None:
+            from dwave.inspector.server import app
+            app.view_functions['send_problem'] = _original_view
+            _original_view = None
+        _settings = None
+        _payloads.clear()
@@ -0,0 +1,536 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact, array-backed labels for models with structured string labels.
+
+Models like the bin packing problem of the *Scaling for Production* section
+of the documentation label variables ``f'x_{i},{j}'`` and ``f'y_{j}'``.
+Each such label is a Python string plus entries in the label-to-index and
+index-to-label maps of :class:`dimod.variables.Variables`, which dominates
+memory for models with millions of variables.
+
+:class:`StructuredVariables` instead describes labels as blocks of one
+template over integer fields. A model is built on the integer labels
+``0, 1, ...``, which :mod:`dimod` stores without materializing any labels,
+and the structured labels are recovered from the block layout:
+
+* A dense block, such as ``x_{i},{j}`` for all ``i, j`` in a box, stores
+  nothing per variable. Label and index are related arithmetically, a
+  perfect hash of the fields.
+* A sparse block stores each label as one packed 64-bit integer key of its
+  fields, indexed by a direct-address table when the keys fill their range
+  densely and by the sorted keys otherwise.
+
+.. autosummary::
+
+    LabelBlock
+    StructuredVariables
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import re
+import string
+import typing
+
+import numpy as np
+
+if typing.TYPE_CHECKING:
+    import dimod
+    import numpy.typing
+
+__all__ = ['LabelBlock', 'StructuredVariables']
+
+# canonical decimal integers, so that parsing a label and formatting its
+# fields round-trip
+_INTEGER = r'(0|-?[1-9][0-9]*)'
+
+
+def _parse_template(template):
+    """Return the number of fields of a template, a regular expression
+    matching its labels and a format string with positional fields."""
+    pattern = []
+    positional = []
+    num_fields = 0
+    previous_field = False
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if literal:
+            pattern.append(re.escape(literal))
+            positional.append(literal.replace('{', '{{').replace('}', '}}'))
+            previous_field = False
+        if field is not None:
+            if spec or conversion:
+                raise ValueError(f"template {template!r}: fields cannot have a format "
+                                 "specification or conversion")
+            if field and not field.isidentifier():
+                raise ValueError(f"template {template!r}: fields must be empty or named")
+            if previous_field:
+                raise ValueError(f"template {template!r}: adjacent fields are ambiguous")
+            pattern.append(_INTEGER)
+            positional.append('{}')
+            num_fields += 1
+            previous_field = True
+
+    if not num_fields:
+        raise ValueError(f"template {template!r} has no fields")
+
+    return num_fields, re.compile(''.join(pattern)), ''.join(positional)
+
+
+class LabelBlock:
+    """Labels of one template over integer fields, with consecutive
+    indices. Created by :meth:`StructuredVariables.add` and
+    :meth:`StructuredVariables.add_from`.
+
+    Attributes:
+        template (str): Format string of the labels, e.g. ``'x_{i},{j}'``.
+        start (int): Index of the first variable of the block.
+        stop (int): One past the index of the last variable of the block.
+        shape (tuple[int]): Extent of each field.
+        lower (tuple[int]): Smallest value of each field.
+    """
+    def __init__(self, template, start, lower, shape, keys=None):
+        self.template = template
+        self.start = start
+        self.lower = tuple(int(v) for v in lower)
+        self.shape = tuple(int(v) for v in shape)
+
+        self._num_fields, self._pattern, positional = _parse_template(template)
+        self._format = positional.format
+        # templates that differ only in the names of their fields have the
+        # same labels, e.g. 'x_{i}' and 'x_{}'
+        self._positional = positional
+        if self._num_fields != len(self.shape):
+            raise ValueError(f"template {template!r} has {self._num_fields} fields, "
+                             f"expected {len(self.shape)}")
+
+        # mixed-radix key of the fields relative to lower
+        self._volume = int(np.prod(self.shape, dtype=object))
+        if self._volume >= 2**63:
+            raise ValueError("fields span too large a range to be packed in 64 bits")
+
+        self._table = self._order = self._sorted = None
+        if keys is None:
+            # dense: the key is the offset from start
+            self._keys = None
+            self.stop = start + self._volume
+            return
+
+        self._keys = keys
+        self.stop = start + len(keys)
+        dtype = np.int32 if len(keys) < 2**31 else np.int64
+
+        if self._volume <= 2 * len(keys):
+            # direct-address table
+            self._table = np.full(self._volume, -1, dtype=dtype)
+            self._table[keys] = np.arange(len(keys), dtype=dtype)
+            self._order = None
+            if (self._table >= 0).sum() != len(keys):
+                raise ValueError("duplicate labels")
+        else:
+            self._table = None
+            self._order = np.argsort(keys, kind='stable').astype(dtype)
+            self._sorted = keys[self._order]
+            if len(keys) > 1 and not np.all(np.diff(self._sorted)):
+                raise ValueError("duplicate labels")
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __repr__(self):
+        kind = 'dense' if self._keys is None else 'sparse'
+        return (f"{type(self).__name__}({self.template!r}, {kind}, "
+                f"indices={self.start}..{self.stop - 1}, lower={self.lower}, "
+                f"shape={self.shape})")
+
+    @property
+    def nbytes(self):
+        """Bytes of array storage of the block."""
+        return sum(a.nbytes for a in (self._keys, self._table, self._order, self._sorted)
+                   if a is not None)
+
+    def _offsets(self, fields):
+        """Offsets from ``start`` of the given fields, -1 for fields not in
+        the block."""
+        fields = [np.asarray(f, dtype=np.int64) for f in fields]
+        if len(fields) != len(self.shape):
+            raise ValueError(f"expected {len(self.shape)} fields, got {len(fields)}")
+        fields = np.broadcast_arrays(*fields)
+
+        inside = np.ones(fields[0].shape, dtype=bool)
+        relative = []
+        for f, low, extent in zip(fields, self.lower, self.shape):
+            r = f - low
+            inside &= (r >= 0) & (r < extent)
+            relative.append(np.where(inside, r, 0))
+
+        keys = np.ravel_multi_index(relative, self.shape) if relative[0].ndim else \
+            np.int64(np.ravel_multi_index(relative, self.shape))
+        keys = np.asarray(keys, dtype=np.int64)
+
+        if self._keys is None:
+            offsets = keys
+        elif self._table is not None:
+            offsets = self._table[keys].astype(np.int64)
+        else:
+            position = np.searchsorted(self._sorted, keys).clip(0, len(self._sorted) - 1)
+            found = self._sorted[position] == keys
+            offsets = np.where(found, self._order[position], -1)
+
+        return np.where(inside, offsets, -1)
+
+    def index(self, *fields: numpy.typing.ArrayLike) -> typing.Union[int, np.ndarray]:
+        """Index of the variables with the given fields.
+
+        Args:
+            *fields: One integer or array per field, broadcast together.
+
+        Returns:
+            The index, or an array of indices shaped like the broadcast
+            fields.
+
+        Raises:
+            ValueError: If any of the labels is not in the block.
+
+        Examples:
+            >>> from dwaveoceansdk.labels import StructuredVariables
+            >>> variables = StructuredVariables()
+            >>> x = variables.add('x_{i},{j}', (3, 4))
+            >>> x.index(1, 2)
+            6
+            >>> x.index([0, 2], 3)
+            array([ 3, 11])
+        """
+        offsets = self._offsets(fields)
+        if (offsets < 0).any():
+            raise ValueError("unknown variable")
+        indices = offsets + self.start
+        return int(indices) if indices.ndim == 0 else indices
+
+    @property
+    def indices(self) -> np.ndarray:
+        """Indices of the block's variables; for a dense block shaped like
+        the block."""
+        indices = np.arange(self.start, self.stop)
+        return indices.reshape(self.shape) if self._keys is None else indices
+
+    def fields(self, indices: numpy.typing.ArrayLike) -> np.ndarray:
+        """Fields of the variables with the given indices, as an array with
+        one more dimension, of size the number of fields, than
+        ``indices``."""
+        offsets = np.asarray(indices, dtype=np.int64) - self.start
+        if ((offsets < 0) | (offsets >= len(self))).any():
+            raise ValueError("indices outside of the block")
+        keys = offsets if self._keys is None else self._keys[offsets]
+        return np.stack(np.unravel_index(keys, self.shape), axis=-1) + self.lower
+
+    def labels(self, indices: typing.Optional[numpy.typing.ArrayLike] = None) -> list:
+        """String labels of the given variables, by default all of the
+        block's variables in index order."""
+        if indices is None:
+            indices = np.arange(self.start, self.stop)
+        fields = self.fields(np.ravel(indices)).tolist()
+        return [self._format(*f) for f in fields]
+
+    def values(self, sample: numpy.typing.ArrayLike) -> np.ndarray:
+        """Values of the block's variables in ``sample``, an array of the
+        values of all variables in index order; for a dense block shaped
+        like the block.
+
+        Examples:
+            >>> from dwaveoceansdk.labels import StructuredVariables
+            >>> variables = StructuredVariables()
+            >>> x = variables.add('x_{i},{j}', (2, 3))
+            >>> x.values(range(6))
+            array([[0, 1, 2],
+                   [3, 4, 5]])
+        """
+        values = np.asarray(sample)[..., self.start:self.stop]
+        if self._keys is None:
+            return values.reshape(values.shape[:-1] + self.shape)
+        return values
+
+    def _match(self, label):
+        """Offset of a string label in the block, or -1."""
+        if not isinstance(label, str):
+            return -1
+        match = self._pattern.fullmatch(label)
+        if match is None:
+            return -1
+
+        # scalar mixed-radix key, much faster than _offsets() for one label
+        key = 0
+        for value, low, extent in zip(match.groups(), self.lower, self.shape):
+            value = int(value) - low
+            if not 0 <= value < extent:
+                return -1
+            key = key * extent + value
+
+        if self._keys is None:
+            return key
+        if self._table is not None:
+            return int(self._table[key])
+        position = int(np.searchsorted(self._sorted, key))
+        if position < len(self._sorted) and self._sorted[position] == key:
+            return int(self._order[position])
+        return -1
+
+
+class StructuredVariables(collections.abc.Sequence):
+    """Compact variable labels made of blocks of one template each.
+
+    A drop-in for :class:`dimod.variables.Variables` where labels are
+    looked up or listed. Variables are numbered consecutively across blocks,
+    in the order the blocks are added, and models are built on these
+    integer indices as labels.
+
+    Examples:
+        Label the variables of the bin packing model built by
+        :func:`dwaveoceansdk.construction.bin_packing`, where variable
+        ``i*n + j`` is ``x_{i},{j}`` and variable ``n*n + j`` is ``y_{j}``.
+
+        >>> import numpy as np
+        >>> from dwaveoceansdk.construction import bin_packing
+        >>> from dwaveoceansdk.labels import StructuredVariables
+        ...
+        >>> n = 3
+        >>> cqm = bin_packing(np.array([.5, .3, .4]))
+        >>> variables = StructuredVariables()
+        >>> x = variables.add('x_{i},{j}', (n, n))
+        >>> y = variables.add('y_{j}', (n,))
+        >>> variables.index('x_2,1')
+        7
+        >>> variables[n*n + 1]
+        'y_1'
+        >>> float(cqm.objective.linear[y.index(1)])
+        1.0
+    """
+    def __init__(self):
+        self._blocks = []
+        self._starts = np.zeros(0, dtype=np.int64)
+        self._by_template = {}
+
+    def _append(self, block):
+        for other in self._by_template.get(block._positional, ()):
+            if self._overlaps(block, other):
+                raise ValueError(f"block overlaps the labels of {other!r}")
+
+        self._blocks.append(block)
+        self._starts = np.append(self._starts, block.start)
+        self._by_template.setdefault(block._positional, []).append(block)
+        return block
+
+    @staticmethod
+    def _overlaps(block, other):
+        # boxes are disjoint if disjoint in any one field
+        for low, extent, other_low, other_extent in zip(block.lower, block.shape,
+                                                        other.lower, other.shape):
+            if low + extent <= other_low or other_low + other_extent <= low:
+                return False
+        if block._keys is None and other._keys is None:
+            return True
+        sparse, dense = (block, other) if block._keys is not None else (other, block)
+        fields = sparse.fields(np.arange(sparse.start, sparse.stop))
+        return bool((dense._offsets(fields.T) >= 0).any())
+
+    def add(self, template: str, shape: typing.Sequence[int], *,
+            lower: typing.Optional[typing.Sequence[int]] = None) -> LabelBlock:
+        """Add a dense block: all labels of ``template`` with fields in a
+        box, numbered in row-major order of the fields.
+
+        Args:
+            template: Format string with one ``{}`` or ``{name}`` field per
+                integer field, e.g. ``'x_{i},{j}'``. Fields must be
+                separated by literal text.
+
+            shape: Extent of each field.
+
+            lower: Smallest value of each field. Defaults to zeros.
+
+        Returns:
+            The block, for vectorized lookups.
+        """
+        shape = tuple(shape)
+        if lower is None:
+            lower = (0,) * len(shape)
+        if len(lower) != len(shape) or any(extent < 0 for extent in shape):
+            raise ValueError("lower and shape must have one entry per field and "
+                             "shape must be non-negative")
+        return self._append(LabelBlock(template, len(self), lower, shape))
+
+    def add_from(self, template: str, fields: numpy.typing.ArrayLike) -> LabelBlock:
+        """Add a sparse block: labels of ``template`` with the given fields,
+        numbered in the given order.
+
+        Args:
+            template: Format string, see :meth:`add`.
+
+            fields: Integer array of shape ``(num_labels, num_fields)``.
+
+        Returns:
+            The block, for vectorized lookups.
+        """
+        fields = np.asarray(fields, dtype=np.int64)
+        if fields.ndim != 2:
+            raise ValueError("fields must be a 2D array of shape (num_labels, num_fields)")
+
+        if len(fields):
+            lower = fields.min(axis=0)
+            shape = fields.max(axis=0) - lower + 1
+            if np.prod(shape.astype(object)) >= 2**63:
+                raise ValueError("fields span too large a range to be packed in 64 bits")
+            keys = np.ravel_multi_index((fields - lower).T, tuple(shape)).astype(np.int64)
+        else:
+            lower = shape = np.zeros(fields.shape[1], dtype=np.int64)
+            keys = np.zeros(0, dtype=np.int64)
+
+        return self._append(LabelBlock(template, len(self), lower, shape, keys))
+
+    @property
+    def blocks(self) -> list[LabelBlock]:
+        """Blocks in index order."""
+        return list(self._blocks)
+
+    def __len__(self):
+        return self._blocks[-1].stop if self._blocks else 0
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of array storage, the per-variable cost of the labels."""
+        return sum(block.nbytes for block in self._blocks) + self._starts.nbytes
+
+    def _block(self, index):
+        if not 0 <= index < len(self):
+            raise IndexError("index out of range")
+        return self._blocks[int(np.searchsorted(self._starts, index, side='right')) - 1]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.labels(np.arange(len(self))[index])
+        index = int(index)
+        if index < 0:
+            index += len(self)
+        return self._block(index).labels([index])[0]
+
+    def __iter__(self):
+        for block in self._blocks:
+            # format one chunk at a time to bound memory
+            for start in range(block.start, block.stop, 2**16):
+                yield from block.labels(np.arange(start, min(start + 2**16, block.stop)))
+
+    def __contains__(self, label):
+        return self._find(label) >= 0
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._blocks!r})"
+
+    def _find(self, label):
+        if not isinstance(label, str):
+            return -1
+        for block in self._blocks:
+            offset = block._match(label)
+            if offset >= 0:
+                return block.start + offset
+        return -1
+
+    def index(self, label: str) -> int:
+        """Index of a variable.
+
+        Raises:
+            ValueError: If the label is not a variable, like
+            :meth:`dimod.variables.Variables.index`.
+        """
+        index = self._find(label)
+        if index < 0:
+            raise ValueError(f"unknown variable {label!r}")
+        return index
+
+    def count(self, label: str) -> int:
+        return int(label in self)
+
+    def indices(self, labels: typing.Iterable[str]) -> np.ndarray:
+        """Indices of many variables, as an array.
+
+        Labels are parsed per template and looked up in bulk, so this is
+        faster than calling :meth:`index` for each label.
+        """
+        labels = list(labels)
+        indices = np.full(len(labels), -1, dtype=np.int64)
+
+        for blocks in self._by_template.values():
+            pattern = blocks[0]._pattern
+            positions = []
+            fields = []
+            for position, label in enumerate(labels):
+                if indices[position] < 0 and isinstance(label, str):
+                    match = pattern.fullmatch(label)
+                    if match is not None:
+                        positions.append(position)
+                        fields.append(match.groups())
+            if not positions:
+                continue
+
+            fields = np.array(fields, dtype=np.int64).T
+            positions = np.array(positions)
+            for block in blocks:
+                offsets = block._offsets(fields)
+                found = offsets >= 0
+                indices[positions[found]] = offsets[found] + block.start
+
+        missing = np.flatnonzero(indices < 0)
+        if len(missing):
+            raise ValueError(f"unknown variable {labels[missing[0]]!r}")
+        return indices
+
+    def labels(self, indices: numpy.typing.ArrayLike) -> list:
+        """String labels of the variables with the given indices."""
+        indices = np.asarray(indices, dtype=np.int64).ravel()
+        if ((indices < 0) | (indices >= len(self))).any():
+            raise IndexError("index out of range")
+
+        labels = [None] * len(indices)
+        owner = np.searchsorted(self._starts, indices, side='right') - 1
+        for b in np.unique(owner):
+            positions = np.flatnonzero(owner == b)
+            for position, label in zip(positions.tolist(),
+                                       self._blocks[b].labels(indices[positions])):
+                labels[position] = label
+        return labels
+
+    def to_variables(self) -> dimod.variables.Variables:
+        """Materialize the labels as :class:`dimod.variables.Variables`."""
+        from dimod.variables import Variables
+
+        return Variables(self)
+
+    def relabel(self, model, *, inplace: bool = False):
+        """Relabel a model or sample set from integer indices to the
+        string labels, e.g. for output. Only the variables present are
+        relabeled, and their labels materialized.
+        """
+        mapping = dict(zip(model.variables, self.labels(list(model.variables))))
+        return model.relabel_variables(mapping, inplace=inplace)
+
+    def samples(self, sampleset: dimod.SampleSet) -> np.ndarray:
+        """Samples of a sample set over integer indices as an array with one
+        column per variable, in index order, for :meth:`LabelBlock.values`."""
+        variables = sampleset.variables
+        samples = sampleset.record.sample
+        if len(variables) != len(self):
+            raise ValueError("sample set does not have one variable per label")
+        if variables.is_range:
+            return samples
+        order = np.argsort(np.fromiter(variables, dtype=np.int64, count=len(variables)))
+        return samples[:, order]
@@ -0,0 +1,806 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batched and incremental evaluation of :mod:`dwave.optimization` models.
+
+Evaluating candidate states of a nonlinear model, e.g. to check the states
+returned by a solver or to pick warm starts, means loading each state into
+:attr:`~dwave.optimization.model.Model.states` and reading the objective
+and constraints, which walks the model's expression graph once per state.
+:class:`StateBatch` instead compiles the graph once into numpy operations
+that act on all the states at once, with one leading batch axis per
+symbol. Symbols of dynamic size, such as the lists of a
+:class:`~dwave.optimization.symbols.DisjointLists` decision, are kept as
+zero-padded arrays with a size per state.
+
+:meth:`StateBatch.update` changes some decisions in some of the states
+and re-evaluates only the symbols that depend on them, for only the states
+in which they changed.
+
+.. autosummary::
+
+    StateBatch
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import functools
+import io
+import json
+import typing
+import zipfile
+
+import numpy as np
+
+__all__ = ['StateBatch']
+
+# decision symbols with their own state, by class name
+_DECISIONS = frozenset(['BinaryVariable', 'IntegerVariable', 'ListVariable', 'SetVariable',
+                        'DisjointLists', 'DisjointBitSets'])
+
+# symbols whose state is a part of their decision's
+_PARTS = {'DisjointList': 'list_index', 'DisjointBitSet': 'set_index'}
+
+
+def _metadata(symbol, name):
+    """JSON metadata ``name`` that ``symbol`` writes when it is serialized."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        symbol._into_zipfile(zf, 'symbol/')
+        return json.loads(zf.read(f'symbol/{name}'))
+
+
+def _shape(symbol):
+    shape = getattr(symbol, 'shape', None)
+    return None if shape is None else tuple(shape())
+
+
+# values are (data, sizes) pairs. data has a leading batch axis, of length
+# one for symbols that do not depend on any decision. For symbols of
+# dynamic size, axis 1 of data is zero-padded and sizes holds its length in
+# each state; sizes is None otherwise.
+
+def _mask(sizes, width, ndim):
+    """Boolean mask of the valid entries of dynamic data of ``ndim`` dims."""
+    mask = np.arange(width) < sizes[..., None]
+    return mask.reshape(mask.shape + (1,) * (ndim - mask.ndim))
+
+
+def _pad(data, width, axis=1):
+    """``data`` padded or truncated to ``width`` along ``axis``."""
+    if data.shape[axis] >= width:
+        return data[(slice(None),) * axis + (slice(width),)]
+    padding = [(0, 0)] * data.ndim
+    padding[axis] = (0, width - data.shape[axis])
+    return np.pad(data, padding)
+
+
+def _ragged(rows, width, num_rows):
+    """Zero-padded ``(num_rows, width)`` data and sizes of 1D rows."""
+    sizes = np.fromiter(map(len, rows), dtype=np.int64, count=num_rows)
+    if (sizes > width).any():
+        raise ValueError(f"expected at most {width} elements per row")
+    data = np.zeros((num_rows, width))
+    if sizes.any():
+        data[_mask(sizes, width, 2)] = np.concatenate(rows)
+    return data, sizes
+
+
+def _distinct(data, sizes, num_values):
+    """Number of times each of ``range(num_values)`` occurs in each row of
+    dynamic ``data``, or None if a row holds other values."""
+    values = data[_mask(sizes, data.shape[-1], data.ndim)]
+    if (values % 1).any() or (values < 0).any() or (values >= num_values).any():
+        return None
+    rows = np.repeat(np.arange(len(data)), sizes.reshape(len(data), -1).sum(axis=1))
+    return np.bincount(rows * num_values + values.astype(np.intp),
+                       minlength=len(data) * num_values).reshape(len(data), num_values)
+
+
+def _take(value, rows):
+    data, sizes = value
+    if rows is None:
+        return value
+    if len(data) > 1:
+        data = data[rows]
+    return data, None if sizes is None else sizes[rows]
+
+
+def _align(values):
+    """Data of ``values`` broadcastable against each other, and their sizes."""
+    ndim = max(data.ndim for data, _ in values)
+    widths = [data.shape[1] for data, sizes in values if sizes is not None]
+    sizes = next((sizes for _, sizes in values if sizes is not None), None)
+
+    aligned = []
+    for data, dynamic in values:
+        if dynamic is not None and data.shape[1] != max(widths):
+            data = _pad(data, max(widths))
+        # scalars broadcast against the entries of arrays
+        aligned.append(data.reshape(data.shape[:1] + (1,) * (ndim - data.ndim) + data.shape[1:]))
+    return aligned, sizes
+
+
+def _as_float(data):
+    return np.asarray(data, dtype=np.float64)
+
+
+def _elementwise(func):
+    def compile(symbol):
+        def apply(*values):
+            aligned, sizes = _align(values)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return _as_float(func(*aligned)), sizes
+        return apply
+    return compile
+
+
+def _nary(ufunc):
+    return _elementwise(lambda *arrays: functools.reduce(ufunc, arrays))
+
+
+def _safe_divide(x, y):
+    zero = y == 0
+    return np.where(zero, 0, x / np.where(zero, 1, y))
+
+
+def _reduction(ufunc, identity):
+    def compile(symbol):
+        axes = tuple(symbol.axes()) if hasattr(symbol, 'axes') else ()
+        initial = getattr(symbol, 'initial', None)
+        initial = identity if initial is None else initial
+
+        def apply(value):
+            data, sizes = value
+            if sizes is not None:
+                data = np.where(_mask(sizes, data.shape[1], data.ndim), data, identity)
+            axis = tuple(a + 1 for a in axes) if axes else tuple(range(1, data.ndim))
+            result = _as_float(ufunc.reduce(data, axis=axis, initial=initial))
+            return result, sizes if sizes is not None and 1 not in axis else None
+        return apply
+    return compile
+
+
+def _slice_rows(key, sizes):
+    """Start, length and step of ``range(size)[key]`` for each size; steps
+    are positive in dwave-optimization."""
+    step = 1 if key.step is None else key.step
+
+    def bound(index, default):
+        if index is None:
+            return default
+        if index < 0:
+            return np.maximum(index + sizes, 0)
+        return np.minimum(index, sizes)
+
+    start = bound(key.start, 0)
+    stop = bound(key.stop, sizes)
+    return start, np.maximum((stop - start + step - 1) // step, 0), step
+
+
+def _basic_indexing(symbol):
+    key = tuple(symbol._infer_indices())
+    (array,) = symbol.iter_predecessors()
+
+    if _shape(array)[0] >= 0:
+        def apply(value):
+            data, _ = value
+            return data[(slice(None),) + key], None
+        return apply
+
+    first, rest = key[0], (slice(None), slice(None)) + key[1:]
+    if not isinstance(first, slice):
+        return None
+
+    @functools.lru_cache(maxsize=None)
+    def width(size):
+        # the longest slice of an array of at most this size
+        return max(len(range(n)[first]) for n in range(size + 1))
+
+    def apply(value):
+        data, sizes = value
+        start, lengths, step = _slice_rows(first, sizes)
+        columns = width(data.shape[1])
+        if first.start is None or first.start >= 0:
+            # the same start in every state in which the slice is not empty
+            data = _pad(data[:, first.start or 0::step], columns)
+        elif data.shape[1]:
+            positions = np.minimum(start[:, None] + step * np.arange(columns), data.shape[1] - 1)
+            data = data[np.arange(len(data))[:, None], positions]
+        else:
+            data = np.zeros(data.shape[:1] + (columns,) + data.shape[2:])
+        return data[rest], lengths
+    return apply
+
+
+def _advanced_indexing(symbol):
+    predecessors = [p.topological_index() for p in symbol.iter_predecessors()]
+    layout = _metadata(symbol, 'indices.json')
+    # slices mixed with index arrays, or indexing into a dynamic array
+    if not all(isinstance(i, int) for i in layout) or -1 in _shape(
+            next(symbol.iter_predecessors())):
+        return None
+    positions = [predecessors.index(i, 1) if i in predecessors[1:] else 0 for i in layout]
+
+    def apply(*values):
+        indices = [values[p] for p in positions]
+        width = max((data.shape[1] for data, sizes in indices if sizes is not None), default=0)
+        sizes = next((sizes for _, sizes in indices if sizes is not None), None)
+
+        arrays = [(data if dynamic is None else _pad(data, width)).astype(np.intp)
+                  for data, dynamic in indices]
+
+        data, _ = values[0]
+        if len(data) == 1:
+            data = data[0]
+        else:
+            ndim = max(a.ndim for a in arrays)
+            arrays.insert(0, np.arange(len(data)).reshape((-1,) + (1,) * (ndim - 1)))
+
+        # padding holds arbitrary values, wrapping keeps them in range
+        flat = np.ravel_multi_index(np.broadcast_arrays(*arrays), data.shape[:len(arrays)],
+                                    mode='wrap')
+        return data.reshape((-1,) + data.shape[len(arrays):])[flat], sizes
+    return apply
+
+
+def _reshape(symbol):
+    shape = _shape(symbol)
+    if -1 in shape:
+        return None
+
+    def apply(value):
+        data, _ = value
+        return data.reshape(data.shape[:1] + shape), None
+    return apply
+
+
+def _size(symbol):
+    (array,) = symbol.iter_predecessors()
+    shape = _shape(array)
+
+    def apply(value):
+        data, sizes = value
+        if sizes is None:
+            return np.full(1, float(np.prod(shape))), None
+        return _as_float(sizes * np.prod(shape[1:], dtype=np.int64)), None
+    return apply
+
+
+def _copy(symbol):
+    return lambda value: value
+
+
+def _unary(func):
+    def compile(symbol):
+        def apply(value):
+            data, sizes = value
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return _as_float(func(data)), sizes
+        return apply
+    return compile
+
+
+# numpy implementations of symbols, by class name; other symbols are read
+# from a copy of the model, one state at a time
+_COMPILERS = {
+    'Absolute': _unary(np.abs),
+    'Add': _elementwise(np.add),
+    'AdvancedIndexing': _advanced_indexing,
+    'All': _reduction(np.logical_and, True),
+    'And': _elementwise(np.logical_and),
+    'Any': _reduction(np.logical_or, False),
+    'BasicIndexing': _basic_indexing,
+    'Copy': _copy,
+    'Cos': _unary(np.cos),
+    'Divide': _elementwise(np.divide),
+    'Equal': _elementwise(np.equal),
+    'Exp': _unary(np.exp),
+    'Expit': _unary(lambda x: 1 / (1 + np.exp(-x))),
+    'LessEqual': _elementwise(np.less_equal),
+    'Log': _unary(np.log),
+    'Logical': _unary(lambda x: x != 0),
+    'Max': _reduction(np.maximum, -np.inf),
+    'Maximum': _elementwise(np.maximum),
+    'Min': _reduction(np.minimum, np.inf),
+    'Minimum': _elementwise(np.minimum),
+    'Modulus': _elementwise(np.mod),
+    'Multiply': _elementwise(np.multiply),
+    'NaryAdd': _nary(np.add),
+    'NaryMaximum': _nary(np.maximum),
+    'NaryMinimum': _nary(np.minimum),
+    'NaryMultiply': _nary(np.multiply),
+    'Negative': _unary(np.negative),
+    'Not': _unary(np.logical_not),
+    'Or': _elementwise(np.logical_or),
+    'Prod': _reduction(np.multiply, 1),
+    'Reshape': _reshape,
+    'Rint': _unary(np.rint),
+    'SafeDivide': _elementwise(_safe_divide),
+    'Sin': _unary(np.sin),
+    'Size': _size,
+    'Square': _unary(np.square),
+    'SquareRoot': _unary(np.sqrt),
+    'Subtract': _elementwise(np.subtract),
+    'Sum': _reduction(np.add, 0),
+    'Tanh': _unary(np.tanh),
+    'Xor': _elementwise(np.logical_xor),
+    }
+
+
+class _Node:
+    __slots__ = ('index', 'symbol', 'kind', 'predecessors', 'shape', 'apply', 'batched',
+                 'part', 'domain')
+
+    def __init__(self, symbol, kind, predecessors, shape, apply=None, batched=False,
+                 part=None, domain=None):
+        self.index = symbol.topological_index()
+        self.symbol = symbol
+        self.kind = kind
+        self.predecessors = predecessors
+        self.shape = shape
+        self.apply = apply
+        self.batched = batched      # depends on a decision
+        self.part = part            # index into the state of its decision
+        self.domain = domain
+
+    @property
+    def dynamic(self):
+        return self.shape is not None and -1 in self.shape
+
+
+def _domain(symbol, kind):
+    """Parameters of the states of a decision, for validation."""
+    if kind in ('BinaryVariable', 'IntegerVariable'):
+        if kind == 'BinaryVariable':
+            return 0., 1.
+        return symbol.lower_bound(), symbol.upper_bound()
+    if kind in ('ListVariable', 'SetVariable'):
+        metadata = _metadata(symbol, 'shape.json')
+        return metadata['max_value'], metadata['min_size'], metadata['max_size']
+    if kind == 'DisjointLists':
+        return symbol.primary_set_size(), symbol.num_disjoint_lists()
+    metadata = _metadata(symbol, 'shape.json')
+    return metadata['primary_set_size'], metadata['num_disjoint_sets']
+
+
+def _compile(model) -> list[_Node]:
+    """Nodes of the symbols of ``model``, in topological order."""
+    nodes = []
+    for symbol in model.iter_symbols():
+        kind = type(symbol).__name__
+        predecessors = tuple(p.topological_index() for p in symbol.iter_predecessors())
+        shape = _shape(symbol)
+
+        if kind == 'Input':
+            raise ValueError("models with inputs are not supported")
+
+        if kind in _DECISIONS:
+            node = _Node(symbol, kind, predecessors, shape, batched=True,
+                         domain=_domain(symbol, kind))
+        elif kind == 'Constant':
+            state = _as_float(symbol.state())
+            node = _Node(symbol, kind, predecessors, shape,
+                         apply=lambda state=state[np.newaxis]: (state, None))
+        elif kind in _PARTS:
+            node = _Node(symbol, kind, predecessors, shape, batched=True,
+                         part=getattr(symbol, _PARTS[kind])())
+        else:
+            compile = _COMPILERS.get(kind)
+            apply = compile(symbol) if compile is not None else None
+            node = _Node(symbol, kind, predecessors, shape, apply=apply,
+                         batched=apply is None or any(nodes[p].batched for p in predecessors))
+        nodes.append(node)
+    return nodes
+
+
+class StateBatch:
+    """Values of every symbol of a :mod:`dwave.optimization` model for a
+    batch of states of its decisions.
+
+    Symbols are evaluated with numpy for all the states at once, in
+    topological order. Symbols without a numpy implementation, listed in
+    :attr:`fallback`, are evaluated by a private copy of the model, one
+    state at a time. Decision states are checked against the domains of
+    their symbols.
+
+    Args:
+        model (:class:`~dwave.optimization.model.Model`):
+            Nonlinear model without inputs. It must not be changed while
+            in use.
+
+        states (sequence or mapping, optional):
+            States of every decision, as accepted by :meth:`set_states`.
+            By default, the states of ``model.states`` are evaluated.
+
+    Examples:
+        >>> from dwave.optimization.generators import traveling_salesperson
+        >>> from dwaveoceansdk.nonlinear import StateBatch
+        ...
+        >>> model = traveling_salesperson([[0, 1, 2], [1, 0, 3], [2, 3, 0]])
+        >>> route = next(model.iter_decisions())
+        >>> batch = StateBatch(model, [[[0, 1, 2], [2, 1, 0], [1, 0, 2]]])
+        >>> batch.objective.tolist()
+        [6.0, 6.0, 6.0]
+        >>> index = route.topological_index()
+        >>> batch.update({index: [[0, 2, 1]]}, rows=[1]).tolist()  # re-evaluated symbols
+        [2, 3, 4, 5, 6, 7, 8, 9, 10]
+        >>> batch.value(route)[1].tolist()
+        [0.0, 2.0, 1.0]
+    """
+    def __init__(self, model, states=None):
+        self.model = model
+        with model.lock():
+            self._nodes = _compile(model)
+            # symbols other than decisions are only indexed while the
+            # model is locked
+            objective = model.objective
+            self._objective = None if objective is None else objective.topological_index()
+            self._constraints = [c.topological_index() for c in model.iter_constraints()]
+
+        self.fallback = tuple(node.index for node in self._nodes
+                              if node.apply is None and node.kind not in _DECISIONS
+                              and node.part is None)
+
+        self._values: list[typing.Any] = [None] * len(self._nodes)
+        self._decisions = [node for node in self._nodes if node.kind in _DECISIONS]
+        self._order = [decision.topological_index() for decision in model.iter_decisions()]
+        self.num_states = 0
+
+        # copy of the model for the fallback symbols, and which of its
+        # states hold the current decisions
+        self._copy = None
+        self._loaded = np.zeros(0, dtype=bool)
+
+        for node in self._nodes:
+            if not node.batched and node.apply is not None:
+                self._values[node.index] = node.apply(
+                    *(self._values[p] for p in node.predecessors))
+
+        self.set_states(states)
+
+    def __len__(self):
+        return self.num_states
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.model!r}) with {self.num_states} states"
+
+    def _node(self, symbol):
+        index = symbol if isinstance(symbol, (int, np.integer)) else symbol.topological_index()
+        if index is None:
+            raise ValueError("symbol has no topological index; lock the model or give "
+                             "the index of the symbol")
+        if not 0 <= index < len(self._nodes):
+            raise ValueError(f"no symbol with topological index {index}")
+        return self._nodes[index]
+
+    def _decision(self, symbol):
+        node = self._node(symbol)
+        if node.kind not in _DECISIONS:
+            raise ValueError(f"symbol {node.index} ({node.kind}) is not a decision")
+        return node
+
+    def _keyed(self, states):
+        """``states`` keyed by the topological index of their decision."""
+        if isinstance(states, collections.abc.Mapping):
+            return {self._decision(key).index: value for key, value in states.items()}
+        states = list(states)
+        if len(states) != len(self._order):
+            raise ValueError(f"expected states of {len(self._order)} decisions, "
+                             f"received {len(states)}")
+        return dict(zip(self._order, states))
+
+    def _convert(self, node, states, num_rows=None):
+        """Value of decision ``node`` for ``states``, after validation."""
+        kind, domain = node.kind, node.domain
+        name = f"states of decision {node.index} ({kind})"
+
+        if kind in ('DisjointLists', 'SetVariable') or (kind == 'ListVariable' and node.dynamic):
+            states = list(states)
+            if num_rows is not None and len(states) != num_rows:
+                raise ValueError(f"{name}: expected {num_rows} states, received {len(states)}")
+            num_rows = len(states)
+
+        if kind == 'DisjointLists':
+            size, num_lists = domain
+            for state in states:
+                if len(state) != num_lists:
+                    raise ValueError(f"{name}: expected {num_lists} lists per state")
+            data, sizes = _ragged([lst for state in states for lst in state], size,
+                                  num_rows * num_lists)
+            data, sizes = data.reshape(num_rows, num_lists, size), sizes.reshape(num_rows, -1)
+            counts = _distinct(data, sizes, size)
+            if counts is None or not (counts == 1).all():
+                raise ValueError(f"{name}: each state must partition range({size})")
+            return data, sizes
+
+        if kind in ('SetVariable', 'ListVariable') and node.dynamic:
+            max_value, min_size, max_size = domain
+            data, sizes = _ragged(states, max_size, num_rows)
+            counts = _distinct(data, sizes, max_value)
+            if counts is None or (counts > 1).any() or (sizes < min_size).any():
+                raise ValueError(f"{name}: states must be subsets of range({max_value}) "
+                                 f"with {min_size} to {max_size} elements")
+            return data, sizes
+
+        data = np.asarray(states, dtype=np.float64)
+        shape = (data.shape[0] if data.ndim and num_rows is None else num_rows,)
+        if kind == 'DisjointBitSets':
+            size, num_sets = domain
+            shape += (num_sets, size)
+        else:
+            shape += node.shape
+        if data.shape != shape:
+            raise ValueError(f"{name}: expected an array of shape {shape}, "
+                             f"received {data.shape}")
+
+        if kind == 'ListVariable':
+            if not (np.sort(data, axis=1) == np.arange(node.shape[0])).all():
+                raise ValueError(f"{name}: states must be permutations of range({shape[1]})")
+        elif kind == 'DisjointBitSets':
+            if not np.isin(data, (0, 1)).all() or not (data.sum(axis=1) == 1).all():
+                raise ValueError(f"{name}: each state must partition range({domain[0]})")
+        else:
+            lower, upper = domain
+            if (data % 1).any() or (data < lower).any() or (data > upper).any():
+                raise ValueError(f"{name}: states must be integers in [{lower}, {upper}]")
+        return data, None
+
+    def _state(self, node, row):
+        """State of decision ``node`` in ``row``, as accepted by ``set_state``."""
+        data, sizes = self._values[node.index]
+        if node.kind == 'DisjointLists':
+            return [data[row, k, :n] for k, n in enumerate(sizes[row])]
+        if sizes is not None:
+            return data[row, :sizes[row]]
+        return data[row]
+
+    def _read(self, node, num_states):
+        """States of decision ``node`` in ``model.states``."""
+        symbol = node.symbol
+        if node.kind in ('DisjointLists', 'DisjointBitSets'):
+            parts = sorted((self._nodes[s.topological_index()] for s in symbol.iter_successors()
+                            if type(s).__name__ in _PARTS), key=lambda part: part.part)
+            states = [[part.symbol.state(i) for part in parts] for i in range(num_states)]
+            return states if node.kind == 'DisjointLists' else np.reshape(
+                states, (num_states, len(parts), node.domain[0]))
+        states = [symbol.state(i) for i in range(num_states)]
+        return states if node.dynamic else np.reshape(states, (num_states,) + node.shape)
+
+    def set_states(self, states=None):
+        """Evaluate every symbol for new states of all the decisions.
+
+        Args:
+            states (sequence or mapping, optional):
+                States of each decision, in the order of
+                :meth:`~dwave.optimization.model.Model.iter_decisions`, or
+                keyed by the topological index of the decision. Array
+                decisions take an array of shape
+                ``(num_states, *symbol.shape())``; sets and lists of
+                dynamic size a sequence of sequences;
+                :class:`~dwave.optimization.symbols.DisjointLists` a
+                sequence of sequences of lists; and
+                :class:`~dwave.optimization.symbols.DisjointBitSets` an
+                array of shape ``(num_states, num_sets, primary_set_size)``.
+                By default, the states of ``model.states`` are read.
+        """
+        if states is None:
+            with self.model.lock():
+                num_states = self.model.states.size()
+                states = {node.index: self._read(node, num_states) for node in self._decisions}
+        else:
+            states = self._keyed(states)
+            missing = [node.index for node in self._decisions if node.index not in states]
+            if missing:
+                raise ValueError(f"no states given for decisions {missing}")
+
+        values = {}
+        for node in self._decisions:
+            values[node.index] = self._convert(node, states[node.index])
+        num_states = {len(data) for data, _ in values.values()}
+        if len(num_states) > 1:
+            raise ValueError("decisions have different numbers of states")
+
+        self.num_states = num_states.pop() if num_states else 0
+        self._loaded = np.zeros(self.num_states, dtype=bool)
+        for index, value in values.items():
+            self._values[index] = value
+        for node in self._nodes:
+            if node.batched and node.kind not in _DECISIONS:
+                self._evaluate(node, None)
+
+    def update(self, states, rows=None) -> np.ndarray:
+        """Change the states of some decisions and re-evaluate the symbols
+        that depend on them.
+
+        Only the symbols downstream of a decision whose state changed are
+        re-evaluated, and only for the states in which one of their
+        predecessors changed. Each list of a
+        :class:`~dwave.optimization.symbols.DisjointLists` decision is
+        tracked separately.
+
+        Args:
+            states (sequence or mapping):
+                New states of all the decisions, or of some keyed by their
+                topological index, in the format of :meth:`set_states`.
+
+            rows (array-like, optional):
+                Indices of the states changed, one per new state. By
+                default, all of them.
+
+        Returns:
+            :class:`numpy.ndarray`: Topological indices of the symbols
+            re-evaluated.
+        """
+        if rows is not None:
+            rows = np.asarray(rows, dtype=np.intp).reshape(-1)
+            if len(np.unique(rows)) != len(rows) or \
+                    ((rows < 0) | (rows >= self.num_states)).any():
+                raise ValueError(f"rows must be distinct indices of the {self.num_states} states")
+        num_rows = self.num_states if rows is None else len(rows)
+
+        dirty = {}
+        for index, value in self._keyed(states).items():
+            node = self._nodes[index]
+            data, sizes = self._convert(node, value, num_rows)
+            old, old_sizes = _take(self._values[node.index], rows)
+
+            # which states, and which parts of them, changed
+            changed = old != data
+            parts = node.kind in ('DisjointLists', 'DisjointBitSets')
+            changed = changed.reshape(changed.shape[:2 if parts else 1] + (-1,)).any(axis=-1)
+            if sizes is not None:
+                changed |= old_sizes != sizes
+
+            if rows is None:
+                self._values[node.index] = data, sizes
+                dirty[node.index] = changed
+            else:
+                current, current_sizes = self._values[node.index]
+                current[rows] = data
+                if sizes is not None:
+                    current_sizes[rows] = sizes
+                dirty[node.index] = mask = np.zeros((self.num_states,) + changed.shape[1:],
+                                                    dtype=bool)
+                mask[rows] = changed
+
+        if not dirty:
+            return np.zeros(0, dtype=np.int64)
+        stale = functools.reduce(np.logical_or, (m.reshape(self.num_states, -1).any(axis=1)
+                                                 for m in dirty.values()))
+        self._loaded[stale] = False
+
+        evaluated = []
+        for node in self._nodes[min(dirty):]:
+            if node.index in dirty or not node.batched:
+                continue
+            masks = [dirty[p] if node.part is None else dirty[p][:, node.part]
+                     for p in node.predecessors if p in dirty]
+            if not masks:
+                continue
+            mask = functools.reduce(np.logical_or, masks)
+            if not mask.any():
+                continue
+            self._evaluate(node, None if mask.all() else np.flatnonzero(mask))
+            dirty[node.index] = mask
+            evaluated.append(node.index)
+        return np.asarray(evaluated, dtype=np.int64)
+
+    def _evaluate(self, node, rows):
+        """Evaluate ``node`` for ``rows`` of the states, or all of them."""
+        num_rows = self.num_states if rows is None else len(rows)
+
+        if node.part is not None:
+            data, sizes = _take(self._values[node.predecessors[0]], rows)
+            if sizes is None:
+                value = data[:, node.part], None
+            else:
+                # lists are padded to the longest of the batch only
+                sizes = sizes[:, node.part]
+                value = data[:, node.part, :sizes.max(initial=0)], sizes
+        elif node.apply is None:
+            value = self._fallback(node, rows)
+        else:
+            value = node.apply(*(_take(self._values[p], rows) for p in node.predecessors))
+
+        data, sizes = value
+        if len(data) != num_rows:
+            data = np.repeat(data, num_rows, axis=0)
+
+        if rows is None:
+            self._values[node.index] = data, sizes
+            return
+
+        current, current_sizes = self._values[node.index]
+        if sizes is not None and current.shape[1] != data.shape[1]:
+            width = max(current.shape[1], data.shape[1])
+            current, data = _pad(current, width), _pad(data, width)
+        current[rows] = data
+        if sizes is not None:
+            current_sizes[rows] = sizes
+        self._values[node.index] = current, current_sizes
+
+    def _fallback(self, node, rows):
+        """Evaluate ``node`` with the copy of the model, state by state."""
+        from dwave.optimization import Model
+
+        if self._copy is None:
+            with self.model.lock():
+                copy = Model.from_file(self.model.to_file())
+            copy.lock()
+            self._copy = copy, list(copy.iter_symbols())
+        copy, symbols = self._copy
+
+        rows = np.arange(self.num_states) if rows is None else rows
+        if copy.states.size() != self.num_states:
+            copy.states.resize(self.num_states)
+            self._loaded[:] = False
+        for row in rows[~self._loaded[rows]].tolist():
+            for decision in self._decisions:
+                symbols[decision.index].set_state(row, self._state(decision, row))
+        self._loaded[rows] = True
+
+        states = [_as_float(symbols[node.index].state(row)) for row in rows.tolist()]
+        if node.dynamic:
+            return _ragged(states, max(map(len, states), default=0), len(states))
+        return np.reshape(states, (len(states),) + node.shape), None
+
+    def value(self, symbol):
+        """States of ``symbol``, given by symbol or topological index.
+
+        Symbols other than decisions have a topological index only while
+        the model is locked; for an unlocked model, give the index.
+
+        Returns:
+            :class:`numpy.ndarray` of shape ``(num_states, *symbol.shape())``
+            for symbols of fixed shape; a list of arrays, one per state, for
+            symbols of dynamic size; and a list of lists of arrays for
+            :class:`~dwave.optimization.symbols.DisjointLists` decisions.
+        """
+        node = self._node(symbol)
+        data, sizes = self._values[node.index]
+        if node.kind == 'DisjointLists':
+            return [[data[i, k, :n] for k, n in enumerate(row)] for i, row in enumerate(sizes)]
+        if sizes is not None:
+            return [data[i, :n] for i, n in enumerate(sizes)]
+        if len(data) != self.num_states:
+            return np.repeat(data, self.num_states, axis=0)
+        return data
+
+    @property
+    def objective(self) -> typing.Optional[np.ndarray]:
+        """Objective value of each state, or None if the model has no
+        objective."""
+        if self._objective is None:
+            return None
+        return self.value(self._objective).reshape(-1)
+
+    @property
+    def feasible(self) -> np.ndarray:
+        """Whether each state satisfies all the constraints."""
+        feasible = np.ones(self.num_states, dtype=bool)
+        for constraint in self._constraints:
+            feasible &= self.value(constraint).reshape(self.num_states, -1).all(axis=1)
+        return feasible
+
+    def set_model_states(self, rows=None):
+        """Load the decision states of ``rows``, by default all, into
+        ``model.states``, e.g. as initial states for a solver."""
+        rows = range(self.num_states) if rows is None else np.asarray(rows).tolist()
+        with self.model.lock():
+            self.model.states.resize(len(rows))
+            for i, row in enumerate(rows):
+                for decision in self._decisions:
+                    decision.symbol.set_state(i, self._state(decision, row))
@@ -0,0 +1,511 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bulk penalty models for constraint satisfaction problems.
+
+:func:`penaltymodel.get_penalty_model` handles one constraint at a time: it
+opens the SQLite cache, queries and deserializes the model, and on a miss
+solves a linear program. A problem with tens of thousands of copies of the
+same few constraints pays that cost for each copy. :func:`penalty_bqm`
+instead
+
+1.  collects the distinct gadget specifications (:class:`GadgetSpec`) of
+    all the constraints in one pass,
+2.  looks them up in a :class:`PenaltyModelIndex`, an in-process hash index
+    of the cache that is loaded with a single query,
+3.  generates the missing models in parallel and adds them to the cache,
+    and
+4.  stamps each gadget's model out for all of its instances at once, as
+    arrays, into a single binary quadratic model.
+
+.. autosummary::
+
+    Gadget
+    GadgetSpec
+    PenaltyModelIndex
+    penalty_bqm
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import contextlib
+import json
+import threading
+import typing
+
+import dimod
+import numpy as np
+
+from dwaveoceansdk._utilities import InlineExecutor
+from dwaveoceansdk.tracing import span
+
+__all__ = ['Gadget', 'GadgetSpec', 'PenaltyModelIndex', 'penalty_bqm']
+
+
+class GadgetSpec:
+    """Specification of a penalty model: the feasible configurations of a
+    constraint on ``n`` decision variables, the graph the model may use and
+    the bounds on its biases and classical gap.
+
+    Decision variables are labelled ``0, ..., n-1`` and auxiliary variables
+    ``n, ..., num_nodes-1``. Specifications are hashable and equal if they
+    describe the same model, whatever the order of the configurations and
+    edges.
+
+    Args:
+        configurations (iterable[sequence]):
+            Feasible configurations of the decision variables, as spins or
+            binary values.
+
+        graph (int or iterable[tuple[int, int]], optional):
+            Number of nodes of a complete graph, or the edges of the graph.
+            Defaults to the complete graph on the decision variables.
+
+        linear_bound (tuple[float, float], optional, default=(-2, 2)):
+            Range of the linear biases.
+
+        quadratic_bound (tuple[float, float], optional, default=(-1, 1)):
+            Range of the quadratic biases.
+
+        min_classical_gap (float, optional, default=2):
+            Minimum energy gap between the feasible and infeasible
+            configurations.
+
+    Examples:
+        >>> from dwaveoceansdk.penalties import GadgetSpec
+        >>> AND = GadgetSpec([(0, 0, 0), (0, 1, 0), (1, 0, 0), (1, 1, 1)], graph=4)
+        >>> AND.num_variables, AND.num_nodes
+        (3, 4)
+    """
+    def __init__(self, configurations, graph=None, *,
+                 linear_bound=(-2, 2), quadratic_bound=(-1, 1), min_classical_gap=2):
+        configurations = np.asarray(list(configurations))
+        if configurations.ndim != 2 or not configurations.size:
+            raise ValueError("configurations must be a non-empty collection of "
+                             "equal-length sequences")
+
+        # spins, sorted and without repeats
+        self.configurations = np.unique(np.where(configurations > 0, 1, -1).astype(np.int8),
+                                        axis=0)
+        self.num_variables = num_variables = configurations.shape[1]
+
+        if graph is None:
+            graph = num_variables
+        if isinstance(graph, int):
+            num_nodes = graph
+            edges = [(u, v) for u in range(num_nodes) for v in range(u + 1, num_nodes)]
+        else:
+            edges = sorted(set((min(u, v), max(u, v)) for u, v in graph))
+            num_nodes = max(num_variables, edges[-1][1] + 1 if edges else 0)
+            if any(u < 0 or u == v for u, v in edges):
+                raise ValueError("graph edges must join distinct non-negative integers")
+        if num_nodes < num_variables:
+            raise ValueError("graph must have a node for each decision variable")
+
+        self.num_nodes = num_nodes
+        self.edges = tuple(edges)
+        self.linear_bound = tuple(map(float, linear_bound))
+        self.quadratic_bound = tuple(map(float, quadratic_bound))
+        self.min_classical_gap = float(min_classical_gap)
+
+        self._key = (num_nodes, self.edges, self.configurations.shape,
+                     self.configurations.tobytes(), self.linear_bound,
+                     self.quadratic_bound, self.min_classical_gap)
+        self._hash = hash(self._key)
+        self._database_key = None
+
+    def __eq__(self, other):
+        return isinstance(other, GadgetSpec) and self._key == other._key
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(<{len(self.configurations)} configurations>, "
+                f"num_variables={self.num_variables}, num_nodes={self.num_nodes})")
+
+    def database_key(self) -> tuple:
+        """Columns of the ``penaltymodel`` cache that a matching model has,
+        in the cache's encoding: the graph, the feasible configurations and
+        the decision variables."""
+        if self._database_key is not None:
+            return self._database_key
+
+        from penaltymodel import PenaltyModelCache
+
+        # edges as by PenaltyModelCache.encode_graph, for sorted edges
+        edges = json.dumps(list(map(list, self.edges)), separators=(',', ':'))
+        sampleset = PenaltyModelCache.encode_sampleset(
+            (self.configurations, list(range(self.num_variables))))
+        key = self._database_key = (
+            self.num_nodes, edges, sampleset['num_variables'],
+            sampleset['samples'], sampleset['energies'],
+            json.dumps(list(range(self.num_variables)), separators=(',', ':')))
+        return key
+
+    def accepts(self, linear_range, quadratic_range, classical_gap) -> bool:
+        """Whether a model with the given ranges of biases and gap meets
+        the bounds of the specification."""
+        return (self.linear_bound[0] <= linear_range[0]
+                and linear_range[1] <= self.linear_bound[1]
+                and self.quadratic_bound[0] <= quadratic_range[0]
+                and quadratic_range[1] <= self.quadratic_bound[1]
+                and classical_gap >= self.min_classical_gap)
+
+
+class Gadget:
+    """Penalty model of a :class:`GadgetSpec`, as arrays over the nodes
+    ``0, ..., num_nodes-1`` of the specification's graph.
+
+    Attributes:
+        spec (:class:`GadgetSpec`): The specification.
+        bqm (:class:`dimod.BinaryQuadraticModel`): The spin-valued model.
+        classical_gap (float): Energy gap of the model.
+    """
+    def __init__(self, spec, bqm, classical_gap):
+        self.spec = spec
+        self.bqm = bqm
+        self.classical_gap = float(classical_gap)
+        self._arrays = {}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.spec!r}, classical_gap={self.classical_gap!r})"
+
+    def arrays(self, vartype=dimod.SPIN):
+        """Linear biases, quadratic ``(irow, icol, biases)`` and offset of
+        the model in ``vartype``, computed once."""
+        vartype = dimod.as_vartype(vartype)
+        try:
+            return self._arrays[vartype]
+        except KeyError:
+            pass
+
+        bqm = self.bqm.change_vartype(vartype, inplace=False)
+        bqm.add_linear_from((v, 0) for v in range(self.spec.num_nodes))
+        linear, (irow, icol, quadratic), offset = bqm.to_numpy_vectors(
+            variable_order=range(self.spec.num_nodes))
+        arrays = self._arrays[vartype] = (
+            linear.astype(np.float64),
+            (irow.astype(np.int64), icol.astype(np.int64), quadratic.astype(np.float64)),
+            float(offset))
+        return arrays
+
+
+def _generate(spec):
+    """Generate the model of ``spec``, in a worker process."""
+    import networkx as nx
+    from penaltymodel.generation import generate
+
+    graph = nx.Graph()
+    graph.add_nodes_from(range(spec.num_nodes))
+    graph.add_edges_from(spec.edges)
+
+    bqm, gap, _ = generate(graph, (spec.configurations, list(range(spec.num_variables))),
+                           linear_bound=spec.linear_bound,
+                           quadratic_bound=spec.quadratic_bound,
+                           min_classical_gap=spec.min_classical_gap)
+    return bqm, gap
+
+
+class PenaltyModelIndex:
+    """In-process index of the ``penaltymodel`` cache.
+
+    The models in the cache are read with a single query on first use and
+    indexed by their graph and feasible configurations; the binary
+    quadratic model of an entry is deserialized only when first needed.
+    Models resolved by :meth:`resolve` are kept for the lifetime of the
+    index and the generated ones are also added to the cache.
+
+    Args:
+        database (str, optional):
+            Path of the cache's SQLite database. Defaults to that of
+            :class:`penaltymodel.PenaltyModelCache`.
+
+        persist (bool, optional, default=True):
+            Read and update the cache. If False, the index starts empty and
+            generated models are only kept in memory.
+
+    Examples:
+        >>> from dwaveoceansdk.penalties import GadgetSpec, PenaltyModelIndex
+        >>> index = PenaltyModelIndex(persist=False)
+        >>> EQ = GadgetSpec([(-1, -1), (1, 1)])
+        >>> index.resolve([EQ])[EQ].classical_gap
+        2.0
+    """
+    def __init__(self, database=None, *, persist=True):
+        self.database = database
+        self.persist = persist
+
+        self._entries = None    # database key -> [[gap, linear, quadratic, bqm], ...]
+        self._resolved = {}     # spec -> Gadget
+        self._lock = threading.RLock()
+
+    def _cache(self):
+        from penaltymodel import PenaltyModelCache
+        return PenaltyModelCache(self.database)
+
+    def _load(self):
+        if self._entries is not None:
+            return
+
+        entries = collections.defaultdict(list)
+        if self.persist:
+            with span('penalties.load'), self._cache() as cache:
+                for row in cache.conn.execute("SELECT * FROM penalty_model_view;"):
+                    key = (row['num_nodes'], row['edges'], row['num_variables'],
+                           row['samples'], row['energies'], row['decision_variables'])
+                    entries[key].append([
+                        row['classical_gap'],
+                        (row['min_linear_bias'], row['max_linear_bias']),
+                        (row['min_quadratic_bias'], row['max_quadratic_bias']),
+                        row['bqm_data']])
+
+        # best gap first, as retrieved by the cache
+        for candidates in entries.values():
+            candidates.sort(key=lambda entry: entry[0], reverse=True)
+        self._entries = entries
+
+    def __len__(self):
+        with self._lock:
+            self._load()
+            return sum(map(len, self._entries.values()))
+
+    def lookup(self, spec: GadgetSpec) -> typing.Optional[Gadget]:
+        """Indexed model of ``spec`` with the largest gap, or None."""
+        with self._lock:
+            gadget = self._resolved.get(spec)
+            if gadget is not None:
+                return gadget
+
+            self._load()
+            for entry in self._entries.get(spec.database_key(), ()):
+                gap, linear_range, quadratic_range, bqm = entry
+                if spec.accepts(linear_range, quadratic_range, gap):
+                    if not isinstance(bqm, dimod.BinaryQuadraticModel):
+                        bqm = entry[3] = dimod.BinaryQuadraticModel.from_file(bqm)
+                    gadget = self._resolved[spec] = Gadget(spec, bqm, gap)
+                    return gadget
+            return None
+
+    def add(self, spec: GadgetSpec, bqm: dimod.BinaryQuadraticModel, classical_gap: float,
+            *, cache=None) -> Gadget:
+        """Index a model of ``spec``, and add it to the cache if persisted."""
+        bqm = dimod.as_bqm(bqm, dtype=float)
+        if bqm.vartype is not dimod.SPIN:
+            bqm = bqm.change_vartype(dimod.SPIN, inplace=False)
+
+        with self._lock:
+            self._load()
+            if self.persist:
+                with contextlib.ExitStack() as stack:
+                    if cache is None:
+                        cache = stack.enter_context(self._cache())
+                    cache.insert_penalty_model(
+                        bqm, (spec.configurations, list(range(spec.num_variables))),
+                        classical_gap)
+
+            linear_range = (min(bqm.linear.values(), default=0),
+                            max(bqm.linear.values(), default=0))
+            quadratic_range = (min(bqm.quadratic.values(), default=0),
+                               max(bqm.quadratic.values(), default=0))
+            candidates = self._entries[spec.database_key()]
+            candidates.append([classical_gap, linear_range, quadratic_range, bqm])
+            candidates.sort(key=lambda entry: entry[0], reverse=True)
+
+            gadget = self._resolved[spec] = Gadget(spec, bqm, classical_gap)
+            return gadget
+
+    def resolve(self, specs: typing.Iterable[GadgetSpec], *,
+                num_workers: int = 1,
+                executor: typing.Optional[concurrent.futures.Executor] = None,
+                ) -> dict[GadgetSpec, Gadget]:
+        """Models of the distinct ``specs``, generating those not indexed.
+
+        Args:
+            specs: Specifications, possibly repeated.
+
+            num_workers: Number of worker processes to generate the missing
+                models in. With the default of one, models are generated in
+                the calling thread.
+
+            executor: Executor to submit the generation of the missing
+                models to instead of a new pool of ``num_workers``
+                processes.
+
+        Returns:
+            The model of each distinct specification.
+
+        Raises:
+            :exc:`penaltymodel.ImpossiblePenaltyModel`: If no model meets a
+                specification.
+        """
+        if not isinstance(num_workers, int) or num_workers < 1:
+            raise ValueError("num_workers must be a positive integer")
+
+        specs = list(dict.fromkeys(specs))
+
+        with self._lock:
+            resolved = {spec: self.lookup(spec) for spec in specs}
+            missing = [spec for spec, gadget in resolved.items() if gadget is None]
+            if not missing:
+                return resolved
+
+            if executor is not None:
+                pool = contextlib.nullcontext(executor)
+            elif num_workers == 1 or len(missing) == 1:
+                pool = InlineExecutor()
+            else:
+                pool = concurrent.futures.ProcessPoolExecutor(min(num_workers, len(missing)))
+
+            with span('penalties.generate', num_missing=len(missing), num_workers=num_workers):
+                with pool as pool:
+                    futures = [(spec, pool.submit(_generate, spec)) for spec in missing]
+
+                    with contextlib.ExitStack() as stack:
+                        # one connection for all the insertions
+                        cache = stack.enter_context(self._cache()) if self.persist else None
+                        for spec, future in futures:
+                            bqm, gap = future.result()
+                            resolved[spec] = self.add(spec, bqm, gap, cache=cache)
+
+        return resolved
+
+
+# default index, shared by the calls of penalty_bqm in this process
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def _get_default_index():
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = PenaltyModelIndex()
+        return _default_index
+
+
+def penalty_bqm(constraints: typing.Iterable[tuple[GadgetSpec, typing.Sequence[typing.Hashable]]],
+                vartype: dimod.typing.VartypeLike = dimod.SPIN, *,
+                index: typing.Optional[PenaltyModelIndex] = None,
+                num_workers: int = 1,
+                executor: typing.Optional[concurrent.futures.Executor] = None,
+                aux_prefix: str = 'aux',
+                ) -> dimod.BinaryQuadraticModel:
+    """Binary quadratic model of many constraints, built from one penalty
+    model per distinct gadget specification.
+
+    The model of each specification is resolved once, through ``index``,
+    and its biases are stamped out for all of the specification's
+    constraints at once.
+
+    Args:
+        constraints:
+            Pairs ``(spec, variables)`` of a :class:`GadgetSpec` and the
+            labels of the constraint's decision variables, in the order of
+            the specification's decision variables.
+
+        vartype: Variable type of the returned model.
+
+        index: Index to resolve the models with. Defaults to an index of
+            the ``penaltymodel`` cache shared within the process.
+
+        num_workers: Number of worker processes to generate the missing
+            models in, see :meth:`PenaltyModelIndex.resolve`.
+
+        executor: Executor to generate the missing models with instead of
+            a new pool of ``num_workers`` processes.
+
+        aux_prefix: Auxiliary variables are labelled ``f'{aux_prefix}{i}'``
+            for ``i = 0, 1, ...``.
+
+    Returns:
+        The sum of the penalty models of the constraints. Its ground states
+        are the assignments that satisfy all the constraints, if any.
+
+    Raises:
+        :exc:`penaltymodel.ImpossiblePenaltyModel`: If no model meets a
+            specification.
+
+    Examples:
+        >>> from dwaveoceansdk.penalties import GadgetSpec, PenaltyModelIndex, penalty_bqm
+        >>> EQ = GadgetSpec([(-1, -1), (1, 1)])
+        >>> bqm = penalty_bqm([(EQ, 'ab'), (EQ, 'bc')], index=PenaltyModelIndex(persist=False))
+        >>> bqm.variables
+        Variables(['a', 'b', 'c'])
+    """
+    vartype = dimod.as_vartype(vartype)
+    if index is None:
+        index = _get_default_index()
+
+    with span('penalties.collect') as s:
+        labels = {}
+        groups = collections.defaultdict(list)   # spec -> rows of variable indices
+        for spec, variables in constraints:
+            if not isinstance(spec, GadgetSpec):
+                raise ValueError(f"expected a GadgetSpec, received {type(spec).__name__}")
+            if len(variables) != spec.num_variables:
+                raise ValueError(f"constraint on {len(variables)} variables for a gadget with "
+                                 f"{spec.num_variables} decision variables")
+            row = [labels.setdefault(v, len(labels)) for v in variables]
+            if len(set(row)) != len(row):
+                raise ValueError(f"repeated variable in constraint on {variables!r}")
+            groups[spec].append(row)
+        s.set(num_variables=len(labels), num_gadgets=len(groups))
+
+    gadgets = index.resolve(groups, num_workers=num_workers, executor=executor)
+
+    with span('penalties.stamp', num_gadgets=len(groups)):
+        num_variables = len(labels)
+        linear_parts, irow_parts, icol_parts, quadratic_parts = [], [], [], []
+        offset = 0.
+        for spec, rows in groups.items():
+            linear, (irow, icol, quadratic), gadget_offset = gadgets[spec].arrays(vartype)
+
+            # global index of each node of each instance, auxiliaries after
+            # the variables so far
+            num_instances = len(rows)
+            num_aux = spec.num_nodes - spec.num_variables
+            nodes = np.empty((num_instances, spec.num_nodes), dtype=np.int64)
+            nodes[:, :spec.num_variables] = rows
+            if num_aux:
+                nodes[:, spec.num_variables:] = np.arange(
+                    num_variables, num_variables + num_instances * num_aux).reshape(-1, num_aux)
+                num_variables += num_instances * num_aux
+
+            linear_parts.append((nodes.ravel(), np.tile(linear, num_instances)))
+            irow_parts.append(nodes[:, irow].ravel())
+            icol_parts.append(nodes[:, icol].ravel())
+            quadratic_parts.append(np.tile(quadratic, num_instances))
+            offset += num_instances * gadget_offset
+
+        variable_order = list(labels)
+        variable_order.extend(f'{aux_prefix}{i}' for i in range(num_variables - len(labels)))
+        if len(set(variable_order)) != num_variables:
+            raise ValueError(f"auxiliary variable labels with prefix {aux_prefix!r} clash "
+                             "with the constraints' variables")
+
+        linear = np.zeros(num_variables)
+        for indices, biases in linear_parts:
+            linear += np.bincount(indices, weights=biases, minlength=num_variables)
+
+        def concatenate(parts, dtype):
+            return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+
+        return dimod.BinaryQuadraticModel.from_numpy_vectors(
+            linear,
+            (concatenate(irow_parts, np.int64), concatenate(icol_parts, np.int64),
+             concatenate(quadratic_parts, np.float64)),
+            offset, vartype, variable_order=variable_order)
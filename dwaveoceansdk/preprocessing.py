@@ -0,0 +1,470 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Parallel preprocessing of large binary quadratic models.
+
+:func:`~dwave.preprocessing.lower_bounds.roof_duality` runs on one core and
+holds the GIL, and fixing its variables with
+:class:`~dwave.preprocessing.composites.FixVariablesComposite` copies the
+model. :func:`preprocess` instead works on the arrays of the model:
+
+1.  ``components``: the model is split into its connected components.
+2.  ``roof_duality``: small components are solved exactly, in bulk; the
+    other components are grouped into chunks with about the same number of
+    variables and interactions, and roof duality runs on each component of
+    a chunk, with chunks in worker processes if requested. Roof duality per
+    component can fix more variables than on the whole model, whose flow
+    network connects the components through its source and sink.
+3.  ``reduce``: the reduced model is built from the arrays of the
+    variables and interactions that are not fixed, without copying the
+    model first. If no variables are fixed, the input model is returned.
+
+The time and peak memory of each stage are reported in
+:attr:`PreprocessingResult.stages` and, when :mod:`~dwaveoceansdk.tracing`
+is enabled, as spans.
+
+.. autosummary::
+
+    PreprocessingComposite
+    PreprocessingResult
+    connected_components
+    preprocess
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+import time
+import typing
+
+import dimod
+import numpy as np
+
+from dwaveoceansdk._utilities import InlineExecutor, max_rss
+from dwaveoceansdk.tracing import span
+
+__all__ = ['PreprocessingComposite', 'PreprocessingResult', 'connected_components',
+           'preprocess']
+
+
+class PreprocessingResult:
+    """Result of :func:`preprocess`.
+
+    Attributes:
+        bqm (:class:`dimod.BinaryQuadraticModel`): The reduced model, with
+            the fixed variables removed, or the input model if no variables
+            are fixed.
+        fixed (dict): Values of the fixed variables, in the model's vartype.
+        lower_bound (float): Lower bound on the energy of the model.
+        num_components (int): Number of connected components of the model.
+        stages (dict): For each stage, its ``'time'`` in seconds and the
+            peak resident set size of the process after it, ``'max_rss'``,
+            in bytes or None where unavailable.
+    """
+    def __init__(self, bqm, fixed, lower_bound, num_components, stages):
+        self.bqm = bqm
+        self.fixed = fixed
+        self.lower_bound = lower_bound
+        self.num_components = num_components
+        self.stages = stages
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(num_variables={self.bqm.num_variables}, "
+                f"num_fixed={len(self.fixed)}, lower_bound={self.lower_bound!r}, "
+                f"num_components={self.num_components})")
+
+    def expand(self, sampleset: dimod.SampleSet) -> dimod.SampleSet:
+        """Add the fixed variables to samples of the reduced model. Energies
+        of the reduced model are those of the input model."""
+        if not self.fixed:
+            return sampleset
+        return dimod.append_variables(sampleset, self.fixed)
+
+
+def _to_binary(linear, irow, icol, quadratic, offset, vartype):
+    """Binary form of the arrays of a model."""
+    if vartype is dimod.BINARY:
+        return linear, quadratic, offset
+
+    # s = 2x - 1
+    binary = 2 * linear
+    binary -= np.bincount(irow, quadratic, len(linear)) * 2
+    binary -= np.bincount(icol, quadratic, len(linear)) * 2
+    return binary, 4 * quadratic, offset - linear.sum() + quadratic.sum()
+
+
+def connected_components(bqm: dimod.BinaryQuadraticModel) -> tuple[int, np.ndarray]:
+    """Connected components of a binary quadratic model.
+
+    Args:
+        bqm: Binary quadratic model.
+
+    Returns:
+        A 2-tuple of the number of components and an array giving the
+        component of each variable, in the order of ``bqm.variables``.
+
+    Examples:
+        >>> import dimod
+        >>> from dwaveoceansdk.preprocessing import connected_components
+        >>> bqm = dimod.BinaryQuadraticModel({'a': 1}, {'bc': -1}, 0, 'SPIN')
+        >>> num_components, components = connected_components(bqm)
+        >>> num_components
+        2
+        >>> dict(zip(bqm.variables, components.tolist()))
+        {'b': 0, 'c': 0, 'a': 1}
+    """
+    _, (irow, icol, _), _ = bqm.to_numpy_vectors(variable_order=bqm.variables)
+    return _connected_components(bqm.num_variables, irow, icol)
+
+
+def _connected_components(num_variables, irow, icol):
+    from scipy.sparse import coo_array
+    from scipy.sparse.csgraph import connected_components
+
+    graph = coo_array((np.ones(len(irow), dtype=np.int8), (irow, icol)),
+                      shape=(num_variables, num_variables))
+    return connected_components(graph, directed=False)
+
+
+def _chunks(components, large, irow, num_chunks):
+    """Split the components of the ``large`` variables into at most
+    ``num_chunks`` groups of consecutive components with about the same
+    number of variables and interactions.
+
+    Yields the variables and the interactions of each group, sorted by
+    component, and pointers to the start of each component in them.
+    """
+    variables = np.flatnonzero(large)
+    interactions = np.flatnonzero(large[irow])
+    # renumber the components 0, 1, ...
+    _, variable_components = np.unique(components[variables], return_inverse=True)
+    interaction_components = variable_components[np.searchsorted(variables,
+                                                                 irow[interactions])]
+    num_components = variable_components.max(initial=-1) + 1
+
+    variable_order = variables[np.argsort(variable_components, kind='stable')]
+    interaction_order = interactions[np.argsort(interaction_components, kind='stable')]
+
+    variable_ptr = np.zeros(num_components + 1, dtype=np.int64)
+    np.cumsum(np.bincount(variable_components, minlength=num_components),
+              out=variable_ptr[1:])
+    interaction_ptr = np.zeros(num_components + 1, dtype=np.int64)
+    np.cumsum(np.bincount(interaction_components, minlength=num_components),
+              out=interaction_ptr[1:])
+
+    cost = variable_ptr + interaction_ptr
+    bounds = np.searchsorted(cost, np.linspace(0, cost[-1], num_chunks + 1)[1:-1])
+    bounds = np.unique(np.concatenate([[0], bounds, [num_components]]))
+
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        vptr = variable_ptr[start:stop + 1]
+        iptr = interaction_ptr[start:stop + 1]
+        yield (variable_order[vptr[0]:vptr[-1]], interaction_order[iptr[0]:iptr[-1]],
+               vptr - vptr[0], iptr - iptr[0])
+
+
+def _solve_small(linear, irow, icol, quadratic, components, sizes, size, strict,
+                 fixed_values):
+    """Solve the components of ``size`` variables by enumerating their
+    states, fixing variables in ``fixed_values`` and returning the sum of
+    the components' ground energies."""
+    in_size = sizes[components] == size
+    variables = np.flatnonzero(in_size)
+    if not len(variables):
+        return 0
+
+    # variables of each component as rows, in order
+    variables = variables[np.argsort(components[variables], kind='stable')].reshape(-1, size)
+    row = np.empty(len(components), dtype=np.int64)
+    row[variables] = np.arange(len(variables))[:, None]
+    position = np.empty(len(components), dtype=np.int64)
+    position[variables] = np.arange(size)
+
+    interactions = np.flatnonzero(in_size[irow])
+    index = ((row[irow[interactions]] * size + position[irow[interactions]]) * size
+             + position[icol[interactions]])
+    interaction_biases = np.bincount(index, quadratic[interactions],
+                                     len(variables) * size * size)
+
+    states = (np.arange(2**size)[:, None] >> np.arange(size)) & 1
+    energies = linear[variables] @ states.T
+    energies += np.einsum('cab,sa,sb->cs', interaction_biases.reshape(-1, size, size),
+                          states, states)
+
+    ground_energies = energies.min(axis=1)
+    if strict:
+        # values shared by all ground states
+        ground = energies <= ground_energies[:, None] + 1e-9 * (1 + abs(ground_energies[:, None]))
+        ones = ground @ states
+        num_ground = ground.sum(axis=1, keepdims=True)
+        fixed_values[variables[ones == num_ground]] = 1
+        fixed_values[variables[ones == 0]] = 0
+    else:
+        fixed_values[variables] = states[energies.argmin(axis=1)]
+
+    return ground_energies.sum()
+
+
+def _roof_duality(strict, linear, irow, icol, quadratic, variable_ptr, interaction_ptr):
+    """Roof duality of each component of a binary model over
+    ``range(len(linear))``, returning the total lower bound, and the indices
+    and values of the fixed variables.
+
+    Components are solved separately: roof duality on their disjoint union
+    fixes fewer variables, as its flow network shares the source and sink.
+    """
+    from dwave.preprocessing.lower_bounds import roof_duality
+
+    lower_bound = 0
+    indices = []
+    values = []
+    for c in range(len(variable_ptr) - 1):
+        vstart, vstop = variable_ptr[c], variable_ptr[c + 1]
+        istart, istop = interaction_ptr[c], interaction_ptr[c + 1]
+
+        bqm = dimod.BinaryQuadraticModel.from_numpy_vectors(
+            linear[vstart:vstop],
+            (irow[istart:istop] - vstart, icol[istart:istop] - vstart,
+             quadratic[istart:istop]),
+            0, dimod.BINARY)
+        component_lower_bound, fixed = roof_duality(bqm, strict=strict)
+
+        lower_bound += component_lower_bound
+        indices.extend(v + vstart for v in fixed)
+        values.extend(fixed.values())
+
+    return lower_bound, np.array(indices, dtype=np.int64), np.array(values, dtype=np.int8)
+
+
+def preprocess(bqm: dimod.BinaryQuadraticModel, *,
+               strict: bool = True,
+               exact_size: int = 4,
+               num_workers: int = 1,
+               executor: typing.Optional[concurrent.futures.Executor] = None,
+               ) -> PreprocessingResult:
+    """Fix variables of a binary quadratic model with roof duality, per
+    connected component and in parallel.
+
+    Args:
+        bqm: Binary quadratic model.
+
+        strict: If True, only fix variables for which the assignments are
+            true for all minimizing points (strong persistency). See
+            :func:`~dwave.preprocessing.lower_bounds.roof_duality`.
+
+        exact_size: Components of up to this many variables are solved
+            exactly, in bulk, by enumerating their states. Their lower
+            bound is their ground energy and the variables fixed are those
+            with the same value in all ground states, or, if not ``strict``,
+            in one ground state.
+
+        num_workers: Number of worker processes to run roof duality in.
+            Components are grouped into this many chunks. With the default
+            of one, roof duality runs in the calling thread.
+
+        executor: Executor to submit the chunks to instead of a new pool of
+            ``num_workers`` processes, e.g. to reuse workers across calls.
+
+    Returns:
+        The reduced model, the fixed variables, the lower bound and the
+        time and memory of each stage.
+
+    Examples:
+        >>> import dimod
+        >>> from dwaveoceansdk.preprocessing import preprocess
+        ...
+        >>> bqm = dimod.BinaryQuadraticModel({'a': 1, 'b': 0}, {'bc': -1}, 0, 'SPIN')
+        >>> result = preprocess(bqm)
+        >>> result.fixed
+        {'a': -1}
+        >>> sorted(result.bqm.variables)
+        ['b', 'c']
+    """
+    if not isinstance(num_workers, int) or num_workers < 1:
+        raise ValueError("num_workers must be a positive integer")
+    if not isinstance(exact_size, int) or not 0 <= exact_size <= 16:
+        raise ValueError("exact_size must be an integer between 0 and 16")
+
+    stages = {}
+
+    def record(name, t):
+        stages[name] = dict(time=time.perf_counter() - t, max_rss=max_rss())
+
+    t = time.perf_counter()
+    with span('preprocess.components', num_variables=bqm.num_variables,
+              num_interactions=bqm.num_interactions):
+        linear, (irow, icol, quadratic), offset = bqm.to_numpy_vectors(
+            variable_order=bqm.variables)
+        linear = linear.astype(np.float64, copy=False)
+        quadratic = quadratic.astype(np.float64, copy=False)
+        num_components, components = _connected_components(bqm.num_variables, irow, icol)
+        binary, binary_quadratic, binary_offset = _to_binary(
+            linear, irow, icol, quadratic, offset, bqm.vartype)
+    record('components', t)
+
+    t = time.perf_counter()
+    with span('preprocess.roof_duality', num_components=num_components,
+              num_workers=num_workers):
+        fixed_values = np.full(bqm.num_variables, -1, dtype=np.int8)
+
+        # small components are solved exactly, in bulk
+        sizes = np.bincount(components)
+        lower_bound = binary_offset
+        for size in range(1, exact_size + 1):
+            lower_bound += _solve_small(binary, irow, icol, binary_quadratic, components,
+                                        sizes, size, strict, fixed_values)
+
+        if executor is not None:
+            pool = contextlib.nullcontext(executor)
+        elif num_workers == 1:
+            pool = InlineExecutor()
+        else:
+            pool = concurrent.futures.ProcessPoolExecutor(num_workers)
+
+        with pool as pool:
+            futures = []
+            local = np.empty(bqm.num_variables, dtype=np.int64)
+            for variables, interactions, variable_ptr, interaction_ptr in _chunks(
+                    components, sizes[components] > exact_size, irow, num_workers):
+                # relabel the chunk's variables 0, 1, ...
+                local[variables] = np.arange(len(variables))
+                futures.append((variables, pool.submit(
+                    _roof_duality, strict, binary[variables], local[irow[interactions]],
+                    local[icol[interactions]], binary_quadratic[interactions],
+                    variable_ptr, interaction_ptr)))
+
+            for variables, future in futures:
+                chunk_lower_bound, indices, values = future.result()
+                lower_bound += chunk_lower_bound
+                fixed_values[variables[indices]] = values
+    record('roof_duality', t)
+
+    t = time.perf_counter()
+    with span('preprocess.reduce'):
+        is_fixed = fixed_values >= 0
+        if is_fixed.any():
+            reduced = _reduce(bqm, linear, irow, icol, quadratic, offset, is_fixed,
+                              fixed_values)
+            values = fixed_values[is_fixed]
+            if bqm.vartype is dimod.SPIN:
+                values = 2 * values - 1
+            labels = [bqm.variables[v] for v in np.flatnonzero(is_fixed).tolist()]
+            fixed = dict(zip(labels, values.tolist()))
+        else:
+            reduced = bqm
+            fixed = {}
+    record('reduce', t)
+
+    return PreprocessingResult(reduced, fixed, float(lower_bound), num_components, stages)
+
+
+def _reduce(bqm, linear, irow, icol, quadratic, offset, is_fixed, fixed_values):
+    """Model over the variables that are not fixed."""
+    values = fixed_values.astype(np.float64)
+    if bqm.vartype is dimod.SPIN:
+        values = 2 * values - 1
+    values[~is_fixed] = 0
+
+    # interactions with a fixed variable become linear biases or the offset
+    fixed_row = is_fixed[irow]
+    fixed_col = is_fixed[icol]
+    both = fixed_row & fixed_col
+    offset = offset + (linear * values).sum() + (quadratic[both] * values[irow[both]]
+                                                 * values[icol[both]]).sum()
+    linear = linear + np.bincount(icol, quadratic * values[irow] * (fixed_row & ~fixed_col),
+                                  len(linear))
+    linear += np.bincount(irow, quadratic * values[icol] * (fixed_col & ~fixed_row),
+                          len(linear))
+
+    keep = ~is_fixed
+    index = np.cumsum(keep) - 1
+    kept = ~(fixed_row | fixed_col)
+
+    if bqm.variables.is_range:
+        labels = np.flatnonzero(keep)
+    else:
+        labels = [bqm.variables[v] for v in np.flatnonzero(keep).tolist()]
+
+    return dimod.BinaryQuadraticModel.from_numpy_vectors(
+        linear[keep], (index[irow[kept]], index[icol[kept]], quadratic[kept]),
+        offset, bqm.vartype, variable_order=labels)
+
+
+class PreprocessingComposite(dimod.ComposedSampler):
+    """Composite that fixes variables with :func:`preprocess` before
+    sampling the reduced model with its child.
+
+    Like :class:`~dwave.preprocessing.composites.FixVariablesComposite` with
+    roof duality, but per connected component and in parallel. Compose with
+    :class:`~dwave.preprocessing.composites.ScaleComposite` as the child to
+    scale the reduced model.
+
+    Args:
+        child_sampler (:class:`dimod.Sampler`): A dimod sampler.
+        num_workers (int, optional, default=1): Worker processes, see
+            :func:`preprocess`.
+
+    Examples:
+        >>> import dimod
+        >>> from dwave.preprocessing import ScaleComposite
+        >>> from dwaveoceansdk.preprocessing import PreprocessingComposite
+        ...
+        >>> sampler = PreprocessingComposite(ScaleComposite(dimod.ExactSolver()))
+        >>> bqm = dimod.BinaryQuadraticModel({'a': 1}, {'bc': -1}, 0, 'SPIN')
+        >>> sampleset = sampler.sample(bqm, scalar=.5)
+        >>> float(sampleset.first.energy)
+        -2.0
+    """
+    def __init__(self, child_sampler, *, num_workers=1):
+        self._children = [child_sampler]
+        self.num_workers = num_workers
+
+    @property
+    def children(self):
+        return self._children
+
+    @property
+    def parameters(self):
+        parameters = self.child.parameters.copy()
+        parameters['strict'] = []
+        return parameters
+
+    @property
+    def properties(self):
+        return {'child_properties': self.child.properties.copy()}
+
+    def sample(self, bqm, *, strict=True, **parameters):
+        """Fix variables of ``bqm`` and sample the reduced model.
+
+        Args:
+            bqm (:class:`dimod.BinaryQuadraticModel`): Binary quadratic model.
+            strict (bool, optional, default=True): See :func:`preprocess`.
+            **parameters: Parameters of the child sampler.
+
+        Returns:
+            :class:`dimod.SampleSet`: Samples of ``bqm``, with the
+            preprocessing result in its info as ``'preprocessing'``.
+        """
+        result = preprocess(bqm, strict=strict, num_workers=self.num_workers)
+
+        if result.bqm.num_variables:
+            sampleset = result.expand(self.child.sample(result.bqm, **parameters))
+        else:
+            sampleset = dimod.SampleSet.from_samples_bqm(result.fixed, bqm)
+
+        sampleset.info.update(preprocessing=dict(
+            num_fixed=len(result.fixed), lower_bound=result.lower_bound,
+            num_components=result.num_components, stages=result.stages))
+        return sampleset
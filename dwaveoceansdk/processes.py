@@ -0,0 +1,496 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run ``dwave-hybrid`` branches in worker processes.
+
+:class:`hybrid.Race`, :class:`hybrid.Parallel` and :class:`hybrid.Map` run
+their branches in threads, so CPU-bound branches that hold the GIL, such as
+the Python decomposers, run one at a time. :class:`ProcessRace`,
+:class:`ProcessParallel` and :class:`ProcessMap` are drop-in replacements
+that run each branch in a worker process of a :class:`ProcessPool`.
+
+Branches are pickled and shipped with their input state for every
+iteration, so their timers, counters and other attributes are not updated
+in the parent process. Branches and their runnables must be importable in
+the worker processes, which rules out runnables defined in ``__main__``
+under the ``spawn`` start method.
+
+.. autosummary::
+
+    ProcessMap
+    ProcessParallel
+    ProcessPool
+    ProcessRace
+"""
+
+import concurrent.futures
+import contextlib
+import io
+import multiprocessing
+import os
+import pickle
+import threading
+
+import hybrid
+
+__all__ = ['ProcessMap', 'ProcessParallel', 'ProcessPool', 'ProcessRace']
+
+# number of stop flags shared with the workers, which bounds the number of
+# branches submitted to a pool and not yet completed
+_NUM_SLOTS = 4096
+
+# buffers in a shared memory block start at multiples of this many bytes
+_ALIGNMENT = 64
+
+_LOCK_TYPES = (type(threading.Lock()), type(threading.RLock()))
+
+
+class _Pickler(pickle.Pickler):
+    """Pickler for runnables, which hold locks and stop events; those are
+    recreated, released and unset, on unpickling."""
+    def reducer_override(self, obj):
+        if isinstance(obj, threading.Event):
+            return threading.Event, ()
+        if isinstance(obj, _LOCK_TYPES):
+            return type(obj), ()
+        return NotImplemented
+
+
+def _dumps(obj, buffer_callback=None):
+    f = io.BytesIO()
+    _Pickler(f, protocol=5, buffer_callback=buffer_callback).dump(obj)
+    return f.getvalue()
+
+
+class _Payload:
+    """Pickled object whose out-of-band buffers, e.g. the arrays of the
+    problem and samples of a state, are in a shared memory block if they
+    are at least ``threshold`` bytes in total."""
+    def __init__(self, obj, threshold):
+        from multiprocessing import shared_memory
+
+        buffers = []
+        self.data = _dumps(obj, buffers.append)
+        raw = [buffer.raw() for buffer in buffers]
+
+        self.layout = []
+        size = 0
+        for view in raw:
+            size = -(-size // _ALIGNMENT) * _ALIGNMENT
+            self.layout.append((size, view.nbytes))
+            size += view.nbytes
+
+        self._shm = None
+        if size < threshold:
+            # small objects go through the pool's pipe
+            self.name = None
+            self.buffers = [bytearray(view) for view in raw]
+            return
+
+        self._shm = shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for view, (offset, nbytes) in zip(raw, self.layout):
+            shm.buf[offset:offset + nbytes] = view
+        self.name = shm.name
+        self.buffers = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_shm']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state, _shm=None)
+
+    def load(self, unlink=False):
+        """Return a copy of the object. If ``unlink`` is true, the shared
+        memory block is removed afterwards."""
+        from multiprocessing import shared_memory
+
+        if self.name is None:
+            return pickle.loads(self.data, buffers=self.buffers)
+
+        shm = shared_memory.SharedMemory(self.name)
+        try:
+            # copied so that the object does not outlive the block, and so
+            # that workers sharing an input cannot modify each other's copy
+            buffers = [bytearray(shm.buf[offset:offset + nbytes])
+                       for offset, nbytes in self.layout]
+        finally:
+            shm.close()
+            if unlink:
+                shm.unlink()
+        return pickle.loads(self.data, buffers=buffers)
+
+    def detach(self):
+        """Close the creating process's handle, leaving the block for
+        another process to load and unlink."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
+        return self
+
+    def release(self):
+        """Remove the shared memory block."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+# worker process globals, set by _initialize
+_stop_flags = None
+_poll_interval = None
+_threshold = None
+
+
+def _initialize(stop_flags, poll_interval, threshold):
+    global _stop_flags, _poll_interval, _threshold
+    _stop_flags = stop_flags
+    _poll_interval = poll_interval
+    _threshold = threshold
+
+    # a forked worker inherits hybrid's thread pool without its threads, so
+    # runnables would wait forever on work submitted to it
+    import hybrid.concurrency
+    import hybrid.core
+    from hybrid.utils import cpu_count
+    executor = concurrent.futures.ThreadPoolExecutor(cpu_count() * 5)
+    hybrid.concurrency.thread_executor = hybrid.core.thread_executor = executor
+
+
+def _run(data, payload, slot, runopts):
+    """Run one iteration of a pickled runnable in a worker process,
+    stopping it when the parent raises the stop flag in ``slot``."""
+    runnable = pickle.loads(data)
+    state = payload.load()
+
+    future = runnable.run(state, **runopts)
+
+    # stop is repeated while the flag is up, as runnables that start after
+    # the first stop, e.g. later components of a branch, would miss it
+    while not concurrent.futures.wait([future], timeout=_poll_interval).done:
+        if _stop_flags[slot]:
+            runnable.stop()
+
+    return _Payload(future.result(), _threshold).detach()
+
+
+class ProcessPool:
+    """Worker processes that run ``dwave-hybrid`` runnables.
+
+    States are shipped to and from the workers pickled, with their arrays in
+    :mod:`multiprocessing.shared_memory` blocks, so that the problem and
+    samples are copied once rather than streamed through a pipe. A state
+    raced or run in parallel by several branches is written to shared
+    memory once for all of them.
+
+    Runnables are stopped cooperatively: :meth:`stop` raises a flag in
+    memory shared with the workers, which the worker running the runnable
+    polls every ``poll_interval`` seconds and answers by calling the
+    runnable's :meth:`~hybrid.core.Runnable.stop`.
+
+    Args:
+        max_workers (int, optional):
+            Number of worker processes. Defaults to the number of CPUs.
+            Branches of a :class:`ProcessRace` queued for lack of workers
+            only start when a running one completes.
+
+        mp_context (str or :mod:`multiprocessing` context, optional):
+            Start method of the workers, e.g. ``'spawn'``. Defaults to the
+            platform default.
+
+        poll_interval (float, optional, default=0.01):
+            Seconds between checks of the stop flag in the workers.
+
+        shared_memory_threshold (int, optional, default=2**16):
+            States whose arrays total fewer bytes are sent through the
+            pool's pipe instead of shared memory.
+
+    Examples:
+        >>> import dimod
+        >>> import hybrid
+        >>> from dwaveoceansdk.processes import ProcessPool
+        ...
+        >>> bqm = dimod.generators.ran_r(1, 10, seed=1)
+        >>> with ProcessPool(2) as pool:            # doctest: +SKIP
+        ...     future = pool.submit(hybrid.SimulatedAnnealingProblemSampler(),
+        ...                          hybrid.State.from_problem(bqm))
+        ...     state = future.result()
+    """
+    def __init__(self, max_workers=None, *, mp_context=None, poll_interval=0.01,
+                 shared_memory_threshold=2**16):
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+        if not poll_interval > 0:
+            raise ValueError("poll_interval must be positive")
+
+        if mp_context is None or isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+
+        if os.name == 'posix':
+            # workers register the blocks they create with the resource
+            # tracker; without a tracker started here, each would start its
+            # own and report blocks unlinked by this process as leaked
+            from multiprocessing import resource_tracker
+            resource_tracker.ensure_running()
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shared_memory_threshold = shared_memory_threshold
+
+        self._stop_flags = mp_context.RawArray('b', _NUM_SLOTS)
+        self._free_slots = list(range(_NUM_SLOTS))
+        self._running = {}      # future -> (slot, worker future)
+        self._lock = threading.Lock()
+
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            self.max_workers, mp_context=mp_context, initializer=_initialize,
+            initargs=(self._stop_flags, poll_interval, shared_memory_threshold))
+
+    def __repr__(self):
+        return f'{type(self).__name__}(max_workers={self.max_workers})'
+
+    def __reduce__(self):
+        raise TypeError(f"{type(self).__name__} objects cannot be pickled, "
+                        "nest process flows only in the parent process")
+
+    def share(self, state):
+        """Write ``state`` for use as the input of several :meth:`submit`
+        calls, released on exiting the returned context manager."""
+        payload = _Payload(state, self.shared_memory_threshold)
+
+        @contextlib.contextmanager
+        def shared():
+            try:
+                yield payload
+            finally:
+                payload.release()
+
+        return shared()
+
+    def submit(self, runnable, state, **runopts):
+        """Run one iteration of ``runnable`` on ``state`` in a worker.
+
+        Args:
+            runnable (:class:`~hybrid.core.Runnable`):
+                Runnable to run. It is pickled, so later changes to it do
+                not affect this iteration.
+
+            state (:class:`~hybrid.core.State`):
+                Input state, or one entered with :meth:`share`.
+
+            **runopts:
+                Run options, passed to :meth:`~hybrid.core.Runnable.run`.
+
+        Returns:
+            :class:`concurrent.futures.Future`: The output state.
+        """
+        if isinstance(state, _Payload):
+            payload, owned = state, False
+        else:
+            payload, owned = _Payload(state, self.shared_memory_threshold), True
+
+        data = _dumps(runnable)
+
+        with self._lock:
+            if not self._free_slots:
+                raise RuntimeError(f"more than {_NUM_SLOTS} runnables submitted and not "
+                                   "completed")
+            slot = self._free_slots.pop()
+        self._stop_flags[slot] = 0
+
+        future = concurrent.futures.Future()
+        future.set_running_or_notify_cancel()
+
+        worker_future = self.executor.submit(_run, data, payload, slot, runopts)
+        with self._lock:
+            self._running[future] = slot, worker_future
+
+        def done(worker_future):
+            with self._lock:
+                self._running.pop(future, None)
+                self._free_slots.append(slot)
+            if owned:
+                payload.release()
+
+            try:
+                state = worker_future.result().load(unlink=True)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(state)
+
+        worker_future.add_done_callback(done)
+        return future
+
+    def stop(self, future):
+        """Stop the runnable computing ``future``, which then resolves to
+        the runnable's output state, or raises
+        :exc:`concurrent.futures.CancelledError` if it had not started.
+        Does nothing if the future is done."""
+        with self._lock:
+            try:
+                slot, worker_future = self._running[future]
+            except KeyError:
+                return
+            self._stop_flags[slot] = 1
+        worker_future.cancel()
+
+    def shutdown(self, wait=True):
+        """Shut down the worker processes, see
+        :meth:`concurrent.futures.Executor.shutdown`."""
+        self.executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def _get_pool(pool):
+    global _default_pool
+    if pool is not None:
+        return pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = ProcessPool()
+        return _default_pool
+
+
+class ProcessRace(hybrid.RacingBranches):
+    """:class:`hybrid.Race` with the branches running in worker processes.
+
+    The branches are run with run option ``racing_context=True``. Once one
+    completes, the others are stopped cooperatively and the output states
+    of all are returned, in branch order. Branches still queued for a
+    worker are cancelled and return the input state.
+
+    Args:
+        *branches (:class:`~hybrid.core.Runnable`):
+            Branches to race.
+
+        pool (:class:`ProcessPool`, optional):
+            Worker processes, preferably at least one per branch. Defaults
+            to a pool with a worker per CPU shared by all process flows.
+
+    Examples:
+        >>> import hybrid
+        >>> from dwaveoceansdk.processes import ProcessRace
+        ...
+        >>> workflow = hybrid.Loop(
+        ...     ProcessRace(
+        ...         hybrid.InterruptableTabuSampler(),
+        ...         hybrid.EnergyImpactDecomposer(size=10)
+        ...         | hybrid.SimulatedAnnealingSubproblemSampler()
+        ...         | hybrid.SplatComposer())
+        ...     | hybrid.ArgMin(), convergence=3)
+    """
+    def __init__(self, *branches, pool=None, **runopts):
+        super().__init__(*branches, **runopts)
+        self.pool = pool
+        self._futures = []
+
+    def next(self, state, **runopts):
+        pool = _get_pool(self.pool)
+        runopts.update(racing_context=True)
+
+        with pool.share(state) as payload:
+            self._futures = futures = [pool.submit(branch, payload, **runopts)
+                                       for branch in self.branches]
+
+            concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+            self.stop()
+            concurrent.futures.wait(futures)
+
+        states = []
+        for future in futures:
+            try:
+                states.append(future.result())
+            except concurrent.futures.CancelledError:
+                states.append(state)
+        return hybrid.States(*states)
+
+    def halt(self):
+        pool = _get_pool(self.pool)
+        for future in self._futures:
+            pool.stop(future)
+
+
+class ProcessParallel(hybrid.ParallelBranches):
+    """:class:`hybrid.Parallel` with the branches running in worker
+    processes.
+
+    Every branch runs on a copy of the input state. The output states are
+    returned in branch order once all branches complete.
+
+    Args:
+        *branches (:class:`~hybrid.core.Runnable`):
+            Branches to run.
+
+        pool (:class:`ProcessPool`, optional):
+            Worker processes. Defaults to a pool with a worker per CPU
+            shared by all process flows.
+    """
+    def __init__(self, *branches, pool=None, **runopts):
+        super().__init__(*branches, **runopts)
+        self.pool = pool
+        self._futures = []
+
+    def next(self, state, **runopts):
+        pool = _get_pool(self.pool)
+
+        with pool.share(state) as payload:
+            self._futures = futures = [pool.submit(branch, payload, **runopts)
+                                       for branch in self.branches]
+            concurrent.futures.wait(futures)
+
+        return hybrid.States(*(future.result() for future in futures))
+
+    def halt(self):
+        pool = _get_pool(self.pool)
+        for future in self._futures:
+            pool.stop(future)
+
+
+class ProcessMap(hybrid.Map):
+    """:class:`hybrid.Map` with the runnable running in worker processes.
+
+    Args:
+        runnable (:class:`~hybrid.core.Runnable`):
+            Runnable run on every input state.
+
+        pool (:class:`ProcessPool`, optional):
+            Worker processes. Defaults to a pool with a worker per CPU
+            shared by all process flows.
+    """
+    def __init__(self, runnable, pool=None, **runopts):
+        super().__init__(runnable, **runopts)
+        self.pool = pool
+
+    def next(self, states, **runopts):
+        pool = _get_pool(self.pool)
+
+        self._futures = [pool.submit(self.runnable, state, **runopts) for state in states]
+        concurrent.futures.wait(self._futures)
+
+        return hybrid.States(*(future.result() for future in self._futures))
+
+    def halt(self):
+        pool = _get_pool(self.pool)
+        for future in self._futures:
+            pool.stop(future)
@@ -0,0 +1,478 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Memory-mapped files for sharing models and sample sets between processes.
+
+A file holds a small JSON header followed by the raw arrays of a
+:class:`~dimod.BinaryQuadraticModel`, :class:`~dimod.ConstrainedQuadraticModel`
+or :class:`~dimod.SampleSet`, each aligned to 64 bytes. Opening a file maps
+it read-only and returns views of the arrays without reading or parsing
+them, so any number of processes can open the same file and share the
+pages of the operating system's file cache. Writing to a file in a
+memory-backed filesystem such as ``/dev/shm`` avoids the disk altogether.
+
+A :class:`~dimod.SampleSet` loaded from a file is backed directly by the
+mapped record array. Quadratic models keep their biases in their own
+storage, so they are constructed from the mapped arrays in a single
+vectorized copy; :func:`open_mapped` gives access to the arrays themselves.
+
+.. autosummary::
+
+    MappedFile
+    dump
+    load
+    open_mapped
+
+File layout
+-----------
+
+======  ========  ===========================================================
+Offset  Size      Content
+======  ========  ===========================================================
+0       8         Magic string ``b'DWAVEMAP'``.
+8       2         Format version, major and minor, as unsigned bytes.
+10      2         Reserved.
+12      4         Length of the header in bytes, little-endian unsigned.
+16      variable  UTF-8 JSON header, padded with spaces to the alignment.
+...     variable  Arrays at the offsets given in the header.
+======  ========  ===========================================================
+
+The header holds the ``type`` of the stored object, the ``arrays`` as a
+mapping from name to ``dtype``, ``shape`` and ``offset``, and the
+``metadata`` of the object, such as its variable labels.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import typing
+
+if typing.TYPE_CHECKING:
+    import dimod
+
+__all__ = ['MappedFile', 'dump', 'load', 'open_mapped']
+
+MAGIC = b'DWAVEMAP'
+VERSION = (1, 0)
+ALIGNMENT = 64
+
+_PREAMBLE = struct.Struct('<8sBBxxI')
+
+# vartype codes of the constrained quadratic model variables
+_VARTYPES = ('BINARY', 'SPIN', 'INTEGER', 'REAL')
+
+
+def _align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _serialize_labels(variables):
+    """Store range labels by their length rather than as a list."""
+    from dimod.variables import iter_serialize_variables
+
+    if variables == range(len(variables)):
+        return len(variables)
+    return list(iter_serialize_variables(variables))
+
+
+def _deserialize_labels(labels):
+    from dimod.variables import iter_deserialize_variables
+
+    if isinstance(labels, int):
+        return range(labels)
+    return list(iter_deserialize_variables(labels))
+
+
+def _dtype_to_json(dtype):
+    if dtype.fields is None:
+        return dtype.str
+    # offsets and itemsize keep any padding of the structured dtype
+    return dict(names=list(dtype.names),
+                formats=[[dtype.fields[name][0].base.str, list(dtype.fields[name][0].shape)]
+                         for name in dtype.names],
+                offsets=[dtype.fields[name][1] for name in dtype.names],
+                itemsize=dtype.itemsize)
+
+
+def _dtype_from_json(obj):
+    import numpy as np
+
+    if isinstance(obj, str):
+        return np.dtype(obj)
+    return np.dtype(dict(names=obj['names'],
+                         formats=[(base, tuple(shape)) for base, shape in obj['formats']],
+                         offsets=obj['offsets'],
+                         itemsize=obj['itemsize']))
+
+
+def _bqm_arrays(bqm):
+    linear, (irow, icol, quadratic), offset = bqm.to_numpy_vectors(bqm.variables)
+
+    arrays = dict(linear=linear, irow=irow, icol=icol, quadratic=quadratic)
+    metadata = dict(vartype=bqm.vartype.name,
+                    offset=float(offset),
+                    variables=_serialize_labels(bqm.variables))
+    return arrays, metadata
+
+
+def _cqm_arrays(cqm):
+    import numpy as np
+    from dimod.variables import iter_serialize_variables
+
+    variables = cqm.variables
+    index = variables.index
+
+    vartypes = np.fromiter((_VARTYPES.index(cqm.vartype(v).name) for v in variables),
+                           dtype=np.uint8, count=len(variables))
+    lower_bounds = np.fromiter(map(cqm.lower_bound, variables), dtype=np.float64,
+                               count=len(variables))
+    upper_bounds = np.fromiter(map(cqm.upper_bound, variables), dtype=np.float64,
+                               count=len(variables))
+
+    # the objective is expression 0 and constraint c is expression c + 1,
+    # each a row of the linear and quadratic CSR arrays
+    expressions = [cqm.objective, *(comparison.lhs for comparison in cqm.constraints.values())]
+
+    linear_ptr = [0]
+    linear_index = []
+    linear_bias = []
+    quadratic_ptr = [0]
+    quadratic_row = []
+    quadratic_col = []
+    quadratic_bias = []
+    for expression in expressions:
+        for v, bias in expression.iter_linear():
+            linear_index.append(index(v))
+            linear_bias.append(bias)
+        linear_ptr.append(len(linear_index))
+
+        for u, v, bias in expression.iter_quadratic():
+            quadratic_row.append(index(u))
+            quadratic_col.append(index(v))
+            quadratic_bias.append(bias)
+        quadratic_ptr.append(len(quadratic_row))
+
+    lhs = [comparison.lhs for comparison in cqm.constraints.values()]
+
+    arrays = dict(
+        vartypes=vartypes,
+        lower_bounds=lower_bounds,
+        upper_bounds=upper_bounds,
+        linear_ptr=np.asarray(linear_ptr, dtype=np.int64),
+        linear_index=np.asarray(linear_index, dtype=np.int64),
+        linear_bias=np.asarray(linear_bias, dtype=np.float64),
+        quadratic_ptr=np.asarray(quadratic_ptr, dtype=np.int64),
+        quadratic_row=np.asarray(quadratic_row, dtype=np.int64),
+        quadratic_col=np.asarray(quadratic_col, dtype=np.int64),
+        quadratic_bias=np.asarray(quadratic_bias, dtype=np.float64),
+        offsets=np.fromiter((expression.offset for expression in expressions),
+                            dtype=np.float64, count=len(expressions)),
+        rhs=np.fromiter((comparison.rhs for comparison in cqm.constraints.values()),
+                        dtype=np.float64, count=len(lhs)),
+        # hard constraints have no weight
+        weights=np.fromiter((expression.weight() if expression.is_soft() else np.nan
+                             for expression in lhs), dtype=np.float64, count=len(lhs)),
+        )
+    metadata = dict(
+        variables=_serialize_labels(variables),
+        constraints=list(iter_serialize_variables(cqm.constraints)),
+        senses=[comparison.sense.value for comparison in cqm.constraints.values()],
+        penalties=[expression.penalty() if expression.is_soft() else None
+                   for expression in lhs],
+        discrete=[expression.is_discrete() for expression in lhs],
+        )
+    return arrays, metadata
+
+
+def _sampleset_arrays(sampleset):
+    from dimod.serialization.utils import serialize_ndarrays
+
+    record = sampleset.record
+    if record.dtype.hasobject:
+        raise ValueError("sample sets with object fields cannot be memory-mapped")
+
+    try:
+        info = json.loads(json.dumps(serialize_ndarrays(sampleset.info)))
+    except (TypeError, ValueError) as err:
+        raise ValueError(f"sample set info must be JSON-serializable: {err}") from err
+
+    arrays = dict(record=record)
+    metadata = dict(vartype=sampleset.vartype.name,
+                    variables=_serialize_labels(sampleset.variables),
+                    info=info)
+    return arrays, metadata
+
+
+def dump(obj: typing.Union[dimod.BinaryQuadraticModel, dimod.ConstrainedQuadraticModel,
+                           dimod.SampleSet],
+         file: typing.Union[str, os.PathLike]) -> None:
+    """Write a binary quadratic model, constrained quadratic model or sample
+    set to a memory-mappable file.
+
+    Args:
+        obj: Object to write.
+        file: Path of the file. An existing file is replaced.
+
+    Raises:
+        TypeError: If ``obj`` is not of a supported type.
+        ValueError: If ``obj`` is a sample set with fields or info that
+            cannot be stored.
+
+    Examples:
+        >>> import dimod
+        >>> from dwaveoceansdk.serialization import dump, load
+        >>> bqm = dimod.BinaryQuadraticModel({'a': 1}, {'ab': -1}, 0.5, 'SPIN')
+        >>> dump(bqm, 'problem.dwmap')    # doctest: +SKIP
+        >>> load('problem.dwmap') == bqm    # doctest: +SKIP
+        True
+    """
+    import dimod
+    import numpy as np
+
+    if isinstance(obj, dimod.BinaryQuadraticModel):
+        arrays, metadata = _bqm_arrays(obj)
+    elif isinstance(obj, dimod.ConstrainedQuadraticModel):
+        arrays, metadata = _cqm_arrays(obj)
+    elif isinstance(obj, dimod.SampleSet):
+        arrays, metadata = _sampleset_arrays(obj)
+    else:
+        raise TypeError(f"cannot memory-map an object of type {type(obj).__name__}")
+
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+
+    # the array offsets depend on the header length, which depends on the
+    # offsets, so reserve space for the offsets in a first pass
+    def encode_header(offsets):
+        return json.dumps(dict(
+            type=type(obj).__name__,
+            arrays={name: dict(dtype=_dtype_to_json(array.dtype),
+                               shape=list(array.shape),
+                               offset=offsets[name])
+                    for name, array in arrays.items()},
+            metadata=metadata,
+            )).encode()
+
+    header = encode_header(dict.fromkeys(arrays, 2**63))
+    start = _align(_PREAMBLE.size + len(header))
+
+    offsets = {}
+    for name, array in arrays.items():
+        offsets[name] = start
+        start = _align(start + array.nbytes)
+
+    header = encode_header(offsets)
+    header += b' ' * (_align(_PREAMBLE.size + len(header)) - _PREAMBLE.size - len(header))
+
+    with open(file, 'wb') as f:
+        f.write(_PREAMBLE.pack(MAGIC, *VERSION, len(header)))
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(offsets[name])
+            f.write(array.reshape(-1).view(np.uint8))
+        f.truncate(max(f.tell(), start))
+
+
+class MappedFile:
+    """A memory-mapped file written by :func:`dump`.
+
+    Args:
+        file: Path of the file.
+
+    Attributes:
+        type (str): Class name of the stored object, one of
+            ``'BinaryQuadraticModel'``, ``'ConstrainedQuadraticModel'`` or
+            ``'SampleSet'``.
+
+        arrays (dict[str, :class:`numpy.ndarray`]): Read-only views of the
+            stored arrays.
+
+        metadata (dict): Everything else needed to reconstruct the object.
+
+    The file is unmapped once the file object and all arrays viewing it are
+    garbage collected.
+
+    Examples:
+        Read the biases of a model without constructing it.
+
+        >>> from dwaveoceansdk.serialization import open_mapped
+        >>> mapped = open_mapped('problem.dwmap')    # doctest: +SKIP
+        >>> mapped.arrays['linear']    # doctest: +SKIP
+        array([1., 0.])
+    """
+    def __init__(self, file: typing.Union[str, os.PathLike]):
+        import numpy as np
+
+        with open(file, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, major, minor, header_length = _PREAMBLE.unpack_from(buffer)
+        except struct.error:
+            magic = None
+        if magic != MAGIC:
+            raise ValueError(f"{os.fspath(file)!r} is not a memory-mapped dimod file")
+        if major != VERSION[0]:
+            raise ValueError(f"unsupported file format version {major}.{minor}")
+
+        header = json.loads(buffer[_PREAMBLE.size:_PREAMBLE.size + header_length])
+
+        self.type = header['type']
+        self.metadata = header['metadata']
+        self.arrays = {
+            name: np.ndarray(tuple(spec['shape']), dtype=_dtype_from_json(spec['dtype']),
+                             buffer=buffer, offset=spec['offset'])
+            for name, spec in header['arrays'].items()}
+
+    def __repr__(self):
+        return f'<{type(self).__name__} type={self.type!r} arrays={list(self.arrays)}>'
+
+    @property
+    def variables(self) -> typing.Sequence[typing.Hashable]:
+        """Variable labels of the stored object."""
+        return _deserialize_labels(self.metadata['variables'])
+
+    def load(self) -> typing.Union[dimod.BinaryQuadraticModel,
+                                   dimod.ConstrainedQuadraticModel,
+                                   dimod.SampleSet]:
+        """Construct the stored object from the mapped arrays."""
+        if self.type == 'BinaryQuadraticModel':
+            return self._load_bqm()
+        elif self.type == 'ConstrainedQuadraticModel':
+            return self._load_cqm()
+        elif self.type == 'SampleSet':
+            return self._load_sampleset()
+        raise ValueError(f"unknown stored type {self.type!r}")
+
+    def _load_bqm(self):
+        import dimod
+
+        arrays = self.arrays
+        return dimod.BinaryQuadraticModel.from_numpy_vectors(
+            arrays['linear'],
+            (arrays['irow'], arrays['icol'], arrays['quadratic']),
+            self.metadata['offset'],
+            self.metadata['vartype'],
+            variable_order=self.variables)
+
+    def _load_cqm(self):
+        import dimod
+
+        arrays = self.arrays
+        metadata = self.metadata
+        variables = self.variables
+
+        cqm = dimod.ConstrainedQuadraticModel()
+
+        # add runs of variables that share a vartype and bounds at once
+        vartypes = arrays['vartypes'].tolist()
+        lower_bounds = arrays['lower_bounds'].tolist()
+        upper_bounds = arrays['upper_bounds'].tolist()
+        start = 0
+        for stop in range(1, len(variables) + 1):
+            if (stop < len(variables) and vartypes[stop] == vartypes[start]
+                    and lower_bounds[stop] == lower_bounds[start]
+                    and upper_bounds[stop] == upper_bounds[start]):
+                continue
+
+            vartype = _VARTYPES[vartypes[start]]
+            if vartype in ('BINARY', 'SPIN'):
+                cqm.add_variables(vartype, variables[start:stop])
+            else:
+                cqm.add_variables(vartype, variables[start:stop],
+                                  lower_bound=lower_bounds[start],
+                                  upper_bound=upper_bounds[start])
+            start = stop
+
+        linear_ptr = arrays['linear_ptr'].tolist()
+        quadratic_ptr = arrays['quadratic_ptr'].tolist()
+        offsets = arrays['offsets'].tolist()
+
+        def expression(e):
+            lstart, lstop = linear_ptr[e], linear_ptr[e + 1]
+            qstart, qstop = quadratic_ptr[e], quadratic_ptr[e + 1]
+
+            linear = [variables[i] for i in arrays['linear_index'][lstart:lstop].tolist()]
+            row = [variables[i] for i in arrays['quadratic_row'][qstart:qstop].tolist()]
+            col = [variables[i] for i in arrays['quadratic_col'][qstart:qstop].tolist()]
+
+            qm = dimod.QuadraticModel()
+            qm.add_variables_from_model(cqm, variables=dict.fromkeys(linear + row + col))
+            qm.add_linear_from(zip(linear, arrays['linear_bias'][lstart:lstop].tolist()))
+            qm.add_quadratic_from(zip(row, col, arrays['quadratic_bias'][qstart:qstop].tolist()))
+            qm.offset = offsets[e]
+            return qm
+
+        cqm.set_objective(expression(0))
+
+        labels = _deserialize_labels(metadata['constraints'])
+        rhs = arrays['rhs'].tolist()
+        weights = arrays['weights'].tolist()
+        for c, label in enumerate(labels):
+            penalty = metadata['penalties'][c]
+            cqm.add_constraint_from_model(
+                expression(c + 1), metadata['senses'][c], rhs[c], label=label,
+                weight=None if penalty is None else weights[c],
+                penalty=penalty if penalty is not None else 'linear',
+                copy=False)
+            if metadata['discrete'][c]:
+                cqm.constraints[label].lhs.mark_discrete()
+
+        return cqm
+
+    def _load_sampleset(self):
+        import dimod
+        import numpy as np
+        from dimod.serialization.utils import deserialize_ndarrays
+
+        # the sample set holds the mapped record itself, without a copy
+        return dimod.SampleSet(self.arrays['record'].view(np.recarray),
+                               self.variables,
+                               deserialize_ndarrays(self.metadata['info']),
+                               self.metadata['vartype'])
+
+
+def open_mapped(file: typing.Union[str, os.PathLike]) -> MappedFile:
+    """Memory-map a file written by :func:`dump`.
+
+    Args:
+        file: Path of the file.
+
+    Returns:
+        The mapped file, with read-only views of the stored arrays.
+    """
+    return MappedFile(file)
+
+
+def load(file: typing.Union[str, os.PathLike]
+         ) -> typing.Union[dimod.BinaryQuadraticModel,
+                           dimod.ConstrainedQuadraticModel,
+                           dimod.SampleSet]:
+    """Load a binary quadratic model, constrained quadratic model or sample
+    set from a file written by :func:`dump`.
+
+    A loaded :class:`~dimod.SampleSet` is a read-only view of the file.
+
+    Args:
+        file: Path of the file.
+
+    Returns:
+        The stored object.
+
+    Raises:
+        ValueError: If ``file`` was not written by :func:`dump`.
+    """
+    return MappedFile(file).load()
@@ -0,0 +1,305 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Aggregate sampler output chunk by chunk.
+
+Sampling with a large ``num_reads`` and aggregating afterwards keeps every
+read in memory. :func:`iter_chunks` splits the reads over several calls to
+the sampler and :class:`StreamingSampleSet` folds each returned chunk into
+running aggregates, so that only the aggregates and one chunk are held at
+a time and the aggregates can be read while sampling continues.
+
+.. autosummary::
+
+    StreamingSampleSet
+    iter_chunks
+"""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import math
+import typing
+
+if typing.TYPE_CHECKING:
+    import dimod
+
+__all__ = ['StreamingSampleSet', 'iter_chunks']
+
+
+def iter_chunks(sampler: dimod.Sampler,
+                bqm: dimod.BinaryQuadraticModel,
+                num_reads: int,
+                *,
+                chunk_size: int = 1000,
+                **parameters,
+                ) -> typing.Iterator[dimod.SampleSet]:
+    """Sample ``num_reads`` reads in chunks of at most ``chunk_size`` reads.
+
+    Args:
+        sampler: Sampler accepting a ``num_reads`` parameter.
+
+        bqm: Binary quadratic model to sample.
+
+        num_reads: Total number of reads.
+
+        chunk_size: Maximum number of reads per call to the sampler.
+
+        **parameters: Passed to each call. A ``seed`` parameter is
+            incremented for each chunk so that the chunks differ but the
+            stream is reproducible.
+
+    Yields:
+        A sample set per chunk, resolved.
+
+    Examples:
+        >>> import dimod
+        >>> from dwave.samplers import SimulatedAnnealingSampler
+        >>> from dwaveoceansdk.streaming import StreamingSampleSet, iter_chunks
+        ...
+        >>> bqm = dimod.generators.ran_r(1, 20, seed=1)
+        >>> stream = StreamingSampleSet()
+        >>> for chunk in iter_chunks(SimulatedAnnealingSampler(), bqm, 1000, chunk_size=100):
+        ...     stream.update(chunk)
+        >>> stream.num_reads
+        1000
+    """
+    if num_reads < 0:
+        raise ValueError("num_reads must be a non-negative integer")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    seed = parameters.pop('seed', None)
+
+    for i, start in enumerate(range(0, num_reads, chunk_size)):
+        if seed is not None:
+            parameters['seed'] = (seed + i) % 2**32
+
+        sampleset = sampler.sample(bqm, num_reads=min(chunk_size, num_reads - start),
+                                   **parameters)
+        sampleset.resolve()
+        yield sampleset
+
+
+def _aggregate(samples, energies, num_occurrences):
+    """Merge identical rows of ``samples``, summing their occurrences."""
+    import numpy as np
+
+    if len(samples) <= 1:
+        return samples, energies, num_occurrences
+
+    unique, index, inverse = np.unique(samples, axis=0, return_index=True,
+                                       return_inverse=True)
+    counts = np.zeros(len(unique), dtype=np.int64)
+    np.add.at(counts, inverse.reshape(-1), num_occurrences)
+    return unique, energies[index], counts
+
+
+class StreamingSampleSet:
+    """Running aggregates of a stream of sample sets.
+
+    Chunks are added with :meth:`update`. The following aggregates are kept
+    up to date after each chunk:
+
+    * the total number of reads and the energy range and mean,
+    * the number of occurrences of each distinct sample, keyed by a 128-bit
+      hash of the sample so that samples are not kept in memory,
+    * the ``top_k`` distinct samples of lowest energy,
+    * a histogram of the energies of all reads, with bins of a fixed width.
+
+    Memory use is bounded by the chunk size, ``top_k`` and the number of
+    histogram bins, plus 16 bytes and a dictionary entry per distinct
+    sample if ``count_unique`` is true.
+
+    Args:
+        top_k (int, optional, default=10):
+            Number of lowest-energy distinct samples to keep.
+
+        bin_width (float, optional):
+            Width of the energy histogram bins. Bin ``i`` counts the reads
+            with energy in ``[i*bin_width, (i+1)*bin_width)``. No histogram
+            is kept by default.
+
+        count_unique (bool, optional, default=True):
+            Count the occurrences of every distinct sample.
+
+    Examples:
+        >>> import dimod
+        >>> from dwaveoceansdk.streaming import StreamingSampleSet
+        ...
+        >>> bqm = dimod.BinaryQuadraticModel({'a': 1, 'b': -1}, {}, 0, 'SPIN')
+        >>> stream = StreamingSampleSet(top_k=2, bin_width=1)
+        >>> for _ in range(3):
+        ...     stream.update(dimod.ExactSolver().sample(bqm))
+        >>> stream.num_reads, stream.num_unique
+        (12, 4)
+        >>> float(stream.first.energy)
+        -2.0
+        >>> stream.histogram()
+        {-2: 3, 0: 6, 2: 3}
+    """
+    def __init__(self, top_k: int = 10, *, bin_width: typing.Optional[float] = None,
+                 count_unique: bool = True):
+        if top_k < 1:
+            raise ValueError("top_k must be a positive integer")
+        if bin_width is not None and not bin_width > 0:
+            raise ValueError("bin_width must be positive")
+
+        self.top_k = top_k
+        self.bin_width = bin_width
+        self.count_unique = count_unique
+
+        self.variables = None
+        self.vartype = None
+        self.num_reads = 0
+        self.num_chunks = 0
+
+        self.min_energy = math.inf
+        self.max_energy = -math.inf
+        self._energy_sum = 0.0
+
+        self._counts = collections.Counter()
+        self._bins = collections.Counter()
+
+        self._top = None
+
+    def __repr__(self):
+        return (f'<{type(self).__name__} num_reads={self.num_reads} '
+                f'num_chunks={self.num_chunks}>')
+
+    @staticmethod
+    def _key(row):
+        return hashlib.blake2b(row.tobytes(), digest_size=16).digest()
+
+    def update(self, sampleset: dimod.SampleSet) -> None:
+        """Fold the reads of ``sampleset`` into the aggregates.
+
+        Args:
+            sampleset: A chunk of samples. The first chunk fixes the
+                variables and vartype of the stream; later chunks must have
+                the same variables, in any order, and vartype.
+        """
+        import numpy as np
+
+        record = sampleset.record
+
+        if self.variables is None:
+            self.variables = list(sampleset.variables)
+            self.vartype = sampleset.vartype
+            self._dtype = record.sample.dtype
+
+        if sampleset.vartype is not self.vartype:
+            raise ValueError(f"expected vartype {self.vartype.name}, "
+                             f"received {sampleset.vartype.name}")
+
+        samples = record.sample
+        if list(sampleset.variables) != self.variables:
+            if (len(sampleset.variables) != len(self.variables)
+                    or not all(v in sampleset.variables for v in self.variables)):
+                raise ValueError("chunk variables do not match the stream's variables")
+            samples = samples[:, [sampleset.variables.index(v) for v in self.variables]]
+
+        samples = np.ascontiguousarray(samples, dtype=self._dtype)
+        energies = np.asarray(record.energy, dtype=np.float64)
+        num_occurrences = np.asarray(record.num_occurrences, dtype=np.int64)
+
+        self.num_chunks += 1
+        if not len(samples):
+            return
+
+        self.num_reads += int(num_occurrences.sum())
+        self.min_energy = min(self.min_energy, float(energies.min()))
+        self.max_energy = max(self.max_energy, float(energies.max()))
+        self._energy_sum += float(energies @ num_occurrences)
+
+        samples, energies, num_occurrences = _aggregate(samples, energies, num_occurrences)
+
+        if self.count_unique:
+            for row, count in zip(samples, num_occurrences.tolist()):
+                self._counts[self._key(row)] += count
+
+        if self.bin_width is not None:
+            bins, inverse = np.unique(np.floor(energies / self.bin_width).astype(np.int64),
+                                      return_inverse=True)
+            counts = np.zeros(len(bins), dtype=np.int64)
+            np.add.at(counts, inverse.reshape(-1), num_occurrences)
+            self._bins.update(dict(zip(bins.tolist(), counts.tolist())))
+
+        if self._top is not None:
+            samples, energies, num_occurrences = _aggregate(
+                np.concatenate((self._top[0], samples)),
+                np.concatenate((self._top[1], energies)),
+                np.concatenate((self._top[2], num_occurrences)))
+
+        order = np.argsort(energies, kind='stable')[:self.top_k]
+        self._top = (samples[order], energies[order], num_occurrences[order])
+
+    @property
+    def num_unique(self) -> int:
+        """Number of distinct samples seen."""
+        if not self.count_unique:
+            raise ValueError("distinct samples are not counted, set count_unique=True")
+        return len(self._counts)
+
+    @property
+    def mean_energy(self) -> float:
+        """Mean energy over all reads."""
+        return self._energy_sum / self.num_reads if self.num_reads else math.nan
+
+    def histogram(self) -> dict:
+        """Return the energy histogram as a mapping from bin index to the
+        number of reads in the bin, in order of bin index."""
+        if self.bin_width is None:
+            raise ValueError("no histogram is kept, set bin_width")
+        return dict(sorted(self._bins.items()))
+
+    def to_sampleset(self) -> dimod.SampleSet:
+        """Return the ``top_k`` lowest-energy distinct samples seen so far.
+
+        The number of occurrences of each sample counts all of its reads
+        if ``count_unique`` is true, and its reads while it was among the
+        ``top_k`` otherwise. The aggregates are in the ``info`` field.
+        """
+        import dimod
+
+        if self._top is None:
+            return dimod.SampleSet.from_samples(
+                ([], self.variables or []), self.vartype or 'BINARY', [])
+
+        samples, energies, num_occurrences = self._top
+        if self.count_unique:
+            num_occurrences = [self._counts[self._key(row)] for row in samples]
+
+        info = dict(num_reads=self.num_reads,
+                    num_chunks=self.num_chunks,
+                    min_energy=self.min_energy,
+                    max_energy=self.max_energy,
+                    mean_energy=self.mean_energy)
+        if self.count_unique:
+            info.update(num_unique=self.num_unique)
+        if self.bin_width is not None:
+            info.update(bin_width=self.bin_width, histogram=self.histogram())
+
+        return dimod.SampleSet.from_samples((samples, self.variables), self.vartype, energies,
+                                            num_occurrences=num_occurrences, info=info)
+
+    @property
+    def first(self):
+        """Lowest-energy sample seen so far, as for :attr:`dimod.SampleSet.first`."""
+        return self.to_sampleset().first
+
+    def lowest(self, **kwargs) -> dimod.SampleSet:
+        """Lowest-energy samples seen so far, see :meth:`dimod.SampleSet.lowest`."""
+        return self.to_sampleset().lowest(**kwargs)
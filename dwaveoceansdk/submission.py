@@ -0,0 +1,182 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Submit many problems to a sampler concurrently from :mod:`asyncio` code.
+
+Solving problems one at a time, as in
+``[sampler.sample(bqm).resolve() for bqm in problems]`` with a remote
+sampler, pays the full submit and wait round trip for every problem.
+:func:`submit_many` keeps up to ``max_in_flight`` problems submitted at
+once and hands back sample sets as they complete.
+
+.. autosummary::
+
+    BatchSubmission
+    submit_many
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import itertools
+import typing
+
+if typing.TYPE_CHECKING:
+    import dimod
+
+__all__ = ['BatchSubmission', 'submit_many']
+
+
+class BatchSubmission:
+    """Problems being submitted to a sampler, see :func:`submit_many`.
+
+    Iterate asynchronously to receive ``(index, sampleset)`` pairs in
+    completion order, or await to receive all sample sets in problem order.
+    A batch can be consumed only once.
+    """
+    def __init__(self, sampler, problems, *, max_in_flight, method, return_exceptions,
+                 parameters):
+        self.sampler = sampler
+        self.problems = problems
+        self.max_in_flight = max_in_flight
+        self.method = method
+        self.return_exceptions = return_exceptions
+        self.parameters = parameters
+
+        self._consumed = False
+
+    def _solve(self, problem):
+        # runs in a worker thread: submitting may block on uploading the
+        # problem and resolving blocks until the answer is loaded
+        sampleset = getattr(self.sampler, self.method)(problem, **self.parameters)
+        sampleset.resolve()
+        return sampleset
+
+    def __aiter__(self) -> typing.AsyncIterator[tuple[int, dimod.SampleSet]]:
+        if self._consumed:
+            raise RuntimeError("a batch submission can only be consumed once")
+        self._consumed = True
+        return self._iterate()
+
+    async def _iterate(self):
+        loop = asyncio.get_running_loop()
+        executor = concurrent.futures.ThreadPoolExecutor(self.max_in_flight,
+                                                         thread_name_prefix='submit_many')
+
+        # problems are pulled from the iterable only when there is room for
+        # them, so a slow consumer holds back submission
+        problems = enumerate(self.problems)
+        running = {}
+
+        try:
+            while True:
+                for index, problem in itertools.islice(problems,
+                                                       self.max_in_flight - len(running)):
+                    running[loop.run_in_executor(executor, self._solve, problem)] = index
+
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+                for future in sorted(done, key=running.__getitem__):
+                    index = running.pop(future)
+                    try:
+                        yield index, future.result()
+                    except Exception as err:
+                        if not self.return_exceptions:
+                            raise
+                        yield index, err
+        finally:
+            for future in running:
+                future.cancel()
+            # problems already submitted to a remote solver run to completion
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _gather(self):
+        results = {}
+        async for index, result in self:
+            results[index] = result
+        return [results[index] for index in range(len(results))]
+
+    def __await__(self) -> typing.Generator[typing.Any, None, list]:
+        return self._gather().__await__()
+
+
+def submit_many(sampler: dimod.Sampler,
+                problems: typing.Iterable,
+                *,
+                max_in_flight: int = 10,
+                method: str = 'sample',
+                return_exceptions: bool = False,
+                **parameters,
+                ) -> BatchSubmission:
+    """Submit problems to a sampler with at most ``max_in_flight`` of them
+    submitted but not yet completed at any time.
+
+    All problems go through the given sampler, and so for
+    :class:`~dwave.system.samplers.DWaveSampler` and the Leap hybrid samplers
+    through its single :class:`~dwave.cloud.Client`, whose worker threads
+    batch submissions, poll for results and reuse pooled HTTP connections.
+    Each problem in flight occupies a thread that submits it and waits for
+    its answer, so uploading new problems overlaps with waiting for others.
+
+    The problems iterable is consumed lazily: a new problem is only taken
+    when one completes and its sample set has been handed over. Problems
+    already submitted when iteration stops early still run to completion
+    on the solver.
+
+    Args:
+        sampler: Sampler to submit the problems to.
+
+        problems: Problems, e.g. binary quadratic models, in any form
+            accepted by the sampler's ``method``.
+
+        max_in_flight: Maximum number of problems in flight.
+
+        method: Name of the sampler method called for each problem, e.g.
+            ``'sample_cqm'`` for
+            :class:`~dwave.system.samplers.LeapHybridCQMSampler`.
+
+        return_exceptions: If true, exceptions raised for a problem are
+            returned in place of its sample set. Otherwise the first
+            exception is raised.
+
+        **parameters: Passed to each call of the sampler method.
+
+    Returns:
+        A :class:`BatchSubmission`. Iterate over it with ``async for`` to
+        receive ``(index, sampleset)`` pairs as problems complete, where
+        ``index`` is the position of the problem in ``problems``, or await
+        it for the list of sample sets in problem order.
+
+    Examples:
+        >>> import asyncio
+        >>> import dimod
+        >>> from dwaveoceansdk.submission import submit_many
+        ...
+        >>> problems = [dimod.generators.ran_r(1, 5, seed=seed) for seed in range(4)]
+        >>> async def main():
+        ...     return await submit_many(dimod.ExactSolver(), problems, max_in_flight=2)
+        >>> [sampleset.first.energy for sampleset in asyncio.run(main())]   # doctest: +SKIP
+        [-6.0, -6.0, -4.0, -6.0]
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be a positive integer")
+    if not callable(getattr(sampler, method, None)):
+        raise ValueError(f"sampler has no method {method!r}")
+
+    return BatchSubmission(sampler, problems, max_in_flight=max_in_flight, method=method,
+                           return_exceptions=return_exceptions, parameters=parameters)
@@ -0,0 +1,407 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Utilities for running Ocean code without access to a QPU."""
+
+import base64
+import contextlib
+import datetime
+import http.server
+import json
+import sys
+import threading
+import time
+import urllib.parse
+import uuid
+import zlib
+
+__all__ = ['StandInSAPI', 'mock_qpu']
+
+
+@contextlib.contextmanager
+def mock_qpu(**mock_parameters):
+    """Replace :class:`~dwave.system.samplers.DWaveSampler` with
+    :class:`~dwave.system.testing.MockDWaveSampler` everywhere.
+
+    Every loaded module that holds a reference to ``DWaveSampler``, such as
+    :mod:`dwave.system`, the ``dwave-system`` composites and samplers,
+    :mod:`hybrid.samplers` and :mod:`dwaveoceansdk`, has the reference
+    replaced for the duration of the context. This is the same substitution
+    made for the documentation doctests, generalized so that code
+    constructing ``DWaveSampler()`` anywhere in the stack runs offline.
+
+    Modules imported after entering the context see the mock only if they
+    import ``DWaveSampler`` from one of the patched modules. The
+    substitution is process-wide and not thread-safe.
+
+    Args:
+        **mock_parameters:
+            Default keyword arguments for the
+            :class:`~dwave.system.testing.MockDWaveSampler` constructor, e.g.
+            ``topology_type='pegasus'``. Keyword arguments given when the
+            sampler is constructed take precedence. A ``solver`` feature
+            filter such as ``solver=dict(topology__type='zephyr')`` selects
+            the mock's topology type.
+
+    Yields:
+        type: The mock sampler class that replaces ``DWaveSampler``.
+
+    Examples:
+        >>> from dwaveoceansdk.testing import mock_qpu
+        >>> with mock_qpu(topology_type='pegasus'):
+        ...     from dwave.system import DWaveSampler, EmbeddingComposite
+        ...     sampler = EmbeddingComposite(DWaveSampler())
+        ...     sampleset = sampler.sample_ising({'a': -1, 'b': +1}, {('a', 'b'): -1})
+    """
+    # import the packages that hold references to DWaveSampler so that
+    # they are patched too, even if the caller imports them later
+    import dwave.system
+    import hybrid
+    from dwave.system.samplers.dwave_sampler import DWaveSampler
+    from dwave.system.testing import MockDWaveSampler
+
+    class MockQPUSampler(MockDWaveSampler):
+        def __init__(self, *args, **parameters):
+            parameters = {**mock_parameters, **parameters}
+
+            solver = parameters.get('solver')
+            if isinstance(solver, dict) and 'topology__type' in solver:
+                if parameters.get('topology_type') != solver['topology__type']:
+                    parameters.pop('topology_shape', None)
+                parameters['topology_type'] = solver['topology__type']
+
+            super().__init__(*args, **parameters)
+
+    MockQPUSampler.__name__ = MockQPUSampler.__qualname__ = 'MockDWaveSampler'
+
+    patched = []
+    for module in list(sys.modules.values()):
+        # use vars() rather than getattr() to not trigger lazy module
+        # __getattr__ hooks
+        try:
+            namespace = vars(module)
+        except TypeError:
+            continue
+        if namespace.get('DWaveSampler') is DWaveSampler:
+            patched.append((module, DWaveSampler))
+            module.DWaveSampler = MockQPUSampler
+
+    # the facade resolves DWaveSampler on first use, so it may not hold a
+    # reference yet
+    facade = sys.modules.get('dwaveoceansdk')
+    if facade is not None and 'DWaveSampler' not in vars(facade):
+        patched.append((facade, None))
+        facade.DWaveSampler = MockQPUSampler
+
+    try:
+        yield MockQPUSampler
+    finally:
+        for module, original in patched:
+            if original is None:
+                del module.DWaveSampler
+            else:
+                module.DWaveSampler = original
+
+
+class _SAPIRequestHandler(http.server.BaseHTTPRequestHandler):
+    # set on the subclass created by StandInSAPI
+    sapi = None
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, obj, code=200):
+        body = json.dumps(obj).encode()
+
+        # the client checks that the response media type is the one it
+        # asked for
+        media_type = self.headers.get('Accept', 'application/json').split(';')[0].strip()
+
+        self.send_response(code)
+        self.send_header('Content-Type', f'{media_type}; version=3.0.0')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, code, message):
+        self.send_json(dict(error_code=code, error_msg=message), code)
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        query = urllib.parse.parse_qs(url.query)
+        parts = [part for part in url.path.split('/') if part]
+
+        self.sapi._count_request(f'GET /{"/".join(parts[:1])}/')
+
+        if parts == ['solvers', 'remote']:
+            self.send_json([self.sapi.solver_data])
+        elif parts[:2] == ['solvers', 'remote'] and len(parts) == 3:
+            if parts[2] != self.sapi.solver_name:
+                self.send_error_json(404, f"solver {parts[2]!r} not found")
+            else:
+                self.send_json(self.sapi.solver_data)
+        elif parts == ['problems'] and 'id' in query:
+            ids = query['id'][0].split(',')
+            timeout = float(query['timeout'][0]) if 'timeout' in query else 0
+            self.send_json(self.sapi._statuses(ids, timeout))
+        elif parts[:1] == ['problems'] and len(parts) == 2:
+            message = self.sapi._answer(parts[1])
+            if message is None:
+                self.send_error_json(404, f"problem {parts[1]!r} not found")
+            else:
+                self.send_json(message)
+        else:
+            self.send_error_json(404, f"{url.path!r} not found")
+
+    def do_POST(self):
+        url = urllib.parse.urlsplit(self.path)
+
+        self.sapi._count_request('POST /problems/')
+
+        if url.path.rstrip('/') != '/problems':
+            self.send_error_json(404, f"{url.path!r} not found")
+            return
+
+        data = self.rfile.read(int(self.headers['Content-Length']))
+        if self.headers.get('Content-Encoding') == 'deflate':
+            data = zlib.decompress(data)
+
+        self.send_json([self.sapi._submit(job) for job in json.loads(data)])
+
+
+class StandInSAPI:
+    """Local stand-in for the Solver API (SAPI) of a structured solver.
+
+    An HTTP server on ``127.0.0.1`` that answers the requests
+    :class:`~dwave.system.samplers.DWaveSampler` makes through
+    ``dwave-cloud-client``: solver lookup, problem submission in ``qp``
+    format, status polling (including long polling) and answer loading.
+    Problems are solved by a classical sampler and complete ``latency``
+    seconds after they are submitted, so that client-side concurrency can
+    be exercised without network access or credentials.
+
+    Problem uploads, used by the Leap hybrid solvers, are not supported.
+
+    Args:
+        solver_data (dict, optional):
+            Solver description as returned by SAPI. Defaults to a
+            Chimera-structured solver from
+            :func:`dwave.cloud.testing.mocks.qpu_chimera_solver_data`.
+
+        sampler (:class:`dimod.Sampler`, optional, default=:class:`dimod.RandomSampler`):
+            Sampler that solves the submitted problems. Only the
+            ``num_reads`` parameter of a submission is passed on, if the
+            sampler accepts it.
+
+        latency (float, optional, default=0):
+            Seconds between the submission and completion of a problem.
+
+    Attributes:
+        max_in_flight (int):
+            Largest number of problems submitted but whose answer had not
+            yet been loaded.
+
+        requests (dict[str, int]):
+            Number of requests per method and top-level path.
+
+    Examples:
+        >>> from dwave.system import DWaveSampler
+        >>> from dwaveoceansdk.testing import StandInSAPI
+        >>> with StandInSAPI(latency=0.1) as sapi:
+        ...     sampler = DWaveSampler(**sapi.config)
+        ...     sampleset = sampler.sample_ising({0: 1}, {}, num_reads=10)
+        ...     len(sampleset)
+        10
+    """
+    def __init__(self, solver_data=None, *, sampler=None, latency=0.0):
+        if solver_data is None:
+            from dwave.cloud.testing.mocks import qpu_chimera_solver_data
+            solver_data = qpu_chimera_solver_data(2)
+
+        if sampler is None:
+            import dimod
+            sampler = dimod.RandomSampler()
+
+        self.solver_data = solver_data
+        self.sampler = sampler
+        self.latency = latency
+
+        self.max_in_flight = 0
+        self.requests = {}
+
+        self._problems = {}
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._server = None
+
+    @property
+    def solver_name(self):
+        return self.solver_data['identity']['name']
+
+    @property
+    def endpoint(self):
+        """URL of the running server."""
+        if self._server is None:
+            raise RuntimeError("server is not running")
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/'
+
+    @property
+    def config(self):
+        """Keyword arguments that configure a ``dwave-cloud-client``
+        :class:`~dwave.cloud.Client`, or ``DWaveSampler``, to use this
+        server."""
+        return dict(endpoint=self.endpoint, token='stand-in-token', solver=self.solver_name)
+
+    def start(self):
+        """Start serving in a background thread."""
+        from dwave.cloud.solver import StructuredSolver
+
+        self._solver = StructuredSolver(client=None, data=self.solver_data)
+
+        handler = type('SAPIRequestHandler', (_SAPIRequestHandler,), dict(sapi=self))
+        self._server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        """Stop the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _count_request(self, key):
+        with self._condition:
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+    def _decode(self, job):
+        """Decode a ``qp``-encoded problem to a binary quadratic model."""
+        import dimod
+        import numpy as np
+
+        data = job['data']
+        solver = self._solver
+
+        lin = np.frombuffer(base64.b64decode(data['lin']), dtype='<f8')
+        quad = np.frombuffer(base64.b64decode(data['quad']), dtype='<f8')
+
+        # inactive qubits are encoded as NaN and only couplers between
+        # active qubits are encoded
+        qubits = solver._encoding_qubits
+        active = {q for q, bias in zip(qubits, lin) if not np.isnan(bias)}
+        couplers = [(u, v) for u, v in solver._encoding_couplers if u in active and v in active]
+
+        return dimod.BinaryQuadraticModel(
+            {q: bias for q, bias in zip(qubits, lin.tolist()) if q in active},
+            dict(zip(couplers, quad.tolist())),
+            0, 'SPIN' if job['type'] == 'ising' else 'BINARY'), data.get('offset', 0)
+
+    def _encode_answer(self, bqm, offset, sampleset):
+        import numpy as np
+        from dwave.cloud.testing.mocks import qpu_problem_timing_data
+
+        active = np.asarray(sampleset.variables, dtype='<i4')
+        samples = sampleset.record.sample
+        bits = (samples > 0).astype(np.uint8)
+
+        def b64(array):
+            return base64.b64encode(np.ascontiguousarray(array).tobytes()).decode('ascii')
+
+        return dict(
+            format='qp',
+            active_variables=b64(active),
+            energies=b64(bqm.energies((samples, sampleset.variables)).astype('<f8')),
+            num_occurrences=b64(sampleset.record.num_occurrences.astype('<i4')),
+            solutions=b64(np.packbits(bits, axis=1)),
+            num_variables=max(self._solver.nodes) + 1,
+            offset=offset,
+            timing=qpu_problem_timing_data(),
+            )
+
+    def _submit(self, job):
+        now = datetime.datetime.now(datetime.timezone.utc)
+
+        try:
+            bqm, offset = self._decode(job)
+            parameters = {}
+            if 'num_reads' in self.sampler.parameters:
+                parameters.update(num_reads=job.get('params', {}).get('num_reads', 1))
+            sampleset = self.sampler.sample(bqm, **parameters)
+            answer = self._encode_answer(bqm, offset, sampleset)
+        except Exception as err:
+            return dict(error_code=400, error_msg=f'{type(err).__name__}: {err}')
+
+        problem = dict(id=str(uuid.uuid4()),
+                       type=job['type'],
+                       label=job.get('label'),
+                       solver=self.solver_data['identity'],
+                       submitted_on=now.isoformat())
+
+        with self._condition:
+            self._problems[problem['id']] = dict(message=problem,
+                                                 answer=answer,
+                                                 done_at=time.monotonic() + self.latency,
+                                                 loaded=False)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+
+        return dict(problem, status='PENDING')
+
+    def _status(self, problem_id):
+        problem = self._problems.get(problem_id)
+        if problem is None:
+            return dict(id=problem_id, status='FAILED', error_message="problem not found")
+        if time.monotonic() < problem['done_at']:
+            return dict(problem['message'], status='PENDING')
+        solved_on = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        return dict(problem['message'], status='COMPLETED', solved_on=solved_on)
+
+    def _statuses(self, ids, timeout):
+        """Return the statuses of ``ids``, waiting up to ``timeout`` seconds
+        for one of them to complete, as SAPI does for long polling."""
+        deadline = time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                pending = [self._problems[i]['done_at'] for i in ids
+                           if i in self._problems and time.monotonic() < self._problems[i]['done_at']]
+                if len(pending) < len(ids) or time.monotonic() >= deadline:
+                    break
+                self._condition.wait(min(deadline, min(pending)) - time.monotonic())
+
+            return [self._status(i) for i in ids]
+
+    def _answer(self, problem_id):
+        with self._condition:
+            problem = self._problems.get(problem_id)
+            if problem is None:
+                return None
+
+            message = self._status(problem_id)
+            if message['status'] == 'COMPLETED':
+                message['answer'] = problem['answer']
+                if not problem['loaded']:
+                    problem['loaded'] = True
+                    self._in_flight -= 1
+            return message
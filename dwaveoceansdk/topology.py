@@ -0,0 +1,346 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Array-backed QPU topology graphs, cached on disk.
+
+The Chimera, Pegasus and Zephyr generators of :mod:`dwave.graphs` build a
+:class:`networkx.Graph` node by node, which for the larger topologies takes
+noticeable time and memory in every process that needs one. The functions
+of this module instead return a :class:`Topology`: the adjacency in
+compressed sparse row (CSR) form and the coordinates of the nodes, as
+arrays. Each topology is generated once, saved under the Ocean cache
+directory, and then memory-mapped, so all processes on a machine share a
+single copy in the page cache. A :class:`networkx.Graph` is built only when
+:meth:`Topology.to_networkx` is called.
+
+.. autosummary::
+
+    Topology
+    chimera_topology
+    pegasus_topology
+    zephyr_topology
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+
+__all__ = ['Topology', 'chimera_topology', 'pegasus_topology', 'zephyr_topology']
+
+# bump when the files written by Topology.save change
+_FORMAT_VERSION = 1
+
+_ARRAYS = ('nodes', 'indptr', 'indices', 'coordinates')
+
+
+class Topology:
+    """QPU topology graph as arrays.
+
+    Nodes are the linear indices of the :mod:`dwave.graphs` generators, in
+    increasing order. Node ``nodes[i]`` is adjacent to nodes
+    ``nodes[indices[indptr[i]:indptr[i+1]]]`` and has coordinates
+    ``coordinates[i]``.
+
+    Topologies returned by :func:`chimera_topology`,
+    :func:`pegasus_topology` and :func:`zephyr_topology` are memory-mapped
+    read-only and shared by all callers; do not modify their arrays.
+
+    Args:
+        family (str):
+            Topology family: ``'chimera'``, ``'pegasus'`` or ``'zephyr'``.
+
+        shape (tuple[int]):
+            Parameters of the generator, e.g. ``(m, n, t)`` for Chimera.
+
+        nodes (array-like):
+            Sorted linear indices of the nodes.
+
+        indptr (array-like):
+            CSR index pointer, of length ``len(nodes) + 1``.
+
+        indices (array-like):
+            CSR column indices: positions in ``nodes`` of the neighbors of
+            each node, sorted.
+
+        coordinates (array-like):
+            Coordinates of the nodes, one row per node.
+
+    Examples:
+        >>> from dwaveoceansdk.topology import pegasus_topology
+        >>> P6 = pegasus_topology(6)
+        >>> P6.num_nodes, P6.num_edges
+        (680, 4484)
+        >>> P6.coordinates[0].tolist()
+        [0, 0, 2, 0]
+        >>> G = P6.to_networkx()   # networkx is only needed here
+    """
+    def __init__(self, family, shape, nodes, indptr, indices, coordinates):
+        if family not in _GENERATORS:
+            raise ValueError(f"unknown topology family {family!r}, "
+                             f"expected one of {sorted(_GENERATORS)}")
+
+        self.family = family
+        self.shape = tuple(shape)
+        self.nodes = np.asarray(nodes)
+        self.indptr = np.asarray(indptr)
+        self.indices = np.asarray(indices)
+        self.coordinates = np.asarray(coordinates)
+
+        if len(self.indptr) != len(self.nodes) + 1 or len(self.coordinates) != len(self.nodes):
+            raise ValueError("nodes, indptr and coordinates have inconsistent lengths")
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.family!r}, {self.shape!r})'
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes."""
+        return len(self.nodes)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of edges."""
+        return len(self.indices) // 2
+
+    @property
+    def degrees(self) -> np.ndarray:
+        """Degree of each node."""
+        return np.diff(self.indptr)
+
+    def index(self, nodes):
+        """Positions of linear indices ``nodes`` in :attr:`nodes`.
+
+        Raises:
+            ValueError: If a node is not in the topology.
+        """
+        nodes = np.asarray(nodes)
+        positions = np.searchsorted(self.nodes, nodes)
+        found = self.nodes[np.minimum(positions, len(self.nodes) - 1)] == nodes
+        if not found.all():
+            missing = nodes[~found].ravel()[0]
+            raise ValueError(f"node {missing!r} is not in the topology")
+        return positions
+
+    def neighbors(self, node) -> np.ndarray:
+        """Linear indices of the neighbors of ``node``."""
+        i = self.index(node)
+        return self.nodes[self.indices[self.indptr[i]:self.indptr[i + 1]]]
+
+    def edges(self) -> np.ndarray:
+        """Edges ``(u, v)``, with ``u < v``, as an array of shape
+        ``(num_edges, 2)`` of linear indices, sorted."""
+        rows = np.repeat(np.arange(self.num_nodes), self.degrees)
+        upper = rows < self.indices
+        return np.stack([self.nodes[rows[upper]], self.nodes[self.indices[upper]]], axis=1)
+
+    def adjacency(self):
+        """Adjacency matrix, as a :class:`scipy.sparse.csr_array` over the
+        positions of the nodes."""
+        from scipy.sparse import csr_array
+
+        data = np.ones(len(self.indices), dtype=np.int8)
+        return csr_array((data, self.indices, self.indptr),
+                         shape=(self.num_nodes, self.num_nodes))
+
+    def to_networkx(self, *, coordinates=False, **kwargs):
+        """Build the :class:`networkx.Graph` of the :mod:`dwave.graphs`
+        generator, e.g. :func:`dwave.graphs.pegasus_graph`, from the
+        arrays.
+
+        Args:
+            coordinates (bool, optional, default=False):
+                Label the nodes by their coordinates rather than their
+                linear indices.
+
+            **kwargs:
+                Passed to the generator, e.g. ``data=False``.
+
+        Returns:
+            :class:`networkx.Graph`: A new graph, equal to the generator's.
+        """
+        import dwave.graphs
+
+        if coordinates:
+            labels = list(map(tuple, self.coordinates.tolist()))
+        else:
+            labels = self.nodes.tolist()
+
+        edges = self.edges()
+        positions = self.index(edges)
+        edge_list = [(labels[u], labels[v]) for u, v in positions.tolist()]
+
+        generator = getattr(dwave.graphs, f'{self.family}_graph')
+        return generator(*self.shape, node_list=labels, edge_list=edge_list,
+                         coordinates=coordinates, **kwargs)
+
+    @classmethod
+    def from_networkx(cls, G):
+        """Topology of a graph from a :mod:`dwave.graphs` generator with
+        linear indices as labels."""
+        import dwave.graphs
+
+        family = G.graph['family']
+        shape = _shape(family, G.graph)
+
+        nodes = np.fromiter(G.nodes, dtype=np.int64, count=G.number_of_nodes())
+        nodes.sort()
+
+        edges = np.array(list(G.edges), dtype=np.int64).reshape(-1, 2)
+        rows = np.searchsorted(nodes, edges.ravel())
+        cols = np.searchsorted(nodes, edges[:, ::-1].ravel())
+        order = np.lexsort((cols, rows))
+        rows, cols = rows[order], cols[order]
+
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(nodes)), out=indptr[1:])
+
+        converter = getattr(dwave.graphs, f'{family}_coordinates')(*shape)
+        coordinates = np.stack(getattr(converter, f'linear_to_{family}')(nodes), axis=1)
+
+        # int32 fits every topology the generators can build in memory
+        return cls(family, shape, nodes.astype(np.int32), indptr.astype(np.int32),
+                   cols.astype(np.int32), coordinates.astype(np.int32))
+
+    def save(self, directory):
+        """Save the topology as ``.npy`` files in ``directory``, which must
+        not exist, so that :meth:`load` can memory-map them.
+
+        The files are written to a temporary directory that is then renamed,
+        so a concurrent :meth:`load` never sees a partial topology. If
+        another process saved the topology first, its files are kept.
+        """
+        parent = os.path.dirname(os.path.abspath(directory))
+        os.makedirs(parent, exist_ok=True)
+
+        tmp = tempfile.mkdtemp(dir=parent, prefix='.tmp-')
+        try:
+            for name in _ARRAYS:
+                np.save(os.path.join(tmp, f'{name}.npy'), getattr(self, name))
+            with open(os.path.join(tmp, 'topology.json'), 'w') as f:
+                json.dump(dict(family=self.family, shape=self.shape,
+                               version=_FORMAT_VERSION), f)
+            os.rename(tmp, directory)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not os.path.isdir(directory):
+                raise
+
+    @classmethod
+    def load(cls, directory, *, mmap_mode='r'):
+        """Load a topology saved by :meth:`save`, memory-mapped by
+        default."""
+        with open(os.path.join(directory, 'topology.json')) as f:
+            meta = json.load(f)
+        if meta.get('version') != _FORMAT_VERSION:
+            raise ValueError(f"unsupported topology format in {directory!r}")
+
+        arrays = {name: np.load(os.path.join(directory, f'{name}.npy'), mmap_mode=mmap_mode)
+                  for name in _ARRAYS}
+        return cls(meta['family'], meta['shape'], **arrays)
+
+
+def _shape(family, graph):
+    """Generator parameters of a :mod:`dwave.graphs` graph's attributes."""
+    if family == 'chimera':
+        return (graph['rows'], graph['columns'], graph['tile'])
+    return (graph['rows'], graph['tile']) if family == 'zephyr' else (graph['rows'],)
+
+
+# directory -> Topology, for the topologies loaded by this process
+_loaded = {}
+_loaded_lock = threading.Lock()
+
+
+def _topology(family, shape, directory):
+    if directory is None:
+        from dwave.cloud.config import get_cache_dir
+        directory = os.path.join(get_cache_dir(), 'topologies')
+
+    name = '-'.join(map(str, (family, *shape, f'v{_FORMAT_VERSION}')))
+    path = os.path.join(directory, name)
+
+    with _loaded_lock:
+        topology = _loaded.get(path)
+        if topology is not None:
+            return topology
+
+        if not os.path.isdir(path):
+            import dwave.graphs
+            G = getattr(dwave.graphs, f'{family}_graph')(*shape)
+            Topology.from_networkx(G).save(path)
+
+        topology = _loaded[path] = Topology.load(path)
+        return topology
+
+
+def chimera_topology(m, n=None, t=4, *, directory=None) -> Topology:
+    """Topology of :func:`dwave.graphs.chimera_graph`, generated on first
+    use and then loaded from disk.
+
+    Args:
+        m (int): Number of rows of unit cells.
+        n (int, optional): Number of columns of unit cells. Defaults to ``m``.
+        t (int, optional, default=4): Size of the shore of each unit cell.
+        directory (str, optional):
+            Cache directory. Defaults to a ``topologies`` directory under
+            the Ocean cache directory, see
+            :func:`~dwave.cloud.config.get_cache_dir`.
+
+    Returns:
+        :class:`Topology`: Memory-mapped, shared with other callers.
+    """
+    return _topology('chimera', (m, m if n is None else n, t), directory)
+
+
+def pegasus_topology(m, *, directory=None) -> Topology:
+    """Topology of :func:`dwave.graphs.pegasus_graph` with the default
+    offsets and only the fabric nodes, generated on first use and then
+    loaded from disk.
+
+    Args:
+        m (int): Size parameter of the Pegasus lattice.
+        directory (str, optional):
+            Cache directory, as for :func:`chimera_topology`.
+
+    Returns:
+        :class:`Topology`: Memory-mapped, shared with other callers.
+    """
+    return _topology('pegasus', (m,), directory)
+
+
+def zephyr_topology(m, t=4, *, directory=None) -> Topology:
+    """Topology of :func:`dwave.graphs.zephyr_graph`, generated on first
+    use and then loaded from disk.
+
+    Args:
+        m (int): Grid parameter of the Zephyr lattice.
+        t (int, optional, default=4): Tile parameter of the Zephyr lattice.
+        directory (str, optional):
+            Cache directory, as for :func:`chimera_topology`.
+
+    Returns:
+        :class:`Topology`: Memory-mapped, shared with other callers.
+    """
+    return _topology('zephyr', (m, t), directory)
+
+
+_GENERATORS = {
+    'chimera': chimera_topology,
+    'pegasus': pegasus_topology,
+    'zephyr': zephyr_topology,
+}
@@ -0,0 +1,634 @@
+# Copyright 2026 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Opt-in timing spans and counters across the Ocean stack.
+
+When an ``EmbeddingComposite(DWaveSampler())`` call is slow, tracing shows
+where the time went: embedding, chain-strength computation, submission,
+queueing and solving on SAPI, QPU access, unembedding and sample-set
+construction, each as a nested, timed span.
+
+Tracing is off by default and costs nothing then: the component packages
+are instrumented by wrapping a few of their functions and methods only
+while tracing is enabled, and :func:`span` returns a shared no-op context
+manager after a single check.
+
+.. autosummary::
+
+    Collector
+    Span
+    counter
+    disable
+    enable
+    span
+    tracing
+
+Examples:
+    >>> import dimod
+    >>> from dwave.samplers import SimulatedAnnealingSampler
+    >>> from dwaveoceansdk.tracing import tracing
+    ...
+    >>> with tracing(packages=['dwave.samplers']) as collector:
+    ...     sampleset = SimulatedAnnealingSampler().sample_ising({'a': -1}, {})
+    >>> [span.name for span in collector.spans]
+    ['SimulatedAnnealingSampler.sample']
+    >>> collector.dump('trace.json')    # doctest: +SKIP
+"""
+
+import contextlib
+import importlib
+import json
+import os
+import threading
+import time
+import weakref
+
+__all__ = ['Collector', 'Span', 'counter', 'disable', 'enable', 'span', 'tracing']
+
+# active collector, None while tracing is disabled
+_collector = None
+
+# open spans of each thread
+_local = threading.local()
+
+# (package, owner, attribute, original) of each installed wrapper
+_patches = []
+_instrumented = set()
+
+# SAPI futures whose stages are recorded
+_recorded = weakref.WeakSet()
+
+# serializes enabling and disabling
+_lock = threading.Lock()
+
+
+class Span:
+    """A named, timed section of work.
+
+    Attributes:
+        name (str): Name of the span.
+        category (str): Package or layer that emitted the span.
+        start (int): Start time, in :func:`time.perf_counter_ns` nanoseconds.
+        end (int): End time, in :func:`time.perf_counter_ns` nanoseconds.
+        track (int/str): Identifier of the thread that ran the span, or a
+            name for spans reconstructed after the fact, such as the stages
+            of a SAPI problem.
+        parent (:class:`Span`): Enclosing span in the same thread, if any.
+        attributes (dict): Details of the span, such as problem sizes.
+    """
+    __slots__ = ('name', 'category', 'start', 'end', 'track', 'parent', 'attributes',
+                 '_collector')
+
+    def __init__(self, name, category, attributes, *, start=None, end=None, track=None,
+                 parent=None):
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+        self.start = start
+        self.end = end
+        self.track = track
+        self.parent = parent
+        self._collector = None
+
+    @property
+    def duration(self):
+        """Duration in seconds."""
+        return (self.end - self.start) / 1e9
+
+    def set(self, **attributes):
+        """Add details to the span."""
+        self.attributes.update(attributes)
+
+    def __enter__(self):
+        try:
+            stack = _local.stack
+        except AttributeError:
+            stack = _local.stack = []
+
+        self.parent = stack[-1] if stack else None
+        self.track = threading.get_ident()
+        stack.append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end = time.perf_counter_ns()
+        _local.stack.pop()
+
+        if exc_type is not None:
+            self.attributes['error'] = exc_type.__name__
+        self._collector.add(self)
+
+    def __repr__(self):
+        duration = '' if self.end is None else f', {self.duration * 1e3:.3f} ms'
+        return f"<{type(self).__name__} {self.name!r} ({self.category}){duration}>"
+
+
+class _NoOpSpan:
+    """Stands in for :class:`Span` while tracing is disabled."""
+    __slots__ = ()
+
+    def set(self, **attributes):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+_NOOP = _NoOpSpan()
+
+
+class Collector:
+    """In-process store of the spans and counters emitted while tracing.
+
+    Attributes:
+        spans (list[:class:`Span`]): Completed spans, in completion order.
+        counters (dict[str, float]): Total of each counter.
+    """
+    def __init__(self):
+        self.spans = []
+        self.counters = {}
+
+        self._samples = []  # (time, name, total) for each counter update
+        self._threads = {}
+        self._lock = threading.Lock()
+
+        # to place wall-clock timestamps, e.g. from SAPI, on the span clock
+        self._origin = time.perf_counter_ns()
+        self._wall_offset = time.time_ns() - self._origin
+
+    def add(self, span):
+        """Add a completed span."""
+        if span.track not in self._threads and isinstance(span.track, int):
+            self._threads[span.track] = threading.current_thread().name
+        self.spans.append(span)
+
+    def record(self, name, start, end, *, category, track, **attributes):
+        """Add a span from known start and end times, in
+        :func:`time.perf_counter_ns` nanoseconds."""
+        self.spans.append(Span(name, category, attributes, start=start, end=end, track=track))
+
+    def count(self, name, value=1):
+        """Add ``value`` to counter ``name``."""
+        now = time.perf_counter_ns()
+        with self._lock:
+            total = self.counters[name] = self.counters.get(name, 0) + value
+            self._samples.append((now, name, total))
+
+    def from_wall_clock(self, seconds):
+        """Convert a :func:`time.time` timestamp to the span clock."""
+        return int(seconds * 1e9) - self._wall_offset
+
+    def clear(self):
+        """Remove all spans and counters."""
+        with self._lock:
+            self.spans.clear()
+            self.counters.clear()
+            self._samples.clear()
+
+    def summary(self):
+        """Return the number of spans and their total, mean and maximum
+        duration in seconds, by span name.
+
+        Examples:
+            >>> from dwaveoceansdk.tracing import span, tracing
+            >>> with tracing(packages=[]) as collector:
+            ...     for _ in range(3):
+            ...         with span('work'):
+            ...             pass
+            >>> collector.summary()['work']['count']
+            3
+        """
+        summary = {}
+        for span in self.spans:
+            duration = span.duration
+            try:
+                entry = summary[span.name]
+            except KeyError:
+                summary[span.name] = dict(count=1, total=duration, max=duration)
+            else:
+                entry['count'] += 1
+                entry['total'] += duration
+                entry['max'] = max(entry['max'], duration)
+
+        for entry in summary.values():
+            entry['mean'] = entry['total'] / entry['count']
+
+        return summary
+
+    def to_chrome_trace(self):
+        """Return the spans and counters in the Chrome trace event format,
+        viewable in ``chrome://tracing`` and Perfetto.
+
+        Spans are complete (``'X'``) events with the span attributes as
+        arguments and counters are counter (``'C'``) events, with
+        timestamps in microseconds since the collector was created.
+        """
+        pid = os.getpid()
+        origin = self._origin
+
+        # reconstructed spans get their own named tracks after the threads
+        tids = {}
+        names = dict(self._threads)
+        for span in self.spans:
+            if span.track not in tids:
+                if isinstance(span.track, int):
+                    tids[span.track] = span.track
+                else:
+                    tids[span.track] = len(tids) + 1 + max(self._threads, default=0)
+                    names[tids[span.track]] = span.track
+
+        events = [dict(name='process_name', ph='M', pid=pid, tid=0,
+                       args=dict(name='dwaveoceansdk'))]
+        events.extend(dict(name='thread_name', ph='M', pid=pid, tid=tid, args=dict(name=name))
+                      for tid, name in names.items())
+        events.extend(dict(name=span.name, cat=span.category, ph='X', pid=pid,
+                           tid=tids[span.track], ts=(span.start - origin) / 1e3,
+                           dur=(span.end - span.start) / 1e3, args=span.attributes)
+                      for span in self.spans)
+        events.extend(dict(name=name, ph='C', pid=pid, tid=0, ts=(t - origin) / 1e3,
+                           args={name: total})
+                      for t, name, total in self._samples)
+
+        return dict(traceEvents=events, displayTimeUnit='ms')
+
+    def dump(self, file):
+        """Write the Chrome trace, see :meth:`to_chrome_trace`, as JSON.
+
+        Args:
+            file (str/path-like/file-like): File to write to.
+        """
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with open(file, 'w') as f:
+                return self.dump(f)
+        json.dump(self.to_chrome_trace(), file, default=repr)
+
+
+def span(name, category='dwaveoceansdk', **attributes):
+    """Time the enclosed code as a span, if tracing is enabled.
+
+    Spans opened in the same thread nest. While tracing is disabled this
+    returns a shared no-op context manager.
+
+    Args:
+        name (str): Name of the span.
+        category (str, optional): Package or layer emitting the span.
+        **attributes: Details of the span, such as problem sizes.
+
+    Returns:
+        A context manager that yields the :class:`Span`. Use its
+        :meth:`~Span.set` method to add details known only later.
+
+    Examples:
+        >>> from dwaveoceansdk.tracing import span
+        >>> with span('preprocessing', num_variables=100) as s:
+        ...     s.set(num_fixed=10)
+    """
+    collector = _collector
+    if collector is None:
+        return _NOOP
+    opened = Span(name, category, attributes)
+    opened._collector = collector
+    return opened
+
+
+def counter(name, value=1):
+    """Add ``value`` to counter ``name``, if tracing is enabled."""
+    collector = _collector
+    if collector is not None:
+        collector.count(name, value)
+
+
+# instrumentation
+
+def _describe(args):
+    """Span attributes for a sampler-like call: the problem size."""
+    if args:
+        num_variables = getattr(args[0], 'num_variables', None)
+        if isinstance(num_variables, int):
+            return dict(num_variables=num_variables)
+    return {}
+
+
+def _traced(function, name, category, method=False):
+    """Wrap ``function`` to run in a span. For methods, ``{cls}`` in the
+    name is the class of the instance."""
+    def wrapper(*args, **kwargs):
+        collector = _collector
+        if collector is None:
+            return function(*args, **kwargs)
+
+        if method:
+            label = name.format(cls=type(args[0]).__name__)
+            attributes = _describe(args[1:])
+        else:
+            label = name
+            attributes = _describe(args)
+
+        opened = Span(label, category, attributes)
+        opened._collector = collector
+        with opened:
+            return function(*args, **kwargs)
+
+    wrapper.__wrapped__ = function
+    wrapper.__name__ = getattr(function, '__name__', name)
+    wrapper.__qualname__ = getattr(function, '__qualname__', name)
+    wrapper.__doc__ = getattr(function, '__doc__', None)
+    return wrapper
+
+
+class _TracedInstanceAttribute:
+    """Data descriptor that traces calls of a callable stored on instances,
+    such as the ``find_embedding`` function of an embedding composite."""
+    def __init__(self, attribute, name, category):
+        self.attribute = attribute
+        self.name = name
+        self.category = category
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            value = instance.__dict__[self.attribute]
+        except KeyError:
+            raise AttributeError(self.attribute) from None
+        return _traced(value, self.name, self.category)
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.attribute] = value
+
+    def __delete__(self, instance):
+        del instance.__dict__[self.attribute]
+
+
+def _resolve_wrapper(function, name, category, method=True):
+    """Trace only the first, blocking, resolution of a sample set."""
+    def resolve(self):
+        if _collector is None or not hasattr(self, '_future'):
+            return function(self)
+        with span('SampleSet.resolve', 'dimod'):
+            return function(self)
+    resolve.__wrapped__ = function
+    return resolve
+
+
+def _record_problem(collector, future):
+    """Reconstruct the life of a SAPI problem from the timestamps of its
+    ``dwave-cloud-client`` future, on a track of its own."""
+    track = f'SAPI problem {future.id}'
+
+    def stamp(t):
+        return None if t is None else collector.from_wall_clock(t.timestamp())
+
+    created, received, solved, resolved = map(stamp, (
+        future.time_created, future.time_received, future.time_solved, future.time_resolved))
+
+    for name, start, end in [('sapi.submit', created, received),
+                             ('sapi.solve', received, solved),
+                             ('sapi.load', solved, resolved)]:
+        if start is not None and end is not None and start <= end:
+            collector.record(name, start, end, category='dwave.cloud', track=track,
+                             problem_id=future.id)
+
+    try:
+        timing = future.timing
+    except Exception:
+        timing = {}
+
+    # the QPU access ends at, and is part of, the solve stage
+    access = timing.get('qpu_access_time')
+    if solved is not None and isinstance(access, (int, float)):
+        collector.record('qpu.access', solved - int(access * 1e3), solved,
+                         category='dwave.cloud', track=track, problem_id=future.id)
+
+    for key, value in timing.items():
+        if isinstance(value, (int, float)):
+            collector.count(f'sapi.timing.{key}', value)
+
+
+def _load_result_wrapper(function, name, category, method=True):
+    """Trace the wait for a SAPI answer and record its stages."""
+    def _load_result(self):
+        collector = _collector
+        if collector is None or self._result is not None:
+            return function(self)
+
+        with span('sapi.wait', 'dwave.cloud', problem_id=self.id) as s:
+            result = function(self)
+            s.set(problem_id=self.id)
+
+        # several threads may wait on the same future
+        with _lock:
+            first = self not in _recorded
+            _recorded.add(self)
+        if first:
+            _record_problem(collector, self)
+        return result
+    _load_result.__wrapped__ = function
+    return _load_result
+
+
+def _dispatch_wrapper(function, name, category, method=True):
+    """Trace each step of a ``dwave-hybrid`` runnable under its name."""
+    def dispatch(self, future, **kwargs):
+        if _collector is None:
+            return function(self, future, **kwargs)
+        with span(getattr(self, 'name', type(self).__name__), 'hybrid'):
+            return function(self, future, **kwargs)
+    dispatch.__wrapped__ = function
+    return dispatch
+
+
+# package -> [(module, class or None, attribute, span name, wrapper)]
+INSTRUMENTATION = {
+    'dimod': [
+        ('dimod.sampleset', 'SampleSet', 'from_samples', 'SampleSet.from_samples', _traced),
+        ('dimod.sampleset', 'SampleSet', 'resolve', 'SampleSet.resolve', _resolve_wrapper),
+    ],
+    'minorminer': [
+        ('minorminer', None, 'find_embedding', 'minorminer.find_embedding', _traced),
+    ],
+    'dwave.system': [
+        ('dwave.system.composites.embedding', 'EmbeddingComposite', 'sample',
+         '{cls}.sample', _traced),
+        # the composite's find_embedding defaults to the function object, so
+        # wrapping minorminer.find_embedding does not reach it
+        ('dwave.system.composites.embedding', 'EmbeddingComposite', 'find_embedding',
+         'find_embedding', _TracedInstanceAttribute),
+        ('dwave.embedding.transforms', 'EmbeddedStructure', 'embed_bqm', 'embed_bqm', _traced),
+        ('dwave.embedding.transforms', None, 'uniform_torque_compensation', 'chain_strength',
+         _traced),
+        ('dwave.system.composites.embedding', None, 'unembed_sampleset', 'unembed_sampleset',
+         _traced),
+        ('dwave.system.samplers.dwave_sampler', 'DWaveSampler', 'sample', '{cls}.sample',
+         _traced),
+        ('dwave.system.samplers.leap_hybrid_sampler', 'LeapHybridSampler', 'sample',
+         '{cls}.sample', _traced),
+        ('dwave.system.samplers.leap_hybrid_sampler', 'LeapHybridCQMSampler', 'sample_cqm',
+         '{cls}.sample_cqm', _traced),
+        ('dwave.system.samplers.leap_hybrid_sampler', 'LeapHybridNLSampler', 'sample',
+         '{cls}.sample', _traced),
+    ],
+    'dwave.cloud': [
+        ('dwave.cloud.solver', 'StructuredSolver', 'sample_bqm', '{cls}.sample_bqm', _traced),
+        ('dwave.cloud.solver', 'BaseUnstructuredSolver', 'upload_problem',
+         '{cls}.upload_problem', _traced),
+        ('dwave.cloud.computation', 'Future', '_load_result', 'sapi.wait',
+         _load_result_wrapper),
+    ],
+    'dwave.samplers': [
+        (f'dwave.samplers.{module}', cls, 'sample', '{cls}.sample', _traced)
+        for module, cls in [('sa.sampler', 'SimulatedAnnealingSampler'),
+                            ('tabu.sampler', 'TabuSampler'),
+                            ('greedy.sampler', 'SteepestDescentSolver'),
+                            ('random.sampler', 'RandomSampler'),
+                            ('tree.samplers', 'TreeDecompositionSolver'),
+                            ('tree.samplers', 'TreeDecompositionSampler'),
+                            ('planar.sampler', 'PlanarGraphSolver')]
+    ],
+    'hybrid': [
+        ('hybrid.core', 'Runnable', 'dispatch', None, _dispatch_wrapper),
+    ],
+}
+"""dict: Functions and methods traced for each package while tracing is
+enabled, as ``(module, class, attribute, span name, wrapper factory)``.
+Entries whose module or attribute is missing in the installed version of
+the package are skipped."""
+
+
+def _instrument(package):
+    for module_name, class_name, attribute, name, factory in INSTRUMENTATION[package]:
+        try:
+            owner = importlib.import_module(module_name)
+            if class_name is not None:
+                owner = getattr(owner, class_name)
+        except (ImportError, AttributeError):
+            continue
+
+        original = vars(owner).get(attribute)
+        if factory is _TracedInstanceAttribute:
+            wrapper = factory(attribute, name, package)
+        elif original is None:
+            continue
+        elif isinstance(original, classmethod):
+            wrapper = classmethod(factory(original.__func__, name, package, method=True))
+        elif isinstance(original, staticmethod):
+            wrapper = staticmethod(factory(original.__func__, name, package))
+        else:
+            wrapper = factory(original, name, package, method=class_name is not None)
+
+        setattr(owner, attribute, wrapper)
+        _patches.append((package, owner, attribute, original))
+
+
+def _uninstrument(packages):
+    """Remove the wrappers installed for ``packages``, latest first."""
+    for i in reversed(range(len(_patches))):
+        package, owner, attribute, original = _patches[i]
+        if package in packages:
+            del _patches[i]
+            if original is None:
+                delattr(owner, attribute)
+            else:
+                setattr(owner, attribute, original)
+    _instrumented.difference_update(packages)
+
+
+def enable(collector=None, *, packages=None):
+    """Start tracing.
+
+    Args:
+        collector (:class:`Collector`, optional):
+            Collector for the spans and counters. Defaults to a new one.
+
+        packages (iterable[str], optional):
+            Packages to instrument, keys of :data:`INSTRUMENTATION`.
+            Defaults to all of them. Instrumenting a package imports it, if
+            it is installed.
+
+    Returns:
+        :class:`Collector`: The collector.
+    """
+    global _collector
+
+    if collector is None:
+        collector = Collector()
+    if packages is None:
+        packages = INSTRUMENTATION
+
+    with _lock:
+        for package in packages:
+            if package not in INSTRUMENTATION:
+                raise ValueError(f"unknown package {package!r}, "
+                                 f"expected one of {sorted(INSTRUMENTATION)}")
+            if package not in _instrumented:
+                _instrument(package)
+                _instrumented.add(package)
+
+        _collector = collector
+
+    return collector
+
+
+def disable():
+    """Stop tracing and remove the instrumentation.
+
+    Returns:
+        :class:`Collector`: The collector that was active, if any.
+    """
+    global _collector
+
+    with _lock:
+        collector, _collector = _collector, None
+        _uninstrument(set(_instrumented))
+
+    return collector
+
+
+@contextlib.contextmanager
+def tracing(collector=None, *, packages=None):
+    """Trace the enclosed code, see :func:`enable`.
+
+    Yields:
+        :class:`Collector`: The collector.
+
+    Examples:
+        >>> from dwave.system import DWaveSampler, EmbeddingComposite
+        >>> from dwaveoceansdk.testing import StandInSAPI
+        >>> from dwaveoceansdk.tracing import tracing
+        ...
+        >>> with StandInSAPI() as sapi, tracing() as collector:
+        ...     sampler = EmbeddingComposite(DWaveSampler(**sapi.config))
+        ...     sampleset = sampler.sample_ising({'a': -1, 'b': +1}, {('a', 'b'): -1})
+        >>> sorted(collector.summary())     # doctest: +SKIP
+        ['DWaveSampler.sample', 'EmbeddingComposite.sample', 'SampleSet.from_samples',
+         'SampleSet.resolve', 'StructuredSolver.sample_bqm', 'chain_strength', 'embed_bqm',
+         'find_embedding', 'qpu.access', 'sapi.load', 'sapi.solve', 'sapi.submit',
+         'sapi.wait', 'unembed_sampleset']
+    """
+    global _collector
+
+    with _lock:
+        previous, instrumented = _collector, set(_instrumented)
+    collector = enable(collector, packages=packages)
+    try:
+        yield collector
+    finally:
+        # the previous collector, with only the packages it instrumented
+        with _lock:
+            _uninstrument(_instrumented - instrumented)
+            _collector = previous
@@ -0,0 +1,112 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import unittest
+
+import dimod
+import numpy as np
+from dwave.samplers import SimulatedAnnealingSampler, SteepestDescentSolver
+from dwave.samplers.sa.sampler import _default_ising_beta_range
+
+from dwaveoceansdk.batching import sample_many
+
+
+def random_bqms(num_problems):
+    rng = np.random.default_rng(42)
+    return [dimod.generators.gnp_random_bqm(3 + i % 8, .5, 'SPIN' if i % 2 else 'BINARY',
+                                            random_state=i,
+                                            bias_generator=lambda n: rng.choice([-1, 1], n))
+            for i in range(num_problems)]
+
+
+class TestSampleMany(unittest.TestCase):
+    def assertConsistent(self, bqms, samplesets, num_reads):
+        self.assertEqual(len(samplesets), len(bqms))
+        for bqm, sampleset in zip(bqms, samplesets):
+            self.assertIs(sampleset.vartype, bqm.vartype)
+            self.assertEqual(sampleset.variables, bqm.variables)
+            self.assertEqual(len(sampleset), num_reads)
+            np.testing.assert_allclose(sampleset.record.energy,
+                                       bqm.energies(sampleset))
+
+    def test_simulated_annealing(self):
+        bqms = random_bqms(50)
+
+        for num_threads in [1, 3]:
+            with self.subTest(num_threads=num_threads):
+                samplesets = sample_many(SimulatedAnnealingSampler(), bqms, num_reads=10,
+                                         num_threads=num_threads, seed=1)
+                self.assertConsistent(bqms, samplesets, 10)
+
+                for bqm, sampleset in zip(bqms, samplesets):
+                    ground = dimod.ExactSolver().sample(bqm).first.energy
+                    self.assertAlmostEqual(sampleset.first.energy, ground)
+
+    def test_tiny(self):
+        bqm = dimod.BinaryQuadraticModel.from_ising({'a': -1, 'b': +1}, {('a', 'b'): -1})
+
+        for sampleset in sample_many(SimulatedAnnealingSampler(), [bqm] * 100, num_reads=2):
+            self.assertEqual(sampleset.first.energy, -1)
+
+    def test_beta_range(self):
+        bqms = random_bqms(10)
+        samplesets = sample_many(SimulatedAnnealingSampler(), bqms, num_sweeps=10)
+
+        for bqm, sampleset in zip(bqms, samplesets):
+            hot, cold = _default_ising_beta_range(bqm.spin.linear, bqm.spin.quadratic)
+            beta_range = sampleset.info['beta_range']
+            self.assertAlmostEqual(beta_range[0], hot)
+            self.assertGreaterEqual(beta_range[1], cold * (1 - 1e-12))
+            self.assertLessEqual(beta_range[1], 2 * cold)
+
+        samplesets = sample_many(SimulatedAnnealingSampler(), bqms, num_sweeps=10,
+                                 beta_range=[.1, 5], beta_schedule_type='linear')
+        for sampleset in samplesets:
+            self.assertEqual(sampleset.info, dict(beta_range=[.1, 5], beta_schedule_type='linear'))
+
+    def test_seed(self):
+        bqms = random_bqms(20)
+
+        a = sample_many(SimulatedAnnealingSampler(), bqms, num_sweeps=5, num_threads=2, seed=3)
+        b = sample_many(SimulatedAnnealingSampler(), bqms, num_sweeps=5, num_threads=2, seed=3)
+        for x, y in zip(a, b):
+            np.testing.assert_array_equal(x.record.sample, y.record.sample)
+
+    def test_other_sampler(self):
+        bqms = random_bqms(20)
+        samplesets = sample_many(SteepestDescentSolver(), bqms, num_reads=3, num_threads=2,
+                                 seed=4)
+        self.assertConsistent(bqms, samplesets, 3)
+
+        # every sample is a local minimum of its own problem
+        for bqm, sampleset in zip(bqms, samplesets):
+            descended = SteepestDescentSolver().sample(bqm, initial_states=sampleset)
+            np.testing.assert_array_equal(descended.record.energy, sampleset.record.energy)
+
+    def test_empty(self):
+        self.assertEqual(sample_many(SimulatedAnnealingSampler(), []), [])
+
+        with self.assertWarns(UserWarning):
+            sampleset, = sample_many(SimulatedAnnealingSampler(), [dimod.BQM('SPIN')])
+        self.assertEqual(sampleset.record.sample.shape, (1, 0))
+
+    def test_invalid(self):
+        bqms = random_bqms(2)
+
+        with self.assertRaises(ValueError):
+            sample_many(SimulatedAnnealingSampler(), bqms, num_threads=0)
+        with self.assertRaises(ValueError):
+            sample_many(SimulatedAnnealingSampler(), bqms, beta_schedule_type='custom')
+        with self.assertRaises(TypeError):
+            sample_many(SimulatedAnnealingSampler(), bqms, unknown=1)
@@ -0,0 +1,403 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from dwaveoceansdk.bench import (
+    components, construction, gate, graphs, labels, nonlinear, pipeline, processes, regression)
+from dwaveoceansdk.bench.__main__ import main
+
+
+class TestComponents(unittest.TestCase):
+    def test_pinned_components(self):
+        self.assertEqual(set(components.pinned_components()), set(components.COMPONENTS))
+
+        requirements = ['dimod == 0.12.22', 'diskcache>=5.2.1,<6', 'minorminer==0.2.*']
+        with mock.patch.object(components, 'requires', return_value=requirements):
+            self.assertEqual(components.pinned_components(), ['dimod'])
+
+    def test_first_calls(self):
+        for name, calls in components.FIRST_CALLS.items():
+            for call_name, func in calls.items():
+                with self.subTest(component=name, call=call_name):
+                    func()
+
+    def test_measure_component(self):
+        result = components.measure_component('dwave-preprocessing', repeat=2)
+
+        self.assertEqual(result['repeat'], 2)
+        self.assertGreater(result['import_time']['median'], 0)
+        self.assertLessEqual(result['import_time']['min'], result['import_time']['median'])
+        self.assertEqual(set(result['first_calls']), {'roof_duality', 'ScaleComposite.sample'})
+
+    def test_unknown_component(self):
+        with self.assertRaises(ValueError):
+            components.measure_component('numpy')
+
+
+class TestCLI(unittest.TestCase):
+    def test_json_report(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'report.json')
+
+            with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                main(['--components', 'dwave-samplers', '--repeat', '1', '-o', filename])
+
+            with open(filename) as f:
+                report = json.load(f)
+
+        self.assertIn('dwave-samplers', stdout.getvalue())
+        self.assertEqual(report['benchmark'], 'components')
+        self.assertEqual(list(report['components']), ['dwave-samplers'])
+        self.assertIn('SimulatedAnnealingSampler.sample_ising',
+                      report['components']['dwave-samplers']['first_calls'])
+
+
+class TestConstruction(unittest.TestCase):
+    def test_measure_build(self):
+        for builder in construction.BUILDERS:
+            with self.subTest(builder=builder):
+                result = construction.measure_build(builder, 10, seed=3)
+
+                self.assertEqual(result['num_variables'], 110)
+                self.assertEqual(result['num_constraints'], 20)
+                self.assertGreater(result['build_time'], 0)
+
+    def test_reference_max_size(self):
+        report = construction.run([5, 10], reference_max_size=5, seed=3)
+
+        self.assertEqual(report['benchmark'], 'construction')
+        self.assertEqual(list(report['builders']['reference']), ['5'])
+        self.assertEqual(list(report['builders']['arrays']), ['5', '10'])
+
+    def test_unknown_builder(self):
+        with self.assertRaises(ValueError):
+            construction.measure_build('symbolic', 10)
+
+
+class TestPipeline(unittest.TestCase):
+    def test_run(self):
+        report = pipeline.run(num_problems=2, num_variables=12, num_reads=10, seed=5)
+
+        self.assertEqual(report['benchmark'], 'pipeline')
+
+        embedding = report['pipelines']['embedding']
+        self.assertEqual(embedding['num_problems'], 2)
+        self.assertGreater(embedding['problems_per_second'], 0)
+        self.assertEqual(set(embedding['stages']),
+                         {'embedding', 'sampling', 'unembedding', 'postprocessing'})
+        for summary in embedding['stages'].values():
+            self.assertEqual(summary['count'], 2)
+
+        stages = report['pipelines']['hybrid']['stages']
+        self.assertIn('QPUSubproblemAutoEmbeddingSampler', stages)
+
+    def test_qpu_restored(self):
+        from dwave.system.testing import MockDWaveSampler
+
+        qpu = MockDWaveSampler(topology_type='chimera', topology_shape=[4])
+        problems = pipeline.generate_problems(1, 5, seed=1)
+
+        pipeline.run_embedding_pipeline(problems, qpu=qpu, num_reads=5)
+        self.assertNotIn('sample', vars(qpu))
+
+        # and when sampling fails
+        with mock.patch.object(pipeline, 'StageTimer') as timer:
+            timer.return_value.side_effect = KeyError
+            with self.assertRaises(KeyError):
+                pipeline.run_embedding_pipeline(problems, qpu=qpu, num_reads=5)
+        self.assertNotIn('sample', vars(qpu))
+
+    def test_generate_problems(self):
+        problems = pipeline.generate_problems(3, 5, seed=1)
+
+        self.assertEqual(len(problems), 3)
+        self.assertEqual([bqm.num_variables for bqm in problems], [5, 5, 5])
+        self.assertEqual(problems, pipeline.generate_problems(3, 5, seed=1))
+
+    def test_cli(self):
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            main(['pipeline', '--pipelines', 'embedding', '--num-problems', '1',
+                  '--num-variables', '5', '--topology-type', 'chimera'])
+
+        self.assertIn('problems/s', stdout.getvalue())
+
+
+class TestProcesses(unittest.TestCase):
+    def test_run(self):
+        report = processes.run([2], num_variables=50, subproblem_size=10, num_iterations=2,
+                               num_sweeps=10, seed=6)
+
+        self.assertEqual(report['benchmark'], 'processes')
+        self.assertEqual(set(report['workers']), {'2'})
+
+        result = report['workers']['2']
+        self.assertGreater(result['threads'], 0)
+        self.assertGreater(result['processes'], 0)
+        self.assertEqual(result['speedup'], result['threads'] / result['processes'])
+
+    def test_unknown_executor(self):
+        with self.assertRaises(ValueError):
+            processes.measure('fibers', None, 1)
+
+
+class TestGate(unittest.TestCase):
+    def test_measure_batch(self):
+        result = gate.measure_batch(6, num_circuits=3, seed=1)
+
+        self.assertEqual(result['num_circuits'], 3)
+        self.assertGreater(result['time']['batch'], 0)
+        self.assertGreater(result['memory']['reference'], 0)
+        self.assertLess(result['max_error'], 1e-10)
+
+    def test_measure_sparse(self):
+        result = gate.measure_sparse(8)
+
+        self.assertEqual(result['num_amplitudes'], 2)
+        self.assertGreater(result['time']['sparse'], 0)
+        self.assertLess(result['max_error'], 1e-10)
+
+    def test_run(self):
+        report = gate.run(num_qubits=[4], num_circuits=4, max_batch_bytes=16 << 5, seed=2)
+
+        self.assertEqual(report['benchmark'], 'gate')
+        self.assertEqual(set(report['modes']), set(gate.MODES))
+        # the batch is limited to two states of 4 qubits
+        self.assertEqual(report['modes']['batch'][0]['num_circuits'], 2)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            gate.run(['dense'], num_qubits=[2])
+
+
+class TestNonlinear(unittest.TestCase):
+    def test_move_states(self):
+        model = nonlinear.cvrp_model(20, seed=1)
+        states = nonlinear.random_states(model, 10, seed=1)
+
+        rows, moved = nonlinear.move_states(states, .3, seed=1)
+
+        self.assertEqual(len(rows), 3)
+        for row, state in zip(rows, moved):
+            self.assertEqual(sorted(np.concatenate(state)), list(range(20)))
+            # one route changed
+            self.assertLessEqual(
+                sum(not np.array_equal(a, b) for a, b in zip(state, states[row])), 1)
+
+    def test_measure_model(self):
+        for name in nonlinear.MODELS:
+            with self.subTest(model=name):
+                result = nonlinear.measure_model(name, 12, num_states=20, repeat=1, seed=2)
+
+                self.assertEqual(result['num_moved'], 2)
+                self.assertGreater(result['time']['update']['batch'], 0)
+                self.assertLess(result['max_error'], 1e-9)
+                self.assertTrue(result['feasible_match'])
+
+    def test_run(self):
+        report = nonlinear.run(['tsp'], sizes=[5], num_states=4, repeat=1, seed=3)
+
+        self.assertEqual(report['benchmark'], 'nonlinear')
+        self.assertEqual(report['models']['tsp'][0]['num_states'], 4)
+
+        with self.assertRaises(ValueError):
+            nonlinear.run(['qap'])
+
+
+class TestGraphs(unittest.TestCase):
+    def test_measure_problem(self):
+        G = graphs.random_graph(50, 200, seed=3)
+        for problem in graphs.PROBLEMS:
+            with self.subTest(problem=problem):
+                result = graphs.measure_problem(problem, G, num_reads=3, seed=3)
+
+                self.assertEqual(result['num_nodes'], 50)
+                self.assertGreater(result['build']['arrays'], 0)
+                self.assertGreater(result['decode']['reference'], 0)
+                self.assertEqual('reweight' in result, problem != 'vertex_coloring')
+
+    def test_run(self):
+        report = graphs.run(['max_cut'], num_nodes=20, num_edges=40, seed=1)
+
+        self.assertEqual(report['benchmark'], 'graphs')
+        self.assertEqual(list(report['problems']), ['max_cut'])
+
+    def test_unknown_problem(self):
+        with self.assertRaises(ValueError):
+            graphs.measure_problem('clique', graphs.random_graph(5, 5))
+
+
+class TestLabels(unittest.TestCase):
+    def test_measure_labels(self):
+        for representation in labels.REPRESENTATIONS:
+            with self.subTest(representation=representation):
+                result = labels.measure_labels(representation, 10, num_lookups=100, seed=2)
+
+                self.assertEqual(result['num_variables'], 110)
+                self.assertGreater(result['bytes_per_variable'], 0)
+                self.assertGreater(result['lookups_per_second'], 0)
+
+    def test_structured_is_smaller(self):
+        report = labels.run([100], num_lookups=10, seed=2)
+
+        self.assertEqual(report['benchmark'], 'labels')
+        results = {name: result['100']['bytes_per_variable']
+                   for name, result in report['representations'].items()}
+        self.assertLess(results['dense'], results['sparse'])
+        self.assertLess(results['sparse'], results['strings'])
+
+    def test_unknown_representation(self):
+        with self.assertRaises(ValueError):
+            labels.measure_labels('tuples', 10)
+
+
+class TestRegression(unittest.TestCase):
+    SETUP_CFG = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'setup.cfg')
+
+    def write_setup_cfg(self, tmpdir, **pins):
+        """Copy of the SDK's setup.cfg with some pins replaced."""
+        with open(self.SETUP_CFG) as f:
+            text = f.read()
+        for name, (before, after) in pins.items():
+            text = text.replace(f'{name}=={before}', f'{name}=={after}')
+        filename = os.path.join(tmpdir, 'setup.cfg')
+        with open(filename, 'w') as f:
+            f.write(text)
+        return filename
+
+    def test_load_pins(self):
+        pins = regression.load_pins(self.SETUP_CFG)
+        self.assertEqual(set(pins), set(components.pinned_components()))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'setup.cfg')
+            with open(filename, 'w') as f:
+                f.write('[options]\ninstall_requires =\n    dimod>=0.12\n')
+            with self.assertRaises(ValueError):
+                regression.load_pins(filename)
+
+            # dependencies other than the components are not pins
+            with open(filename, 'w') as f:
+                f.write('[options]\ninstall_requires =\n    dimod==0.12.22\n'
+                        '    diskcache>=5.2.1,<6\n')
+            self.assertEqual(regression.load_pins(filename), {'dimod': '0.12.22'})
+
+            for requirement in ['dimod==0.12.*', 'dimod>=0.12,==0.12.22', 'dimod=0.12']:
+                with open(filename, 'w') as f:
+                    f.write(f'[options]\ninstall_requires =\n    {requirement}\n')
+                with self.subTest(requirement=requirement), self.assertRaises(ValueError):
+                    regression.load_pins(filename)
+
+            with self.assertRaises(ValueError):
+                regression.load_pins('no-such-revision', repository=tmpdir)
+
+    def test_mann_whitney_u(self):
+        u, p = regression.mann_whitney_u([1, 2, 3], [1, 2, 3])
+        self.assertEqual(u, 4.5)
+        self.assertEqual(p, 1)
+
+        self.assertEqual(regression.mann_whitney_u([1, 1], [1, 1]), (2, 1))
+
+        # with ties, as scipy.stats.mannwhitneyu(method='asymptotic')
+        u, p = regression.mann_whitney_u([1, 2, 2, 3, 5, 6], [4, 5, 7, 8, 8, 9, 10])
+        self.assertEqual(u, 3.5)
+        self.assertAlmostEqual(p, 0.014743, places=6)
+
+        with self.assertRaises(ValueError):
+            regression.mann_whitney_u([], [1])
+
+    def test_compare(self):
+        rng = np.random.default_rng(0)
+        baseline = rng.normal(1, .02, 15).tolist()
+        times = dict(slower=[1.2 * t for t in baseline], faster=[.8 * t for t in baseline],
+                     within=[1.05 * t for t in baseline], same=baseline)
+
+        results = regression.compare({name: baseline for name in times}, times, threshold=.1)
+
+        self.assertTrue(results['slower']['regression'])
+        self.assertAlmostEqual(results['slower']['delta'], .2)
+        self.assertTrue(results['faster']['improvement'])
+        self.assertFalse(results['faster']['regression'])
+        for name in ('within', 'same'):
+            self.assertFalse(results[name]['regression'])
+            self.assertFalse(results[name]['improvement'])
+
+        # a slowdown that is not significant is not a regression
+        results = regression.compare(dict(w=[1., 1.]), dict(w=[2., 2.]))
+        self.assertFalse(results['w']['regression'])
+
+    def test_workloads(self):
+        result = regression.measure_environment(repeat=2, scale=.05, distributions=['dimod'])
+
+        self.assertEqual(set(result['times']), set(regression.WORKLOADS))
+        for times in result['times'].values():
+            self.assertEqual(len(times), 2)
+        self.assertEqual(result['versions'], dict(dimod=regression.version('dimod')))
+
+        with self.assertRaises(ValueError):
+            regression.measure_environment(workloads=['qaoa'])
+
+    def test_run(self):
+        pins = regression.load_pins(self.SETUP_CFG)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            candidate = self.write_setup_cfg(tmpdir, dimod=(pins['dimod'], '99.0.0'))
+
+            # both pin sets are measured in this interpreter
+            with mock.patch.object(regression, 'create_environment',
+                                   return_value=sys.executable) as create:
+                report = regression.run(self.SETUP_CFG, candidate,
+                                        workloads=['bqm_energies', 'roof_duality'], rounds=2,
+                                        repeat=2, scale=.05, threshold=10., env_dir=tmpdir)
+
+        self.assertEqual(create.call_count, 2)
+        self.assertEqual(report['benchmark'], 'regression')
+        self.assertEqual(report['pins']['changed'], dict(dimod=[pins['dimod'], '99.0.0']))
+        self.assertEqual(len(report['times']['candidate']['roof_duality']), 4)
+        self.assertEqual(set(report['workloads']), {'bqm_energies', 'roof_duality'})
+        self.assertEqual(report['regressions'], [])
+        self.assertFalse(report['skipped'])
+        self.assertFalse(report['failed'])
+
+    def test_unchanged(self):
+        with mock.patch.object(regression, 'create_environment') as create:
+            with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                self.assertEqual(main(['regression', '--baseline', self.SETUP_CFG,
+                                       '--candidate', self.SETUP_CFG]), 0)
+
+        create.assert_not_called()
+        self.assertIn('pins unchanged', stdout.getvalue())
+
+    def test_cli_fails(self):
+        report = dict(benchmark='regression', pins=dict(changed={'dimod': ['1', '2']}),
+                      workloads=dict(w=dict(baseline=1., candidate=2., delta=1., p_value=.001,
+                                            regression=True, improvement=False)),
+                      regressions=['w'], skipped=False, failed=True)
+
+        with mock.patch.object(regression, 'run', return_value=report):
+            with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                self.assertEqual(main(['regression', '--baseline', 'HEAD']), 1)
+
+        self.assertIn('REGRESSION', stdout.getvalue())
+        self.assertIn('failed: w', stdout.getvalue())
@@ -0,0 +1,174 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import tempfile
+import time
+import unittest
+
+import dimod
+import numpy as np
+from dwave.preprocessing import ScaleComposite, roof_duality
+from dwave.samplers import SimulatedAnnealingSampler
+
+from dwaveoceansdk.caching import CachingComposite, ResultCache, model_hash
+
+
+class TestModelHash(unittest.TestCase):
+    def test_equal(self):
+        bqm = dimod.generators.gnp_random_bqm(20, .5, 'BINARY', random_state=1)
+        self.assertEqual(model_hash(bqm), model_hash(bqm.copy()))
+
+        other = dimod.BinaryQuadraticModel(bqm.vartype)
+        other.add_variables_from((v, bqm.get_linear(v)) for v in bqm.variables)
+        other.add_quadratic_from(reversed([(v, u, bias) for u, v, bias in bqm.iter_quadratic()]))
+        other.offset = bqm.offset
+        self.assertEqual(model_hash(bqm), model_hash(other))
+
+    def test_different(self):
+        bqm = dimod.BinaryQuadraticModel({'a': 1}, {'ab': -1}, 0, 'SPIN')
+        reference = model_hash(bqm)
+
+        for change in [lambda m: m.change_vartype('BINARY', inplace=True),
+                       lambda m: m.add_linear('b', 1e-9),
+                       lambda m: m.add_quadratic('a', 'b', 1),
+                       lambda m: m.relabel_variables({'a': 'c'}),
+                       lambda m: setattr(m, 'offset', 1)]:
+            with self.subTest(change=change):
+                other = bqm.copy()
+                change(other)
+                self.assertNotEqual(model_hash(other), reference)
+
+
+class TestResultCache(unittest.TestCase):
+    def test_key(self):
+        cache = ResultCache()
+        bqm = dimod.BinaryQuadraticModel({'a': 1}, {}, 0, 'SPIN')
+
+        self.assertEqual(cache.key('f', bqm, dict(x=1, y=[2])),
+                         cache.key('f', bqm.copy(), dict(y=[2], x=1)))
+        self.assertNotEqual(cache.key('f', bqm, dict(x=1)), cache.key('g', bqm, dict(x=1)))
+        self.assertNotEqual(cache.key('f', bqm, dict(x=1)), cache.key('f', bqm, dict(x=2)))
+        self.assertNotEqual(cache.key('f', bqm, dict(x=np.zeros(2000))),
+                            cache.key('f', bqm, dict(x=np.eye(1, 2000).ravel())))
+
+    def test_wrap(self):
+        cache = ResultCache()
+        cached = cache.wrap(roof_duality)
+        bqm = dimod.generators.gnp_random_bqm(10, .5, 'BINARY', random_state=2)
+
+        self.assertEqual(cached(bqm), roof_duality(bqm))
+        self.assertEqual(cached(bqm.copy()), roof_duality(bqm))
+        cached(bqm, strict=False)
+
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries']), (1, 2, 2))
+        self.assertEqual(stats['hit_rate'], 1 / 3)
+        self.assertGreater(stats['size'], 0)
+
+        cache.clear()
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    def test_not_shared(self):
+        cache = ResultCache()
+        cache.set('k', [1])
+        cache.get('k').append(2)
+        self.assertEqual(cache.get('k'), [1])
+
+    def test_ttl(self):
+        cache = ResultCache(ttl=.05)
+        cache.set('k', 1)
+        self.assertEqual(cache.get('k'), 1)
+        time.sleep(.1)
+        self.assertIsNone(cache.get('k'))
+
+        with self.assertRaises(ValueError):
+            ResultCache(ttl=0)
+
+    def test_size_limit(self):
+        cache = ResultCache(size_limit=2500)
+        for key in 'abc':
+            cache.set(key, bytes(1000))
+            cache.get('a')   # 'a' is the most recently used
+
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
+
+    def test_directory(self):
+        bqm = dimod.generators.gnp_random_bqm(10, .5, 'BINARY', random_state=3)
+        with tempfile.TemporaryDirectory() as directory:
+            with ResultCache(directory) as cache:
+                cache.wrap(roof_duality)(bqm)
+
+            # persisted across cache objects
+            with ResultCache(directory) as cache:
+                cache.wrap(roof_duality)(bqm)
+                self.assertEqual(cache.stats()['hits'], 1)
+
+
+class TestCachingComposite(unittest.TestCase):
+    def test_exact(self):
+        sampler = CachingComposite(dimod.ExactSolver())
+        bqm = dimod.generators.ran_r(1, 5, seed=4)
+
+        first = sampler.sample(bqm)
+        second = sampler.sample(bqm.copy())
+
+        self.assertEqual(first.info['cache'],
+                         dict(hit=False, hits=0, misses=1, hit_rate=0.0))
+        self.assertEqual(second.info['cache'],
+                         dict(hit=True, hits=1, misses=1, hit_rate=0.5))
+        np.testing.assert_array_equal(first.record, second.record)
+        self.assertIsNot(first.record, second.record)
+
+    def test_composed(self):
+        sampler = CachingComposite(ScaleComposite(dimod.ExactSolver()))
+        bqm = dimod.generators.ran_r(1, 5, seed=5)
+
+        sampler.sample(bqm, scalar=.5)
+        self.assertFalse(sampler.sample(bqm, scalar=.25).info['cache']['hit'])
+        self.assertTrue(sampler.sample(bqm, scalar=.5).info['cache']['hit'])
+
+    def test_seeded(self):
+        sampler = CachingComposite(SimulatedAnnealingSampler())
+        bqm = dimod.generators.ran_r(1, 10, seed=6)
+
+        first = sampler.sample(bqm, seed=1, num_reads=5, num_sweeps=10)
+        second = sampler.sample(bqm, seed=1, num_reads=5, num_sweeps=10)
+        self.assertTrue(second.info['cache']['hit'])
+        np.testing.assert_array_equal(first.record.sample, second.record.sample)
+
+        self.assertFalse(sampler.sample(bqm, seed=2, num_reads=5,
+                                        num_sweeps=10).info['cache']['hit'])
+
+    def test_nondeterministic(self):
+        bqm = dimod.generators.ran_r(1, 10, seed=7)
+
+        with self.assertRaises(ValueError):
+            CachingComposite(SimulatedAnnealingSampler()).sample(bqm, num_reads=5)
+
+        sampler = CachingComposite(SimulatedAnnealingSampler(), deterministic=True)
+        sampler.sample(bqm, num_reads=5, num_sweeps=10)
+        self.assertTrue(sampler.sample(bqm, num_reads=5, num_sweeps=10).info['cache']['hit'])
+
+    def test_shared_cache(self):
+        cache = ResultCache()
+        bqm = dimod.generators.ran_r(1, 5, seed=8)
+
+        CachingComposite(dimod.ExactSolver(), cache).sample(bqm)
+        CachingComposite(dimod.ExactSolver(), cache).sample(bqm)
+        CachingComposite(dimod.NullSampler(), cache).sample(bqm)
+
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['entries'], 2)
@@ -0,0 +1,137 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import unittest
+
+import dimod
+import numpy as np
+
+from dwaveoceansdk.bench.construction import bin_packing_reference
+from dwaveoceansdk.construction import (
+    add_constraints_from_arrays, bin_packing, set_objective_from_arrays)
+
+
+class TestSetObjective(unittest.TestCase):
+    def test_linear(self):
+        cqm = dimod.ConstrainedQuadraticModel()
+        set_objective_from_arrays(cqm, [0, 2, 2], [1., 2., 3.], offset=1.5)
+
+        self.assertEqual(cqm.variables, [0, 1, 2])
+        self.assertEqual(cqm.objective.linear, {0: 1, 2: 5})
+        self.assertEqual(cqm.objective.offset, 1.5)
+
+    def test_quadratic(self):
+        cqm = dimod.ConstrainedQuadraticModel()
+        set_objective_from_arrays(cqm, [0, 1], [1, -1], quadratic=([0, 1], [1, 3], [2, 4]))
+
+        self.assertEqual(cqm.objective.linear, {0: 1, 1: -1, 2: 0, 3: 0})
+        self.assertEqual(cqm.objective.quadratic, {(0, 1): 2, (1, 3): 4})
+        self.assertEqual(cqm.objective.vartype(3), dimod.BINARY)
+
+    def test_quadratic_integer(self):
+        cqm = dimod.ConstrainedQuadraticModel()
+        with self.assertRaises(ValueError):
+            set_objective_from_arrays(cqm, [0], [1], quadratic=([0], [1], [1]), vartype='INTEGER')
+
+    def test_integer(self):
+        cqm = dimod.ConstrainedQuadraticModel()
+        set_objective_from_arrays(cqm, [0, 1], [1, 2], vartype='INTEGER',
+                                  lower_bound=-5, upper_bound=5)
+
+        self.assertEqual(cqm.vartype(1), dimod.INTEGER)
+        self.assertEqual(cqm.lower_bound(1), -5)
+        self.assertEqual(cqm.upper_bound(1), 5)
+
+    def test_shape_mismatch(self):
+        cqm = dimod.ConstrainedQuadraticModel()
+        with self.assertRaises(ValueError):
+            set_objective_from_arrays(cqm, [0, 1], [1])
+
+
+class TestAddConstraints(unittest.TestCase):
+    def test_rows(self):
+        cqm = dimod.ConstrainedQuadraticModel()
+        labels = add_constraints_from_arrays(cqm, [0, 2, 3], [0, 1, 2], [1, 2, 3],
+                                             ['<=', '>='], [1, 2])
+
+        self.assertEqual(len(labels), 2)
+        first, second = (cqm.constraints[label] for label in labels)
+        self.assertEqual(first.lhs.linear, {0: 1, 1: 2})
+        self.assertEqual(first.sense, dimod.sym.Sense.Le)
+        self.assertEqual(first.rhs, 1)
+        self.assertEqual(second.lhs.linear, {2: 3})
+        self.assertEqual(second.sense, dimod.sym.Sense.Ge)
+        self.assertEqual(second.rhs, 2)
+
+    def test_labels(self):
+        cqm = dimod.ConstrainedQuadraticModel()
+        labels = add_constraints_from_arrays(cqm, [0, 1, 2], [0, 1], [1, 1], '==', 1,
+                                             labels=['a', 'b'])
+
+        self.assertEqual(labels, ['a', 'b'])
+        self.assertEqual(list(cqm.constraints), ['a', 'b'])
+
+    def test_empty_row(self):
+        cqm = dimod.ConstrainedQuadraticModel()
+        label, = add_constraints_from_arrays(cqm, [0, 0], [], [], '<=', 0)
+
+        self.assertEqual(cqm.constraints[label].lhs.num_variables, 0)
+
+    def test_integer(self):
+        cqm = dimod.ConstrainedQuadraticModel()
+        label, = add_constraints_from_arrays(cqm, [0, 2], [0, 1], [1, 1], '<=', 7,
+                                             vartype='INTEGER', upper_bound=10)
+
+        self.assertEqual(cqm.vartype(0), dimod.INTEGER)
+        self.assertEqual(cqm.upper_bound(1), 10)
+        self.assertEqual(cqm.constraints[label].lhs.vartype(1), dimod.INTEGER)
+
+    def test_invalid(self):
+        cqm = dimod.ConstrainedQuadraticModel()
+
+        with self.subTest('indptr'):
+            with self.assertRaises(ValueError):
+                add_constraints_from_arrays(cqm, [0, 3], [0, 1], [1, 1], '==', 1)
+        with self.subTest('coefficients'):
+            with self.assertRaises(ValueError):
+                add_constraints_from_arrays(cqm, [0, 2], [0, 1], [1], '==', 1)
+        with self.subTest('sense'):
+            with self.assertRaises(ValueError):
+                add_constraints_from_arrays(cqm, [0, 2], [0, 1], [1, 1], ['=='] * 2, 1)
+        with self.subTest('labels'):
+            with self.assertRaises(ValueError):
+                add_constraints_from_arrays(cqm, [0, 2], [0, 1], [1, 1], '==', 1, labels=[])
+
+        self.assertEqual(len(cqm.constraints), 0)
+
+
+class TestBinPacking(unittest.TestCase):
+    def test_matches_reference(self):
+        n = 6
+        weights = np.random.default_rng(42).random(n)
+
+        reference = bin_packing_reference(weights)
+        mapping = {f'x_{i},{j}': i*n + j for i in range(n) for j in range(n)}
+        mapping.update({f'y_{j}': n*n + j for j in range(n)})
+        reference.relabel_variables(mapping)
+
+        cqm = bin_packing(weights)
+
+        self.assertTrue(cqm.objective.is_equal(reference.objective))
+        self.assertEqual(list(cqm.constraints), list(reference.constraints))
+        for label, constraint in cqm.constraints.items():
+            with self.subTest(label):
+                self.assertTrue(constraint.lhs.is_equal(reference.constraints[label].lhs))
+                self.assertEqual(constraint.sense, reference.constraints[label].sense)
+                self.assertEqual(constraint.rhs, reference.constraints[label].rhs)
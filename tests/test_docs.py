@@ -0,0 +1,163 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+
+from dwaveoceansdk.docs import build_cpp_docs, headers_fingerprint
+
+_sphinx = importlib.util.find_spec('sphinx') is not None
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(textwrap.dedent(text))
+
+
+class TestBuildCppDocs(unittest.TestCase):
+    def setUp(self):
+        self.project = tempfile.TemporaryDirectory()
+        self.addCleanup(self.project.cleanup)
+        self.header = os.path.join(self.project.name, 'include', 'a.h')
+        write(self.header, 'int a();\n')
+        os.makedirs(os.path.join(self.project.name, 'docs'))
+
+        # counts the builds
+        self.command = 'mkdir -p build-cpp/xml && echo >> ../builds'
+
+    def builds(self):
+        with open(os.path.join(self.project.name, 'builds')) as f:
+            return len(f.read())
+
+    def test_skipped_when_unchanged(self):
+        self.assertTrue(build_cpp_docs(self.project.name, command=self.command))
+        self.assertFalse(build_cpp_docs(self.project.name, command=self.command))
+        self.assertEqual(self.builds(), 1)
+
+        write(self.header, 'int a(int);\n')
+        self.assertTrue(build_cpp_docs(self.project.name, command=self.command))
+        self.assertEqual(self.builds(), 2)
+
+    def test_failed_build_retried(self):
+        command = 'echo >> ../builds && false'
+
+        build_cpp_docs(self.project.name, command=command, quiet=True)
+        build_cpp_docs(self.project.name, command=command, quiet=True)
+
+        self.assertEqual(self.builds(), 2)
+
+    def test_fingerprint(self):
+        fingerprint = headers_fingerprint(self.project.name)
+
+        write(os.path.join(self.project.name, 'src', 'a.cpp'), 'int a() { return 0; }\n')
+        write(os.path.join(self.project.name, '.git', 'b.h'), '')
+        self.assertEqual(headers_fingerprint(self.project.name), fingerprint)
+
+        os.rename(self.header, os.path.join(self.project.name, 'include', 'b.h'))
+        self.assertNotEqual(headers_fingerprint(self.project.name), fingerprint)
+
+
+@unittest.skipUnless(_sphinx, "Sphinx is not installed")
+class TestDocTestBuilder(unittest.TestCase):
+    def setUp(self):
+        self.source = tempfile.TemporaryDirectory()
+        self.addCleanup(self.source.cleanup)
+
+        write(os.path.join(self.source.name, 'conf.py'), """
+            import os
+            extensions = ['sphinx.ext.doctest', 'dwaveoceansdk.docs.doctesting']
+            doctest_num_workers = int(os.environ.get('NUM_WORKERS', 1))
+            doctest_cache_versions = {'dimod': os.environ.get('DIMOD_VERSION', '1')}
+            """)
+        write(os.path.join(self.source.name, 'index.rst'), """
+            Index
+            =====
+
+            .. toctree::
+
+               a
+               b
+
+            .. doctest::
+
+               >>> 1 + 1
+               2
+            """)
+        write(os.path.join(self.source.name, 'a.rst'), """
+            A
+            =
+
+            .. testcode::
+
+               print('a')
+
+            .. testoutput::
+
+               a
+            """)
+        write(os.path.join(self.source.name, 'b.rst'), """
+            B
+            =
+
+            .. doctest::
+
+               >>> 3
+               3
+
+            .. doctest:: failing
+
+               >>> 2
+               3
+            """)
+        self.output = os.path.join(self.source.name, '_build')
+
+    def build(self, **env):
+        subprocess.run([sys.executable, '-m', 'sphinx', '-q', '-b', 'doctest',
+                        self.source.name, self.output],
+                       env=dict(os.environ, **env), capture_output=True)
+        with open(os.path.join(self.output, 'output.txt')) as f:
+            output = f.read()
+        with open(os.path.join(self.output, 'doctest-cache.json')) as f:
+            cache = json.load(f)['passed']
+        return output, cache
+
+    def test_parallel(self):
+        serial, _ = self.build(NUM_WORKERS='1')
+        os.remove(os.path.join(self.output, 'doctest-cache.json'))
+        parallel, cache = self.build(NUM_WORKERS='3')
+
+        # the same results, in document order
+        self.assertEqual(serial.split('\n', 2)[2], parallel.split('\n', 2)[2])
+        self.assertIn('4 tests\n    1 failure in tests', parallel)
+        self.assertEqual(len(cache), 3)
+
+    def test_cache(self):
+        self.build()
+        output, cache = self.build(NUM_WORKERS='2')
+
+        # only the failing group is run again
+        self.assertIn('3 groups skipped, passed before', output)
+        self.assertIn('1 test\n    1 failure in tests', output)
+        self.assertEqual(len(cache), 3)
+
+        output, _ = self.build(DIMOD_VERSION='2')
+        self.assertIn('4 tests', output)
+        self.assertNotIn('skipped', output)
@@ -0,0 +1,343 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+import dimod
+import dwave.embedding
+import dwave.graphs
+import minorminer
+import numpy as np
+from dwave.embedding import verify_embedding
+from dwave.system import FixedEmbeddingComposite
+
+from dwaveoceansdk.embedding import (
+    ChainIndex, EmbeddingCache, ParallelFindEmbedding, VectorizedFixedEmbeddingComposite,
+    canonical_order, unembed_sampleset, uniform_torque_compensation)
+from dwaveoceansdk.testing import mock_qpu
+
+
+def path_embedding(S, T, random_seed):
+    """Embed every source node in a chain of ``random_seed % 3 + 1`` nodes
+    of a path target graph."""
+    length = random_seed % 3 + 1
+    return {v: list(range(i * length, (i + 1) * length))
+            for i, v in enumerate(sorted(set(v for edge in S for v in edge)))}
+
+
+def failing_embedding(S, T, random_seed):
+    raise ValueError("bad seed")
+
+
+class TestCanonicalOrder(unittest.TestCase):
+    def test_relabeled(self):
+        bqm = dimod.generators.gnp_random_bqm(20, .3, 'SPIN', random_state=3)
+
+        labels = list(bqm.variables)
+        random.Random(5).shuffle(labels)
+        mapping = dict(zip(bqm.variables, labels))
+
+        S = list(bqm.quadratic)
+        order = canonical_order(S)
+        relabeled_order = canonical_order([(mapping[u], mapping[v]) for u, v in S])
+
+        self.assertEqual([mapping[v] for v in order], relabeled_order)
+
+    def test_isolated(self):
+        self.assertEqual(set(canonical_order([('a', 'b'), ('c', 'c')])), {'a', 'b', 'c'})
+
+
+class TestEmbeddingCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.T = list(dwave.graphs.chimera_graph(4).edges)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_hit(self):
+        S = [(0, 1), (1, 2), (2, 0), (2, 3)]
+        relabeled = [('a', 'b'), ('b', 'c'), ('c', 'a'), ('c', 'd')]
+
+        with EmbeddingCache(self.tmpdir.name) as cache:
+            embedding = cache(S, self.T)
+            self.assertEqual(cache.stats()['misses'], 1)
+            verify_embedding(embedding, S, self.T)
+
+            with mock.patch.object(cache, 'find_embedding') as find_embedding:
+                embedding = cache(relabeled, self.T)
+            find_embedding.assert_not_called()
+
+            verify_embedding(embedding, relabeled, self.T)
+
+            stats = cache.stats()
+            self.assertEqual(stats['hits'], 1)
+            self.assertEqual(stats['entries'], 1)
+            self.assertEqual(stats['hit_rate'], .5)
+
+    def test_persistent(self):
+        S = [(0, 1), (1, 2)]
+
+        with EmbeddingCache(self.tmpdir.name) as cache:
+            cache(S, self.T)
+
+        with EmbeddingCache(self.tmpdir.name) as cache:
+            cache(S, self.T)
+            self.assertEqual(cache.stats()['hits'], 1)
+
+    def test_key(self):
+        S = [(0, 1), (1, 2)]
+
+        with EmbeddingCache(self.tmpdir.name) as cache:
+            cache(S, self.T)
+            cache(S, self.T, chainlength_patience=5)    # different parameters
+            cache(S, self.T[1:])                        # different target
+            cache([(0, 1), (1, 2), (2, 0)], self.T)     # different source
+            cache(S, self.T, verbose=0)                 # ignored parameter
+
+            self.assertEqual(cache.stats()['misses'], 4)
+            self.assertEqual(cache.stats()['hits'], 1)
+
+    def test_failure_not_cached(self):
+        find_embedding = mock.Mock(return_value={})
+
+        with EmbeddingCache(self.tmpdir.name, find_embedding=find_embedding) as cache:
+            self.assertEqual(cache([(0, 1)], self.T), {})
+            self.assertEqual(cache([(0, 1)], self.T), {})
+
+        self.assertEqual(find_embedding.call_count, 2)
+
+    def test_eviction(self):
+        # a 64kB store holds a few dozen small embeddings
+        with EmbeddingCache(self.tmpdir.name, size_limit=2**16) as cache:
+            for n in range(3, 80):
+                cache([(i, (i + 1) % n) for i in range(n)], self.T)
+            self.assertLess(cache.stats()['entries'], 77)
+
+    def test_clear(self):
+        with EmbeddingCache(self.tmpdir.name) as cache:
+            cache([(0, 1)], self.T)
+            cache.clear()
+            self.assertEqual(cache.stats()['entries'], 0)
+            self.assertEqual(cache.stats()['misses'], 0)
+
+    def test_embedding_composite(self):
+        bqm = dimod.generators.gnp_random_bqm(10, .5, 'SPIN', random_state=7)
+
+        with mock_qpu(), EmbeddingCache(self.tmpdir.name) as cache:
+            from dwave.system import DWaveSampler, EmbeddingComposite
+
+            sampler = EmbeddingComposite(DWaveSampler(), find_embedding=cache)
+            sampler.sample(bqm)
+            sampler.sample(bqm.relabel_variables({v: str(v) for v in bqm.variables},
+                                                 inplace=False))
+
+            self.assertEqual(cache.stats()['hits'], 1)
+
+
+class TestParallelFindEmbedding(unittest.TestCase):
+    def test_modes(self):
+        S = [(i, j) for i in range(6) for j in range(i)]
+        T = list(dwave.graphs.chimera_graph(4).edges)
+
+        for mode in ParallelFindEmbedding.MODES:
+            with self.subTest(mode=mode):
+                find_embedding = ParallelFindEmbedding(3, mode=mode, seed=4)
+                verify_embedding(find_embedding(S, T), S, T)
+
+    def test_best(self):
+        S = [(0, 0)]
+        T = [(i, i + 1) for i in range(10)]
+
+        find_embedding = ParallelFindEmbedding(3, mode='best', find_embedding=path_embedding,
+                                               max_workers=2)
+
+        # seeds 1, 2, 3 give chains of length 2, 3 and 1
+        self.assertEqual(find_embedding(S, T, random_seed=1), {0: [0]})
+
+    def test_first(self):
+        S = [(0, 0)]
+        T = [(i, i + 1) for i in range(10)]
+
+        find_embedding = ParallelFindEmbedding(1, find_embedding=path_embedding)
+        self.assertEqual(find_embedding(S, T, random_seed=1), {0: [0, 1]})
+
+    def test_invalid_discarded(self):
+        S = [(0, 1)]
+        T = [(0, 1), (1, 2)]
+
+        # chains of length 3 need more nodes than the target has
+        find_embedding = ParallelFindEmbedding(1, find_embedding=path_embedding)
+        self.assertEqual(find_embedding(S, T, random_seed=2), {})
+
+    def test_all_failed(self):
+        find_embedding = ParallelFindEmbedding(2, find_embedding=failing_embedding)
+
+        with self.assertRaises(RuntimeError):
+            find_embedding([(0, 1)], [(0, 1)])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ParallelFindEmbedding(mode='fastest')
+        with self.assertRaises(ValueError):
+            ParallelFindEmbedding(objective='min_energy')
+        with self.assertRaises(ValueError):
+            ParallelFindEmbedding(0)
+
+    def test_embedding_composite(self):
+        with mock_qpu():
+            from dwave.system import DWaveSampler, EmbeddingComposite
+
+            sampler = EmbeddingComposite(DWaveSampler(),
+                                         find_embedding=ParallelFindEmbedding(2))
+            sampleset = sampler.sample_ising({'a': -1, 'b': +1}, {('a', 'b'): -1})
+
+        self.assertEqual(sampleset.first.energy, -1)
+
+
+def random_target_sampleset(embedding, vartype, num_reads, seed):
+    rng = np.random.default_rng(seed)
+    qubits = sorted(q for chain in embedding.values() for q in chain)
+    values = [-1, 1] if vartype is dimod.SPIN else [0, 1]
+    samples = rng.choice(values, size=(num_reads, len(qubits)))
+    return dimod.SampleSet.from_samples((samples, qubits[::-1]), vartype, 0)
+
+
+class TestUnembedSampleset(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        qubits = rng.permutation(200).tolist()
+        self.embedding = {f'v{v}': qubits[10*v:10*v + v % 4 + 1] for v in range(20)}
+        self.bqm = dimod.generators.gnp_random_bqm(
+            list(self.embedding), .3, 'SPIN', random_state=2)
+
+    def test_matches_dwave_embedding(self):
+        for vartype in [dimod.SPIN, dimod.BINARY]:
+            bqm = self.bqm.change_vartype(vartype, inplace=False)
+            target = random_target_sampleset(self.embedding, vartype, 50, 1)
+
+            for method in [dwave.embedding.majority_vote, dwave.embedding.discard]:
+                with self.subTest(vartype=vartype, method=method.__name__):
+                    expected = dwave.embedding.unembed_sampleset(
+                        target, self.embedding, bqm, chain_break_method=method,
+                        chain_break_fraction=True)
+
+                    sampleset = unembed_sampleset(
+                        target, self.embedding, bqm, chain_break_method=method,
+                        chain_break_fraction=True)
+
+                    self.assertEqual(sampleset.variables, expected.variables)
+                    np.testing.assert_array_equal(sampleset.record.sample,
+                                                  expected.record.sample)
+                    np.testing.assert_allclose(sampleset.record.energy,
+                                               expected.record.energy)
+                    np.testing.assert_allclose(sampleset.record.chain_break_fraction,
+                                               expected.record.chain_break_fraction)
+
+    def test_index_reused(self):
+        target = random_target_sampleset(self.embedding, dimod.SPIN, 5, 2)
+        embedding = dict(self.embedding, extra=[1000, 1001])
+        target = dimod.append_variables(target, {1000: 1, 1001: -1})
+        bqm = self.bqm.copy()
+        bqm.add_variable('extra')
+
+        first = unembed_sampleset(target, embedding, bqm)
+        second = unembed_sampleset(target, embedding, bqm)
+
+        self.assertFalse(first.info['unembedding_timing']['index_reused'])
+        self.assertTrue(second.info['unembedding_timing']['index_reused'])
+        self.assertNotIn('chain_break_fraction', second.record.dtype.names)
+
+    def test_single_qubit_chains(self):
+        embedding = {'a': [0], 'b': [1]}
+        bqm = dimod.BinaryQuadraticModel({}, {'ab': -1}, 0, 'SPIN')
+        target = dimod.SampleSet.from_samples(([[1, -1], [1, 1]], [0, 1]), 'SPIN', 0)
+
+        sampleset = unembed_sampleset(target, embedding, bqm, chain_break_fraction=True)
+
+        np.testing.assert_array_equal(sampleset.record.chain_break_fraction, [0, 0])
+
+    def test_return_embedding(self):
+        target = random_target_sampleset(self.embedding, dimod.SPIN, 5, 3)
+
+        sampleset = unembed_sampleset(target, self.embedding, self.bqm, return_embedding=True)
+
+        context = sampleset.info['embedding_context']
+        self.assertEqual(context['chain_break_method'], 'majority_vote')
+        self.assertEqual(context['embedding'], self.embedding)
+
+    def test_not_vectorized(self):
+        target = random_target_sampleset(self.embedding, dimod.SPIN, 5, 3)
+
+        sampleset = unembed_sampleset(target, self.embedding, self.bqm,
+                                      chain_break_method=dwave.embedding.weighted_random,
+                                      chain_break_fraction=True)
+
+        self.assertIn('chain_break_fraction', sampleset.record.dtype.names)
+        self.assertNotIn('unembedding_timing', sampleset.info)
+
+    def test_uniform_torque_compensation(self):
+        for bqm in [self.bqm, dimod.BinaryQuadraticModel({'a': 1}, {}, 0, 'SPIN')]:
+            self.assertAlmostEqual(
+                uniform_torque_compensation(bqm, prefactor=2),
+                dwave.embedding.chain_strength.uniform_torque_compensation(bqm, prefactor=2))
+
+
+class TestChainIndex(unittest.TestCase):
+    def test_labels(self):
+        index = ChainIndex([('a', 'b'), ('c',)])
+        samples = np.array([[0, 1, 1], [1, 1, 0]])
+
+        unembedded, rows, broken = index.discard(samples, ['c', 'b', 'a'])
+
+        np.testing.assert_array_equal(unembedded, [[1, 0]])
+        np.testing.assert_array_equal(rows, [0])
+        with self.assertRaises(ValueError):
+            index.broken(samples, ['c', 'b', 'd'])
+
+    def test_vartype(self):
+        index = ChainIndex([(0, 1), (2,)])
+        ones = np.ones((2, 3), dtype=np.int8)
+
+        # binary samples without zeros are not taken for spin-valued ones
+        self.assertFalse(index._sums(ones, [0, 1, 2], 'BINARY')[1])
+        self.assertTrue(index._sums(ones, [0, 1, 2], dimod.SPIN)[1])
+        self.assertTrue(index._sums(ones, [0, 1, 2], None)[1])
+
+        unembedded, _, broken = index.majority_vote(ones, [0, 1, 2], dimod.BINARY)
+        np.testing.assert_array_equal(unembedded, ones[:, :2])
+        self.assertFalse(broken.any())
+
+    def test_empty_chain(self):
+        with self.assertRaises(ValueError):
+            ChainIndex([(0,), ()])
+
+
+class TestVectorizedComposites(unittest.TestCase):
+    def test_fixed_embedding(self):
+        embedding = {'a': [0, 1], 'b': [2], 'c': [3, 4]}
+        edges = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 0)]
+        child = dimod.StructureComposite(dimod.ExactSolver(), range(5), edges)
+        bqm = dimod.BinaryQuadraticModel({'a': .5}, {'ab': -1, 'bc': 1, 'ca': -1}, 0, 'SPIN')
+
+        expected = FixedEmbeddingComposite(child, embedding).sample(bqm)
+        sampleset = VectorizedFixedEmbeddingComposite(child, embedding).sample(bqm)
+
+        np.testing.assert_array_equal(sampleset.record.sample, expected.record.sample)
+        np.testing.assert_allclose(sampleset.record.chain_break_fraction,
+                                   expected.record.chain_break_fraction)
+        self.assertIn('unembedding_timing', sampleset.info)
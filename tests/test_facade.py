@@ -0,0 +1,97 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import subprocess
+import sys
+import unittest
+
+import dwaveoceansdk
+
+# heavy dependencies that must not be pulled in by ``import dwaveoceansdk``
+FORBIDDEN_MODULES = ('numpy', 'networkx', 'dwave.cloud')
+
+IMPORT_TIME_LIMIT_US = 100_000
+
+
+def importtime(statement):
+    """Run ``statement`` in a fresh interpreter and return a dict mapping
+    each imported module to its cumulative import time in microseconds."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                          capture_output=True, text=True, check=True)
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def imported(modules, package):
+    """Return True if ``package`` or any of its submodules is in ``modules``."""
+    return any(name == package or name.startswith(package + '.') for name in modules)
+
+
+class TestImportTime(unittest.TestCase):
+    def test_no_heavy_imports(self):
+        modules = importtime('import dwaveoceansdk')
+
+        self.assertIn('dwaveoceansdk', modules)
+        for package in FORBIDDEN_MODULES:
+            with self.subTest(package=package):
+                self.assertFalse(imported(modules, package),
+                                 f"importing dwaveoceansdk imported {package!r}")
+
+    def test_import_time(self):
+        modules = importtime('import dwaveoceansdk')
+        self.assertLess(modules['dwaveoceansdk'], IMPORT_TIME_LIMIT_US)
+
+    def test_only_used_component_imported(self):
+        modules = importtime('import dwaveoceansdk; dwaveoceansdk.BinaryQuadraticModel')
+
+        self.assertTrue(imported(modules, 'dimod'))
+        self.assertFalse(imported(modules, 'dwave.system'))
+        self.assertFalse(imported(modules, 'hybrid'))
+
+
+class TestFacade(unittest.TestCase):
+    def test_all_names_resolve(self):
+        for name in dwaveoceansdk.__all__:
+            with self.subTest(name=name):
+                self.assertTrue(hasattr(dwaveoceansdk, name))
+
+    def test_same_objects(self):
+        import dimod
+        import dwave.system
+        import hybrid
+
+        self.assertIs(dwaveoceansdk.BinaryQuadraticModel, dimod.BinaryQuadraticModel)
+        self.assertIs(dwaveoceansdk.EmbeddingComposite, dwave.system.EmbeddingComposite)
+        self.assertIs(dwaveoceansdk.Loop, hybrid.Loop)
+
+    def test_missing(self):
+        with self.assertRaises(AttributeError):
+            dwaveoceansdk.NotAnOceanName
+
+    def test_dir(self):
+        self.assertIn('DWaveSampler', dir(dwaveoceansdk))
+        self.assertIn('__version__', dir(dwaveoceansdk))
+
+    def test_sample(self):
+        bqm = dwaveoceansdk.BinaryQuadraticModel.from_ising({'a': -1}, {})
+        sampleset = dwaveoceansdk.ExactSolver().sample(bqm)
+        self.assertEqual(sampleset.first.energy, -1)
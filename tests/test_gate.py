@@ -0,0 +1,175 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import unittest
+from unittest import mock
+
+import numpy as np
+import dwave.gate.operations as ops
+from dwave.gate import Circuit, ParametricCircuit
+from dwave.gate.primitives import Variable
+from dwave.gate.simulator import simulate
+
+from dwaveoceansdk import gate
+from dwaveoceansdk.gate import simulate_batch, simulate_sparse
+
+SINGLE = [ops.X, ops.Y, ops.Z, ops.Hadamard, ops.S, ops.T, ops.Identity]
+PARAMETRIC = [ops.RX, ops.RY, ops.RZ]
+CONTROLLED = [ops.CX, ops.CY, ops.CZ, ops.CHadamard]
+PARAMETRIC_CONTROLLED = [ops.CRX, ops.CRY, ops.CRZ]
+
+
+def random_circuit(num_qubits, num_operations, seed):
+    """Parametric circuit using every supported kind of operation."""
+    rng = np.random.default_rng(seed)
+
+    circuit = ParametricCircuit(num_qubits)
+    with circuit.context as (p, q, c):
+        k = 0
+        for _ in range(num_operations):
+            kind = rng.integers(8)
+            u, v, w = (q[i] for i in rng.permutation(num_qubits)[:3])
+            if kind == 0:
+                SINGLE[rng.integers(len(SINGLE))](u)
+            elif kind == 1:
+                PARAMETRIC[rng.integers(len(PARAMETRIC))](p[k], u)
+                k += 1
+            elif kind == 2:
+                CONTROLLED[rng.integers(len(CONTROLLED))](u, v)
+            elif kind == 3:
+                PARAMETRIC_CONTROLLED[rng.integers(len(PARAMETRIC_CONTROLLED))](p[k], u, v)
+                k += 1
+            elif kind == 4:
+                ops.SWAP((u, v))
+            elif kind == 5:
+                ops.CSWAP((u, v, w))
+                ops.CCX((u, v, w))
+            elif kind == 6:
+                ops.Rotation([p[k], .3, p[k + 1]], u)
+                k += 2
+            else:
+                ops.RX([.7], u)
+    return circuit
+
+
+def reference_state(circuit, row, little_endian=False):
+    columns = {variable.name: i for i, variable in enumerate(circuit._parameter_register)}
+    parameters = [[row[columns[x.name]] if isinstance(x, Variable) else x for x in op.parameters]
+                  if isinstance(op, ops.ParametricOperation) else None
+                  for op in circuit.circuit]
+    evaluated = circuit.eval(parameters)
+    simulate(evaluated, little_endian=little_endian)
+    return evaluated.state
+
+
+class TestSimulateBatch(unittest.TestCase):
+    def test_random_circuits(self):
+        for seed in range(3):
+            circuit = random_circuit(5, 60, seed)
+            parameters = np.random.default_rng(seed).uniform(
+                -np.pi, np.pi, size=(4, circuit.num_parameters))
+
+            for little_endian in (False, True):
+                with self.subTest(seed=seed, little_endian=little_endian):
+                    states = simulate_batch(circuit, parameters, little_endian=little_endian)
+
+                    self.assertEqual(states.shape, (4, 32))
+                    for row, state in zip(parameters, states):
+                        np.testing.assert_allclose(
+                            state, reference_state(circuit, row, little_endian), atol=1e-12)
+
+    def test_compiled_kernels(self):
+        circuit = random_circuit(4, 40, 7)
+        parameters = np.random.default_rng(7).uniform(size=(3, circuit.num_parameters))
+
+        with mock.patch.object(gate, '_KERNEL_MIN_SIZE', 1):
+            states = simulate_batch(circuit, parameters)
+
+        for row, state in zip(parameters, states):
+            np.testing.assert_allclose(state, reference_state(circuit, row), atol=1e-12)
+
+    def test_complex64(self):
+        circuit = random_circuit(4, 30, 1)
+        parameters = np.zeros((2, circuit.num_parameters))
+
+        states = simulate_batch(circuit, parameters, dtype=np.complex64)
+
+        self.assertEqual(states.dtype, np.complex64)
+        np.testing.assert_allclose(states[0], reference_state(circuit, parameters[0]),
+                                   atol=1e-5)
+
+    def test_circuit(self):
+        circuit = Circuit(3)
+        with circuit.context as (q, c):
+            ops.Hadamard(q[0])
+            ops.CX(q[0], q[2])
+
+        states = simulate_batch(circuit)
+
+        simulate(circuit)
+        np.testing.assert_allclose(states, [circuit.state])
+
+    def test_invalid_parameters(self):
+        circuit = random_circuit(3, 20, 0)
+        with self.assertRaises(ValueError):
+            simulate_batch(circuit)
+        with self.assertRaises(ValueError):
+            simulate_batch(circuit, np.zeros((2, circuit.num_parameters + 1)))
+
+    def test_measurement(self):
+        circuit = Circuit(1, 1)
+        with circuit.context as (q, c):
+            ops.Hadamard(q[0])
+            ops.Measurement(q[0]) | c[0]
+
+        with self.assertRaises(ValueError):
+            simulate_batch(circuit)
+        with self.assertRaises(ValueError):
+            simulate_sparse(circuit)
+
+
+class TestSimulateSparse(unittest.TestCase):
+    def test_random_circuits(self):
+        for seed in range(3):
+            circuit = random_circuit(5, 60, seed)
+            row = np.random.default_rng(seed).uniform(-np.pi, np.pi, circuit.num_parameters)
+
+            for little_endian in (False, True):
+                with self.subTest(seed=seed, little_endian=little_endian):
+                    indices, amplitudes = simulate_sparse(circuit, row,
+                                                          little_endian=little_endian)
+
+                    self.assertTrue((np.diff(indices) > 0).all())
+                    state = np.zeros(32, dtype=complex)
+                    state[indices] = amplitudes
+                    np.testing.assert_allclose(
+                        state, reference_state(circuit, row, little_endian), atol=1e-12)
+
+    def test_ghz(self):
+        circuit = Circuit(50)
+        with circuit.context as (q, c):
+            ops.Hadamard(q[0])
+            for i in range(49):
+                ops.CX(q[i], q[i + 1])
+            ops.RZ([np.pi], q[3])
+            ops.SWAP((q[0], q[49]))
+
+        indices, amplitudes = simulate_sparse(circuit)
+
+        self.assertEqual(indices.tolist(), [0, 2**50 - 1])
+        np.testing.assert_allclose(np.abs(amplitudes), [2**-.5, 2**-.5])
+
+    def test_too_many_qubits(self):
+        with self.assertRaises(ValueError):
+            simulate_sparse(Circuit(63))
@@ -0,0 +1,155 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import tempfile
+import unittest
+
+import dimod
+import dwave.graphs
+import networkx as nx
+import numpy as np
+import scipy.sparse
+
+from dwaveoceansdk.graphs import IndependentSet, MaxCut, VertexColoring, VertexCover
+from dwaveoceansdk.topology import chimera_topology
+
+
+def weighted_graph(seed):
+    G = nx.gnp_random_graph(10, .4, seed=seed)
+    G = nx.relabel_nodes(G, {v: f'n{v}' for v in G})
+    rng = np.random.default_rng(seed)
+    for u, v in G.edges:
+        G.edges[u, v]['weight'] = rng.uniform(-1, 1)
+    for v in G:
+        G.nodes[v]['weight'] = rng.uniform(.5, 2)
+    return G
+
+
+def relabeled(problem, labels):
+    return problem.bqm.relabel_variables(dict(enumerate(labels)), inplace=False)
+
+
+class TestMaxCut(unittest.TestCase):
+    def test_matches_dwave_graphs(self):
+        G = weighted_graph(1)
+
+        for weight in [None, 'weight']:
+            with self.subTest(weight=weight):
+                problem = MaxCut(G, weight=weight)
+
+                J = {(u, v): 1 if weight is None else G[u][v][weight] for u, v in G.edges}
+                expected = dimod.BinaryQuadraticModel.from_ising({v: 0 for v in G}, J)
+                self.assertTrue(relabeled(problem, G).is_almost_equal(expected))
+
+        solver = dimod.ExactSolver()
+        cut = MaxCut(G, weight='weight').solve(solver)
+        expected = dwave.graphs.weighted_maximum_cut(G, solver)
+        self.assertIn(cut, [expected, set(G) - expected])
+
+    def test_set_weights(self):
+        G = weighted_graph(2)
+        problem = MaxCut(G)
+        bqm = problem.bqm
+
+        weights = np.array([G[u][v]['weight'] for u, v in problem.nodes[problem.edges]])
+        problem.set_weights(weights)
+
+        self.assertIs(problem.bqm, bqm)
+        self.assertTrue(problem.bqm.is_almost_equal(MaxCut(G, weight='weight').bqm))
+        with self.assertRaises(ValueError):
+            problem.set_weights(weights[1:])
+
+    def test_sparse_matrix(self):
+        # upper triangle, or both, with the same weights
+        upper = scipy.sparse.csr_array(([2., -1.], ([0, 1], [1, 2])), shape=(4, 4))
+
+        for matrix in [upper, upper + upper.T]:
+            problem = MaxCut(matrix)
+
+            self.assertEqual(problem.num_nodes, 4)
+            self.assertEqual(problem.bqm.quadratic, {(1, 0): 2, (2, 1): -1})
+
+    def test_topology(self):
+        with tempfile.TemporaryDirectory() as directory:
+            T = chimera_topology(1, directory=directory)
+
+        problem = MaxCut(T)
+
+        self.assertEqual(problem.bqm.num_interactions, 16)
+        self.assertIn(problem.solve(dimod.ExactSolver()), [set(range(4)), set(range(4, 8))])
+
+    def test_decode_variable_order(self):
+        problem = MaxCut(nx.path_graph(3))
+        sampleset = dimod.SampleSet.from_samples(([[1, 1, -1]], [2, 0, 1]), 'SPIN', 0)
+
+        np.testing.assert_array_equal(problem.decode(sampleset), [[True, False, True]])
+
+
+class TestIndependentSet(unittest.TestCase):
+    def test_matches_dimod(self):
+        G = weighted_graph(3)
+
+        for weight in [None, 'weight']:
+            with self.subTest(weight=weight):
+                problem = IndependentSet(G, weight=weight, lagrange=3)
+
+                expected = dimod.generators.maximum_weight_independent_set(
+                    G.edges, G.nodes(data=weight, default=1) if weight else None,
+                    strength_multiplier=3)
+                self.assertTrue(relabeled(problem, G).is_almost_equal(expected))
+
+        solver = dimod.ExactSolver()
+        self.assertEqual(
+            set(IndependentSet(G, weight='weight').solve(solver)),
+            set(dwave.graphs.maximum_weighted_independent_set(G, solver, weight='weight')))
+
+    def test_set_weights(self):
+        G = weighted_graph(4)
+        problem = IndependentSet(G)
+
+        problem.set_weights([G.nodes[v]['weight'] for v in G])
+
+        self.assertTrue(problem.bqm.is_almost_equal(IndependentSet(G, weight='weight').bqm))
+
+    def test_vertex_cover(self):
+        G = weighted_graph(5)
+        solver = dimod.ExactSolver()
+
+        cover = VertexCover(G).solve(solver)
+
+        self.assertTrue(dwave.graphs.is_vertex_cover(G, cover))
+        self.assertEqual(len(cover),
+                         len(G) - len(dwave.graphs.maximum_independent_set(G, solver)))
+
+
+class TestVertexColoring(unittest.TestCase):
+    def test_matches_dimod(self):
+        G = nx.relabel_nodes(nx.cycle_graph(5), {v: f'n{v}' for v in range(5)})
+        colors = ['r', 'g', 'b']
+
+        problem = VertexColoring(G, colors)
+
+        labels = [(v, c) for v in G for c in colors]
+        expected = dimod.generators.vertex_coloring(G, colors)
+        self.assertTrue(relabeled(problem, labels).is_almost_equal(expected))
+
+        coloring = problem.solve(dimod.ExactSolver())
+        self.assertTrue(dwave.graphs.is_vertex_coloring(G, coloring))
+
+    def test_decode(self):
+        problem = VertexColoring(nx.path_graph(3), 2)
+        sampleset = dimod.SampleSet.from_samples([[1, 1, 0, 0, 0, 1]], 'BINARY', 0)
+
+        np.testing.assert_array_equal(problem.decode(sampleset), [[1, -1, 1]])
+        self.assertEqual(problem._result(problem.decode(sampleset)[0]), {0: 1, 2: 1})
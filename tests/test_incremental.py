@@ -0,0 +1,211 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import copy
+import pickle
+import unittest
+
+import dimod
+import hybrid
+import numpy as np
+from hybrid.exceptions import EndOfStream
+from hybrid.utils import bqm_induced_by, flip_energy_gains
+
+from dwaveoceansdk.incremental import (
+    IncrementalEnergy, IncrementalEnergyImpactDecomposer, IncrementalSplatComposer)
+
+
+class TestIncrementalEnergy(unittest.TestCase):
+    def test_update(self):
+        for vartype in ['SPIN', 'BINARY']:
+            with self.subTest(vartype=vartype):
+                bqm = dimod.generators.gnp_random_bqm(50, .2, vartype, random_state=1)
+                bqm.offset = 1.5
+                rng = np.random.default_rng(2)
+                values = [-1, 1] if vartype == 'SPIN' else [0, 1]
+
+                energy = IncrementalEnergy(bqm, rng.choice(values, 50))
+                for _ in range(20):
+                    indices = rng.choice(50, 5, replace=False)
+                    energy.update(indices, rng.choice(values, 5))
+
+                    sample = dict(zip(bqm.variables, energy.sample))
+                    self.assertAlmostEqual(energy.energy, bqm.energy(sample))
+
+                gains = dict((v, gain) for gain, v in flip_energy_gains(bqm, sample))
+                np.testing.assert_allclose(energy.gains(), [gains[v] for v in bqm.variables])
+
+    def test_affected(self):
+        bqm = dimod.BinaryQuadraticModel({}, {(0, 1): 1, (1, 2): 1, (3, 4): 1}, 0, 'SPIN')
+        energy = IncrementalEnergy(bqm, [1] * 5)
+
+        self.assertEqual(energy.update([0, 3], [-1, 1]).tolist(), [0, 1])
+        self.assertEqual(energy.update([0], [-1]).tolist(), [])
+
+    def test_changes_since(self):
+        bqm = dimod.generators.ran_r(1, 20, seed=3)
+        energy = IncrementalEnergy(bqm, [1] * 20, history=2)
+        sequence = energy.sequence
+
+        a = energy.update([0], [-1])
+        b = energy.update([5], [-1])
+        np.testing.assert_array_equal(energy.changes_since(sequence), np.union1d(a, b))
+        self.assertEqual(len(energy.changes_since(energy.sequence)), 0)
+
+        energy.update([7], [-1])
+        self.assertIsNone(energy.changes_since(sequence))
+
+        energy.set_sample([1] * 20)
+        self.assertIsNone(energy.changes_since(sequence + 3))
+
+    def test_induced_bqm(self):
+        bqm = dimod.generators.gnp_random_bqm(30, .3, 'BINARY', random_state=4)
+        sample = np.random.default_rng(5).integers(2, size=30)
+        energy = IncrementalEnergy(bqm, sample)
+
+        variables = [3, 7, 11, 12, 20]
+        induced = energy.induced_bqm(variables)
+        expected = bqm_induced_by(bqm, variables, dict(enumerate(sample)))
+        self.assertEqual(set(induced.variables), set(expected.variables))
+        for v in variables:
+            self.assertAlmostEqual(induced.get_linear(v), expected.get_linear(v))
+        self.assertEqual(induced.quadratic, expected.quadratic)
+
+    def test_sync(self):
+        bqm = dimod.BinaryQuadraticModel({'a': 1, 'b': -1}, {'ab': 2, 'bc': -1}, 0, 'SPIN')
+        energy = IncrementalEnergy(bqm)
+
+        # lowest energy sample, reordered and of the other vartype
+        samples = dimod.SampleSet.from_samples_bqm(
+            [{'c': 0, 'b': 1, 'a': 0}, {'c': 1, 'b': 1, 'a': 1}], bqm.binary)
+        energy.sync(samples)
+
+        self.assertEqual(energy.sample.tolist(), [-1, 1, -1])
+        self.assertEqual(energy.energy, samples.first.energy)
+
+        with self.assertRaises(ValueError):
+            energy.sync(dimod.SampleSet.from_samples({'a': 1}, 'SPIN', 0))
+
+    def test_copies(self):
+        bqm = dimod.generators.ran_r(1, 10, seed=6)
+        energy = IncrementalEnergy(bqm, [1] * 10)
+
+        # shared by hybrid's deep-copied states
+        self.assertIs(copy.deepcopy(energy), energy)
+        self.assertTrue(energy.matches(copy.deepcopy(bqm)))
+        self.assertFalse(energy.matches(dimod.generators.gnp_random_bqm(10, .5, 'SPIN')))
+
+        # same variables, vartype, offset and linear biases
+        self.assertFalse(energy.matches(dimod.generators.ran_r(1, 10, seed=7)))
+        modified = copy.deepcopy(bqm)
+        modified.set_quadratic(0, 1, -modified.get_quadratic(0, 1))
+        self.assertFalse(energy.matches(modified))
+        self.assertTrue(energy.matches(bqm.relabel_variables({}, inplace=False)))
+
+        new = pickle.loads(pickle.dumps(energy))
+        self.assertEqual(new.energy, energy.energy)
+        with new.lock:
+            new.update([0], [-1])
+
+
+class TestIncrementalEnergyImpactDecomposer(unittest.TestCase):
+    def test_same_subproblems(self):
+        bqm = dimod.generators.ran_r(1, 200, seed=8)
+        sampler = hybrid.SimulatedAnnealingSubproblemSampler(num_sweeps=10)
+
+        for traversal in ['energy', 'bfs', 'pfs']:
+            for rolling in [True, False]:
+                with self.subTest(traversal=traversal, rolling=rolling):
+                    parameters = dict(size=15, traversal=traversal, rolling=rolling,
+                                      rolling_history=.5)
+                    reference = hybrid.EnergyImpactDecomposer(**parameters)
+                    decomposer = IncrementalEnergyImpactDecomposer(**parameters)
+                    composer = IncrementalSplatComposer()
+
+                    state = hybrid.State.from_problem(bqm)
+                    for _ in range(15):
+                        expected = reference.next(state).subproblem
+                        state = decomposer.next(state)
+                        self.assertEqual(state.subproblem, expected)
+
+                        state = sampler.next(state.updated(subsamples=None))
+                        state = composer.next(state)
+
+    def test_min_gain(self):
+        bqm = dimod.BinaryQuadraticModel({'a': 1, 'b': -1, 'c': 3}, {}, 0, 'SPIN')
+        state = hybrid.State.from_sample({'a': 1, 'b': 1, 'c': 1}, bqm)
+
+        subproblem = IncrementalEnergyImpactDecomposer(size=3, min_gain=0).next(state).subproblem
+        self.assertEqual(set(subproblem.variables), {'b'})
+
+    def test_rewind(self):
+        bqm = dimod.generators.ran_r(1, 10, seed=9)
+        decomposer = IncrementalEnergyImpactDecomposer(size=5, silent_rewind=False)
+        state = hybrid.State.from_problem(bqm)
+
+        first = set(decomposer.next(state).subproblem.variables)
+        second = set(decomposer.next(state).subproblem.variables)
+        self.assertEqual(first | second, set(bqm.variables))
+
+        with self.assertRaises(EndOfStream):
+            decomposer.next(state)
+
+        self.assertEqual(set(decomposer.next(state).subproblem.variables), first)
+
+    def test_new_problem(self):
+        decomposer = IncrementalEnergyImpactDecomposer(size=5)
+        decomposer.next(hybrid.State.from_problem(dimod.generators.ran_r(1, 20, seed=1)))
+
+        bqm = dimod.generators.ran_r(1, 20, seed=2)
+        state = hybrid.State.from_problem(bqm)
+        out = decomposer.next(state)
+        self.assertEqual(out.subproblem,
+                         hybrid.EnergyImpactDecomposer(size=5).next(state).subproblem)
+        self.assertIs(out.incremental_energy.bqm, bqm)
+
+
+class TestIncrementalSplatComposer(unittest.TestCase):
+    def test_compose(self):
+        bqm = dimod.generators.ran_r(1, 20, seed=10)
+        state = IncrementalEnergyImpactDecomposer(size=5).next(hybrid.State.from_problem(bqm))
+        state = hybrid.SimulatedAnnealingSubproblemSampler().next(state)
+
+        expected = hybrid.SplatComposer().next(state).samples
+        samples = IncrementalSplatComposer().next(state).samples
+
+        np.testing.assert_array_equal(samples.record.sample, expected.record.sample)
+        self.assertEqual(samples.first.energy, expected.first.energy)
+
+    def test_fallback(self):
+        bqm = dimod.generators.ran_r(1, 20, seed=11)
+        state = hybrid.State.from_problem(bqm)
+        state = hybrid.EnergyImpactDecomposer(size=5).next(state)
+        state = hybrid.SimulatedAnnealingSubproblemSampler(num_reads=3).next(state)
+        state = state.updated(samples=dimod.concatenate([state.samples] * 3))
+
+        expected = hybrid.SplatComposer().next(state).samples
+        samples = IncrementalSplatComposer().next(state).samples
+        self.assertEqual(samples, expected)
+
+    def test_loop(self):
+        bqm = dimod.generators.ran_r(1, 100, seed=12)
+        workflow = hybrid.Loop(
+            IncrementalEnergyImpactDecomposer(size=10)
+            | hybrid.SimulatedAnnealingSubproblemSampler()
+            | IncrementalSplatComposer()
+            | hybrid.Const(subsamples=None), max_iter=10)
+
+        state = workflow.run(hybrid.State.from_problem(bqm)).result()
+
+        self.assertEqual(state.samples.first.energy, bqm.energy(state.samples.first.sample))
@@ -0,0 +1,272 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import gzip
+import json
+import unittest
+
+import numpy as np
+from dwave.inspector.server import app
+from dwave.inspector.storage import problem_store
+
+from dwaveoceansdk import inspector
+from dwaveoceansdk.inspector import (
+    InspectorPayload, aggregate_answer, decode_arrays, encode_arrays)
+
+
+def problem_data(problem_id='p', num_reads=50, num_variables=7, seed=0):
+    """Inspector problem data with many duplicate samples."""
+    rng = np.random.default_rng(seed)
+    embedding = {f'v{i}': [2 * i, 2 * i + 1] for i in range(num_variables)}
+    distinct = rng.choice([-1, 1], (5, num_variables))
+    rows = rng.integers(0, 5, num_reads)
+    solutions = np.repeat(distinct[rows], 2, axis=1)
+    energies = -distinct.sum(axis=1).astype(float)[rows]
+    return dict(
+        ready=True,
+        details=dict(id=problem_id, type='ising', solver='mock', label=None),
+        data=dict(solver='mock', type='ising', params={},
+                  data=dict(format='qp', lin=[0.] * 2 * num_variables, quad=[],
+                            embedding=embedding)),
+        answer=dict(format='qp', solutions=solutions.tolist(), energies=energies.tolist(),
+                    num_occurrences=[1] * num_reads,
+                    active_variables=list(range(2 * num_variables)),
+                    num_variables=2 * num_variables),
+        unembedded_answer=dict(format='qp', vartype='SPIN',
+                               solutions=distinct[rows].tolist(), energies=energies.tolist(),
+                               num_occurrences=[1] * num_reads,
+                               active_variables=list(embedding),
+                               num_variables=num_variables),
+        warnings=[], rel={})
+
+
+class TestArrays(unittest.TestCase):
+    def test_round_trip(self):
+        arrays = dict(a=np.arange(5, dtype=np.int32), b=np.ones((2, 3)),
+                      c=np.array([1, 2, 3], dtype=np.uint8), d=np.zeros(0))
+        page = encode_arrays(arrays, page=3)
+
+        decoded, metadata = decode_arrays(page)
+        self.assertEqual(metadata, dict(page=3))
+        for name, array in arrays.items():
+            np.testing.assert_array_equal(decoded[name], array)
+            self.assertEqual(decoded[name].dtype, array.dtype)
+
+        # every array is aligned for a typed array view
+        (length,) = np.frombuffer(page[:4], '<u4')
+        self.assertEqual((4 + length) % 8, 0)
+        for spec in json.loads(page[4:4 + length])['arrays']:
+            self.assertEqual(spec['offset'] % 8, 0)
+
+    def test_unsupported(self):
+        with self.assertRaises(ValueError):
+            encode_arrays(dict(a=np.array(['x'])))
+        with self.assertRaises(ValueError):
+            encode_arrays(dict(a=np.arange(3, dtype='>i4')))
+
+
+class TestAggregateAnswer(unittest.TestCase):
+    def test_aggregate(self):
+        data = problem_data()
+        answer = aggregate_answer(data['answer'])
+
+        solutions = np.array(data['answer']['solutions'])
+        self.assertEqual(len(answer['solutions']), len(np.unique(solutions, axis=0)))
+        self.assertEqual(answer['num_occurrences'].sum(), 50)
+        self.assertTrue((np.diff(answer['energies']) >= 0).all())
+        for solution, energy, count in zip(answer['solutions'], answer['energies'],
+                                           answer['num_occurrences']):
+            matches = (solutions == solution).all(axis=1)
+            self.assertEqual(matches.sum(), count)
+            self.assertEqual(np.array(data['answer']['energies'])[matches][0], energy)
+
+        self.assertEqual(answer['format'], 'qp')
+
+    def test_ties(self):
+        answer = aggregate_answer(dict(solutions=[[1, 1], [-1, 1], [1, 1], [1, -1]],
+                                       energies=[0., 0., 0., -1.],
+                                       num_occurrences=[2, 1, 3, 1]))
+        self.assertEqual(answer['solutions'].tolist(), [[1, -1], [1, 1], [-1, 1]])
+        self.assertEqual(answer['num_occurrences'].tolist(), [1, 5, 1])
+
+
+class TestInspectorPayload(unittest.TestCase):
+    def test_samples(self):
+        data = problem_data(num_reads=200, num_variables=11)
+        payload = InspectorPayload(data, page_size=3)
+
+        for name in ('answer', 'unembedded_answer'):
+            answer = payload.answer(name)
+            pages = payload.summary()['pages'][name]
+            self.assertEqual(pages['num_pages'], 2)
+            self.assertEqual(pages['num_reads'], 200)
+
+            solutions, energies = [], []
+            for page in range(pages['num_pages']):
+                arrays, metadata = decode_arrays(payload.samples(page, name))
+                self.assertEqual(metadata['offset'], 3 * page)
+                self.assertTrue(metadata['packed'])
+                low, high = metadata['values']
+                bits = np.unpackbits(arrays['solutions'], axis=1,
+                                     count=metadata['num_variables'])
+                solutions.extend(np.where(bits, high, low).tolist())
+                energies.extend(arrays['energies'].tolist())
+            self.assertEqual(solutions, answer['solutions'].tolist())
+            self.assertEqual(energies, answer['energies'].tolist())
+
+        with self.assertRaises(ValueError):
+            payload.samples(2)
+
+    def test_paired(self):
+        data = problem_data(num_reads=100)
+        answer, unembedded = data['answer'], data['unembedded_answer']
+
+        # broken chains give distinct embedded samples the same logical sample
+        rng = np.random.default_rng(1)
+        for row in rng.choice(100, 20, replace=False):
+            answer['solutions'][row][1] *= -1
+            answer['energies'][row] += 2
+        unembedded['energies'] = [-e for e in unembedded['energies']]
+
+        expected = {}
+        for row in range(100):
+            expected[tuple(answer['solutions'][row])] = (unembedded['solutions'][row],
+                                                         unembedded['energies'][row])
+
+        def check(solutions, logical, energies):
+            self.assertEqual(len(solutions), len(logical))
+            for solution, sample, energy in zip(solutions, logical, energies):
+                self.assertEqual(expected[tuple(solution)], (sample, energy))
+
+        payload = InspectorPayload(data, page_size=4, max_samples=5)
+        aggregated = payload.answer()
+        self.assertGreater(len(aggregated['energies']), 5)
+        check(aggregated['solutions'].tolist(),
+              payload.answer('unembedded_answer')['solutions'].tolist(),
+              payload.answer('unembedded_answer')['energies'].tolist())
+        np.testing.assert_array_equal(payload.answer('unembedded_answer')['num_occurrences'],
+                                      aggregated['num_occurrences'])
+
+        document = payload.document()
+        check(document['answer']['solutions'].tolist(),
+              document['unembedded_answer']['solutions'].tolist(),
+              document['unembedded_answer']['energies'].tolist())
+
+        pages = payload.summary()['pages']
+        self.assertEqual(pages['unembedded_answer']['num_pages'], pages['answer']['num_pages'])
+        for page in range(pages['answer']['num_pages']):
+            arrays, metadata = decode_arrays(payload.samples(page))
+            logical, logical_metadata = decode_arrays(payload.samples(page, 'unembedded_answer'))
+            solutions = np.unpackbits(arrays['solutions'], axis=1,
+                                      count=metadata['num_variables'])
+            samples = np.unpackbits(logical['solutions'], axis=1,
+                                    count=logical_metadata['num_variables'])
+            check(np.where(solutions, 1, -1).tolist(), np.where(samples, 1, -1).tolist(),
+                  logical['energies'].tolist())
+
+    def test_unpacked(self):
+        data = problem_data()
+        data['answer']['solutions'][0][0] = 3
+        arrays, metadata = decode_arrays(InspectorPayload(data).samples(0))
+        self.assertFalse(metadata['packed'])
+        self.assertEqual(arrays['solutions'].dtype, np.int8)
+
+    def test_embedding(self):
+        data = problem_data(num_variables=7)
+        payload = InspectorPayload(data, page_size=3)
+
+        embedding = {}
+        for page in range(3):
+            arrays, metadata = decode_arrays(payload.embedding(page))
+            indptr, qubits = arrays['indptr'], arrays['qubits']
+            for i, v in enumerate(metadata['variables']):
+                embedding[v] = qubits[indptr[i]:indptr[i + 1]].tolist()
+        self.assertEqual(embedding, data['data']['data']['embedding'])
+
+        with self.assertRaises(ValueError):
+            payload.embedding(3)
+
+    def test_document(self):
+        data = problem_data()
+        document = InspectorPayload(data, max_samples=2).document()
+
+        self.assertNotIn('rel', document)
+        self.assertEqual(len(document['answer']['solutions']), 2)
+        self.assertEqual(document['answer']['energies'].tolist(),
+                         sorted(set(data['answer']['energies']))[:2])
+        self.assertEqual(document['data'], data['data'])
+
+        summary = InspectorPayload(data).summary()
+        self.assertNotIn('embedding', summary['data']['data'])
+        self.assertNotIn('solutions', summary['answer'])
+        self.assertEqual(summary['answer']['active_variables'],
+                         data['answer']['active_variables'])
+
+
+class TestServer(unittest.TestCase):
+    def setUp(self):
+        inspector.enable(page_size=2)
+        self.addCleanup(inspector.disable)
+
+        self.data = problem_store['p'] = problem_data('p')
+        self.addCleanup(problem_store.pop, 'p', None)
+
+        self.client = app.test_client()
+
+    def get(self, url, **kwargs):
+        response = self.client.get(url, headers={'Accept-Encoding': 'gzip'}, **kwargs)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        return gzip.decompress(response.data)
+
+    def test_problem(self):
+        document = json.loads(self.get('/api/problems/p'))
+        self.assertEqual(document['details'], self.data['details'])
+        self.assertEqual(sum(document['answer']['num_occurrences']), 50)
+        self.assertEqual(document['pages']['answer']['num_pages'], 3)
+
+        # uncompressed when the client does not accept gzip
+        response = self.client.get('/api/problems/p')
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual(response.json, document)
+
+    def test_pages(self):
+        summary = json.loads(self.get('/api/problems/p/summary'))
+        self.assertNotIn('solutions', summary['answer'])
+
+        arrays, metadata = decode_arrays(self.get('/api/problems/p/samples/1'))
+        self.assertEqual(metadata['offset'], 2)
+        self.assertEqual(len(arrays['energies']), 2)
+
+        arrays, metadata = decode_arrays(
+            self.get('/api/problems/p/samples/0', query_string={'answer': 'unembedded'}))
+        self.assertEqual(metadata['num_variables'], 7)
+
+        arrays, metadata = decode_arrays(self.get('/api/problems/p/embedding/3'))
+        self.assertEqual(metadata['variables'], ['v6'])
+
+        self.assertEqual(self.client.get('/api/problems/p/samples/9').status_code, 404)
+        self.assertEqual(self.client.get('/api/problems/q/summary').status_code, 404)
+
+    def test_updated(self):
+        self.get('/api/problems/p')
+        problem_store['p'] = problem_data('p', num_reads=10, seed=1)
+        document = json.loads(self.get('/api/problems/p'))
+        self.assertEqual(sum(document['answer']['num_occurrences']), 10)
+
+    def test_disable(self):
+        inspector.disable()
+        self.assertEqual(self.client.get('/api/problems/p/summary').status_code, 404)
+        response = self.client.get('/api/problems/p')
+        self.assertEqual(len(response.json['answer']['solutions']), 50)
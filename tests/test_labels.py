@@ -0,0 +1,186 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import unittest
+
+import dimod
+import numpy as np
+
+from dwaveoceansdk.bench.construction import bin_packing_reference
+from dwaveoceansdk.construction import bin_packing
+from dwaveoceansdk.labels import StructuredVariables
+
+
+def bin_packing_variables(n):
+    variables = StructuredVariables()
+    variables.add('x_{i},{j}', (n, n))
+    variables.add('y_{j}', (n,))
+    return variables
+
+
+class TestTemplates(unittest.TestCase):
+    def test_positional_and_named(self):
+        variables = StructuredVariables()
+        variables.add('a{}b{}', (2, 2))
+        variables.add('c[{k}]', (2,), lower=(-1,))
+
+        self.assertEqual(list(variables), ['a0b0', 'a0b1', 'a1b0', 'a1b1', 'c[-1]', 'c[0]'])
+
+    def test_invalid(self):
+        variables = StructuredVariables()
+        for template in ['x', 'x{}{}', 'x{:d}', 'x{!r}', 'x{0.a}']:
+            with self.subTest(template=template):
+                with self.assertRaises(ValueError):
+                    variables.add(template, (2, 2))
+
+        with self.assertRaises(ValueError):
+            variables.add('x{}', (2, 2))
+
+    def test_non_canonical(self):
+        variables = bin_packing_variables(20)
+
+        for label in ['x_01,1', 'x_1,+1', 'x_1, 1', 'x_1,1 ', 'y_-0', 'y_20', 'z_1', 3]:
+            with self.subTest(label=label):
+                self.assertNotIn(label, variables)
+                with self.assertRaises(ValueError):
+                    variables.index(label)
+
+
+class TestStructuredVariables(unittest.TestCase):
+    def test_matches_dimod(self):
+        n = 7
+        variables = bin_packing_variables(n)
+        reference = bin_packing_reference(np.linspace(.1, .9, n)).variables
+
+        self.assertEqual(len(variables), len(reference))
+        self.assertEqual(set(variables), set(reference))
+        for label in reference:
+            self.assertEqual(variables[variables.index(label)], label)
+        self.assertEqual(variables.to_variables(), dimod.variables.Variables(variables))
+
+    def test_sequence(self):
+        variables = bin_packing_variables(3)
+
+        self.assertEqual(variables[0], 'x_0,0')
+        self.assertEqual(variables[-1], 'y_2')
+        self.assertEqual(variables[7:10], ['x_2,1', 'x_2,2', 'y_0'])
+        self.assertEqual(variables.count('y_1'), 1)
+        self.assertEqual(variables.count('y_3'), 0)
+        with self.assertRaises(IndexError):
+            variables[12]
+
+    def test_sparse(self):
+        fields = [[5, 7], [1, 2], [100, 3]]
+        for scale in [1, 10**6]:
+            with self.subTest(scale=scale):
+                variables = bin_packing_variables(2)
+                block = variables.add_from('z_{}_{}', np.multiply(fields, scale))
+
+                self.assertEqual(block.labels(), [f'z_{a*scale}_{b*scale}' for a, b in fields])
+                self.assertEqual(variables.index(f'z_{100*scale}_{3*scale}'), 8)
+                self.assertNotIn(f'z_{5*scale}_{2*scale}', variables)
+                np.testing.assert_array_equal(
+                    block.index(np.multiply([1, 100], scale), np.multiply([2, 3], scale)), [7, 8])
+
+        with self.assertRaises(ValueError):
+            StructuredVariables().add_from('z_{}', [[1], [1]])
+
+    def test_overlaps(self):
+        variables = StructuredVariables()
+        variables.add('x_{}', (10,))
+        variables.add('x_{}', (10,), lower=(10,))
+        variables.add_from('x_{}', [[20], [25]])
+
+        for lower in [5, 25]:
+            with self.assertRaises(ValueError):
+                variables.add('x_{}', (3,), lower=(lower,))
+        with self.assertRaises(ValueError):
+            variables.add_from('x_{}', [[30], [9]])
+
+        variables.add('x_{}', (4,), lower=(21,))
+        self.assertEqual(variables.index('x_24'), 25)
+
+        # field names do not change the labels
+        with self.assertRaises(ValueError):
+            variables.add('x_{i}', (3,), lower=(5,))
+        with self.assertRaises(ValueError):
+            variables.add_from('x_{j}', [[30], [9]])
+        variables.add('x_{i}', (2,), lower=(40,))
+        self.assertEqual(variables.indices(['x_41', 'x_3']).tolist(), [27, 3])
+
+    def test_indices(self):
+        variables = bin_packing_variables(50)
+        variables.add_from('z_{}', [[3], [1000]])
+        labels = ['z_1000', 'y_3', 'x_1,2', 'x_49,49', 'z_3']
+
+        np.testing.assert_array_equal(variables.indices(labels),
+                                      [variables.index(v) for v in labels])
+        self.assertEqual(variables.labels(variables.indices(labels)), labels)
+
+        with self.assertRaisesRegex(ValueError, "'y_50'"):
+            variables.indices(['y_1', 'y_50'])
+
+    def test_nbytes(self):
+        variables = bin_packing_variables(1000)
+
+        self.assertEqual(len(variables), 1001000)
+        self.assertLess(variables.nbytes, 100)
+
+
+class TestLabelBlock(unittest.TestCase):
+    def test_index_fields(self):
+        variables = bin_packing_variables(4)
+        x, y = variables.blocks
+
+        np.testing.assert_array_equal(x.index(np.arange(4)[:, None], np.arange(4)), x.indices)
+        np.testing.assert_array_equal(x.fields(x.index([1, 3], 2)), [[1, 2], [3, 2]])
+        self.assertEqual(y.index(2), 18)
+        with self.assertRaises(ValueError):
+            x.index(4, 0)
+        with self.assertRaises(ValueError):
+            y.fields(3)
+
+    def test_bin_packing(self):
+        weights = np.array([.5, .3, .4, .6])
+        n = len(weights)
+        cqm = bin_packing(weights)
+        variables = bin_packing_variables(n)
+        x, y = variables.blocks
+
+        reference = bin_packing_reference(weights)
+        relabeled = variables.relabel(cqm)
+
+        self.assertTrue(relabeled.objective.is_equal(reference.objective))
+        for label, constraint in relabeled.constraints.items():
+            self.assertTrue(constraint.lhs.is_equal(reference.constraints[label].lhs))
+        np.testing.assert_array_equal(
+            [cqm.constraints['capacity_bin_1'].lhs.get_linear(v) for v in x.indices[:, 1]],
+            weights)
+        self.assertEqual(cqm.constraints['capacity_bin_1'].lhs.get_linear(y.index(1)), -1)
+
+    def test_values(self):
+        n = 3
+        variables = bin_packing_variables(n)
+        x, y = variables.blocks
+
+        # every item in bin 1
+        sample = np.zeros(len(variables), dtype=np.int8)
+        sample[x.index(np.arange(n), 1)] = 1
+        sample[y.index(1)] = 1
+        sampleset = dimod.SampleSet.from_samples(
+            (sample[::-1], np.arange(len(variables))[::-1]), 'BINARY', 0)
+
+        samples = variables.samples(sampleset)
+        np.testing.assert_array_equal(x.values(samples)[0], [[0, 1, 0]] * n)
+        np.testing.assert_array_equal(y.values(samples)[0], [0, 1, 0])
@@ -0,0 +1,206 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import unittest
+
+import numpy as np
+from dwave.optimization import Model
+from dwave.optimization.generators import capacitated_vehicle_routing, traveling_salesperson
+from dwave.optimization.mathematical import logical_or, maximum, minimum, sqrt, where
+
+from dwaveoceansdk.nonlinear import StateBatch
+
+
+def random_partition(rng, size, num_lists):
+    cuts = np.sort(rng.integers(0, size + 1, num_lists - 1))
+    return [list(part) for part in np.split(rng.permutation(size), cuts)]
+
+
+class TestStateBatch(unittest.TestCase):
+    def assertMatchesModel(self, batch):
+        """Every symbol of the batch equals its state in ``model.states``."""
+        model = batch.model
+        batch.set_model_states()
+        with model.lock():
+            for symbol in model.iter_symbols():
+                if type(symbol).__name__ in ('DisjointLists', 'DisjointBitSets'):
+                    continue
+                values = batch.value(symbol)
+                for i in range(batch.num_states):
+                    expected = symbol.state(i)
+                    np.testing.assert_allclose(
+                        np.reshape(values[i], expected.shape), expected,
+                        err_msg=f"symbol {symbol.topological_index()}, state {i}")
+
+    def test_tsp(self):
+        rng = np.random.default_rng(0)
+        model = traveling_salesperson(rng.integers(1, 20, (6, 6)))
+        (route,) = model.iter_decisions()
+
+        batch = StateBatch(model, [[rng.permutation(6) for _ in range(5)]])
+        self.assertEqual(len(batch), 5)
+        self.assertEqual(batch.fallback, ())
+        self.assertMatchesModel(batch)
+
+        evaluated = batch.update({route.topological_index(): [rng.permutation(6)]}, rows=[3])
+        self.assertEqual(len(evaluated), model.num_symbols() - 2)   # all but the decision and D
+        self.assertMatchesModel(batch)
+
+    def test_cvrp(self):
+        rng = np.random.default_rng(1)
+        model = capacitated_vehicle_routing(
+            demand=[0, 3, 4, 2, 5, 1, 2], number_of_vehicles=3, vehicle_capacity=8,
+            distances=rng.integers(1, 9, (7, 7)))
+        (routes,) = model.iter_decisions()
+        states = [random_partition(rng, 6, 3) for _ in range(6)]
+
+        batch = StateBatch(model, [states])
+        self.assertEqual(batch.fallback, ())
+        self.assertMatchesModel(batch)
+
+        with model.lock():
+            self.assertEqual(batch.feasible.tolist(), [model.feasible(i) for i in range(6)])
+            self.assertEqual(batch.objective.tolist(),
+                             [model.objective.state(i) for i in range(6)])
+
+        # swapping two routes re-evaluates only the symbols of those routes
+        state = states[1]
+        lists = [s for s in model.iter_symbols() if type(s).__name__ == 'DisjointList']
+        evaluated = batch.update({routes.topological_index(): [[state[1], state[0], state[2]]]},
+                                 rows=[1])
+        self.assertIn(lists[0].topological_index(), evaluated)
+        self.assertNotIn(lists[2].topological_index(), evaluated)
+        self.assertIn(model.objective.topological_index(), evaluated)
+        self.assertMatchesModel(batch)
+
+        batch.update([[random_partition(rng, 6, 3) for _ in range(6)]])
+        self.assertMatchesModel(batch)
+
+    def test_unchanged(self):
+        model = traveling_salesperson([[0, 1, 2], [1, 0, 3], [2, 3, 0]])
+        batch = StateBatch(model, [[[0, 1, 2], [2, 1, 0]]])
+        self.assertEqual(batch.update([[[0, 1, 2], [2, 1, 0]]]).tolist(), [])
+
+    def test_symbols(self):
+        rng = np.random.default_rng(2)
+
+        model = Model()
+        x = model.integer(3, lower_bound=-4, upper_bound=6)
+        y = model.binary(3)
+        s = model.set(5, min_size=1)
+        _, subsets = model.disjoint_bit_sets(4, 2)
+        c = model.constant([1.5, -2., 3.])
+        r = model.constant(np.arange(5.))
+
+        model.minimize(
+            ((x * c + y - x) / (c + 10)).sum()
+            + (x % model.constant(3)).max() + abs(-x).min() + (x ** 2).sum()
+            + s.sum() + s.prod() + s.max() + s.min()
+            + logical_or(x <= c, y == 1).sum()
+            + s[1:].sum() + s[:-1].sum() + s[::2].sum() + s[-2:].sum() + s[1:3].sum()
+            + maximum(x, c).sum() + minimum(x, y).sum() + sqrt(abs(x)).sum()
+            + x.reshape((3, 1)).sum() + subsets[0].sum() * subsets[1].prod()
+            + r[s].sum()
+            + where(y, x, c).sum())
+        model.add_constraint(x.sum() <= 3)
+        model.lock()
+
+        num_states = 8
+        bit_sets = np.zeros((num_states, 2, 4))
+        for i in range(num_states):
+            bit_sets[i, rng.integers(0, 2, 4), np.arange(4)] = 1
+        states = [rng.integers(-4, 7, (num_states, 3)), rng.integers(0, 2, (num_states, 3)),
+                  [rng.permutation(5)[:rng.integers(1, 6)] for _ in range(num_states)],
+                  bit_sets]
+
+        batch = StateBatch(model, states)
+        # where is evaluated state by state
+        self.assertEqual(len(batch.fallback), 1)
+        self.assertMatchesModel(batch)
+
+        batch.update({s.topological_index(): [[4, 0]], x.topological_index(): [[1, 1, 1]]},
+                     rows=[5])
+        self.assertMatchesModel(batch)
+
+        batch.update({x.topological_index(): rng.integers(-4, 7, (num_states, 3))})
+        self.assertMatchesModel(batch)
+
+        # and read back from model.states
+        self.assertMatchesModel(StateBatch(model))
+
+    def test_invalid(self):
+        model = Model()
+        x = model.integer(2, lower_bound=0, upper_bound=3)
+        route = model.list(3)
+        model.set(4, max_size=2)
+        model.lock()
+
+        valid = [[[0, 1]], [[0, 1, 2]], [[3]]]
+        StateBatch(model, valid)
+
+        invalid = [
+            [[[0, 4]], [[0, 1, 2]], [[3]]],         # out of bounds
+            [[[0, .5]], [[0, 1, 2]], [[3]]],        # not integral
+            [[[0, 1]], [[0, 1, 1]], [[3]]],         # not a permutation
+            [[[0, 1]], [[0, 1, 2]], [[3, 3]]],      # repeated element
+            [[[0, 1]], [[0, 1, 2]], [[0, 1, 2]]],   # too large
+            [[[0, 1]], [[0, 1, 2]], [[4]]],         # not in the set
+            [[[0, 1]], [[0, 1, 2]]],                # missing decision
+            [[[0, 1], [0, 1]], [[0, 1, 2]], [[3]]],     # different numbers of states
+            ]
+        for states in invalid:
+            with self.subTest(states=states):
+                with self.assertRaises(ValueError):
+                    StateBatch(model, states)
+
+        batch = StateBatch(model, valid)
+        with self.assertRaises(ValueError):
+            batch.update({x.topological_index(): [[0, 1]]}, rows=[1])
+        with self.assertRaises(ValueError):
+            batch.update({route.topological_index(): [[0, 1, 2], [0, 1, 2]]})
+        with self.assertRaises(ValueError):
+            batch.update({99: [[0, 1]]})
+        with self.assertRaises(ValueError):
+            batch.value(99)
+
+        disjoint = Model()
+        disjoint.disjoint_lists_symbol(3, 2)
+        disjoint.lock()
+        with self.assertRaises(ValueError):
+            StateBatch(disjoint, [[[[0, 1], [1, 2]]]])
+
+    def test_unlocked(self):
+        model = Model()
+        x = model.integer(3, lower_bound=-4, upper_bound=6)
+        s = model.set(5, min_size=1)
+        expr = x.sum() + s.sum()
+        model.minimize(expr)
+        model.add_constraint(x.sum() <= 3)
+
+        states = [[[1, 2, 3], [0, 0, 0], [-4, 6, 1]], [[0, 4], [1], [2, 3, 4]]]
+        batch = StateBatch(model, states)
+
+        np.testing.assert_array_equal(batch.objective, [10, 1, 12])
+        np.testing.assert_array_equal(batch.feasible, [False, True, True])
+        self.assertEqual(batch.value(x)[2].tolist(), [-4, 6, 1])
+        with self.assertRaises(ValueError):
+            batch.value(expr)
+        with model.lock():
+            np.testing.assert_array_equal(batch.value(expr.topological_index()), [10, 1, 12])
+
+    def test_inputs(self):
+        model = Model()
+        model.input()
+        with self.assertRaises(ValueError):
+            StateBatch(model)
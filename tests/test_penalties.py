@@ -0,0 +1,206 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import concurrent.futures
+import itertools
+import os.path
+import tempfile
+import unittest
+import warnings
+
+import dimod
+
+with warnings.catch_warnings():
+    warnings.simplefilter('ignore', DeprecationWarning)
+    import penaltymodel
+
+from dwaveoceansdk.penalties import GadgetSpec, PenaltyModelIndex, penalty_bqm
+
+EQ = [(-1, -1), (1, 1)]
+AND = [(0, 0, 0), (0, 1, 0), (1, 0, 0), (1, 1, 1)]
+XOR = [(0, 0, 0), (0, 1, 1), (1, 0, 1), (1, 1, 0)]
+
+
+def satisfies(sample, constraints):
+    return all(tuple(sample[v] > 0 for v in variables) in
+               set(tuple(c > 0 for c in configuration) for configuration in configurations)
+               for configurations, variables in constraints)
+
+
+class TestGadgetSpec(unittest.TestCase):
+    def test_canonical(self):
+        a = GadgetSpec([(1, 1, 1), (0, 0, 0)], graph=[(1, 0), (2, 1), (0, 2)])
+        b = GadgetSpec([(-1, -1, -1), (1, 1, 1), (1, 1, 1)], graph=3)
+
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(a.database_key(), b.database_key())
+        self.assertNotEqual(a, GadgetSpec([(1, 1, 1), (0, 0, 0)], min_classical_gap=1))
+
+    def test_auxiliary(self):
+        spec = GadgetSpec(AND, graph=[(0, 1), (0, 3), (1, 3), (2, 3)])
+        self.assertEqual(spec.num_variables, 3)
+        self.assertEqual(spec.num_nodes, 4)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            GadgetSpec([])
+        with self.assertRaises(ValueError):
+            GadgetSpec(AND, graph=2)
+        with self.assertRaises(ValueError):
+            GadgetSpec(AND, graph=[(0, 0), (1, 2)])
+
+
+class TestPenaltyModelIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.database = os.path.join(self.tmpdir.name, 'penaltymodel.db')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_persisted(self):
+        spec = GadgetSpec(AND, graph=4)
+
+        index = PenaltyModelIndex(self.database)
+        self.assertEqual(len(index), 0)
+        gadget = index.resolve([spec, spec])[spec]
+        self.assertIs(index.lookup(spec), gadget)
+
+        # readable by penaltymodel
+        with penaltymodel.PenaltyModelCache(self.database) as cache:
+            bqm, gap = cache.retrieve((spec.configurations, [0, 1, 2]), 4)
+        self.assertEqual(bqm, gadget.bqm)
+        self.assertEqual(gap, gadget.classical_gap)
+
+        # and preloaded by a new index
+        other = PenaltyModelIndex(self.database)
+        self.assertEqual(len(other), 1)
+        self.assertEqual(other.lookup(spec).bqm, gadget.bqm)
+
+    def test_preload(self):
+        spec = GadgetSpec(XOR, graph=5)
+        bqm, gap = penaltymodel.get_penalty_model((spec.configurations, [0, 1, 2]), 5,
+                                                  use_cache=False)
+        with penaltymodel.PenaltyModelCache(self.database) as cache:
+            cache.insert_penalty_model(bqm, (spec.configurations, [0, 1, 2]), gap)
+
+        index = PenaltyModelIndex(self.database)
+        self.assertEqual(index.lookup(spec).bqm, bqm)
+
+        # bounds are checked as by the cache
+        tight = GadgetSpec(XOR, graph=5, min_classical_gap=gap + 1)
+        self.assertIsNone(index.lookup(tight))
+
+    def test_not_persisted(self):
+        index = PenaltyModelIndex(self.database, persist=False)
+        index.resolve([GadgetSpec(EQ)])
+        self.assertFalse(os.path.exists(self.database))
+
+    def test_executor(self):
+        specs = [GadgetSpec(AND, graph=4), GadgetSpec(XOR, graph=5), GadgetSpec(EQ)]
+
+        index = PenaltyModelIndex(persist=False)
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            gadgets = index.resolve(specs, executor=executor)
+
+        self.assertEqual(set(gadgets), set(specs))
+        for spec, gadget in gadgets.items():
+            self.assertGreaterEqual(gadget.classical_gap, spec.min_classical_gap)
+
+    def test_workers(self):
+        specs = [GadgetSpec(AND, graph=4), GadgetSpec(XOR, graph=5)]
+
+        index = PenaltyModelIndex(persist=False)
+        gadgets = index.resolve(specs, num_workers=2)
+        self.assertEqual(set(gadgets), set(specs))
+
+        with self.assertRaises(ValueError):
+            index.resolve(specs, num_workers=0)
+
+    def test_impossible(self):
+        # XOR needs two auxiliary variables with the default bounds
+        with self.assertRaises(penaltymodel.ImpossiblePenaltyModel):
+            PenaltyModelIndex(persist=False).resolve([GadgetSpec(XOR, graph=4)])
+
+
+class TestPenaltyBQM(unittest.TestCase):
+    def setUp(self):
+        self.index = PenaltyModelIndex(persist=False)
+
+    def test_ground_states(self):
+        and_spec = GadgetSpec(AND, graph=4)
+        xor_spec = GadgetSpec(XOR, graph=5)
+        constraints = [(and_spec, 'abc'), (xor_spec, 'cde'), (and_spec, 'efa')]
+
+        for vartype in (dimod.SPIN, dimod.BINARY):
+            with self.subTest(vartype=vartype):
+                bqm = penalty_bqm(constraints, vartype, index=self.index)
+
+                self.assertIs(bqm.vartype, vartype)
+                # one auxiliary variable per AND, two per XOR
+                self.assertEqual(set(bqm.variables) - set('abcdef'),
+                                 {'aux0', 'aux1', 'aux2', 'aux3'})
+
+                sampleset = dimod.ExactSolver().sample(bqm).lowest()
+                labelled = [(AND, 'abc'), (XOR, 'cde'), (AND, 'efa')]
+                ground = set()
+                for sample in sampleset.samples():
+                    self.assertTrue(satisfies(sample, labelled))
+                    ground.add(tuple(sample[v] for v in 'abcdef'))
+
+                # every assignment that satisfies all constraints is ground
+                num_satisfying = sum(
+                    satisfies(dict(zip('abcdef', values)), labelled)
+                    for values in itertools.product((0, 1), repeat=6))
+                self.assertEqual(len(ground), num_satisfying)
+
+    def test_sum_of_models(self):
+        spec = GadgetSpec(AND, graph=4)
+        constraints = [(spec, (i, i + 1, i + 2)) for i in range(0, 20, 2)]
+
+        bqm = penalty_bqm(constraints, index=self.index)
+
+        gadget = self.index.lookup(spec)
+        expected = dimod.BinaryQuadraticModel('SPIN')
+        for k, (_, variables) in enumerate(constraints):
+            mapping = dict(enumerate(variables))
+            mapping[3] = f'aux{k}'
+            expected += gadget.bqm.relabel_variables(mapping, inplace=False)
+
+        self.assertEqual(bqm, expected)
+
+    def test_no_auxiliary(self):
+        spec = GadgetSpec(EQ)
+        bqm = penalty_bqm([(spec, 'ab'), (spec, 'bc'), (spec, 'ca')], index=self.index)
+
+        self.assertEqual(set(bqm.variables), set('abc'))
+        self.assertEqual(set(dimod.ExactSolver().sample(bqm).lowest().record.sample.sum(axis=1)),
+                         {-3, 3})
+
+    def test_empty(self):
+        bqm = penalty_bqm([], 'BINARY', index=self.index)
+        self.assertEqual(bqm.num_variables, 0)
+        self.assertIs(bqm.vartype, dimod.BINARY)
+
+    def test_invalid(self):
+        spec = GadgetSpec(EQ)
+        with self.assertRaises(ValueError):
+            penalty_bqm([(spec, 'abc')], index=self.index)
+        with self.assertRaises(ValueError):
+            penalty_bqm([(spec, 'aa')], index=self.index)
+        with self.assertRaises(ValueError):
+            penalty_bqm([(EQ, 'ab')], index=self.index)
+        with self.assertRaises(ValueError):
+            penalty_bqm([(GadgetSpec(AND, graph=4), ['aux0', 'b', 'c'])], index=self.index)
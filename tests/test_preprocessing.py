@@ -0,0 +1,173 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import concurrent.futures
+import unittest
+
+import dimod
+import numpy as np
+from dwave.preprocessing import ScaleComposite, roof_duality
+
+from dwaveoceansdk.preprocessing import (
+    PreprocessingComposite, connected_components, preprocess)
+from dwaveoceansdk.tracing import Collector, tracing
+
+
+def random_bqm(num_variables, p, vartype, seed):
+    # continuous biases, so that ground states are unique
+    rng = np.random.default_rng(seed)
+    bqm = dimod.generators.gnp_random_bqm(num_variables, p, vartype, random_state=seed,
+                                          bias_generator=lambda n: rng.normal(size=n))
+    bqm.relabel_variables({v: f'v{v}' for v in bqm.variables})
+    return bqm
+
+
+class TestConnectedComponents(unittest.TestCase):
+    def test_components(self):
+        bqm = dimod.BinaryQuadraticModel({'e': 1}, {'ab': 1, 'bc': 1, 'df': 1}, 0, 'BINARY')
+
+        num_components, components = connected_components(bqm)
+
+        self.assertEqual(num_components, 3)
+        labels = dict(zip(bqm.variables, components.tolist()))
+        self.assertEqual(labels['a'], labels['c'])
+        self.assertEqual(labels['d'], labels['f'])
+        self.assertEqual(len({labels['a'], labels['d'], labels['e']}), 3)
+
+
+class TestPreprocess(unittest.TestCase):
+    def test_ground_states(self):
+        for vartype in ['SPIN', 'BINARY']:
+            for seed in range(10):
+                bqm = random_bqm(14, .12, vartype, seed)
+                ground = dimod.ExactSolver().sample(bqm).first
+
+                for strict in [True, False]:
+                    for exact_size in [0, 4]:
+                        with self.subTest(vartype=vartype, seed=seed, strict=strict,
+                                          exact_size=exact_size):
+                            result = preprocess(bqm, strict=strict, exact_size=exact_size)
+
+                            self.assertLessEqual(result.lower_bound, ground.energy + 1e-9)
+                            for v, value in result.fixed.items():
+                                self.assertEqual(value, ground.sample[v])
+
+                            reduced = bqm.copy()
+                            reduced.fix_variables(result.fixed)
+                            self.assertTrue(reduced.is_almost_equal(result.bqm))
+
+    def test_roof_duality(self):
+        # one component, larger than exact_size
+        bqm = random_bqm(30, .3, 'BINARY', 3)
+        lower_bound, fixed = roof_duality(bqm)
+
+        result = preprocess(bqm)
+
+        self.assertEqual(result.num_components, 1)
+        self.assertAlmostEqual(result.lower_bound, lower_bound)
+        self.assertEqual(result.fixed, fixed)
+
+    def test_exact(self):
+        # a and b have two ground states; c and d have one
+        bqm = dimod.BinaryQuadraticModel({'a': 1, 'b': 1, 'c': 1, 'e': 0},
+                                         {'ab': -2, 'cd': -3}, 0, 'BINARY')
+
+        result = preprocess(bqm)
+        self.assertEqual(result.fixed, {'c': 1, 'd': 1})
+        self.assertEqual(result.lower_bound, -2)
+
+        result = preprocess(bqm, strict=False)
+        self.assertEqual(set(result.fixed), set(bqm.variables))
+        self.assertEqual(result.bqm.num_variables, 0)
+        self.assertEqual(result.bqm.offset, -2)
+
+    def test_workers(self):
+        bqm = dimod.BinaryQuadraticModel('SPIN')
+        for seed in range(6):
+            component = random_bqm(8, .5, 'SPIN', seed)
+            bqm.update(component.relabel_variables(
+                {v: (seed, v) for v in component.variables}, inplace=False))
+        expected = preprocess(bqm, exact_size=0)
+
+        for num_workers in [2, 4]:
+            with self.subTest(num_workers=num_workers):
+                result = preprocess(bqm, exact_size=0, num_workers=num_workers)
+
+                self.assertEqual(result.fixed, expected.fixed)
+                self.assertEqual(result.lower_bound, expected.lower_bound)
+                self.assertTrue(result.bqm.is_equal(expected.bqm))
+
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            result = preprocess(bqm, exact_size=0, num_workers=2, executor=executor)
+        self.assertEqual(result.fixed, expected.fixed)
+
+    def test_nothing_fixed(self):
+        bqm = dimod.BinaryQuadraticModel({}, {'ab': -1}, 0, 'SPIN')
+
+        result = preprocess(bqm)
+
+        self.assertEqual(result.fixed, {})
+        self.assertIs(result.bqm, bqm)
+
+    def test_empty(self):
+        bqm = dimod.BinaryQuadraticModel({}, {}, 1.5, 'SPIN')
+
+        result = preprocess(bqm)
+
+        self.assertEqual(result.lower_bound, 1.5)
+        self.assertEqual(result.num_components, 0)
+
+    def test_stages(self):
+        bqm = random_bqm(50, .05, 'SPIN', 1)
+
+        with tracing(Collector()) as collector:
+            result = preprocess(bqm)
+
+        self.assertEqual(list(result.stages), ['components', 'roof_duality', 'reduce'])
+        for stage in result.stages.values():
+            self.assertGreaterEqual(stage['time'], 0)
+        self.assertEqual({s.name for s in collector.spans},
+                         {'preprocess.components', 'preprocess.roof_duality',
+                          'preprocess.reduce'})
+
+    def test_invalid(self):
+        bqm = dimod.BinaryQuadraticModel('SPIN')
+        with self.assertRaises(ValueError):
+            preprocess(bqm, num_workers=0)
+        with self.assertRaises(ValueError):
+            preprocess(bqm, exact_size=17)
+
+
+class TestPreprocessingComposite(unittest.TestCase):
+    def test_sample(self):
+        bqm = random_bqm(12, .15, 'SPIN', 4)
+        ground = dimod.ExactSolver().sample(bqm).first
+
+        sampler = PreprocessingComposite(ScaleComposite(dimod.ExactSolver()))
+        sampleset = sampler.sample(bqm, scalar=.5)
+
+        self.assertEqual(set(sampleset.variables), set(bqm.variables))
+        self.assertAlmostEqual(sampleset.first.energy, ground.energy)
+        self.assertEqual(sampleset.first.sample, ground.sample)
+        np.testing.assert_allclose(sampleset.record.energy,
+                                   bqm.energies(sampleset))
+        self.assertGreater(sampleset.info['preprocessing']['num_fixed'], 0)
+
+    def test_all_fixed(self):
+        bqm = dimod.BinaryQuadraticModel({'a': 1, 'b': -1}, {}, 0, 'SPIN')
+
+        sampleset = PreprocessingComposite(dimod.ExactSolver()).sample(bqm)
+
+        self.assertEqual(sampleset.first.sample, {'a': -1, 'b': 1})
+        self.assertEqual(sampleset.first.energy, -2)
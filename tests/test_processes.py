@@ -0,0 +1,166 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import concurrent.futures
+import os
+import time
+import unittest
+
+import dimod
+import hybrid
+import numpy as np
+
+from dwaveoceansdk.processes import ProcessMap, ProcessParallel, ProcessPool, ProcessRace
+
+
+class Fail(hybrid.traits.NotValidated, hybrid.Runnable):
+    def next(self, state, **runopts):
+        raise ValueError("failed")
+
+
+class Pid(hybrid.traits.NotValidated, hybrid.Runnable):
+    def next(self, state, racing_context=False, **runopts):
+        return state.updated(pid=os.getpid(), racing_context=racing_context)
+
+
+class TestProcessPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ProcessPool(2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    def test_submit(self):
+        bqm = dimod.generators.gnp_random_bqm(100, .5, 'SPIN', random_state=1)
+        state = hybrid.State.from_problem(bqm)
+
+        result = self.pool.submit(Pid(), state).result()
+
+        self.assertNotEqual(result.pid, os.getpid())
+        self.assertEqual(result.problem, bqm)
+        np.testing.assert_array_equal(result.samples.record.sample,
+                                      state.samples.record.sample)
+
+    def test_shared_memory(self):
+        bqm = dimod.generators.gnp_random_bqm(100, .5, 'SPIN', random_state=2)
+
+        with ProcessPool(1, shared_memory_threshold=0) as pool:
+            result = pool.submit(hybrid.Identity(), hybrid.State.from_problem(bqm)).result()
+
+        self.assertEqual(result.problem, bqm)
+
+        # the result is writeable and not backed by the released block
+        result.samples.record.sample[:] = 1
+
+    def test_exception(self):
+        with self.assertRaisesRegex(ValueError, "failed"):
+            self.pool.submit(Fail(), hybrid.State()).result()
+
+    def test_stop(self):
+        future = self.pool.submit(hybrid.Wait(), hybrid.State())
+        time.sleep(.1)
+        self.pool.stop(future)
+        self.assertIsInstance(future.result(timeout=10), hybrid.State)
+
+        # does nothing once done
+        self.pool.stop(future)
+
+    def test_stop_queued(self):
+        with ProcessPool(1) as pool:
+            running = pool.submit(hybrid.Wait(), hybrid.State())
+            # the executor forwards a call ahead of the free workers
+            *forwarded, queued = [pool.submit(Pid(), hybrid.State()) for _ in range(3)]
+            pool.stop(queued)
+            pool.stop(running)
+
+            self.assertIsInstance(running.result(timeout=10), hybrid.State)
+            with self.assertRaises(concurrent.futures.CancelledError):
+                queued.result(timeout=10)
+            for future in forwarded:
+                self.assertIn('pid', future.result(timeout=10))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            ProcessPool(0)
+        with self.assertRaises(ValueError):
+            ProcessPool(poll_interval=0)
+
+
+class TestFlows(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ProcessPool(2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    def test_race(self):
+        bqm = dimod.generators.ran_r(1, 10, seed=3)
+
+        # the waiting branch only completes when stopped across processes
+        states = ProcessRace(hybrid.Wait(), Pid(), pool=self.pool).run(
+            hybrid.State.from_problem(bqm)).result(timeout=10)
+
+        self.assertEqual(len(states), 2)
+        self.assertTrue(states[1].racing_context)
+        self.assertEqual(states[0].problem, bqm)
+
+    def test_race_queued(self):
+        state = hybrid.State.from_problem(dimod.generators.ran_r(1, 10, seed=3))
+
+        # branches queued behind the first return the input state
+        with ProcessPool(1) as pool:
+            states = ProcessRace(Pid(), *[hybrid.Wait()] * 4, pool=pool).run(
+                state).result(timeout=10)
+
+        self.assertEqual(len(states), 5)
+        self.assertTrue(states[0].racing_context)
+        for queued in states[1:]:
+            self.assertNotIn('pid', queued)
+            self.assertEqual(queued.problem, state.problem)
+
+    def test_race_workflow(self):
+        bqm = dimod.generators.ran_r(1, 20, seed=4)
+        workflow = hybrid.Loop(
+            ProcessRace(hybrid.InterruptableTabuSampler(),
+                        hybrid.EnergyImpactDecomposer(size=5)
+                        | hybrid.SimulatedAnnealingSubproblemSampler()
+                        | hybrid.SplatComposer(),
+                        pool=self.pool)
+            | hybrid.ArgMin(), max_iter=3)
+
+        state = workflow.run(hybrid.State.from_problem(bqm)).result()
+
+        self.assertEqual(state.samples.first.energy,
+                         bqm.energy(state.samples.first.sample))
+
+    def test_parallel(self):
+        states = ProcessParallel(Pid(), Pid(), pool=self.pool).run(
+            hybrid.State(value=1)).result()
+
+        self.assertEqual([state.value for state in states], [1, 1])
+        self.assertNotIn(os.getpid(), [state.pid for state in states])
+
+    def test_map(self):
+        states = ProcessMap(Pid(), pool=self.pool).run(
+            hybrid.States(hybrid.State(value=1), hybrid.State(value=2))).result()
+
+        self.assertEqual([state.value for state in states], [1, 2])
+
+    def test_exception(self):
+        with self.assertRaisesRegex(ValueError, "failed"):
+            ProcessParallel(Pid(), Fail(), pool=self.pool).run(hybrid.State()).result()
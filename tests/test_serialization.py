@@ -0,0 +1,132 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import dimod
+import numpy as np
+
+from dwaveoceansdk.serialization import ALIGNMENT, dump, load, open_mapped
+
+
+class TestSerialization(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.filename = os.path.join(tmpdir.name, 'model.dwmap')
+
+    def roundtrip(self, obj):
+        dump(obj, self.filename)
+        return load(self.filename)
+
+    def test_bqm(self):
+        bqms = [
+            dimod.BinaryQuadraticModel({'a': 1, (1, 2): 2}, {('a', (1, 2)): -1}, 0.5, 'SPIN'),
+            dimod.generators.gnp_random_bqm(50, .5, 'BINARY', random_state=3),
+            dimod.BinaryQuadraticModel('BINARY'),
+            ]
+        for bqm in bqms:
+            with self.subTest(bqm=bqm):
+                new = self.roundtrip(bqm)
+                self.assertEqual(new, bqm)
+                self.assertEqual(new.variables, bqm.variables)
+                self.assertEqual(new.vartype, bqm.vartype)
+
+    def test_cqm(self):
+        x, y = dimod.Binaries('xy')
+        i = dimod.Integer('i', lower_bound=-3, upper_bound=4)
+        r = dimod.Real('r', lower_bound=-2, upper_bound=3)
+
+        cqm = dimod.ConstrainedQuadraticModel()
+        cqm.set_objective(x + 2*y*i + r + 3)
+        cqm.add_constraint(x + y <= 1, label='soft', weight=2, penalty='quadratic')
+        cqm.add_constraint(i*x - r >= -1, label=('t', 1))
+        cqm.add_discrete('xy', label='one-hot')
+
+        new = self.roundtrip(cqm)
+
+        self.assertTrue(new.is_equal(cqm))
+        self.assertEqual(list(new.variables), list(cqm.variables))
+        self.assertEqual(list(new.constraints), ['soft', ('t', 1), 'one-hot'])
+        self.assertEqual(new.lower_bound('i'), -3)
+        self.assertEqual(new.upper_bound('r'), 3)
+        self.assertEqual(new.constraints['soft'].lhs.weight(), 2)
+        self.assertEqual(new.constraints['soft'].lhs.penalty(), 'quadratic')
+        self.assertFalse(new.constraints[('t', 1)].lhs.is_soft())
+        self.assertTrue(new.constraints['one-hot'].lhs.is_discrete())
+
+    def test_sampleset(self):
+        bqm = dimod.generators.gnp_random_bqm(8, .5, 'SPIN', random_state=5)
+        sampleset = dimod.ExactSolver().sample(bqm)
+        sampleset.info.update(timing={'total': 1.5}, values=np.arange(3))
+
+        new = self.roundtrip(sampleset)
+
+        np.testing.assert_array_equal(new.record, sampleset.record)
+        self.assertEqual(new.variables, sampleset.variables)
+        self.assertEqual(new.vartype, sampleset.vartype)
+        self.assertEqual(new.info['timing'], {'total': 1.5})
+        np.testing.assert_array_equal(new.info['values'], np.arange(3))
+        self.assertEqual(new.first, sampleset.first)
+
+        # backed by the file, not a copy of it
+        self.assertFalse(new.record.flags.writeable)
+        with self.assertRaises(ValueError):
+            new.record.energy[0] = 0
+
+    def test_sampleset_info_not_serializable(self):
+        sampleset = dimod.SampleSet.from_samples([0, 1], 'BINARY', 0, info={'obj': object()})
+        with self.assertRaises(ValueError):
+            dump(sampleset, self.filename)
+
+    def test_arrays(self):
+        bqm = dimod.BinaryQuadraticModel({0: 1, 1: -2}, {(0, 1): 3}, 0, 'BINARY')
+        dump(bqm, self.filename)
+
+        mapped = open_mapped(self.filename)
+
+        self.assertEqual(mapped.type, 'BinaryQuadraticModel')
+        self.assertEqual(mapped.variables, range(2))
+        np.testing.assert_array_equal(mapped.arrays['linear'], [1, -2])
+        np.testing.assert_array_equal(mapped.arrays['quadratic'], [3])
+        for array in mapped.arrays.values():
+            self.assertFalse(array.flags.writeable)
+            self.assertEqual(array.__array_interface__['data'][0] % ALIGNMENT, 0)
+
+    def test_other_process(self):
+        bqm = dimod.generators.gnp_random_bqm(20, .5, 'SPIN', random_state=7)
+        dump(bqm, self.filename)
+
+        proc = subprocess.run(
+            [sys.executable, '-c',
+             'import sys; from dwaveoceansdk.serialization import load; '
+             'print(load(sys.argv[1]).energy(dict.fromkeys(range(20), 1)))', self.filename],
+            capture_output=True, text=True, check=True)
+
+        self.assertAlmostEqual(float(proc.stdout), bqm.energy(dict.fromkeys(range(20), 1)))
+
+    def test_invalid(self):
+        with self.subTest('type'):
+            with self.assertRaises(TypeError):
+                dump({'a': 1}, self.filename)
+
+        with self.subTest('file'):
+            with open(self.filename, 'wb') as f:
+                f.write(b'not a mapped file')
+            with self.assertRaises(ValueError):
+                load(self.filename)
@@ -0,0 +1,121 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import unittest
+
+import dimod
+import numpy as np
+from dwave.samplers import SimulatedAnnealingSampler
+
+from dwaveoceansdk.streaming import StreamingSampleSet, iter_chunks
+
+
+class TestIterChunks(unittest.TestCase):
+    def test_chunks(self):
+        bqm = dimod.generators.gnp_random_bqm(10, .5, 'SPIN', random_state=1)
+        chunks = list(iter_chunks(SimulatedAnnealingSampler(), bqm, 250, chunk_size=100,
+                                  seed=4, num_sweeps=10))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [100, 100, 50])
+
+        # reproducible, with a different seed per chunk
+        again = list(iter_chunks(SimulatedAnnealingSampler(), bqm, 250, chunk_size=100,
+                                 seed=4, num_sweeps=10))
+        for chunk, other in zip(chunks, again):
+            np.testing.assert_array_equal(chunk.record.sample, other.record.sample)
+        self.assertFalse(np.array_equal(chunks[0].record.sample, chunks[1].record.sample))
+
+    def test_invalid(self):
+        bqm = dimod.BinaryQuadraticModel('SPIN')
+        with self.assertRaises(ValueError):
+            next(iter_chunks(dimod.ExactSolver(), bqm, 10, chunk_size=0))
+
+
+class TestStreamingSampleSet(unittest.TestCase):
+    def test_matches_full_sampleset(self):
+        bqm = dimod.generators.gnp_random_bqm(20, .3, 'SPIN', random_state=2)
+
+        stream = StreamingSampleSet(top_k=5, bin_width=.5)
+        chunks = []
+        for chunk in iter_chunks(SimulatedAnnealingSampler(), bqm, 1000, chunk_size=150,
+                                 seed=8, num_sweeps=10):
+            stream.update(chunk)
+            chunks.append(chunk)
+
+        full = dimod.concatenate(chunks)
+        aggregated = full.aggregate()
+        energies = full.record.energy
+
+        self.assertEqual(stream.num_reads, 1000)
+        self.assertEqual(stream.num_chunks, 7)
+        self.assertEqual(stream.num_unique, len(aggregated))
+        self.assertEqual(stream.first.energy, full.first.energy)
+        self.assertEqual(stream.first.sample, full.first.sample)
+        self.assertAlmostEqual(stream.mean_energy, energies.mean())
+        self.assertEqual(stream.min_energy, energies.min())
+        self.assertEqual(stream.max_energy, energies.max())
+
+        top = stream.to_sampleset()
+        order = np.argsort(aggregated.record.energy, kind='stable')[:5]
+        np.testing.assert_array_equal(top.record.energy, aggregated.record.energy[order])
+        np.testing.assert_array_equal(top.record.num_occurrences,
+                                      aggregated.record.num_occurrences[order])
+        self.assertEqual(top.info['num_reads'], 1000)
+
+        bins = np.floor(energies / .5).astype(int)
+        self.assertEqual(stream.histogram(),
+                         {b: int(c) for b, c in zip(*np.unique(bins, return_counts=True))})
+
+    def test_variable_order(self):
+        a = dimod.SampleSet.from_samples(([[0, 1]], 'ab'), 'BINARY', [1.])
+        b = dimod.SampleSet.from_samples(([[1, 0], [0, 0]], 'ba'), 'BINARY', [1., 0.])
+
+        stream = StreamingSampleSet()
+        stream.update(a)
+        stream.update(b)
+
+        self.assertEqual(stream.num_unique, 2)
+        self.assertEqual(stream.first.sample, {'a': 0, 'b': 0})
+        record = stream.to_sampleset().record
+        self.assertEqual(dict(zip(map(tuple, record.sample.tolist()),
+                                  record.num_occurrences.tolist())),
+                         {(0, 0): 1, (0, 1): 2})
+
+    def test_mismatch(self):
+        stream = StreamingSampleSet()
+        stream.update(dimod.SampleSet.from_samples(([[0, 1]], 'ab'), 'BINARY', [1.]))
+
+        with self.subTest('vartype'):
+            with self.assertRaises(ValueError):
+                stream.update(dimod.SampleSet.from_samples(([[-1, 1]], 'ab'), 'SPIN', [1.]))
+        with self.subTest('variables'):
+            with self.assertRaises(ValueError):
+                stream.update(dimod.SampleSet.from_samples(([[0, 1]], 'ac'), 'BINARY', [1.]))
+
+    def test_empty(self):
+        stream = StreamingSampleSet()
+
+        self.assertEqual(len(stream.to_sampleset()), 0)
+        with self.assertRaises(ValueError):
+            stream.first
+
+    def test_disabled_aggregates(self):
+        stream = StreamingSampleSet(count_unique=False)
+        stream.update(dimod.SampleSet.from_samples(([[0, 1]], 'ab'), 'BINARY', [1.]))
+
+        with self.assertRaises(ValueError):
+            stream.num_unique
+        with self.assertRaises(ValueError):
+            stream.histogram()
+        self.assertNotIn('num_unique', stream.to_sampleset().info)
@@ -0,0 +1,140 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import asyncio
+import threading
+import time
+import unittest
+
+import dimod
+from dwave.system import DWaveSampler
+
+from dwaveoceansdk.submission import submit_many
+from dwaveoceansdk.testing import StandInSAPI
+
+
+class SlowSampler(dimod.ExactSolver):
+    """ExactSolver that sleeps for the given number of seconds and keeps
+    track of how many calls run at once."""
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def sample(self, bqm, delay=0, **kwargs):
+        if bqm.offset < 0:
+            raise ValueError("negative offset")
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(delay if delay else bqm.offset)
+            return super().sample(bqm, **kwargs)
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def run(batch):
+    async def main():
+        return await batch
+    return asyncio.run(main())
+
+
+def problem(offset=0.):
+    return dimod.BinaryQuadraticModel({'a': -1}, {}, offset, 'BINARY')
+
+
+class TestSubmitMany(unittest.TestCase):
+    def test_await(self):
+        problems = [problem(delay) for delay in (.2, .1, 0)]
+
+        samplesets = run(submit_many(SlowSampler(), problems))
+
+        self.assertEqual([sampleset.first.energy for sampleset in samplesets],
+                         [-.8, -.9, -1])
+
+    def test_completion_order(self):
+        async def main():
+            return [index async for index, _ in submit_many(SlowSampler(),
+                                                            [problem(.3), problem(0)])]
+
+        self.assertEqual(asyncio.run(main()), [1, 0])
+
+    def test_max_in_flight(self):
+        sampler = SlowSampler()
+        pulled = []
+
+        def problems():
+            for i in range(10):
+                pulled.append(i)
+                yield problem()
+
+        async def main():
+            async for index, _ in submit_many(sampler, problems(), max_in_flight=3,
+                                              delay=.05):
+                # problems are only pulled when there is room for them
+                self.assertLessEqual(len(pulled), index + 4)
+
+        asyncio.run(main())
+
+        self.assertEqual(sampler.max_running, 3)
+        self.assertEqual(len(pulled), 10)
+
+    def test_exceptions(self):
+        problems = [problem(), problem(-1), problem()]
+
+        with self.subTest('raise'):
+            with self.assertRaises(ValueError):
+                run(submit_many(SlowSampler(), problems))
+
+        with self.subTest('return'):
+            results = run(submit_many(SlowSampler(), problems, return_exceptions=True))
+            self.assertIsInstance(results[0], dimod.SampleSet)
+            self.assertIsInstance(results[1], ValueError)
+            self.assertIsInstance(results[2], dimod.SampleSet)
+
+    def test_consumed_once(self):
+        batch = submit_many(SlowSampler(), [problem()])
+        run(batch)
+        with self.assertRaises(RuntimeError):
+            run(batch)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            submit_many(SlowSampler(), [], max_in_flight=0)
+        with self.assertRaises(ValueError):
+            submit_many(SlowSampler(), [], method='sample_cqm')
+
+    def test_stand_in_sapi(self):
+        with StandInSAPI(latency=.2) as sapi:
+            sampler = DWaveSampler(**sapi.config)
+            u, v = sampler.edgelist[0]
+            problems = [dimod.BinaryQuadraticModel({u: i, v: -1}, {(u, v): -1}, 0, 'SPIN')
+                        for i in range(12)]
+
+            t = time.perf_counter()
+            samplesets = run(submit_many(sampler, problems, max_in_flight=6,
+                                                 num_reads=5))
+            elapsed = time.perf_counter() - t
+
+        self.assertEqual(len(samplesets), 12)
+        for bqm, sampleset in zip(problems, samplesets):
+            for sample, energy in sampleset.data(['sample', 'energy']):
+                self.assertAlmostEqual(energy, bqm.energy(sample))
+
+        self.assertLessEqual(sapi.max_in_flight, 6)
+        # sequentially this takes at least 12 * .2 seconds
+        self.assertLess(elapsed, 12 * .2)
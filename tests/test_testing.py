@@ -0,0 +1,123 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import unittest
+
+import dimod
+import dwave.system
+import dwave.system.samplers.clique
+import hybrid.samplers
+from dwave.system.samplers.dwave_sampler import DWaveSampler
+from dwave.system.testing import MockDWaveSampler
+
+import dwaveoceansdk
+from dwaveoceansdk.testing import StandInSAPI, mock_qpu
+
+
+class TestMockQPU(unittest.TestCase):
+    def test_patched_and_restored(self):
+        modules = [dwave.system, dwave.system.samplers, dwave.system.samplers.clique,
+                   hybrid.samplers]
+
+        with mock_qpu() as mock:
+            self.assertTrue(issubclass(mock, MockDWaveSampler))
+            for module in modules:
+                with self.subTest(module=module.__name__):
+                    self.assertIs(module.DWaveSampler, mock)
+            self.assertIs(dwaveoceansdk.DWaveSampler, mock)
+
+        for module in modules:
+            with self.subTest(module=module.__name__):
+                self.assertIs(module.DWaveSampler, DWaveSampler)
+        self.assertIs(dwaveoceansdk.DWaveSampler, DWaveSampler)
+
+    def test_restored_on_error(self):
+        with self.assertRaises(ZeroDivisionError):
+            with mock_qpu():
+                1 / 0
+        self.assertIs(dwave.system.DWaveSampler, DWaveSampler)
+
+    def test_embedding_composite(self):
+        with mock_qpu():
+            from dwave.system import DWaveSampler, EmbeddingComposite
+
+            sampler = EmbeddingComposite(DWaveSampler())
+
+            h = {'a': -1, 'b': +1}
+            J = {('a', 'b'): -1}
+
+            sampleset = sampler.sample_ising(h, J)
+
+        self.assertEqual(sampleset.first.energy, -1)
+
+    def test_parameters(self):
+        with mock_qpu(topology_type='zephyr') as mock:
+            self.assertEqual(mock().properties['topology']['type'], 'zephyr')
+            self.assertEqual(mock(topology_type='chimera').properties['topology']['type'],
+                             'chimera')
+
+            sampler = mock(solver=dict(topology__type='pegasus'))
+            self.assertEqual(sampler.properties['topology']['type'], 'pegasus')
+
+    def test_hybrid(self):
+        import dimod
+
+        bqm = dimod.BinaryQuadraticModel({}, {'ab': 1, 'bc': -1, 'ca': 1}, 0, dimod.SPIN)
+
+        with mock_qpu():
+            workflow = hybrid.QPUSubproblemAutoEmbeddingSampler(num_reads=10)
+            state = hybrid.State.from_subproblem(bqm)
+            result = workflow.run(state).result()
+
+        self.assertEqual(result.subsamples.first.energy, -3.0)
+
+
+class TestStandInSAPI(unittest.TestCase):
+    def test_sample(self):
+        with StandInSAPI() as sapi:
+            sampler = DWaveSampler(**sapi.config)
+            u, v = sampler.edgelist[0]
+            bqm = dimod.BinaryQuadraticModel({u: 1, v: -.5}, {(u, v): -1}, 2, 'SPIN')
+
+            sampleset = sampler.sample(bqm, num_reads=20)
+
+            self.assertEqual(sum(sampleset.record.num_occurrences), 20)
+            self.assertEqual(set(sampleset.variables), {u, v})
+            for sample, energy in sampleset.data(['sample', 'energy']):
+                self.assertAlmostEqual(energy, bqm.energy(sample))
+            self.assertIn('timing', sampleset.info)
+            self.assertEqual(sapi.max_in_flight, 1)
+
+    def test_qubo(self):
+        with StandInSAPI() as sapi:
+            sampler = DWaveSampler(**sapi.config)
+            q = sampler.nodelist[0]
+
+            sampleset = sampler.sample_qubo({(q, q): -1}, num_reads=10)
+
+            self.assertIs(sampleset.vartype, dimod.BINARY)
+            self.assertEqual(set(sampleset.record.sample.ravel()) - {0, 1}, set())
+
+    def test_latency(self):
+        with StandInSAPI(latency=.1, sampler=dimod.ExactSolver()) as sapi:
+            sampler = DWaveSampler(**sapi.config)
+            q = sampler.nodelist[0]
+
+            samplesets = [sampler.sample_ising({q: 1}, {}) for _ in range(5)]
+            self.assertEqual([sampleset.first.energy for sampleset in samplesets], [-1] * 5)
+            self.assertEqual(sapi.max_in_flight, 5)
+
+    def test_not_running(self):
+        with self.assertRaises(RuntimeError):
+            StandInSAPI().endpoint
@@ -0,0 +1,98 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import dwave.graphs
+import networkx as nx
+import numpy as np
+
+from dwaveoceansdk import topology
+from dwaveoceansdk.topology import (
+    Topology, chimera_topology, pegasus_topology, zephyr_topology)
+
+
+class TestTopology(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.addCleanup(topology._loaded.clear)
+
+    def test_matches_generators(self):
+        cases = [
+            (chimera_topology, dwave.graphs.chimera_graph, (2, 3, 2)),
+            (pegasus_topology, dwave.graphs.pegasus_graph, (3,)),
+            (zephyr_topology, dwave.graphs.zephyr_graph, (2, 3)),
+            ]
+        for get_topology, generator, shape in cases:
+            T = get_topology(*shape, directory=self.directory.name)
+
+            for coordinates in [False, True]:
+                with self.subTest(family=T.family, coordinates=coordinates):
+                    G = generator(*shape, coordinates=coordinates)
+                    H = T.to_networkx(coordinates=coordinates)
+
+                    self.assertTrue(nx.utils.graphs_equal(G, H))
+                    self.assertEqual(dict(G.nodes(data=True)), dict(H.nodes(data=True)))
+
+            G = generator(*shape)
+            self.assertEqual(T.num_nodes, G.number_of_nodes())
+            self.assertEqual(T.num_edges, G.number_of_edges())
+            self.assertEqual(set(map(tuple, T.edges().tolist())),
+                             {(min(e), max(e)) for e in G.edges})
+            node = T.nodes[1]
+            self.assertEqual(set(T.neighbors(node).tolist()), set(G[node]))
+            np.testing.assert_array_equal(T.adjacency().sum(axis=1), T.degrees)
+
+    def test_cached(self):
+        with mock.patch.object(Topology, 'from_networkx',
+                               wraps=Topology.from_networkx) as from_networkx:
+            first = pegasus_topology(2, directory=self.directory.name)
+            self.assertIs(pegasus_topology(2, directory=self.directory.name), first)
+
+            # another process: load from disk, memory-mapped
+            topology._loaded.clear()
+            second = pegasus_topology(2, directory=self.directory.name)
+
+        self.assertEqual(from_networkx.call_count, 1)
+        self.assertIsNot(second, first)
+        self.assertIsInstance(second.indices.base, np.memmap)
+        np.testing.assert_array_equal(second.coordinates, first.coordinates)
+        self.assertEqual(os.listdir(self.directory.name), ['pegasus-2-v1'])
+
+    def test_save_existing(self):
+        path = os.path.join(self.directory.name, 'zephyr')
+        T = Topology.from_networkx(dwave.graphs.zephyr_graph(1))
+
+        T.save(path)
+        T.save(path)  # e.g. saved concurrently by another process
+
+        self.assertEqual(os.listdir(self.directory.name), ['zephyr'])
+        np.testing.assert_array_equal(Topology.load(path).indptr, T.indptr)
+
+    def test_index(self):
+        T = chimera_topology(1, directory=self.directory.name)
+
+        np.testing.assert_array_equal(T.index([7, 0]), [7, 0])
+        with self.assertRaises(ValueError):
+            T.index([3, 8])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Topology('square', (2,), [0], [0, 0], [], [[0]])
+        with self.assertRaises(ValueError):
+            Topology('chimera', (1,), [0, 1], [0, 0], [], [[0]])
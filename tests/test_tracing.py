@@ -0,0 +1,200 @@
+# Copyright 2026 D-Wave Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+import dimod
+import hybrid
+from dwave.samplers import SimulatedAnnealingSampler
+from dwave.system import DWaveSampler, EmbeddingComposite
+
+from dwaveoceansdk import tracing
+from dwaveoceansdk.batching import sample_many
+from dwaveoceansdk.testing import StandInSAPI
+
+
+class TestSpans(unittest.TestCase):
+    def test_disabled(self):
+        self.assertIs(tracing.span('a'), tracing.span('b', x=1))
+        tracing.counter('c')
+
+        with tracing.span('a') as s:
+            s.set(x=1)
+
+    def test_nesting(self):
+        with tracing.tracing(packages=[]) as collector:
+            with tracing.span('outer', size=3) as outer:
+                with tracing.span('inner'):
+                    pass
+                outer.set(done=True)
+
+            with self.assertRaises(KeyError):
+                with tracing.span('failed'):
+                    raise KeyError
+
+            tracing.counter('items', 2)
+            tracing.counter('items')
+
+        inner, outer, failed = collector.spans
+        self.assertIs(inner.parent, outer)
+        self.assertIsNone(outer.parent)
+        self.assertEqual(outer.attributes, dict(size=3, done=True))
+        self.assertEqual(failed.attributes, dict(error='KeyError'))
+        self.assertGreaterEqual(outer.duration, inner.duration)
+        self.assertEqual(collector.counters, dict(items=3))
+
+        summary = collector.summary()
+        self.assertEqual(summary['outer']['count'], 1)
+        self.assertEqual(summary['outer']['total'], outer.duration)
+
+    def test_threads(self):
+        def work():
+            with tracing.span('work'):
+                pass
+
+        with tracing.tracing(packages=[]) as collector:
+            with tracing.span('main'):
+                thread = threading.Thread(target=work)
+                thread.start()
+                thread.join()
+
+        spans = {span.name: span for span in collector.spans}
+        self.assertIsNone(spans['work'].parent)
+        self.assertNotEqual(spans['work'].track, spans['main'].track)
+
+    def test_nested_tracing(self):
+        with tracing.tracing(packages=[]) as outer:
+            with tracing.tracing(packages=[]) as inner:
+                with tracing.span('a'):
+                    pass
+            with tracing.span('b'):
+                pass
+
+        self.assertEqual([span.name for span in inner.spans], ['a'])
+        self.assertEqual([span.name for span in outer.spans], ['b'])
+        self.assertIs(tracing.span('c'), tracing.span('d'))
+
+    def test_chrome_trace(self):
+        with tracing.tracing(packages=[]) as collector:
+            with tracing.span('a', n=1):
+                tracing.counter('c', 5)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'trace.json')
+            collector.dump(path)
+            with open(path) as f:
+                trace = json.load(f)
+
+        events = {event['ph']: event for event in trace['traceEvents']}
+        self.assertEqual(events['X']['name'], 'a')
+        self.assertEqual(events['X']['args'], dict(n=1))
+        self.assertGreaterEqual(events['X']['dur'], 0)
+        self.assertEqual(events['C']['args'], dict(c=5))
+        self.assertIn('M', events)
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_restored(self):
+        sample = SimulatedAnnealingSampler.sample
+
+        with tracing.tracing(packages=['dwave.samplers', 'dwave.system']):
+            self.assertIsNot(SimulatedAnnealingSampler.sample, sample)
+            self.assertIn('find_embedding', vars(EmbeddingComposite))
+
+        self.assertIs(SimulatedAnnealingSampler.sample, sample)
+        self.assertNotIn('find_embedding', vars(EmbeddingComposite))
+
+        # a nested block restores exactly the instrumentation around it
+        collector = tracing.enable(packages=['dwave.samplers'])
+        self.addCleanup(tracing.disable)
+        traced = SimulatedAnnealingSampler.sample
+        with tracing.tracing(packages=['dwave.samplers', 'dwave.system']):
+            self.assertIn('find_embedding', vars(EmbeddingComposite))
+        self.assertIs(SimulatedAnnealingSampler.sample, traced)
+        self.assertNotIn('find_embedding', vars(EmbeddingComposite))
+        self.assertIs(tracing.disable(), collector)
+        self.assertIs(SimulatedAnnealingSampler.sample, sample)
+
+        collector = tracing.enable(packages=[])
+        with tracing.tracing(packages=[]):
+            pass
+        self.assertEqual(tracing._instrumented, set())
+        self.assertEqual(tracing._patches, [])
+        self.assertIs(tracing.disable(), collector)
+
+        with self.assertRaises(ValueError):
+            tracing.enable(packages=['numpy'])
+
+    def test_samplers(self):
+        bqm = dimod.generators.ran_r(1, 10, seed=1)
+
+        with tracing.tracing(packages=['dwave.samplers']) as collector:
+            SimulatedAnnealingSampler().sample(bqm, num_reads=1, num_sweeps=10)
+            sample_many(SimulatedAnnealingSampler(), [bqm] * 3, num_sweeps=10)
+
+        self.assertEqual([(span.name, span.attributes) for span in collector.spans[:1]],
+                         [('SimulatedAnnealingSampler.sample', dict(num_variables=10))])
+        self.assertEqual([span.name for span in collector.spans[1:]],
+                         ['sample_many.pack', 'sample_many.sample', 'sample_many.split'])
+
+    def test_embedding_composite(self):
+        with StandInSAPI(latency=.05) as sapi:
+            sampler = EmbeddingComposite(DWaveSampler(**sapi.config))
+
+            with tracing.tracing() as collector:
+                sampleset = sampler.sample_ising({'a': -1, 'b': +1}, {('a', 'b'): -1},
+                                                 num_reads=5)
+                sampleset.resolve()
+
+        spans = {}
+        for span in collector.spans:
+            spans.setdefault(span.name, []).append(span)
+
+        composite, = spans['EmbeddingComposite.sample']
+        for name in ['find_embedding', 'embed_bqm', 'DWaveSampler.sample']:
+            self.assertIs(spans[name][0].parent, composite)
+        self.assertIs(spans['StructuredSolver.sample_bqm'][0].parent,
+                      spans['DWaveSampler.sample'][0])
+
+        self.assertIn('unembed_sampleset', spans)
+        self.assertIn('sapi.wait', spans)
+
+        # the problem's stages are recorded once, on a track of their own
+        problem_id = sampleset.info['problem_id']
+        for name in ['sapi.submit', 'sapi.solve', 'sapi.load']:
+            stage, = spans[name]
+            self.assertEqual(stage.track, f'SAPI problem {problem_id}')
+        self.assertGreaterEqual(spans['sapi.solve'][0].duration, .04)
+
+        self.assertTrue(any(name.startswith('sapi.timing.') for name in collector.counters))
+
+        json.dumps(collector.to_chrome_trace(), default=repr)
+
+    def test_hybrid(self):
+        bqm = dimod.generators.ran_r(1, 20, seed=2)
+        workflow = hybrid.Loop(hybrid.EnergyImpactDecomposer(size=5)
+                               | hybrid.SimulatedAnnealingSubproblemSampler(num_sweeps=10)
+                               | hybrid.SplatComposer()
+                               | hybrid.Const(subsamples=None), max_iter=2)
+
+        with tracing.tracing(packages=['hybrid']) as collector:
+            workflow.run(hybrid.State.from_problem(bqm)).result()
+
+        summary = collector.summary()
+        self.assertEqual(summary['Loop']['count'], 1)
+        self.assertEqual(summary['EnergyImpactDecomposer']['count'], 2)